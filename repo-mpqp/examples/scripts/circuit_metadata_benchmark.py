@@ -0,0 +1,41 @@
+"""Overhead of the metadata of a circuit (gates, measurements, breakpoints,
+variables, ...) queried at each run, on a 5000 instructions circuit. The
+metadata is computed once and cached by the circuit, the first timing clears
+the cache before each run to show the cost without it."""
+
+from timeit import timeit
+
+from sympy import symbols
+
+from mpqp import QCircuit
+from mpqp.gates import CNOT, H, Rx, Rz
+from mpqp.measures import BasisMeasure
+
+theta = symbols("θ")
+circuit = QCircuit(10)
+for i in range(1666):
+    circuit.add([H(i % 10), Rz(0.1 * i, i % 10), CNOT(i % 10, (i + 1) % 10)])
+circuit.add([Rx(theta, 0), BasisMeasure(shots=1000)])
+
+
+def query_metadata():
+    # what a run and the generation of its job look at
+    circuit.breakpoints
+    circuit.measurements
+    circuit.measurements
+    circuit.variables()
+    circuit.count_gates()
+    circuit.gates
+
+
+def query_metadata_uncached():
+    circuit._cache = {}  # pyright: ignore[reportPrivateUsage]
+    query_metadata()
+
+
+runs = 50
+uncached = timeit(query_metadata_uncached, number=runs) / runs
+cached = timeit(query_metadata, number=runs) / runs
+print(f"Circuit of {len(circuit)} instructions, metadata queried at each run:")
+print(f"    without cache: {uncached * 1e3:.3f} ms per run")
+print(f"    with cache:    {cached * 1e3:.3f} ms per run ({uncached / cached:.0f}x)")
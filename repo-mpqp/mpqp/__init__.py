@@ -4,3 +4,4 @@ from mpqp.core.instruction import Instruction
 from mpqp.core.instruction.barrier import Barrier
 from mpqp.core.instruction.breakpoint import Breakpoint
 from mpqp.core.languages import Language
+from mpqp.core.parametric import ParametricCircuit
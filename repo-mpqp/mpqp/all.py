@@ -4,7 +4,7 @@ from sympy import symbols
 
 from mpqp.execution.providers.atos import get_result_from_qlm_job_id
 
-from . import Barrier, Breakpoint, Instruction, Language, QCircuit
+from . import Barrier, Breakpoint, Instruction, Language, ParametricCircuit, QCircuit
 from .execution import (
     Job,
     JobStatus,
@@ -13,9 +13,17 @@ from .execution import (
     Sample,
     StateVector,
     adjust_measure,
+    fuse_gates,
     get_remote_result,
+    get_remote_result_async,
+    get_remote_status,
     run,
+    run_async,
+    run_native_batch,
+    run_sharded,
+    run_sweep,
     submit,
+    submit_async,
 )
 from .execution.devices import (
     ATOSDevice,
@@ -23,6 +31,7 @@ from .execution.devices import (
     GOOGLEDevice,
     IBMDevice,
     AZUREDevice,
+    MPQPDevice,
 )
 from .execution.simulated_devices import IBMSimulatedDevice
 from .execution.remote_handler import get_all_remote_job_ids
@@ -33,9 +33,18 @@ could be used to add CNOT gates to your circuit, using the two registers
 
 from __future__ import annotations
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from numbers import Complex
-from typing import TYPE_CHECKING, Optional, Sequence, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
 from warnings import warn
 
 import numpy as np
@@ -49,9 +58,24 @@ from mpqp.core.instruction.gates import ControlledGate, CRk, Gate, Id
 from mpqp.core.instruction.gates.custom_controlled_gate import CustomControlledGate
 from mpqp.core.instruction.gates.custom_gate import CustomGate
 from mpqp.core.instruction.gates.gate_definition import UnitaryMatrix
+from mpqp.core.instruction.gates.native_gates import NativeGate
 from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
 from mpqp.core.instruction.measurement import BasisMeasure, Measure
 from mpqp.core.instruction.measurement.expectation_value import ExpectationMeasure
+from mpqp.core.dag import CircuitDAG
+from mpqp.core.fingerprint import (
+    DECIMALS,
+    instruction_token,
+    new_hasher,
+    noise_token,
+    qubits_token,
+    update,
+)
+from mpqp.core.instruction_store import (
+    CompactInstructions,
+    InstructionList,
+    iter_templates,
+)
 from mpqp.core.languages import Language
 from mpqp.noise.noise_model import DimensionalNoiseModel, NoiseModel
 from mpqp.tools import DeviceJobIncompatibleError
@@ -64,11 +88,55 @@ if TYPE_CHECKING:
     from cirq.circuits.circuit import Circuit as cirq_Circuit
     from qat.core.wrappers.circuit import Circuit as myQLM_Circuit
     from qiskit.circuit import QuantumCircuit
+    from scipy.sparse import csr_matrix
     from sympy import Basic, Expr
 
     from mpqp.execution.devices import AvailableDevice
 
 
+def _modified_by_add(component: Instruction | NoiseModel) -> bool:
+    """Whether adding a component to a circuit modifies it (the dynamic
+    components are resized, the classical bits of the measures are
+    allocated)."""
+    return component._dynamic or (  # pyright: ignore[reportPrivateUsage]
+        isinstance(component, BasisMeasure) and component.c_targets is None
+    )
+
+
+def _is_constant(instruction: Instruction) -> bool:
+    """Whether substituting values in an instruction would only copy it."""
+    from sympy import Basic
+
+    if type(instruction).subs is Instruction.subs:
+        return True
+    return isinstance(instruction, NativeGate) and (
+        not isinstance(instruction, ParametrizedGate)
+        or not any(isinstance(param, Basic) for param in instruction.parameters)
+    )
+
+
+_InstructionT = TypeVar("_InstructionT", bound=Instruction)
+_ComponentT = TypeVar("_ComponentT", bound="Instruction | NoiseModel")
+
+
+def _shifted(instruction: _InstructionT, qubits_offset: int) -> _InstructionT:
+    """Instruction moved ``qubits_offset`` qubits down. The gates are shallow
+    copies sharing their definition with ``instruction``."""
+    if isinstance(instruction, Gate):
+        shifted = copy(instruction)
+    else:
+        shifted = deepcopy(instruction)
+    shifted.targets = [qubit + qubits_offset for qubit in instruction.targets]
+    if isinstance(instruction, ControlledGate):
+        if TYPE_CHECKING:
+            assert isinstance(shifted, ControlledGate)
+        shifted.controls = [qubit + qubits_offset for qubit in instruction.controls]
+        shifted.non_controlled_gate = _shifted(
+            instruction.non_controlled_gate, qubits_offset
+        )
+    return shifted
+
+
 @typechecked
 class QCircuit:
     """This class models a quantum circuit.
@@ -85,6 +153,9 @@ class QCircuit:
             instructions and want to hardcode the number of qubits.
         nb_cbits: Number of classical bits. It should be positive.
         label: Name of the circuit.
+        compact: If ``True``, the instructions are stored in a
+            :class:`~mpqp.core.instruction_store.CompactInstructions`, which
+            uses much less memory for circuits with many native gates.
 
     Examples:
         >>> circuit = QCircuit(2)
@@ -130,13 +201,25 @@ class QCircuit:
         nb_qubits: Optional[int] = None,
         nb_cbits: Optional[int] = None,
         label: Optional[str] = None,
+        compact: bool = False,
     ):
         if data is None:
             data = []
         self.label = label
         """See parameter description."""
-        self.instructions: list[Instruction] = []
-        """List of instructions of the circuit."""
+        self._instructions: InstructionList | CompactInstructions = (
+            CompactInstructions() if compact else InstructionList()
+        )
+        self._cache: dict[Any, Any] = {}
+        self._cache_source: Optional[
+            tuple[InstructionList | CompactInstructions, int]
+        ] = None
+        self._dag: Optional[
+            tuple[InstructionList | CompactInstructions, int, int, CircuitDAG]
+        ] = None
+        self._hash_state: Optional[
+            tuple[InstructionList | CompactInstructions, int, int, Any]
+        ] = None
         self.noises: list[NoiseModel] = []
         """List of noise models attached to the circuit."""
         self._user_nb_cbits: Optional[int] = None
@@ -180,11 +263,95 @@ class QCircuit:
                     self._nb_qubits = max(connections, default=-1) + 1
             else:
                 self._user_nb_qubits = nb_qubits
-            self.add(deepcopy(data))
+            # the components are shared with ``data``, except the ones
+            # modified when added
+            self.add(
+                [
+                    deepcopy(component) if _modified_by_add(component) else component
+                    for component in data
+                ]
+            )
+
+    @property
+    def instructions(self) -> InstructionList | CompactInstructions:
+        """List of instructions of the circuit.
+
+        The properties derived from the instructions (:attr:`gates`,
+        :meth:`count_gates`, :meth:`variables`, :meth:`fingerprint`, ...) are
+        cached until the instructions are modified, either through the methods
+        of the circuit or directly in this list (which counts its
+        modifications, see
+        :class:`~mpqp.core.instruction_store.InstructionList`). A plain list
+        assigned to this attribute is copied into an
+        :class:`~mpqp.core.instruction_store.InstructionList`.
+
+        The gates are shared between the circuits built from one another (by
+        :meth:`append`, ``+``, :meth:`tensor`, :meth:`without_measurements`,
+        ...) and with the components given to the constructor, so modifying a
+        gate in place modifies it in all these circuits. To modify the gate of
+        a single circuit, replace it in this list by a modified copy. The
+        measures are not shared, their settings (such as ``shots``) can be
+        modified in place.
+
+        Example:
+            >>> circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=10)])
+            >>> composed = circuit + QCircuit([X(1)])
+            >>> composed.instructions[0] is circuit.instructions[0]
+            True
+            >>> composed.measurements[0].shots = 100
+            >>> circuit.measurements[0].shots
+            10
+            >>> from copy import copy
+            >>> gate = copy(composed.instructions[0])
+            >>> gate.targets = [1]
+            >>> composed.instructions[0] = gate
+            >>> circuit.instructions[0]
+            H(0)
+
+        """
+        return self._instructions
+
+    @instructions.setter
+    def instructions(self, instructions: list[Instruction] | CompactInstructions):
+        if not isinstance(instructions, (InstructionList, CompactInstructions)):
+            instructions = InstructionList(instructions)
+        self._instructions = instructions
 
     def __eq__(self, value: object) -> bool:
         return isinstance(value, type(self)) and self.to_dict() == value.to_dict()
 
+    def __getstate__(self):
+        # the DAG is rebuilt when needed, copying its nodes one by one would be
+        # slow (and could exceed the recursion limit for deep circuits)
+        state = self.__dict__.copy()
+        state["_dag"] = None
+        state["_hash_state"] = None
+        state["_cache"] = {}
+        state["_cache_source"] = None
+        return state
+
+    def _cached(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Returns a property derived from the instructions of the circuit,
+        computing it only if the circuit changed since the last call."""
+        source = self._cache_source
+        instructions = self._instructions
+        if (
+            source is None
+            or source[0] is not instructions
+            or source[1] != instructions.version
+        ):
+            self._cache = {}
+            self._cache_source = (instructions, instructions.version)
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _instances(self, kind: type[Instruction]) -> list[Any]:
+        """Instructions of the circuit of a given type, in order."""
+        if isinstance(self.instructions, CompactInstructions):
+            return self.instructions.instances(kind)
+        return [inst for inst in self.instructions if isinstance(inst, kind)]
+
     def add(self, components: OneOrMany[Instruction | NoiseModel]):
         """Adds a ``component`` or a list of ``component`` at the end of the
         circuit.
@@ -262,7 +429,154 @@ class QCircuit:
         if isinstance(components, NoiseModel):
             self.noises.append(components)
         else:
-            self.instructions.append(components)
+            self._cache = {}
+            hash_state_is_valid = self._hash_state_is_valid()
+            dag_is_valid = self._dag_is_valid()
+            self._instructions.append(components)
+            self._keep_hash_state(hash_state_is_valid)
+            if dag_is_valid and self._dag is not None:
+                self._dag[3].push(components)
+                self._keep_dag()
+            else:
+                self._dag = None
+
+    @property
+    def dag(self) -> CircuitDAG:
+        """DAG of the instructions of the circuit, see
+        :class:`~mpqp.core.dag.CircuitDAG`.
+
+        It is built on the first access, and then updated by :meth:`add` (and
+        thus :meth:`append`). It is rebuilt if :attr:`instructions` is replaced
+        or modified directly.
+
+        Example:
+            >>> circuit = QCircuit([H(1), CNOT(0, 1), Rz(0.3, 0), CNOT(0, 2)])
+            >>> circuit.dag.front_layer()
+            [DAGNode(0, H(1))]
+            >>> circuit.depth()
+            4
+            >>> circuit.dag.schedule()
+            [[H(1), Rz(0.3, 0)], [CNOT(0, 1)], [CNOT(0, 2)]]
+
+        """
+        if self._dag is None or not self._dag_is_valid():
+            instructions = self._instructions
+            dag = CircuitDAG(instructions, self.nb_qubits)
+            self._dag = (instructions, instructions.version, self.nb_qubits, dag)
+        return self._dag[3]
+
+    def _dag_is_valid(self) -> bool:
+        # any modification of the instructions not made by the circuit
+        # increments their version, and invalidates the DAG
+        if self._dag is None:
+            return False
+        source, version, nb_qubits, dag = self._dag
+        return (
+            source is self._instructions
+            and version == source.version
+            and (nb_qubits == self.nb_qubits or not dag.spans_register)
+        )
+
+    def _keep_dag(self):
+        """Marks the DAG as up to date after the circuit pushed the
+        instructions it appended to it."""
+        if self._dag is not None:
+            instructions = self._instructions
+            dag = self._dag[3]
+            self._dag = (instructions, instructions.version, self.nb_qubits, dag)
+
+    def fingerprint(self, decimals: int = DECIMALS) -> str:
+        """Structural hash of the circuit: two circuits with the same
+        instructions (gates, qubits, parameters and measures), noise models
+        and registers have the same fingerprint, see
+        :mod:`~mpqp.core.fingerprint`. The global phase :attr:`gphase`, set
+        when the circuit is translated, is not part of the fingerprint.
+
+        The instructions already hashed are not hashed again when instructions
+        are added to the circuit (by :meth:`add` or :meth:`append`), nor when
+        the circuit is copied by ``+``. Any other modification of
+        :attr:`instructions` leads to hashing all the instructions again. The
+        measures, whose settings (such as ``shots``) can be modified in place,
+        are hashed at each call.
+
+        Args:
+            decimals: Number of decimals of the numerical parameters taken into
+                account.
+
+        Returns:
+            The fingerprint, as an hexadecimal string.
+
+        Example:
+            >>> circuit = QCircuit([H(0), Rx(0.1 + 0.2, 1)])
+            >>> circuit.fingerprint() == QCircuit([H(0), Rx(0.3, 1)]).fingerprint()
+            True
+            >>> fingerprint = circuit.fingerprint()
+            >>> circuit.add(CNOT(0, 1))
+            >>> circuit.fingerprint() == fingerprint
+            False
+
+        """
+        if decimals != DECIMALS:
+            hasher = new_hasher()
+            self._hash_instructions(hasher, 0, decimals)
+        else:
+            instructions = self._instructions
+            if not self._hash_state_is_valid() or self._hash_state is None:
+                self._hash_state = (instructions, instructions.version, 0, new_hasher())
+            _, _, count, hasher = self._hash_state
+            if count < len(instructions):
+                self._hash_instructions(hasher, count, decimals)
+                self._hash_state = (
+                    instructions,
+                    instructions.version,
+                    len(instructions),
+                    hasher,
+                )
+            hasher = hasher.copy()
+        update(
+            hasher,
+            *(instruction_token(measure, decimals) for measure in self.measurements),
+            qubits_token([self.nb_qubits, self.nb_cbits]),
+            *(noise_token(noise) for noise in self.noises),
+        )
+        return hasher.hexdigest()
+
+    def _hash_state_is_valid(self) -> bool:
+        # any modification of the instructions not made by the circuit
+        # increments their version, and invalidates the hash
+        if self._hash_state is None:
+            return False
+        source, version, _, _ = self._hash_state
+        return source is self._instructions and version == source.version
+
+    def _keep_hash_state(self, was_valid: bool):
+        """Keeps the hash state valid after instructions were appended by the
+        circuit, if it was valid before: the new instructions are hashed by
+        the next call to :meth:`fingerprint`."""
+        if was_valid and self._hash_state is not None:
+            _, _, count, hasher = self._hash_state
+            instructions = self._instructions
+            self._hash_state = (instructions, instructions.version, count, hasher)
+        else:
+            self._hash_state = None
+
+    def _hash_instructions(self, hasher: Any, start: int, decimals: int):
+        """Feeds the instructions of the circuit, from index ``start``, to
+        ``hasher``."""
+        # the templates of compact instructions are shared, they are kept in
+        # ``tokens`` so that their id is not reused
+        tokens: dict[int, tuple[Instruction, bytes]] = {}
+        for template, qubits in iter_templates(self.instructions, start):
+            if isinstance(template, Measure):
+                # only the position of the measures is kept, they are hashed
+                # at each call of :meth:`fingerprint`
+                update(hasher, b"Measure")
+                continue
+            entry = tokens.get(id(template))
+            if entry is None:
+                entry = (template, instruction_token(template, decimals))
+                tokens[id(template)] = entry
+            update(hasher, entry[1], qubits_token(qubits))
 
     def _check_components_targets(self, components: Instruction | NoiseModel):
         if isinstance(components, BasisMeasure):
@@ -298,11 +612,15 @@ class QCircuit:
         else:
             self._nb_cbits = max(self.nb_cbits, cbits)
 
-    def _update_targets_components(self, component: Instruction | NoiseModel):
+    def _update_targets_components(
+        self, component: _ComponentT, index: Optional[int] = None
+    ) -> _ComponentT:
         """Update the targets of the component with the number of qubits in the circuit.
 
         Args:
             component: Instruction or NoiseModel for which we want to update the `targets` attribute.
+            index: Position of the instruction of the circuit that ``component``
+                is about to replace, if any.
 
         Raises:
             ValueError: If the number of target qubits for a NoiseModel is
@@ -352,8 +670,12 @@ class QCircuit:
             component.basis.set_size(self.nb_qubits)
 
             unique_cbits = set()
-            for instruction in self.instructions:
-                if instruction != component and isinstance(instruction, BasisMeasure):
+            for i, instruction in enumerate(self.instructions):
+                if (
+                    i != index
+                    and instruction != component
+                    and isinstance(instruction, BasisMeasure)
+                ):
                     if instruction.c_targets:
                         unique_cbits.update(instruction.c_targets)
             c_targets: list[int] = []
@@ -405,18 +727,31 @@ class QCircuit:
                         f"requested {nb_cbits}."
                     )
             self._user_nb_cbits = nb_cbits
+            self._cache = {}
 
     def _set_nb_qubits_dynamic(self, nb_qubits: int):
         if not hasattr(self, "_nb_qubits") or nb_qubits != self._nb_qubits:
             self._nb_qubits = nb_qubits
+            self._cache = {}
 
-            for noise in self.noises:
+            # the dynamic components may be shared with other circuits (see
+            # `instructions`), they are copied before being resized
+            for index, noise in enumerate(self.noises):
                 if noise._dynamic:  # pyright: ignore[reportPrivateUsage]
-                    self._update_targets_components(noise)
+                    self.noises[index] = deepcopy(noise)
+                    self._update_targets_components(self.noises[index])
 
-            for instruction in self.instructions:
+            if isinstance(self.instructions, CompactInstructions):
+                candidates = sorted(self.instructions.objects.items())
+            else:
+                candidates = list(enumerate(self.instructions))
+            for index, instruction in candidates:
                 if instruction._dynamic:  # pyright: ignore[reportPrivateUsage]
-                    self._update_targets_components(instruction)
+                    self.instructions[index] = self._update_targets_components(
+                        deepcopy(instruction), index
+                    )
+                    self._dag = None
+                    self._hash_state = None
 
     def append(self, other: QCircuit, qubits_offset: int = 0) -> None:
         """Appends the circuit at the end (right side) of this circuit, inplace.
@@ -488,15 +823,97 @@ class QCircuit:
                 " index and the size of this circuit"
             )
 
-        for inst in deepcopy(other.instructions):
-            inst.targets = [qubit + qubits_offset for qubit in inst.targets]
-            if isinstance(inst, ControlledGate):
-                inst.controls = [qubit + qubits_offset for qubit in inst.controls]
-            if isinstance(inst, BasisMeasure):
-                if not inst._user_set_c_targets:  # pyright: ignore[reportPrivateUsage]
-                    inst.c_targets = None
+        if isinstance(self.instructions, CompactInstructions) and isinstance(
+            other.instructions, CompactInstructions
+        ):
+            self._append_compact(other.instructions, qubits_offset)
+            return
 
-            self.add(inst)
+        gates: list[Gate] = []
+        for inst in list(other.instructions):
+            if isinstance(inst, Gate):
+                gates.append(
+                    inst if qubits_offset == 0 else _shifted(inst, qubits_offset)
+                )
+            else:
+                self._add_gates(gates)
+                gates = []
+                self._append_instruction(inst, qubits_offset)
+        self._add_gates(gates)
+
+    def _add_gates(self, gates: list[Gate]):
+        """Adds gates at the end of the circuit, like :meth:`add` but checking
+        the size of the circuit once for all the gates."""
+        if len(gates) == 0:
+            return
+        last_qubit = max(max(gate.connections()) for gate in gates)
+        if self._user_nb_qubits is not None:
+            if last_qubit >= self._user_nb_qubits:
+                raise NumberQubitsError(
+                    f"Gates connections up to qubit {last_qubit} are not "
+                    f"compatible with circuit size ({self.nb_qubits})."
+                )
+        else:
+            self._set_nb_qubits_dynamic(max(self.nb_qubits, last_qubit + 1))
+        self._cache = {}
+        hash_state_is_valid = self._hash_state_is_valid()
+        dag_is_valid = self._dag_is_valid()
+        self._instructions.extend(gates)
+        self._keep_hash_state(hash_state_is_valid)
+        if dag_is_valid and self._dag is not None:
+            for gate in gates:
+                self._dag[3].push(gate)
+            self._keep_dag()
+        else:
+            self._dag = None
+
+    def _append_instruction(self, inst: Instruction, qubits_offset: int):
+        """Adds an instruction of another circuit, see :meth:`append`. The
+        gates are shared with the other circuit when possible, and shallow
+        copied to be moved. The measures are copied."""
+        reset_cbits = (
+            isinstance(inst, BasisMeasure)
+            and not inst._user_set_c_targets  # pyright: ignore[reportPrivateUsage]
+        )
+        if qubits_offset != 0:
+            inst = _shifted(inst, qubits_offset)
+        elif (
+            reset_cbits
+            or inst._dynamic  # pyright: ignore[reportPrivateUsage]
+            or isinstance(inst, Measure)
+        ):
+            inst = deepcopy(inst)
+        if reset_cbits:
+            if TYPE_CHECKING:
+                assert isinstance(inst, BasisMeasure)
+            inst.c_targets = None
+        self.add(inst)
+
+    def _append_compact(self, other: CompactInstructions, qubits_offset: int):
+        """Appends compact instructions to the compact instructions of this
+        circuit: the native gates are copied in bulk from the arrays of
+        ``other``, only the instructions kept as is go through :meth:`add`."""
+        if TYPE_CHECKING:
+            assert isinstance(self.instructions, CompactInstructions)
+        start, size = 0, len(other)
+        for index in sorted(other.objects) + [size]:
+            if start < index:
+                if self._user_nb_qubits is None:
+                    qubits = other.qubits[
+                        other.qubit_offsets[start] : other.qubit_offsets[index]
+                    ]
+                    if len(qubits) != 0:
+                        self._set_nb_qubits_dynamic(
+                            max(self.nb_qubits, int(qubits.max()) + qubits_offset + 1)
+                        )
+                hash_state_is_valid = self._hash_state_is_valid()
+                self.instructions.extend_from(other, qubits_offset, start, index)
+                self._keep_hash_state(hash_state_is_valid)
+                self._cache = {}
+                self._dag = None
+            if index < size:
+                self._append_instruction(other[index], qubits_offset)
+            start = index + 1
 
     def to_dict(self) -> dict[str, int | str | list[str] | float | None]:
         """
@@ -508,7 +925,19 @@ class QCircuit:
         return {
             attr_name: getattr(self, attr_name)
             for attr_name in dir(self)
-            if attr_name not in {'_nb_qubits', 'gates', 'measurements', 'breakpoints'}
+            if attr_name
+            not in {
+                '_nb_qubits',
+                'gates',
+                'measurements',
+                'breakpoints',
+                'dag',
+                '_dag',
+                '_cache',
+                '_cache_source',
+                '_hash_state',
+                '_instructions',
+            }
             and not attr_name.startswith("__")
             and not callable(getattr(self, attr_name))
         }
@@ -518,10 +947,62 @@ class QCircuit:
         return self
 
     def __add__(self, other: QCircuit) -> QCircuit:
-        res = deepcopy(self)
+        res = self._shallow_copy()
         res += other
         return res
 
+    def _shallow_copy(
+        self, instructions: Optional[list[Instruction] | CompactInstructions] = None
+    ) -> QCircuit:
+        """Copy of this circuit sharing its gates, see :attr:`instructions`.
+        The measures and the noise models are copied.
+
+        Args:
+            instructions: Instructions of the copy, defaults to a copy of the
+                list (or compact sequence) of instructions of this circuit.
+
+        Returns:
+            The copied circuit.
+        """
+        circuit = copy(self)
+        # the caches belong to the instructions of this circuit
+        circuit._cache = {}
+        circuit._cache_source = None
+        circuit._dag = None
+        circuit._hash_state = None
+        if instructions is None:
+            if isinstance(self.instructions, CompactInstructions):
+                circuit.instructions = self.instructions.copy()
+            else:
+                circuit.instructions = InstructionList(self.instructions)
+        else:
+            circuit.instructions = instructions
+        copied = circuit._instructions
+        if isinstance(copied, CompactInstructions):
+            measures = [
+                (index, obj)
+                for index, obj in copied.objects.items()
+                if isinstance(obj, Measure)
+            ]
+        else:
+            measures = [
+                (index, inst)
+                for index, inst in enumerate(copied)
+                if isinstance(inst, Measure)
+            ]
+        for index, measure in measures:
+            copied[index] = deepcopy(measure)
+        if (
+            instructions is None
+            and self._hash_state_is_valid()
+            and self._hash_state is not None
+        ):
+            # the copied measures are equal to the original ones
+            _, _, count, hasher = self._hash_state
+            circuit._hash_state = (copied, copied.version, count, hasher.copy())
+        circuit.noises = deepcopy(self.noises)
+        return circuit
+
     def tensor(self, other: QCircuit) -> QCircuit:
         """Computes the tensor product of this circuit with that in parameter.
 
@@ -580,7 +1061,7 @@ class QCircuit:
                       └───┘
 
         """
-        res = deepcopy(self)
+        res = self._shallow_copy()
         if res._user_nb_qubits is not None and other._user_nb_qubits is not None:
             res.nb_qubits += other.nb_qubits
         else:
@@ -658,7 +1139,8 @@ class QCircuit:
         return self.nb_qubits, (self.nb_cbits or 0)
 
     def depth(self) -> int:
-        """Computes the depth of the circuit.
+        """Computes the depth of the circuit. The depth is maintained by the
+        :attr:`dag` of the circuit, so it is only computed once.
 
         Returns:
             Depth of the circuit.
@@ -670,31 +1152,7 @@ class QCircuit:
             4
 
         """
-        if len(self) == 0:
-            return 0
-
-        nb_qubits = self.nb_qubits
-        instructions = self.without_measurements().instructions
-        layers = np.zeros((nb_qubits, self.count_gates()), dtype=bool)
-
-        current_layer = 0
-        last_barrier = 0
-        for instr in instructions:
-            if isinstance(instr, Barrier):
-                last_barrier = current_layer
-                current_layer += 1
-                continue
-            conns = list(instr.connections())
-            if any(layers[conns, current_layer]):
-                current_layer += 1
-            fitting_layer_index = current_layer
-            for index in range(current_layer, last_barrier - 1, -1):
-                if any(layers[conns, index]):
-                    fitting_layer_index = index + 1
-                    break
-            layers[conns, fitting_layer_index] = [True] * len(conns)
-
-        return current_layer + 1
+        return self.dag.depth
 
     def __len__(self) -> int:
         """Returns the number of instructions added to this circuit.
@@ -759,12 +1217,29 @@ class QCircuit:
         # - to avoid multi-qubit gates
         ...
 
-    def to_matrix(self) -> npt.NDArray[np.complex64]:
+    def to_matrix(self, block_size: Optional[int] = None) -> npt.NDArray[np.complex64]:
         """Compute the unitary matrix associated to this circuit.
 
+        The matrix is computed natively, by contracting the matrices of the
+        gates with the columns of the identity (see
+        :func:`~mpqp.execution.simulators.statevector.circuit_unitary`).
+        Barriers, breakpoints and noise models are ignored. To process the
+        matrix of a large circuit column by column without keeping it in
+        memory, use
+        :func:`~mpqp.execution.simulators.statevector.unitary_column_blocks`,
+        and for a sparse matrix, use :meth:`to_sparse_matrix`.
+
+        Args:
+            block_size: The number of columns computed at once. Smaller blocks
+                reduce the memory needed on top of the output matrix.
+
         Returns:
             a unitary matrix representing this circuit
 
+        Raises:
+            ValueError: If the circuit contains measurements or symbolic
+                parameters.
+
         Examples:
             >>> c = QCircuit([H(0), CNOT(0,1)])
             >>> pprint(c.to_matrix())
@@ -774,17 +1249,41 @@ class QCircuit:
              [0.70711, 0      , -0.70711, 0       ]]
 
         """
-        from qiskit import QuantumCircuit
-        from qiskit.quantum_info.operators import Operator
+        from mpqp.execution.simulators.statevector import circuit_unitary
 
-        qiskit_circuit = self.to_other_language(Language.QISKIT)
-        if TYPE_CHECKING:
-            assert isinstance(qiskit_circuit, QuantumCircuit)
-        matrix = Operator.from_circuit(qiskit_circuit).reverse_qargs().to_matrix()
-        if TYPE_CHECKING:
-            assert isinstance(matrix, np.ndarray)
+        # typed as the other matrices of the library (see ``Matrix`` in
+        # ``mpqp.tools.generics``), even though it is computed in double precision
+        return cast(npt.NDArray[np.complex64], circuit_unitary(self, block_size))
+
+    def to_sparse_matrix(self) -> csr_matrix:
+        """Compute the unitary matrix associated to this circuit, as a
+        ``scipy`` sparse matrix in the CSR format (see
+        :func:`~mpqp.execution.simulators.statevector.sparse_circuit_unitary`).
+        This is efficient for circuits mostly made of permutation and diagonal
+        gates. As for :meth:`to_matrix`, barriers, breakpoints and noise
+        models are ignored.
+
+        Returns:
+            The sparse unitary matrix representing this circuit.
+
+        Raises:
+            ValueError: If the circuit contains measurements or symbolic
+                parameters.
+
+        Example:
+            >>> sparse_matrix = QCircuit([X(0), CNOT(0, 1)]).to_sparse_matrix()
+            >>> sparse_matrix.nnz
+            4
+            >>> print(sparse_matrix.toarray().real)
+            [[0. 0. 1. 0.]
+             [0. 0. 0. 1.]
+             [0. 1. 0. 0.]
+             [1. 0. 0. 0.]]
+
+        """
+        from mpqp.execution.simulators.statevector import sparse_circuit_unitary
 
-        return matrix
+        return sparse_circuit_unitary(self)
 
     def inverse(self) -> QCircuit:
         """Generate the inverse (dagger) of this circuit.
@@ -821,8 +1320,7 @@ class QCircuit:
                  └───────────┘└───┘ ░
 
         """
-        dagger = deepcopy(self)
-        dagger.instructions = []
+        dagger = self._shallow_copy([])
         for instr in self.instructions:
             if isinstance(instr, Gate):
                 dagger.instructions.insert(0, instr.inverse())
@@ -834,6 +1332,8 @@ class QCircuit:
                     NonReversibleWarning,
                 )
                 dagger.instructions.append(instr)
+        if isinstance(self.instructions, CompactInstructions):
+            dagger.instructions = CompactInstructions(dagger.instructions)
         return dagger
 
     def to_gate(self) -> Gate:
@@ -923,7 +1423,15 @@ class QCircuit:
 
         """
         filter2 = Gate if gate is None else gate
-        return len([inst for inst in self.instructions if isinstance(inst, filter2)])
+
+        def count() -> int:
+            if isinstance(self.instructions, CompactInstructions):
+                return self.instructions.count_instances(filter2)
+            return len(
+                [inst for inst in self.instructions if isinstance(inst, filter2)]
+            )
+
+        return self._cached(("count_gates", filter2), count)
 
     @property
     def gates(self) -> list[Gate]:
@@ -938,7 +1446,7 @@ class QCircuit:
             [H(0), CNOT(0, 1)]
 
         """
-        return [instr for instr in self.instructions if isinstance(instr, Gate)]
+        return list(self._cached(Gate, lambda: self._instances(Gate)))
 
     @property
     def measurements(self) -> list[Measure]:
@@ -958,7 +1466,7 @@ class QCircuit:
             [1], shots=1000)]
 
         """
-        return [inst for inst in self.instructions if isinstance(inst, Measure)]
+        return list(self._cached(Measure, lambda: self._instances(Measure)))
 
     def without_measurements(self) -> QCircuit:
         """Provides a copy of this circuit with all the measurements removed.
@@ -984,11 +1492,13 @@ class QCircuit:
                       └───┘
 
         """
-        new_circuit = deepcopy(self)
+        if isinstance(self.instructions, CompactInstructions):
+            new_circuit = self._shallow_copy(self.instructions.without(Measure))
+        else:
+            new_circuit = self._shallow_copy(
+                [inst for inst in self.instructions if not isinstance(inst, Measure)]
+            )
         new_circuit._nb_cbits = 0
-        new_circuit.instructions = [
-            inst for inst in self.instructions if not isinstance(inst, Measure)
-        ]
 
         return new_circuit
 
@@ -998,11 +1508,11 @@ class QCircuit:
         Returns:
             A copy of this circuit with all the breakpoints removed.
         """
-        new_circuit = deepcopy(self)
-        new_circuit.instructions = [
-            inst for inst in self.instructions if not isinstance(inst, Breakpoint)
-        ]
-        return new_circuit
+        if isinstance(self.instructions, CompactInstructions):
+            return self._shallow_copy(self.instructions.without(Breakpoint))
+        return self._shallow_copy(
+            [inst for inst in self.instructions if not isinstance(inst, Breakpoint)]
+        )
 
     def without_noises(self) -> QCircuit:
         """Provides a copy of this circuit with all the noise models removed.
@@ -1032,10 +1542,30 @@ class QCircuit:
                        0  1
 
         """
-        new_circuit = deepcopy(self)
+        new_circuit = self._shallow_copy()
         new_circuit.noises = []
         return new_circuit
 
+    def to_compact(self) -> QCircuit:
+        """Provides a copy of this circuit storing its instructions in a
+        :class:`~mpqp.core.instruction_store.CompactInstructions`.
+
+        Returns:
+            A compact copy of this circuit.
+
+        Example:
+            >>> circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure()])
+            >>> compact = circuit.to_compact()
+            >>> type(compact.instructions).__name__
+            'CompactInstructions'
+            >>> compact == circuit
+            True
+
+        """
+        if isinstance(self.instructions, CompactInstructions):
+            return self._shallow_copy()
+        return self._shallow_copy(CompactInstructions(self.instructions))
+
     def pre_measure(self) -> QCircuit:
         circuit = QCircuit()
         circuit._set_nb_qubits_dynamic(self.nb_qubits)
@@ -1074,6 +1604,8 @@ class QCircuit:
         method will be used only for complex objects that are not tractable with
         OpenQASM (like hybrid structures).
 
+        The translations can be cached, see :mod:`~mpqp.core.translation_cache`.
+
         Args:
             language: Enum representing the target language.
             translation_warning: If `True`, a warning will be raised.
@@ -1127,11 +1659,30 @@ class QCircuit:
             circuits.
 
         """
+        from mpqp.core.translation_cache import translation_cache
+
+        return translation_cache.translate(
+            self,
+            language,
+            (translation_warning, skip_pre_measure, printing),
+            lambda: self._to_other_language(
+                language, translation_warning, skip_pre_measure, printing
+            ),
+        )
+
+    def _to_other_language(
+        self,
+        language: Language = Language.QISKIT,
+        translation_warning: bool = True,
+        skip_pre_measure: bool = False,
+        printing: bool = False,
+    ) -> QuantumCircuit | myQLM_Circuit | braket_Circuit | cirq_Circuit | str:
+        """See :meth:`to_other_language`, without the translation cache."""
         if not skip_pre_measure:
             circuit = self.without_measurements()
             circuit += self.pre_measure()
             circuit.add(self.measurements)
-            circuit_other = circuit.to_other_language(
+            circuit_other = circuit._to_other_language(
                 language,
                 translation_warning=translation_warning,
                 skip_pre_measure=True,
@@ -1156,17 +1707,27 @@ class QCircuit:
             if self.label is not None:
                 new_circ.name = self.label
 
-            for instruction in self.instructions:
+            # the native gates of a compact circuit share their templates, so
+            # each template is translated once (the template is kept alongside
+            # its translation so its id cannot be reused)
+            translated: dict[int, tuple[Instruction, Any]] = {}
+            compact = isinstance(self.instructions, CompactInstructions)
+            for instruction, qubits in iter_templates(self.instructions):
                 if isinstance(instruction, (Measure, Breakpoint)):
                     continue
-                options = (
-                    {"printing": printing}
-                    if isinstance(instruction, CustomGate)
-                    else {}
-                )
-                qiskit_inst = instruction.to_other_language(
-                    language, qiskit_parameters, **options
-                )
+                if compact and id(instruction) in translated:
+                    qiskit_inst = translated[id(instruction)][1]
+                else:
+                    options = (
+                        {"printing": printing}
+                        if isinstance(instruction, CustomGate)
+                        else {}
+                    )
+                    qiskit_inst = instruction.to_other_language(
+                        language, qiskit_parameters, **options
+                    )
+                    if compact:
+                        translated[id(instruction)] = (instruction, qiskit_inst)
                 if TYPE_CHECKING:
                     assert isinstance(
                         qiskit_inst, (CircuitInstruction, Operation, Operator)
@@ -1182,10 +1743,8 @@ class QCircuit:
                         instruction.label,
                     )
                 else:
-                    if isinstance(instruction, ControlledGate):
-                        qargs = instruction.controls + instruction.targets
-                    elif isinstance(instruction, Gate):
-                        qargs = instruction.targets
+                    if isinstance(instruction, Gate):
+                        qargs = qubits
                     elif isinstance(instruction, Barrier):
                         qargs = range(self.nb_qubits)
                     else:
@@ -1223,8 +1782,13 @@ class QCircuit:
             return new_circ
 
         elif language == Language.MY_QLM:
+            if len(self.variables()) != 0:
+                from mpqp.execution.providers.atos import symbolic_circuit_to_myqlm
+
+                # the variables become variables of the myQLM circuit
+                return symbolic_circuit_to_myqlm(self)
             cleaned_circuit = self.without_measurements()
-            qasm2_code = cleaned_circuit.to_other_language(
+            qasm2_code = cleaned_circuit._to_other_language(
                 Language.QASM2,
                 translation_warning=translation_warning,
                 skip_pre_measure=True,
@@ -1246,14 +1810,17 @@ class QCircuit:
                     if isinstance(inst, Gate)
                 )
             )
-            circuit = QCircuit(
-                [
-                    Id(qubit)
-                    for qubit in range(self.nb_qubits)
-                    if qubit not in used_qubits
-                ],
-                nb_qubits=self.nb_qubits,
-            ) + deepcopy(self)
+            circuit = (
+                QCircuit(
+                    [
+                        Id(qubit)
+                        for qubit in range(self.nb_qubits)
+                        if qubit not in used_qubits
+                    ],
+                    nb_qubits=self.nb_qubits,
+                )
+                + self
+            )
 
             from mpqp.execution.providers.aws import apply_noise_to_braket_circuit
 
@@ -1264,7 +1831,7 @@ class QCircuit:
                         "an error on AWS Braket side."
                     )
 
-            qasm3_code = circuit.to_other_language(
+            qasm3_code = circuit._to_other_language(
                 Language.QASM3,
                 translation_warning=translation_warning,
                 skip_pre_measure=True,
@@ -1272,6 +1839,14 @@ class QCircuit:
             self.gphase = circuit.gphase
             if TYPE_CHECKING:
                 assert isinstance(qasm3_code, str)
+            variables = self.variables()
+            if len(variables) != 0:
+                from mpqp.qasm.mpqp_to_qasm import qasm3_input_declarations
+
+                # the variables become ``FreeParameter`` of the Braket circuit
+                qasm3_code = qasm3_input_declarations(
+                    qasm3_code, sorted(variables, key=str)
+                )
             from mpqp.qasm.qasm_to_braket import qasm3_to_braket_Circuit
 
             return apply_noise_to_braket_circuit(
@@ -1290,13 +1865,13 @@ class QCircuit:
             for qubit in cirq_qubits:
                 cirq_circuit.append(I(qubit))
 
-            for instruction in self.instructions:
+            for instruction, qubits in iter_templates(self.instructions):
                 if isinstance(instruction, (ExpectationMeasure, Barrier, Breakpoint)):
                     continue
                 elif isinstance(instruction, (CustomGate, CustomControlledGate)):
                     custom_circuit = QCircuit(self.nb_qubits)
                     custom_circuit.add(instruction)
-                    qasm2_code = custom_circuit.to_other_language(
+                    qasm2_code = custom_circuit._to_other_language(
                         Language.QASM2,
                         translation_warning=translation_warning,
                         skip_pre_measure=True,
@@ -1308,21 +1883,12 @@ class QCircuit:
                     custom_cirq_circuit = qasm2_to_cirq_Circuit(qasm2_code)
                     cirq_circuit += custom_cirq_circuit
                     self.gphase += custom_circuit.gphase
-                elif isinstance(instruction, ControlledGate):
-                    targets = []
-                    for target in instruction.targets:
-                        targets.append(cirq_qubits[target])
-                    controls = []
-                    for control in instruction.controls:
-                        controls.append(cirq_qubits[control])
-                    cirq_instruction = instruction.to_other_language(Language.CIRQ)
-                    cirq_circuit.append(cirq_instruction.on(*controls, *targets))
                 else:
-                    targets = []
-                    for target in instruction.targets:
-                        targets.append(cirq_qubits[target])
+                    # controls first for the controlled gates
                     cirq_instruction = instruction.to_other_language(Language.CIRQ)
-                    cirq_circuit.append(cirq_instruction.on(*targets))
+                    cirq_circuit.append(
+                        cirq_instruction.on(*(cirq_qubits[qubit] for qubit in qubits))
+                    )
 
             return cirq_circuit
         elif language == Language.QASM2:
@@ -1332,19 +1898,11 @@ class QCircuit:
             self.gphase = gphase
             return qasm_str
         elif language == Language.QASM3:
-            qasm2_code = self.to_other_language(
-                Language.QASM2,
-                translation_warning=translation_warning,
-                skip_pre_measure=True,
-            )
-            if TYPE_CHECKING:
-                assert isinstance(qasm2_code, str)
-            from mpqp.qasm.open_qasm_2_and_3 import open_qasm_2_to_3
+            from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm3
 
-            qasm3_code = open_qasm_2_to_3(
-                qasm2_code, translation_warning=translation_warning
-            )
-            return qasm3_code
+            qasm_str, gphase = mpqp_to_qasm3(self, translation_warning)
+            self.gphase = gphase
+            return qasm_str
         else:
             raise NotImplementedError(f"Error: {language} is not supported")
 
@@ -1363,6 +1921,8 @@ class QCircuit:
         than the computational basis. We automatically add this adaptation as an
         intermediate circuit called ``pre_measure``.
 
+        The translations can be cached, see :mod:`~mpqp.core.translation_cache`.
+
         Args:
             device: representing the target device.
             translation_warning: If `True`, a warning will be raised.
@@ -1402,6 +1962,24 @@ class QCircuit:
             circuits.
 
         """
+        from mpqp.core.translation_cache import translation_cache
+
+        return translation_cache.translate(
+            self,
+            device,
+            (translation_warning, skip_pre_measure),
+            lambda: self._to_other_device(
+                device, translation_warning, skip_pre_measure
+            ),
+        )
+
+    def _to_other_device(
+        self,
+        device: AvailableDevice,
+        translation_warning: bool = True,
+        skip_pre_measure: bool = False,
+    ) -> QuantumCircuit | myQLM_Circuit | braket_Circuit | cirq_Circuit:
+        """See :meth:`to_other_device`, without the translation cache."""
         from mpqp.execution.devices import (
             ATOSDevice,
             AWSDevice,
@@ -1453,7 +2031,7 @@ class QCircuit:
                     f"than the one of the IBMSimulatedDevice ({device.value().num_qubits})."
                 )
 
-            qiskit_circuit = circuit.to_other_language(
+            qiskit_circuit = circuit._to_other_language(
                 Language.QISKIT, translation_warning, skip_pre_measure
             )
             if TYPE_CHECKING:
@@ -1506,7 +2084,7 @@ class QCircuit:
         elif isinstance(device, GOOGLEDevice):
             from cirq.circuits.circuit import Circuit as CirqCircuit
 
-            cirq_circuit = self.to_other_language(
+            cirq_circuit = self._to_other_language(
                 Language.CIRQ, translation_warning, skip_pre_measure
             )
 
@@ -1555,12 +2133,12 @@ class QCircuit:
                 cirq_device.validate_circuit(cirq_circuit)
             return cirq_circuit
         elif isinstance(device, AWSDevice):
-            aws_circuit = self.to_other_language(
+            aws_circuit = self._to_other_language(
                 Language.BRAKET, translation_warning, skip_pre_measure
             )
             return aws_circuit
         elif isinstance(device, ATOSDevice):
-            circuit = self.to_other_language(
+            circuit = self._to_other_language(
                 Language.MY_QLM, translation_warning, skip_pre_measure
             )
             return circuit
@@ -1658,15 +2236,15 @@ class QCircuit:
             ...      BasisMeasure(shots=1000)]
             ... )
             >>> print(c)  # doctest: +NORMALIZE_WHITESPACE
-                 ┌───────┐┌───┐┌───┐                             ┌─┐
-            q_0: ┤ Rx(θ) ├┤ X ├┤ H ├───────────■─────────────────┤M├───
-                 └───────┘└─┬─┘└───┘┌────────┐ │P(2**(1 - k)*pi) └╥┘┌─┐
-            q_1: ───────────■────■──┤ P(π/2) ├─■──────────────────╫─┤M├
-                               ┌─┴─┐└─┬───┬──┘        ┌─┐         ║ └╥┘
-            q_2: ──────────────┤ X ├──┤ X ├───────────┤M├─────────╫──╫─
-                               └───┘  └───┘           └╥┘         ║  ║
-            c: 3/══════════════════════════════════════╩══════════╩══╩═
-                                                       2          0  1
+                 ┌───────┐┌───┐┌───┐                            ┌─┐
+            q_0: ┤ Rx(θ) ├┤ X ├┤ H ├───────────■────────────────┤M├───
+                 └───────┘└─┬─┘└───┘┌────────┐ │P(π*2**(1 - k)) └╥┘┌─┐
+            q_1: ───────────■────■──┤ P(π/2) ├─■─────────────────╫─┤M├
+                               ┌─┴─┐└─┬───┬──┘       ┌─┐         ║ └╥┘
+            q_2: ──────────────┤ X ├──┤ X ├──────────┤M├─────────╫──╫─
+                               └───┘  └───┘          └╥┘         ║  ║
+            c: 3/═════════════════════════════════════╩══════════╩══╩═
+                                                      2          0  1
             >>> print(c.subs({theta: np.pi, k: 1}))  # doctest: +NORMALIZE_WHITESPACE
                  ┌───────┐┌───┐┌───┐                 ┌─┐
             q_0: ┤ Rx(π) ├┤ X ├┤ H ├───────────■─────┤M├───
@@ -1679,11 +2257,15 @@ class QCircuit:
                                                  2    0  1
 
         """
-        new_circuit = deepcopy(self)
-        new_circuit.instructions = [
-            inst.subs(values, remove_symbolic) for inst in self.instructions
-        ]
-        return new_circuit
+        if isinstance(self.instructions, CompactInstructions):
+            return self._shallow_copy(self.instructions.subs(values, remove_symbolic))
+        # the instructions without any sympy expression are shared
+        return self._shallow_copy(
+            [
+                (inst if _is_constant(inst) else inst.subs(values, remove_symbolic))
+                for inst in self.instructions
+            ]
+        )
 
     def pretty_print(self):
         """Provides a pretty print of the QCircuit.
@@ -1759,15 +2341,18 @@ class QCircuit:
         """
         from sympy import Expr
 
-        params: set[Basic] = set()
-        for inst in self.instructions:
-            if isinstance(inst, ParametrizedGate):
-                for param in inst.parameters:
-                    if isinstance(param, Expr):
-                        params.update(param.free_symbols)
-        return params
+        def variables() -> set[Basic]:
+            params: set[Basic] = set()
+            for inst, _ in iter_templates(self.instructions):
+                if isinstance(inst, ParametrizedGate):
+                    for param in inst.parameters:
+                        if isinstance(param, Expr):
+                            params.update(param.free_symbols)
+            return params
+
+        return set(self._cached("variables", variables))
 
     @property
     def breakpoints(self) -> list[Breakpoint]:
         """Returns the breakpoints of the circuit in order."""
-        return [inst for inst in self.instructions if isinstance(inst, Breakpoint)]
+        return list(self._cached(Breakpoint, lambda: self._instances(Breakpoint)))
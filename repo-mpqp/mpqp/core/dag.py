@@ -0,0 +1,431 @@
+"""A :class:`~mpqp.core.circuit.QCircuit` is a sequence of instructions, but
+most of the analyses of a circuit (depth, layers, scheduling, ...) only depend
+on the order of the instructions acting on each qubit. :class:`CircuitDAG`
+represents a circuit as a directed acyclic graph: each instruction is a node,
+linked to the previous and next instructions on each of its qubits (its
+*wires*).
+
+The DAG of a circuit is available through :attr:`QCircuit.dag
+<mpqp.core.circuit.QCircuit.dag>`. It is built once, and then kept up to date
+when instructions are added to the circuit, so the depth of the circuit is
+always known:
+
+    >>> circuit = QCircuit([H(0), CNOT(0, 1), H(2)])
+    >>> circuit.dag.depth
+    2
+    >>> circuit.add(CNOT(1, 2))
+    >>> circuit.dag.depth
+    3
+    >>> circuit.dag.layers()
+    [[H(0), H(2)], [CNOT(0, 1)], [CNOT(1, 2)]]
+
+The layering of the DAG keeps the order of the instructions on each qubit.
+:meth:`CircuitDAG.schedule` also uses the commutation relations between the
+gates (see :func:`commute`) to find shallower layerings."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional
+
+from typeguard import typechecked
+
+from mpqp.core.instruction.barrier import Barrier
+from mpqp.core.instruction.breakpoint import Breakpoint
+from mpqp.core.instruction.gates.controlled_gate import ControlledGate
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.gates.native_gates import (
+    CNOT,
+    CP,
+    CZ,
+    TOF,
+    CRk,
+    CRk_dagger,
+    Id,
+    P,
+    Rk,
+    Rk_dagger,
+    Rx,
+    Ry,
+    Rz,
+    S,
+    S_dagger,
+    T,
+    X,
+    Y,
+    Z,
+)
+from mpqp.core.instruction.instruction import Instruction
+
+_TARGET_BASES: dict[type[Gate], str] = {
+    Id: "I",
+    X: "X",
+    Rx: "X",
+    CNOT: "X",
+    TOF: "X",
+    Y: "Y",
+    Ry: "Y",
+    Z: "Z",
+    S: "Z",
+    S_dagger: "Z",
+    T: "Z",
+    Rz: "Z",
+    P: "Z",
+    Rk: "Z",
+    Rk_dagger: "Z",
+    CZ: "Z",
+    CP: "Z",
+    CRk: "Z",
+    CRk_dagger: "Z",
+}
+"""Basis in which the gates are diagonal on their targets (``"I"`` for the
+identity, which is diagonal in any basis). Controlled gates are diagonal in the
+computational basis on their controls."""
+
+
+def _bases(gate: Gate) -> dict[int, Optional[str]]:
+    """Basis in which a gate is diagonal, for each of its qubits (``None`` if
+    the gate is not known to be diagonal in a product basis)."""
+    basis = _TARGET_BASES.get(type(gate))
+    bases: dict[int, Optional[str]] = {target: basis for target in gate.targets}
+    if isinstance(gate, ControlledGate):
+        bases.update({control: "Z" if basis else None for control in gate.controls})
+    return bases
+
+
+def _commute(
+    first: Optional[dict[int, Optional[str]]],
+    second: Optional[dict[int, Optional[str]]],
+) -> bool:
+    """Non type-checked version of :func:`commute`, working on the
+    :func:`_bases` of the gates (``None`` standing for an instruction which
+    commutes with nothing)."""
+    if first is None or second is None:
+        return False
+    for qubit, basis in first.items():
+        if qubit not in second:
+            continue
+        other = second[qubit]
+        if basis == "I" or other == "I":
+            continue
+        if basis is None or basis != other:
+            return False
+    return True
+
+
+@typechecked
+def commute(first: Gate, second: Gate) -> bool:
+    """Checks if two gates commute, using a sufficient condition: the gates
+    commute if, on each qubit they share, both of them are diagonal in the same
+    basis (for instance :class:`~mpqp.core.instruction.gates.native_gates.Rz`
+    and the control of a
+    :class:`~mpqp.core.instruction.gates.native_gates.CNOT`, or two ``CNOT``
+    sharing their target). The gates are then simultaneously diagonalizable,
+    whatever their parameters.
+
+    Args:
+        first: The first gate.
+        second: The second gate.
+
+    Returns:
+        ``True`` if the gates are known to commute, ``False`` if they may not
+        commute.
+
+    Examples:
+        >>> commute(Rz(0.3, 0), CNOT(0, 1))
+        True
+        >>> commute(CNOT(0, 2), CNOT(1, 2))
+        True
+        >>> commute(X(1), CNOT(0, 1)), commute(X(0), CNOT(0, 1))
+        (True, False)
+        >>> commute(H(0), X(1))
+        True
+
+    """
+    if first.connections().isdisjoint(second.connections()):
+        return True
+    return _commute(_bases(first), _bases(second))
+
+
+class DAGNode:
+    """Node of a :class:`CircuitDAG`, wrapping an instruction of the circuit.
+
+    Args:
+        index: Position of the instruction in the circuit.
+        instruction: The instruction.
+        qubits: Qubits of the instruction, controls first for the controlled
+            gates.
+    """
+
+    __slots__ = ("index", "instruction", "qubits", "predecessors", "successors")
+
+    def __init__(self, index: int, instruction: Instruction, qubits: list[int]):
+        self.index = index
+        """Position of the instruction in the circuit."""
+        self.instruction = instruction
+        """The instruction of the node."""
+        self.qubits = qubits
+        """Qubits of the instruction, controls first for controlled gates."""
+        self.predecessors: list[DAGNode] = []
+        """Last instructions on the wires of the node before it."""
+        self.successors: list[DAGNode] = []
+        """First instructions on the wires of the node after it."""
+
+    def __repr__(self) -> str:
+        return f"DAGNode({self.index}, {self.instruction!r})"
+
+
+class CircuitDAG:
+    """Directed acyclic graph of the instructions of a circuit.
+
+    Each instruction is linked to the last instructions added on its qubits, so
+    adding an instruction (see :meth:`push`) only costs a few operations, and
+    the layering of the circuit is updated on the fly:
+
+    - a gate is placed in the first layer following the gates preceding it on
+      its qubits;
+    - a barrier separates the layers of the instructions before and after it;
+    - measures and breakpoints are not placed in the layers.
+
+    This class is not type-checked on purpose, its methods being called for
+    each instruction of potentially very large circuits.
+
+    Args:
+        instructions: The instructions of the circuit.
+        nb_qubits: The number of qubits of the circuit. The barriers and
+            breakpoints span all the qubits, and the wires are extended when
+            an instruction acts on more qubits.
+
+    Example:
+        >>> dag = CircuitDAG([H(0), CNOT(0, 1), Barrier(), X(1), BasisMeasure([0, 1])], 2)
+        >>> dag.depth, dag.layers()
+        (3, [[H(0)], [CNOT(0, 1)], [Barrier(), X(1)]])
+        >>> [node.instruction for node in dag.wire(0)]
+        [H(0), CNOT(0, 1), Barrier(), BasisMeasure([0, 1])]
+        >>> dag.nodes[1].successors
+        [DAGNode(2, Barrier())]
+
+    """
+
+    def __init__(self, instructions: Iterable[Instruction] = (), nb_qubits: int = 0):
+        self.nodes: list[DAGNode] = []
+        """Nodes of the instructions, in the order of the circuit."""
+        self.layer_indices: list[int] = []
+        """Layer of each node. The layers of the measures and breakpoints are
+        the ones they would be added to, but they are not part of the
+        layers."""
+        self.spans_register = False
+        """Whether a node spans the whole register (or depends on its size),
+        in which case the DAG cannot follow a change of the number of
+        qubits."""
+        self._wires: list[list[DAGNode]] = []
+        self._ends: list[int] = []
+        self._depth = 0
+        self._extend(nb_qubits)
+        for instruction in instructions:
+            self.push(instruction)
+
+    @property
+    def nb_qubits(self) -> int:
+        """Number of wires of the DAG."""
+        return len(self._wires)
+
+    @property
+    def depth(self) -> int:
+        """Depth of the circuit, the barriers (even at the beginning or the
+        end of the circuit) counting as a separation between two layers."""
+        return self._depth
+
+    def _extend(self, nb_qubits: int):
+        while len(self._wires) < nb_qubits:
+            self._wires.append([])
+            self._ends.append(0)
+
+    def push(self, instruction: Instruction) -> DAGNode:
+        """Adds an instruction at the end of the circuit.
+
+        Args:
+            instruction: The instruction to add.
+
+        Returns:
+            The node of the instruction.
+        """
+        if isinstance(instruction, (Barrier, Breakpoint)):
+            qubits = list(range(self.nb_qubits))
+        elif isinstance(instruction, ControlledGate):
+            qubits = instruction.controls + instruction.targets
+        else:
+            qubits = list(instruction.targets)
+        if isinstance(instruction, (Barrier, Breakpoint)) or (
+            instruction._dynamic  # pyright: ignore[reportPrivateUsage]
+        ):
+            self.spans_register = True
+        self._extend(max(qubits, default=-1) + 1)
+        node = DAGNode(len(self.nodes), instruction, qubits)
+
+        wires, ends = self._wires, self._ends
+        for qubit in qubits:
+            wire = wires[qubit]
+            if wire and wire[-1] not in node.predecessors:
+                node.predecessors.append(wire[-1])
+                wire[-1].successors.append(node)
+            wire.append(node)
+
+        layer = max((ends[qubit] for qubit in qubits), default=0)
+        if isinstance(instruction, Gate):
+            for qubit in qubits:
+                ends[qubit] = layer + 1
+            self._depth = max(self._depth, layer + 1)
+        elif isinstance(instruction, Barrier):
+            # the barrier does not occupy its layer, but the instructions after
+            # it cannot be placed before
+            for qubit in qubits:
+                ends[qubit] = layer
+            self._depth = max(self._depth, layer + 1)
+        self.nodes.append(node)
+        self.layer_indices.append(layer)
+        return node
+
+    def wire(self, qubit: int) -> list[DAGNode]:
+        """Nodes acting on a qubit.
+
+        Args:
+            qubit: The qubit of the wire.
+
+        Returns:
+            The nodes of the instructions acting on ``qubit``, in order.
+        """
+        return list(self._wires[qubit])
+
+    def layers(self) -> list[list[Instruction]]:
+        """Splits the gates and barriers of the circuit into layers, each gate
+        being placed in the first layer following the gates preceding it on its
+        qubits.
+
+        Returns:
+            The instructions of each layer, there are :attr:`depth` of them.
+        """
+        layers: list[list[Instruction]] = [[] for _ in range(self._depth)]
+        for node, layer in zip(self.nodes, self.layer_indices):
+            if isinstance(node.instruction, (Gate, Barrier)):
+                layers[layer].append(node.instruction)
+        return layers
+
+    def front_layer(self) -> list[DAGNode]:
+        """Nodes without predecessors, which can be executed first.
+
+        Returns:
+            The first nodes of the wires.
+        """
+        return [node for node in self.nodes if not node.predecessors]
+
+    def front_layers(self) -> Iterator[list[DAGNode]]:
+        """Iterates over the successive front layers of the DAG: the nodes of
+        a front layer only depend on the nodes of the previous front layers.
+
+        Yields:
+            The nodes of each front layer, in the order of the circuit.
+
+        Example:
+            >>> dag = CircuitDAG([H(0), H(1), CNOT(0, 1), X(2), BasisMeasure([0, 1, 2])])
+            >>> [[node.index for node in front] for front in dag.front_layers()]
+            [[0, 1, 3], [2], [4]]
+
+        """
+        remaining = [len(node.predecessors) for node in self.nodes]
+        front = self.front_layer()
+        while front:
+            yield front
+            next_front = []
+            for node in front:
+                for successor in node.successors:
+                    remaining[successor.index] -= 1
+                    if remaining[successor.index] == 0:
+                        next_front.append(successor)
+            front = sorted(next_front, key=lambda node: node.index)
+
+    def schedule(self, commutation: bool = True) -> list[list[Instruction]]:
+        """Splits the gates and barriers of the circuit into layers, like
+        :meth:`layers`, but a gate can also be placed before the preceding
+        gates it commutes with (see :func:`commute`). The gates are never moved
+        across barriers or measures.
+
+        Args:
+            commutation: If ``False``, the commutation relations are ignored,
+                and the result is the same as :meth:`layers`.
+
+        Returns:
+            The instructions of each layer.
+
+        Example:
+            >>> dag = CircuitDAG([H(1), CNOT(0, 1), Rz(0.5, 0), CNOT(0, 2)])
+            >>> dag.layers()
+            [[H(1)], [CNOT(0, 1)], [Rz(0.5, 0)], [CNOT(0, 2)]]
+            >>> dag.schedule()
+            [[H(1), Rz(0.5, 0)], [CNOT(0, 1)], [CNOT(0, 2)]]
+
+        """
+        nb_qubits = self.nb_qubits
+        # on each wire, the instructions are summarized by their bases (None if
+        # nothing can be moved across them) and the first layer following them
+        # and all the instructions before them on the wire, consecutive single
+        # qubit gates diagonal in the same basis being merged
+        history: list[list[list[Any]]] = [[] for _ in range(nb_qubits)]
+        tops = [0] * nb_qubits
+        taken: list[dict[int, int]] = [{} for _ in range(nb_qubits)]
+        placed: list[tuple[int, int, Instruction]] = []
+
+        def first_free(qubit: int, layer: int) -> int:
+            path = []
+            nexts = taken[qubit]
+            while layer in nexts:
+                path.append(layer)
+                layer = nexts[layer]
+            for visited in path:
+                nexts[visited] = layer
+            return layer
+
+        for node in self.nodes:
+            instruction, qubits = node.instruction, node.qubits
+            if isinstance(instruction, Gate):
+                bases = _bases(instruction) if commutation else None
+                layer = 0
+                for qubit in qubits:
+                    for entry_bases, bound in reversed(history[qubit]):
+                        if not _commute(bases, entry_bases):
+                            layer = max(layer, bound)
+                            break
+                while True:
+                    free = max(first_free(qubit, layer) for qubit in qubits)
+                    if free == layer:
+                        break
+                    layer = free
+                for qubit in qubits:
+                    taken[qubit][layer] = layer + 1
+                    tops[qubit] = max(tops[qubit], layer + 1)
+                    wire = history[qubit]
+                    if (
+                        len(qubits) == 1
+                        and bases is not None
+                        and wire
+                        and wire[-1][0] == bases
+                    ):
+                        wire[-1][1] = max(wire[-1][1], layer + 1)
+                    else:
+                        wire.append([bases, max(layer + 1, wire[-1][1] if wire else 0)])
+                placed.append((layer, node.index, instruction))
+            elif isinstance(instruction, Barrier):
+                layer = max((tops[qubit] for qubit in qubits), default=0)
+                for qubit in qubits:
+                    tops[qubit] = layer
+                    history[qubit].append([None, layer])
+                placed.append((layer, node.index, instruction))
+            else:
+                for qubit in qubits:
+                    history[qubit].append([None, tops[qubit]])
+
+        layers: list[list[Instruction]] = [
+            [] for _ in range(max((layer + 1 for layer, _, _ in placed), default=0))
+        ]
+        for layer, _, instruction in sorted(placed, key=lambda item: item[:2]):
+            layers[layer].append(instruction)
+        return layers
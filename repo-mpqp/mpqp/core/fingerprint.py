@@ -0,0 +1,153 @@
+"""Structural fingerprints of circuits, observables and jobs.
+
+Comparing two circuits with ``==`` serializes both of them, and the local
+storage compares the ``repr`` of the circuits. A fingerprint is a short hash
+of the structure of an object (its gates, their qubits and parameters, its
+measures and noise models), so that identical objects can be recognized in
+constant time once their fingerprints are known:
+
+    >>> circuit = QCircuit([H(0), CNOT(0, 1), Rz(0.5, 1)])
+    >>> circuit.fingerprint() == QCircuit([H(0), CNOT(0, 1), Rz(0.5, 1)]).fingerprint()
+    True
+    >>> circuit.fingerprint() == QCircuit([H(0), CNOT(0, 1), Rz(0.6, 1)]).fingerprint()
+    False
+
+The numerical parameters are rounded to :data:`DECIMALS` decimals before being
+hashed, so the fingerprint does not depend on rounding errors (except for the
+rare values lying on a rounding boundary). The labels are not part of the
+fingerprint. Symbolic parameters are hashed through their ``sympy``
+representation."""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from typing import TYPE_CHECKING, Any, Iterable, cast
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from mpqp.core.instruction.instruction import Instruction
+    from mpqp.noise.noise_model import NoiseModel
+
+
+DECIMALS = 10
+"""Default number of decimals kept of the numerical values hashed in a
+fingerprint."""
+
+
+def new_hasher() -> Any:
+    """Hash object used for the fingerprints (``blake2b``, with a 16 bytes
+    digest)."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def array_token(values: Any, decimals: int = DECIMALS) -> bytes:
+    """Bytes representing an array of numbers, rounded to ``decimals``
+    decimals. Arrays of symbolic values are represented by their ``repr``.
+
+    Args:
+        values: The numbers to represent (any array-like).
+        decimals: Number of decimals kept.
+
+    Returns:
+        The representation of the array, including its shape.
+
+    Example:
+        >>> array_token([0.1 + 0.2]) == array_token([0.3])
+        True
+
+    """
+    array = np.asarray(values)
+    try:
+        numbers = np.round(array.astype(np.complex128), decimals)
+    except TypeError:
+        return repr(array.tolist()).encode()
+    # adding 0 merges the negative zeros with the positive ones
+    numbers = numbers + 0.0
+    return struct.pack(f"{array.ndim}q", *array.shape) + numbers.tobytes()
+
+
+def parameter_token(parameter: Any, decimals: int = DECIMALS) -> bytes:
+    """Bytes representing a gate parameter, numerical or symbolic."""
+    from sympy import Basic, srepr
+
+    if isinstance(parameter, Basic) and len(parameter.free_symbols) != 0:
+        return srepr(parameter).encode()
+    # the sympy expressions without variables are numbers
+    return array_token(complex(cast(complex, parameter)), decimals)
+
+
+def instruction_token(instruction: Instruction, decimals: int = DECIMALS) -> bytes:
+    """Bytes representing an instruction, without its qubits for the gates
+    (see :func:`~mpqp.core.instruction_store.iter_templates`).
+
+    Args:
+        instruction: The instruction to represent.
+        decimals: Number of decimals kept of the numerical values.
+
+    Returns:
+        The representation of the instruction.
+    """
+    from mpqp.core.instruction.barrier import Barrier
+    from mpqp.core.instruction.breakpoint import Breakpoint
+    from mpqp.core.instruction.gates.custom_controlled_gate import (
+        CustomControlledGate,
+    )
+    from mpqp.core.instruction.gates.gate import Gate
+    from mpqp.core.instruction.gates.native_gates import NativeGate
+    from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
+    from mpqp.core.instruction.measurement.basis import VariableSizeBasis
+    from mpqp.core.instruction.measurement.basis_measure import BasisMeasure
+    from mpqp.core.instruction.measurement.expectation_value import (
+        ExpectationMeasure,
+    )
+
+    parts = [type(instruction).__name__.encode()]
+    if isinstance(instruction, NativeGate):
+        if isinstance(instruction, ParametrizedGate):
+            parts += [parameter_token(p, decimals) for p in instruction.parameters]
+    elif isinstance(instruction, CustomControlledGate):
+        parts.append(instruction_token(instruction.non_controlled_gate, decimals))
+        parts.append(str(len(instruction.controls)).encode())
+    elif isinstance(instruction, Gate):
+        parts.append(array_token(instruction.to_canonical_matrix(), decimals))
+    elif isinstance(instruction, (Barrier, Breakpoint)):
+        parts.append(repr(instruction.targets).encode())
+    elif isinstance(instruction, BasisMeasure):
+        basis = instruction.basis
+        parts.append(
+            repr(
+                [instruction.targets, instruction.c_targets, instruction.shots]
+            ).encode()
+        )
+        parts.append(type(basis).__name__.encode())
+        if isinstance(basis, VariableSizeBasis):
+            parts.append(str(basis.nb_qubits).encode())
+        else:
+            parts.append(array_token(basis.basis_vectors, decimals))
+    elif isinstance(instruction, ExpectationMeasure):
+        parts.append(repr([instruction.targets, instruction.shots]).encode())
+        parts += [obs.fingerprint(decimals).encode() for obs in instruction.observables]
+    else:
+        parts.append(repr(instruction).encode())
+    return b"|".join(parts)
+
+
+def update(hasher: Any, *tokens: bytes) -> None:
+    """Feeds tokens to a hash object, each one prefixed by its length so that
+    the concatenation is unambiguous."""
+    for token in tokens:
+        hasher.update(struct.pack("q", len(token)))
+        hasher.update(token)
+
+
+def noise_token(noise: NoiseModel) -> bytes:
+    """Bytes representing a noise model."""
+    return f"{noise!r}{noise.targets}".encode()
+
+
+def qubits_token(qubits: Iterable[int]) -> bytes:
+    """Bytes representing the qubits an instruction acts on."""
+    qubits = list(qubits)
+    return struct.pack(f"{len(qubits)}q", *qubits)
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from functools import reduce
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from warnings import warn
 
 import numpy as np
@@ -17,6 +16,9 @@ from mpqp.tools.errors import NumberQubitsWarning
 from mpqp.tools.generics import Matrix
 from mpqp.tools.maths import matrix_eq
 
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+
 
 @typechecked
 class Gate(Instruction, ABC):
@@ -46,6 +48,10 @@ class Gate(Instruction, ABC):
         """Return the matricial semantics to this gate. Considering connections'
         order and position, in contrast with :meth:`~Gate.to_canonical_matrix`.
 
+        The canonical matrix is extended with the identity on the qubits the
+        gate does not act on, and its rows and columns are then reordered by
+        a single permutation of the qubits.
+
         Args:
             desired_gate_size: The total number for qubits needed for the gate
                 representation. If not provided, the minimum number of qubits
@@ -54,6 +60,10 @@ class Gate(Instruction, ABC):
         Returns:
             A numpy array representing the unitary matrix of the gate.
 
+        Raises:
+            ValueError: If ``desired_gate_size`` is too small to contain the
+                gate.
+
         Example:
             >>> m = UnitaryMatrix(
             ...     np.array([[0, 0, 0, 1], [0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0]])
@@ -79,46 +89,87 @@ class Gate(Instruction, ABC):
              [0, 0, 0, 0, 0, 1, 0, 0]]
 
         """
-        from .native_gates import SWAP
+        return self._embed_canonical_matrix(self.targets, desired_gate_size)
+
+    def to_sparse_matrix(self, desired_gate_size: int = 0) -> csr_matrix:
+        """Return the matricial semantics of this gate as :meth:`to_matrix`,
+        but as a ``scipy`` sparse matrix in the CSR format. Only the non-zero
+        elements are computed, so this is useful for registers too large for a
+        dense matrix.
 
+        Args:
+            desired_gate_size: The total number for qubits needed for the gate
+                representation. If not provided, the minimum number of qubits
+                required to generate the matrix will be used.
+
+        Returns:
+            The sparse unitary matrix of the gate.
+
+        Raises:
+            ValueError: If ``desired_gate_size`` is too small to contain the
+                gate, or if the gate contains symbolic parameters.
+
+        Example:
+            >>> print(CNOT(2, 0).to_sparse_matrix().nnz)
+            8
+            >>> np.allclose(CNOT(2, 0).to_sparse_matrix().toarray(), CNOT(2, 0).to_matrix())
+            True
+
+        """
+        return self._embed_sparse_matrix(self.targets, desired_gate_size)
+
+    def _embedding(
+        self, qubits: list[int], desired_gate_size: int
+    ) -> tuple[list[int], int]:
+        """Positions of ``qubits`` in the register of the matrix of the gate,
+        and the size of this register (see :meth:`to_matrix`)."""
         first_connection = min(self.connections())
         last_connection = max(self.connections())
-        connections_offset = 0
-
         if desired_gate_size == 0:
-            desired_gate_size = last_connection - first_connection + 1
-            connections_offset = first_connection
-
-        if connections_offset + desired_gate_size < last_connection:
-            raise ValueError(f"`desired_gate_size` must be at least {last_connection}")
-
-        preceding_eyes = np.eye(2 ** (first_connection - connections_offset))
-        following_eyes = np.eye(
-            2
-            ** (
-                desired_gate_size
-                - len(self.targets)
-                - (first_connection - connections_offset)
+            offset = first_connection
+            size = last_connection - first_connection + 1
+        elif desired_gate_size <= last_connection:
+            raise ValueError(
+                f"`desired_gate_size` must be at least {last_connection + 1}"
             )
+        else:
+            offset = 0
+            size = desired_gate_size
+        return [qubit - offset for qubit in qubits], size
+
+    def _embed_canonical_matrix(
+        self, qubits: list[int], desired_gate_size: int
+    ) -> Matrix:
+        """Computes the matrix of :meth:`to_matrix` from the canonical matrix,
+        acting on ``qubits`` in this order.
+
+        The canonical matrix is kroned with the identity of the remaining
+        qubits, reshaped into a tensor with one axis per qubit, and these axes
+        are transposed to the order of the register. The cost is linear in the
+        size of the result, instead of the products of ``SWAP`` matrices
+        needed otherwise.
+        """
+        positions, size = self._embedding(qubits, desired_gate_size)
+        others = [qubit for qubit in range(size) if qubit not in positions]
+        matrix = np.kron(self.to_canonical_matrix(), np.eye(2 ** len(others)))
+        axes = list(np.argsort(positions + others))
+        return (
+            matrix.reshape((2,) * (2 * size))
+            .transpose(axes + [size + axis for axis in axes])
+            .reshape(2**size, 2**size)
         )
-        result = np.kron(
-            preceding_eyes, np.kron(self.to_canonical_matrix(), following_eyes)
-        )
-
-        permutations = set(
-            tuple(sorted((origin + first_connection, destination)))
-            for (origin, destination) in enumerate(self.targets)
-            if origin + first_connection != destination
-        )
-
-        swaps = [
-            SWAP(o_index - connections_offset, d_index - connections_offset).to_matrix(
-                desired_gate_size
-            )
-            for o_index, d_index in permutations
-        ]
 
-        return reduce(np.dot, swaps[::-1] + [result] + swaps)
+    def _embed_sparse_matrix(
+        self, qubits: list[int], desired_gate_size: int
+    ) -> csr_matrix:
+        """Computes the matrix of :meth:`to_sparse_matrix`, the gate acting on
+        ``qubits`` in this order, by placing the non-zero elements of its
+        matrix (see
+        :func:`~mpqp.execution.simulators.statevector.sparse_operator`)."""
+        from mpqp.execution.simulators.statevector import gate_matrix, sparse_operator
+
+        positions, size = self._embedding(qubits, desired_gate_size)
+        return sparse_operator(gate_matrix(self), positions, size)
 
     @abstractmethod
     def to_canonical_matrix(self) -> Matrix:
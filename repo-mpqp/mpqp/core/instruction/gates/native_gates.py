@@ -17,11 +17,11 @@ import inspect
 import sys
 from abc import abstractmethod
 from numbers import Integral
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, cast
 
 if TYPE_CHECKING:
     from sympy import Expr
-    from qiskit.circuit import Parameter
+    from qiskit.circuit import Parameter, ParameterExpression
 
 import numpy as np
 import numpy.typing as npt
@@ -44,13 +44,15 @@ from mpqp.tools.maths import cos, exp, sin
 @typechecked
 def _qiskit_parameter_adder(
     param: Expr | float, qiskit_parameters: set["Parameter"]
-) -> "Parameter | float | int":
+) -> "ParameterExpression | float | int":
     """To avoid having several parameters in qiskit for the same value we keep
     track of them in a set. This function takes care of this, this way you can
     directly call `QiskitGate(_qiskit_parameter_adder(<param>, <q_params_set>))`
     without having to manually take care of the de-duping.
 
-    This process is a form of memoization.
+    This process is a form of memoization. An expression is translated to the
+    same expression of the parameters of its variables, so that the circuit
+    can be bound variable by variable.
 
     Args:
         param: The parameter you need for your qiskit gate.
@@ -60,8 +62,37 @@ def _qiskit_parameter_adder(
     Returns:
         The memoized parameter
     """
-    from sympy import Expr
+    from sympy import Expr, Symbol
+
+    if isinstance(param, Expr) and not isinstance(param, Symbol):
+        if len(param.free_symbols) == 0:
+            return float(param)
+        import math
+
+        from qiskit.circuit import ParameterExpression
+        from sympy import lambdify
+
+        def function(name: str):
+            return lambda x: (
+                getattr(x, name)()
+                if isinstance(x, ParameterExpression)
+                else getattr(math, name)(x)
+            )
 
+        variables = sorted(param.free_symbols, key=str)
+        return lambdify(
+            variables,
+            param,
+            [
+                {name: function(name) for name in ("sin", "cos", "tan", "exp", "log")},
+                "math",
+            ],
+        )(
+            *(
+                _qiskit_parameter_adder(cast("Expr", var), qiskit_parameters)
+                for var in variables
+            )
+        )
     if isinstance(param, Expr):
         name = str(param)
         previously_set_param = list(
@@ -248,12 +279,12 @@ class RotationGate(NativeGate, ParametrizedGate, SimpleClassReprABC):
         elif language == Language.CIRQ:
             return self.cirq_gate(theta)
         if language == Language.QASM2:
-            from mpqp.qasm.mpqp_to_qasm import float_to_qasm_str
+            from mpqp.qasm.mpqp_to_qasm import parameter_to_qasm_str
 
             instruction_str = self.qasm2_gate
             instruction_str += (
                 "("
-                + ",".join(float_to_qasm_str(float(param)) for param in self.parameters)
+                + ",".join(parameter_to_qasm_str(param) for param in self.parameters)
                 + ")"
             )
 
@@ -919,52 +950,6 @@ class SWAP(InvolutionGate, NoParameterGate):
     )
     """Size of the gate."""
 
-    def to_matrix(self, desired_gate_size: int = 0) -> npt.NDArray[np.complex64]:
-        """Constructs the matrix representation of a SWAP gate for two qubits.
-
-        Args:
-            nb_qubits: The total number for qubits gate representation. If not
-                provided, the minimum number of qubits required to generate the
-                matrix will be used.
-
-        Returns:
-            The matrix representation of the SWAP gate.
-        """
-        control, target = self.targets[0], self.targets[1]
-
-        max_qubits = max(control, target) + 1
-        if desired_gate_size != 0 and desired_gate_size < max_qubits:
-            raise ValueError(
-                f"The number of qubits in the system must be at least {max_qubits}."
-            )
-
-        nb_qubits_swap = abs(control - target) + 1
-        min_nb_qubits = min(control, target)
-        swap_matrix = np.eye(2**nb_qubits_swap, dtype=np.complex64)
-
-        for i in range(2**nb_qubits_swap):
-            binary_state = list(format(i, f"0{nb_qubits_swap}b"))
-
-            (
-                binary_state[nb_qubits_swap - control + min_nb_qubits - 1],
-                binary_state[nb_qubits_swap - target + min_nb_qubits - 1],
-            ) = (
-                binary_state[nb_qubits_swap - target + min_nb_qubits - 1],
-                binary_state[nb_qubits_swap - control + min_nb_qubits - 1],
-            )
-
-            swapped_index = int("".join(binary_state), 2)
-
-            swap_matrix[i, i] = 0
-            swap_matrix[swapped_index, i] = 1
-
-        if desired_gate_size != 0:
-            swap_matrix = np.kron(np.eye(2**min_nb_qubits), swap_matrix)
-            swap_matrix = np.kron(
-                swap_matrix, np.eye(2 ** (desired_gate_size - max_qubits))
-            )
-        return swap_matrix
-
 
 class U(NativeGate, ParametrizedGate, SingleQubitGate):
     r"""Generic one qubit unitary gate. It is parametrized by 3 Euler angles.
@@ -1002,6 +987,10 @@ class U(NativeGate, ParametrizedGate, SingleQubitGate):
         from cirq.ops.common_gates import ry as cirq_ry, rz as cirq_rz
         from cirq.ops.global_phase_op import GlobalPhaseGate
         from cirq.ops.raw_types import Qid
+        from cirq.protocols.resolve_parameters import (
+            is_parameterized,
+            parameter_names,
+        )
 
         class CirqUGate(QasmUGate):  # pyright: ignore[reportUntypedBaseClass]
             # 3M-TODO: find better way to define the class outside
@@ -1029,6 +1018,32 @@ class U(NativeGate, ParametrizedGate, SingleQubitGate):
                     cirq_rz(self.phi).on(q),
                 ]
 
+            # the parameters can be symbolic, in which case cirq needs to know
+            # how to resolve them (for instance in sweeps)
+            def _is_parameterized_(self) -> bool:
+                return any(
+                    is_parameterized(param)
+                    for param in (self.theta, self.phi, self.lmda)
+                )
+
+            def _parameter_names_(self) -> set[str]:
+                return set().union(
+                    *(
+                        parameter_names(param)
+                        for param in (self.theta, self.phi, self.lmda)
+                    )
+                )
+
+            def _resolve_parameters_(
+                self, resolver, recursive: bool  # pyright: ignore
+            ):
+                return CirqUGate(
+                    *(
+                        resolver.value_of(param, recursive)
+                        for param in (self.theta, self.phi, self.lmda)
+                    )
+                )
+
         return CirqUGate
 
     qlm_aqasm_keyword = "U"
@@ -1095,12 +1110,12 @@ class U(NativeGate, ParametrizedGate, SingleQubitGate):
         elif language == Language.CIRQ:
             return self.cirq_gate(self.theta, self.phi, self.gamma)
         elif language == Language.QASM2:
-            from mpqp.qasm.mpqp_to_qasm import float_to_qasm_str
+            from mpqp.qasm.mpqp_to_qasm import parameter_to_qasm_str
 
             instruction_str = self.qasm2_gate
             instruction_str += (
                 "("
-                + ",".join(float_to_qasm_str(float(param)) for param in self.parameters)
+                + ",".join(parameter_to_qasm_str(param) for param in self.parameters)
                 + ")"
             )
             qubits = ",".join([f"q[{j}]" for j in self.targets])
@@ -1346,12 +1361,10 @@ class Rk(RotationGate, SingleQubitGate):
         qiskit_parameters: Optional[set["Parameter"]] = None,
     ):
         if language == Language.QASM2:
-            from mpqp.qasm.mpqp_to_qasm import float_to_qasm_str
+            from mpqp.qasm.mpqp_to_qasm import parameter_to_qasm_str
 
             instruction_str = self.qasm2_gate
-            instruction_str += (
-                f"({float_to_qasm_str(2 * np.pi / (2 ** float(self.k)))})"
-            )
+            instruction_str += f"({parameter_to_qasm_str(self.theta)})"
 
             qubits = ",".join([f"q[{j}]" for j in self.targets])
 
@@ -1429,12 +1442,10 @@ class Rk_dagger(RotationGate, SingleQubitGate):
         qiskit_parameters: Optional[set["Parameter"]] = None,
     ):
         if language == Language.QASM2:
-            from mpqp.qasm.mpqp_to_qasm import float_to_qasm_str
+            from mpqp.qasm.mpqp_to_qasm import parameter_to_qasm_str
 
             instruction_str = self.qasm2_gate
-            instruction_str += (
-                f"({float_to_qasm_str(-2 * np.pi / (2 ** float(self.k)))})"
-            )
+            instruction_str += f"({parameter_to_qasm_str(self.theta)})"
 
             qubits = ",".join([f"q[{j}]" for j in self.targets])
 
@@ -1635,12 +1646,10 @@ class CRk(RotationGate, ControlledGate):
         qiskit_parameters: Optional[set["Parameter"]] = None,
     ):
         if language == Language.QASM2:
-            from mpqp.qasm.mpqp_to_qasm import float_to_qasm_str
+            from mpqp.qasm.mpqp_to_qasm import parameter_to_qasm_str
 
             instruction_str = self.qasm2_gate
-            instruction_str += (
-                f"({float_to_qasm_str(2 * np.pi / (2 ** float(self.k)))})"
-            )
+            instruction_str += f"({parameter_to_qasm_str(self.theta)})"
 
             qubits = ",".join([f"q[{j}]" for j in self.controls]) + ","
             qubits += ",".join([f"q[{j}]" for j in self.targets])
@@ -1746,12 +1755,10 @@ class CRk_dagger(RotationGate, ControlledGate):
         qiskit_parameters: Optional[set["Parameter"]] = None,
     ):
         if language == Language.QASM2:
-            from mpqp.qasm.mpqp_to_qasm import float_to_qasm_str
+            from mpqp.qasm.mpqp_to_qasm import parameter_to_qasm_str
 
             instruction_str = self.qasm2_gate
-            instruction_str += (
-                f"({float_to_qasm_str(-2 * np.pi / (2 ** float(self.k)))})"
-            )
+            instruction_str += f"({parameter_to_qasm_str(self.theta)})"
 
             qubits = ",".join([f"q[{j}]" for j in self.controls]) + ","
             qubits += ",".join([f"q[{j}]" for j in self.targets])
@@ -308,15 +308,25 @@ class ComputationalBasis(VariableSizeBasis):
     """
 
     def __init__(self, nb_qubits: Optional[int] = None):
+        self._basis_vectors: Optional[list[npt.NDArray[np.complex64]]] = None
         super().__init__([np.array([1, 0]), np.array([0, 1])], nb_qubits=nb_qubits)
 
+    @property
+    def basis_vectors(self) -> list[npt.NDArray[np.complex64]]:
+        # the vectors are only built when needed, since they have `4^n`
+        # coefficients, way too many for the simulators working on many qubits
+        if self._basis_vectors is None:
+            self._basis_vectors = list(np.eye(2**self.nb_qubits, dtype=np.complex64))
+        return self._basis_vectors
+
+    @basis_vectors.setter
+    def basis_vectors(self, basis_vectors: list[npt.NDArray[np.complex64]]):
+        self._basis_vectors = basis_vectors
+
     def set_size(self, nb_qubits: int):
         if self.nb_qubits == nb_qubits:
             return
-        self.basis_vectors = [
-            np.array([0] * i + [1] + [0] * (2**nb_qubits - 1 - i), dtype=np.complex64)
-            for i in range(2**nb_qubits)
-        ]
+        self._basis_vectors = None
         self.nb_qubits = nb_qubits
 
     def to_computational(self) -> QCircuit:
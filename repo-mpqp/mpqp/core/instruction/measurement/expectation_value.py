@@ -151,6 +151,22 @@ class Observable:
         pauli_string = copy.deepcopy(self._pauli_string)
         return pauli_string
 
+    @property
+    def has_pauli_string(self) -> bool:
+        """Whether the PauliString representation of the observable is already
+        known, in which case :attr:`pauli_string` does not need to decompose
+        the matrix of the observable.
+
+        Examples:
+            >>> from mpqp.measures import X, Z
+            >>> Observable(X @ Z).has_pauli_string
+            True
+            >>> Observable(np.array([[3, -1], [-1, 8]])).has_pauli_string
+            False
+
+        """
+        return self._pauli_string is not None
+
     @property
     def diagonal_elements(self) -> npt.NDArray[np.float64]:
         """The diagonal elements of the matrix representing the observable (diagonal or not)."""
@@ -235,6 +251,60 @@ class Observable:
 
         return self._is_diagonal
 
+    def fingerprint(self, decimals: Optional[int] = None) -> str:
+        """Hash of the observable, see :mod:`~mpqp.core.fingerprint`. The label
+        is not part of the fingerprint.
+
+        The observable is hashed in the form it was defined in (diagonal
+        elements, matrix or Pauli string), so the same observable defined in
+        two different ways can have two different fingerprints.
+
+        Args:
+            decimals: Number of decimals of the coefficients taken into account,
+                defaults to :data:`~mpqp.core.fingerprint.DECIMALS`.
+
+        Returns:
+            The fingerprint, as an hexadecimal string.
+
+        Example:
+            >>> from mpqp.measures import X, Z
+            >>> obs = Observable(2 * X @ Z)
+            >>> obs.fingerprint() == Observable(2 * X @ Z, "label").fingerprint()
+            True
+            >>> obs.fingerprint() == Observable(2 * Z @ X).fingerprint()
+            False
+
+        """
+        from mpqp.core.fingerprint import (
+            DECIMALS,
+            array_token,
+            new_hasher,
+            parameter_token,
+            update,
+        )
+
+        if decimals is None:
+            decimals = DECIMALS
+        hasher = new_hasher()
+        update(hasher, str(self.nb_qubits).encode())
+        if self.is_diagonal:
+            update(hasher, b"diagonal", array_token(self.diagonal_elements, decimals))
+        elif self._matrix is not None:
+            update(hasher, b"matrix", array_token(self._matrix, decimals))
+        else:
+            update(hasher, b"pauli")
+            # the order of the monomials of a simplified Pauli string is not
+            # deterministic
+            for atoms, coef in sorted(
+                (
+                    "".join(map(str, monomial.atoms)).encode(),
+                    parameter_token(monomial.coef, decimals),
+                )
+                for monomial in self.pauli_string.monomials
+            ):
+                update(hasher, atoms, coef)
+        return hasher.hexdigest()
+
     def __repr__(self) -> str:
         if self._is_diagonal and self._diag_elements is not None:
             data = f"{np.array2string(self.diagonal_elements, separator=', ')}"
@@ -522,7 +592,5 @@ class ExpectationMeasure(Measure):
         return {
             attr_name: getattr(self, attr_name)
             for attr_name in dir(self)
-            if attr_name not in {}
-            and not attr_name.startswith("__")
-            and not callable(getattr(self, attr_name))
+            if not attr_name.startswith("__") and not callable(getattr(self, attr_name))
         }
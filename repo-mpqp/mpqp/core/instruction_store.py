@@ -0,0 +1,748 @@
+"""Very large circuits (Trotterized Hamiltonians, arithmetic circuits, ...) can
+contain millions of gates. Stored as a list of
+:class:`~mpqp.core.instruction.gates.gate.Gate`, each gate comes with its own
+targets list, label, definition and parameters, which makes such circuits
+heavy in memory and slow to traverse.
+
+:class:`CompactInstructions` stores the native gates of a circuit as a
+struct of arrays instead: one opcode per instruction, the qubits of all the
+instructions in a flat array indexed by offsets, and the parameters in a
+table. The other instructions (measurements, barriers, custom gates, ...) are
+kept as is. It behaves as a list of instructions, the gates being
+materialized on access, so it can be used through the usual
+:class:`~mpqp.core.circuit.QCircuit` API:
+
+    >>> circuit = QCircuit([H(0), CNOT(0, 1), Rz(0.5, 1), BasisMeasure()], compact=True)
+    >>> type(circuit.instructions).__name__
+    'CompactInstructions'
+    >>> circuit.instructions.opcodes
+    array([ 5,  0, 12, -1], dtype=int16)
+    >>> circuit.instructions[2]
+    Rz(0.5, 1)
+
+The translation of a compact circuit and its simulation only build one
+template gate per distinct gate and parameters, see :func:`iter_templates`.
+
+Both :class:`CompactInstructions` and :class:`InstructionList` (the default
+storage of the instructions of a circuit) count their modifications in a
+``version`` attribute, on which the circuit invalidates the properties it
+derives from its instructions."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from functools import wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Optional,
+    TypeVar,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from mpqp.core.instruction.gates.controlled_gate import ControlledGate
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.gates.native_gates import (
+    NATIVE_GATES,
+    TOF,
+    CRk,
+    CRk_dagger,
+    NativeGate,
+    Rk,
+    Rk_dagger,
+)
+from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
+from mpqp.core.instruction.instruction import Instruction
+
+if TYPE_CHECKING:
+    from numbers import Complex
+
+    from sympy import Expr
+
+
+OPCODES: list[type[NativeGate]] = NATIVE_GATES
+"""Gates stored in the arrays of :class:`CompactInstructions`, the opcode of a
+gate being its index in this list. Other instructions have the opcode
+``-1``."""
+T = TypeVar("T", bound=Instruction)
+_OPCODE_OF: dict[type[Instruction], int] = {
+    gate: opcode for opcode, gate in enumerate(OPCODES)
+}
+_INTEGER_PARAMETERS = (Rk, Rk_dagger, CRk, CRk_dagger)
+_DEFAULT_LABELS: dict[type[NativeGate], Optional[str]] = {}
+
+_TEMPLATES: dict[tuple[Any, ...], Gate] = {}
+"""Cache of the gates returned by :func:`iter_templates`."""
+_MAX_TEMPLATES = 4096
+
+
+def _build(gate: type[NativeGate], qubits: list[int], parameters: list[Any]) -> Gate:
+    """Instantiates a native gate from its qubits (controls first) and
+    parameters."""
+    if gate in _INTEGER_PARAMETERS:
+        # the table stores floats, the integer values of ``k`` are restored
+        parameters = [
+            int(p) if isinstance(p, float) and p.is_integer() else p for p in parameters
+        ]
+    if gate is TOF:
+        return TOF(qubits[:-1], qubits[-1])
+    return gate(*parameters, *qubits)
+
+
+def _grown(array: npt.NDArray[Any], capacity: int) -> npt.NDArray[Any]:
+    """Copy of an array with a larger capacity (the views on the previous
+    array, given by the properties of :class:`CompactInstructions`, stay
+    valid)."""
+    grown = np.zeros(capacity, dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _qubits(instruction: Instruction) -> list[int]:
+    """Qubits of an instruction, the controls first for controlled gates."""
+    if isinstance(instruction, ControlledGate):
+        return instruction.controls + instruction.targets
+    return list(instruction.targets)
+
+
+def _modifying(method: Callable[..., Any]) -> Any:
+    """Wraps a method of :class:`InstructionList` modifying the list, so that
+    it increments the version of the list."""
+
+    @wraps(method)
+    def wrapper(self: InstructionList, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self.version += 1
+        return result
+
+    return wrapper
+
+
+class InstructionList(list[Instruction]):
+    """List of instructions counting its modifications in :attr:`version`.
+
+    This is the default storage of the instructions of a
+    :class:`~mpqp.core.circuit.QCircuit`: all the modifications of the list,
+    including the ones made directly to
+    :attr:`~mpqp.core.circuit.QCircuit.instructions`, invalidate the
+    properties the circuit derives from its instructions.
+
+    Args:
+        instructions: The initial instructions.
+
+    Example:
+        >>> instructions = InstructionList([H(0), CNOT(0, 1)])
+        >>> version = instructions.version
+        >>> instructions[1] = X(1)
+        >>> instructions.version == version
+        False
+
+    """
+
+    version: int = 0
+    """Incremented by each modification of the list (this is a class
+    attribute so that the lists being unpickled can be filled before their
+    attributes are restored)."""
+
+    append = _modifying(list[Instruction].append)
+    extend = _modifying(list[Instruction].extend)
+    insert = _modifying(list[Instruction].insert)
+    pop = _modifying(list[Instruction].pop)
+    remove = _modifying(list[Instruction].remove)
+    clear = _modifying(list[Instruction].clear)
+    sort = _modifying(list[Instruction].sort)
+    reverse = _modifying(list[Instruction].reverse)
+    __setitem__ = _modifying(list[Instruction].__setitem__)
+    __delitem__ = _modifying(list[Instruction].__delitem__)
+    __iadd__ = _modifying(list[Instruction].__iadd__)
+    __imul__ = _modifying(list[Instruction].__imul__)
+
+
+class CompactInstructions(MutableSequence[Instruction]):
+    """Mutable sequence of instructions, storing the native gates in arrays.
+    Accessing an element (or iterating) builds a new gate from the arrays, so
+    modifying it does not modify the sequence: use item assignment instead.
+
+    This class is not type-checked on purpose, its methods being called for
+    each gate of potentially very large circuits.
+
+    Args:
+        instructions: The initial instructions.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> instructions = CompactInstructions([X(0), Rx(theta, 1), CNOT(1, 2)])
+        >>> instructions.qubits, instructions.qubit_offsets
+        (array([0, 1, 1, 2], dtype=int32), array([0, 1, 2, 4]))
+        >>> instructions.parameters, instructions.parameter_offsets
+        (array([nan]), array([0, 0, 1, 1]))
+        >>> list(instructions.subs({theta: 0.2}))
+        [X(0), Rx(0.2, 1), CNOT(1, 2)]
+
+    """
+
+    def __init__(self, instructions: Iterable[Instruction] = ()):
+        self.version = 0
+        """Incremented by each modification of the sequence."""
+        self._size = 0
+        self._opcodes = np.empty(16, dtype=np.int16)
+        self._qubit_offsets = np.zeros(17, dtype=np.int64)
+        self._qubits = np.empty(32, dtype=np.int32)
+        self._parameter_offsets = np.zeros(17, dtype=np.int64)
+        self._parameters = np.empty(16, dtype=np.float64)
+        self._exact_parameters: dict[int, Expr] = {}
+        self._objects: dict[int, Instruction] = {}
+        self.extend(instructions)
+
+    @property
+    def opcodes(self) -> npt.NDArray[np.int16]:
+        """Opcode of each instruction, see :data:`OPCODES`."""
+        return self._opcodes[: self._size]
+
+    @property
+    def qubit_offsets(self) -> npt.NDArray[np.int64]:
+        """The qubits of the ``i``-th instruction are
+        ``qubits[qubit_offsets[i]:qubit_offsets[i+1]]``."""
+        return self._qubit_offsets[: self._size + 1]
+
+    @property
+    def qubits(self) -> npt.NDArray[np.int32]:
+        """Qubits of the native gates, controls first."""
+        return self._qubits[: self._qubit_offsets[self._size]]
+
+    @property
+    def parameter_offsets(self) -> npt.NDArray[np.int64]:
+        """The parameters of the ``i``-th instruction are
+        ``parameters[parameter_offsets[i]:parameter_offsets[i+1]]``."""
+        return self._parameter_offsets[: self._size + 1]
+
+    @property
+    def parameters(self) -> npt.NDArray[np.float64]:
+        """Numerical parameters of the native gates, symbolic parameters being
+        replaced by ``nan``."""
+        return self._parameters[: self._parameter_offsets[self._size]]
+
+    @property
+    def symbolic_parameters(self) -> dict[int, Expr]:
+        """Symbolic parameters of the native gates, given by their position in
+        :attr:`parameters`."""
+        return dict(self._exact_parameters)
+
+    @property
+    def objects(self) -> dict[int, Instruction]:
+        """Instructions kept as is (opcode ``-1``), given by their index."""
+        return dict(self._objects)
+
+    @staticmethod
+    def is_compactable(instruction: Instruction) -> bool:
+        """Whether an instruction is stored in the arrays (otherwise, it is
+        kept as is).
+
+        Args:
+            instruction: The instruction to check.
+
+        Returns:
+            ``True`` if the instruction is a native gate with its default
+            label.
+        """
+        if (
+            not isinstance(instruction, NativeGate)
+            or type(instruction) not in _OPCODE_OF
+        ):
+            return False
+        gate = type(instruction)
+        if gate not in _DEFAULT_LABELS:
+            parameters = getattr(instruction, "parameters", [])
+            _DEFAULT_LABELS[gate] = _build(
+                gate,
+                list(range(len(_qubits(instruction)))),
+                [0] * len(parameters),
+            ).label
+        return instruction.label == _DEFAULT_LABELS[gate]
+
+    def _reserve(self, nb_qubits: int, nb_parameters: int, nb_instructions: int = 1):
+        """Grows the arrays so that ``nb_instructions`` more instructions fit."""
+        if self._size + nb_instructions >= len(self._opcodes):
+            capacity = max(16, 2 * len(self._opcodes), self._size + nb_instructions + 1)
+            self._opcodes = _grown(self._opcodes, capacity)
+            self._qubit_offsets = _grown(self._qubit_offsets, capacity + 1)
+            self._parameter_offsets = _grown(self._parameter_offsets, capacity + 1)
+        end = self._qubit_offsets[self._size] + nb_qubits
+        if end > len(self._qubits):
+            self._qubits = _grown(self._qubits, max(end, 2 * len(self._qubits)))
+        end = self._parameter_offsets[self._size] + nb_parameters
+        if end > len(self._parameters):
+            self._parameters = _grown(
+                self._parameters, max(end, 2 * len(self._parameters))
+            )
+
+    def _push(self, opcode: int, qubits: list[int], parameters: list[Any]) -> None:
+        """Appends a native gate given by its opcode, qubits and parameters
+        (either floats or sympy expressions)."""
+        from sympy import Basic
+
+        self._reserve(len(qubits), len(parameters))
+        index = self._size
+        qubit_start = self._qubit_offsets[index]
+        self._qubits[qubit_start : qubit_start + len(qubits)] = qubits
+        parameter_start = self._parameter_offsets[index]
+        for i, parameter in enumerate(parameters, parameter_start):
+            if isinstance(parameter, Basic):
+                self._exact_parameters[i] = parameter  # pyright: ignore
+                self._parameters[i] = np.nan
+            else:
+                self._parameters[i] = parameter
+        self._opcodes[index] = opcode
+        self._qubit_offsets[index + 1] = qubit_start + len(qubits)
+        self._parameter_offsets[index + 1] = parameter_start + len(parameters)
+        self._size += 1
+
+    def append(self, value: Instruction) -> None:
+        if self.is_compactable(value):
+            parameters = value.parameters if isinstance(value, ParametrizedGate) else []
+            self._push(_OPCODE_OF[type(value)], _qubits(value), parameters)
+        else:
+            self._push(-1, [], [])
+            self._objects[self._size - 1] = value
+        self.version += 1
+
+    def _record(self, index: int) -> tuple[int, list[int], list[Any]]:
+        """Opcode, qubits and parameters of an instruction."""
+        qubits = self._qubits[
+            self._qubit_offsets[index] : self._qubit_offsets[index + 1]
+        ].tolist()
+        start, stop = self._parameter_offsets[index : index + 2]
+        parameters: list[Any] = self._parameters[start:stop].tolist()
+        for i in range(start, stop):
+            if i in self._exact_parameters:
+                parameters[i - start] = self._exact_parameters[i]
+        return int(self._opcodes[index]), qubits, parameters
+
+    def _instruction(self, index: int) -> Instruction:
+        if self._opcodes[index] == -1:
+            return self._objects[index]
+        opcode, qubits, parameters = self._record(index)
+        return _build(OPCODES[opcode], qubits, parameters)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self._instruction(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("instruction index out of range")
+        return self._instruction(index)
+
+    def __iter__(self) -> Iterator[Instruction]:
+        for index in range(self._size):
+            yield self._instruction(index)
+
+    def _replace(self, instructions: list[Instruction]):
+        """Replaces all the content of the sequence."""
+        version = self.version
+        self.__init__(instructions)
+        self.version = version + 1
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if (
+            isinstance(index, int)
+            and -self._size <= index < self._size
+            and self._opcodes[index] == -1
+            and not self.is_compactable(value)
+        ):
+            # replacing an instruction kept as is does not touch the arrays
+            self._objects[index % self._size] = value
+            self.version += 1
+            return
+        instructions = list(self)
+        instructions[index] = value
+        self._replace(instructions)
+
+    def __delitem__(self, index: int | slice) -> None:
+        instructions = list(self)
+        del instructions[index]
+        self._replace(instructions)
+
+    def insert(self, index: int, value: Instruction) -> None:
+        if index >= self._size:
+            self.append(value)
+            return
+        instructions = list(self)
+        instructions.insert(index, value)
+        self._replace(instructions)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactInstructions):
+            return (
+                np.array_equal(self.opcodes, other.opcodes)
+                and np.array_equal(self.qubit_offsets, other.qubit_offsets)
+                and np.array_equal(self.qubits, other.qubits)
+                and np.array_equal(self.parameter_offsets, other.parameter_offsets)
+                and np.array_equal(self.parameters, other.parameters, equal_nan=True)
+                and self._exact_parameters == other._exact_parameters
+                and self._objects == other._objects
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __add__(self, other: Iterable[Any]) -> list[Any]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[Any]) -> list[Any]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"CompactInstructions({list(self)})"
+
+    def count_instances(self, kind: type[Instruction]) -> int:
+        """Counts the instructions of a given type, without materializing the
+        gates.
+
+        Args:
+            kind: Type of the instructions to count.
+
+        Returns:
+            The number of instances of ``kind`` in the sequence.
+        """
+        codes = [
+            opcode for opcode, gate in enumerate(OPCODES) if issubclass(gate, kind)
+        ]
+        count = int(np.count_nonzero(np.isin(self.opcodes, codes)))
+        return count + sum(isinstance(obj, kind) for obj in self._objects.values())
+
+    def instances(self, kind: type[T]) -> list[T]:
+        """Lists the instructions of a given type, only materializing the
+        gates of this type.
+
+        Args:
+            kind: Type of the instructions to list.
+
+        Returns:
+            The instances of ``kind``, in order.
+        """
+        codes = [
+            opcode for opcode, gate in enumerate(OPCODES) if issubclass(gate, kind)
+        ]
+        indices = set(np.flatnonzero(np.isin(self.opcodes, codes)).tolist())
+        indices.update(i for i, obj in self._objects.items() if isinstance(obj, kind))
+        instances = [self._instruction(index) for index in sorted(indices)]
+        return instances  # pyright: ignore[reportReturnType]
+
+    def connections(self) -> Iterator[tuple[Optional[Instruction], list[int]]]:
+        """Iterates over the qubits of the instructions, without materializing
+        the gates.
+
+        Yields:
+            For native gates, ``None`` and the qubits of the gate. For the
+            other instructions, the instruction and its connections.
+        """
+        qubits = self.qubits.tolist()
+        offsets = self.qubit_offsets.tolist()
+        for index in range(self._size):
+            if index in self._objects:
+                obj = self._objects[index]
+                yield obj, sorted(obj.connections())
+            else:
+                yield None, qubits[offsets[index] : offsets[index + 1]]
+
+    def without(self, kind: type[Instruction]) -> CompactInstructions:
+        """Copy of this sequence, without the instructions of a given type
+        which are not stored in the arrays (such as measurements or
+        breakpoints).
+
+        Args:
+            kind: Type of the instructions to remove.
+
+        Returns:
+            The filtered sequence.
+        """
+        keep = np.ones(self._size, dtype=bool)
+        for index, obj in self._objects.items():
+            if isinstance(obj, kind):
+                keep[index] = False
+        return self._select(keep)
+
+    def _select(self, keep: npt.NDArray[np.bool_]) -> CompactInstructions:
+        """Copy of this sequence keeping only some instructions."""
+        kept = np.flatnonzero(keep)
+        result = CompactInstructions()
+        result._size = len(kept)
+        result._opcodes = self.opcodes[kept].copy()
+
+        def gather(offsets: npt.NDArray[np.int64], values: npt.NDArray[Any]):
+            lengths = offsets[kept + 1] - offsets[kept]
+            new_offsets = np.zeros(len(kept) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=new_offsets[1:])
+            positions = np.repeat(offsets[kept] - new_offsets[:-1], lengths)
+            source = np.arange(new_offsets[-1]) + positions
+            return new_offsets, values[source], source
+
+        result._qubit_offsets, result._qubits, _ = gather(
+            self.qubit_offsets, self.qubits
+        )
+        result._parameter_offsets, result._parameters, source = gather(
+            self.parameter_offsets, self.parameters
+        )
+        if self._exact_parameters:
+            new_index = {old: new for new, old in enumerate(source.tolist())}
+            result._exact_parameters = {
+                new_index[i]: expr
+                for i, expr in self._exact_parameters.items()
+                if i in new_index
+            }
+        new_position = {old: new for new, old in enumerate(kept.tolist())}
+        result._objects = {
+            new_position[i]: obj for i, obj in self._objects.items() if keep[i]
+        }
+        return result
+
+    def subs(
+        self, values: dict[Expr | str, Complex], remove_symbolic: bool = False
+    ) -> CompactInstructions:
+        """Substitutes the parameters of the instructions, see
+        :meth:`~mpqp.core.circuit.QCircuit.subs`. Only the symbolic
+        parameters and the instructions kept as is are processed.
+
+        Args:
+            values: Mapping between the variables and the replacing values.
+            remove_symbolic: Whether symbolic values should be replaced by their
+                numeric counterparts.
+
+        Returns:
+            The sequence with the replaced parameters.
+        """
+        result = deepcopy(self)
+        for i, expr in self._exact_parameters.items():
+            value: Expr = expr.subs(values)  # pyright: ignore[reportAssignmentType]
+            # the gates cannot be built from sympy numbers, which are stored
+            # in the table like the numeric parameters
+            if remove_symbolic or value.is_Number:
+                result._parameters[i] = float(value)
+                del result._exact_parameters[i]
+            else:
+                result._exact_parameters[i] = value
+        result._objects = {
+            i: obj.subs(values, remove_symbolic) for i, obj in self._objects.items()
+        }
+        return result
+
+    def with_parameters(
+        self,
+        parameters: npt.NDArray[np.float64],
+        objects: Optional[dict[int, Instruction]] = None,
+    ) -> CompactInstructions:
+        """Copy of this sequence with another (numerical) parameter table. No
+        gate is built and no expression is evaluated: this is the binding step
+        of :class:`~mpqp.core.parametric.ParametricCircuit`.
+
+        Args:
+            parameters: The new table, of the length of :attr:`parameters`.
+            objects: Replacements for some of the instructions kept as is,
+                given by their index. The other ones are shared with this
+                sequence.
+
+        Returns:
+            The sequence with the new parameters.
+
+        Raises:
+            ValueError: If the table does not have the right length.
+
+        Example:
+            >>> instructions = CompactInstructions([Rx(0.1, 0), CNOT(0, 1), Rz(0.2, 1)])
+            >>> list(instructions.with_parameters(np.array([0.3, 0.4])))
+            [Rx(0.3, 0), CNOT(0, 1), Rz(0.4, 1)]
+
+        """
+        if parameters.shape != self.parameters.shape:
+            raise ValueError(
+                f"Expected {len(self.parameters)} parameters, but got an array of "
+                f"shape {parameters.shape}."
+            )
+        result = self.copy()
+        result._parameters = np.array(parameters, dtype=np.float64)
+        result._exact_parameters = {}
+        if objects is not None:
+            result._objects.update(objects)
+        return result
+
+    def copy(self) -> CompactInstructions:
+        """Copy of this sequence. The arrays are copied, the instructions kept
+        as is are shared with this sequence.
+
+        Returns:
+            The copied sequence.
+        """
+        result = CompactInstructions()
+        result._size = self._size
+        result._opcodes = self.opcodes.copy()
+        result._qubit_offsets = self.qubit_offsets.copy()
+        result._qubits = self.qubits.copy()
+        result._parameter_offsets = self.parameter_offsets.copy()
+        result._parameters = self.parameters.copy()
+        result._exact_parameters = dict(self._exact_parameters)
+        result._objects = dict(self._objects)
+        return result
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> CompactInstructions:
+        # sympy expressions are immutable, only the objects need to be copied
+        result = self.copy()
+        result._objects = deepcopy(self._objects, memo)
+        return result
+
+    def extend_from(
+        self,
+        other: CompactInstructions,
+        qubits_offset: int = 0,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> None:
+        """Appends the instructions ``start`` to ``stop`` of another sequence,
+        with their qubits shifted by ``qubits_offset``. The arrays are copied
+        in bulk, no gate is built. The instructions kept as is are appended
+        without being copied nor shifted.
+
+        Args:
+            other: The sequence to append instructions from.
+            qubits_offset: Offset added to the qubits of the native gates.
+            start: Index of the first instruction to append.
+            stop: Index after the last instruction to append, defaults to the
+                length of ``other``.
+
+        Example:
+            >>> instructions = CompactInstructions([H(0)])
+            >>> instructions.extend_from(CompactInstructions([CNOT(0, 1), Rz(0.5, 1)]), 2)
+            >>> list(instructions)
+            [H(0), CNOT(2, 3), Rz(0.5, 3)]
+
+        """
+        if stop is None:
+            stop = other._size
+        if stop <= start:
+            return
+        count = stop - start
+        q_start, q_stop = other._qubit_offsets[[start, stop]]
+        p_start, p_stop = other._parameter_offsets[[start, stop]]
+        self._reserve(int(q_stop - q_start), int(p_stop - p_start), count)
+        size = self._size
+        q_end = self._qubit_offsets[size]
+        p_end = self._parameter_offsets[size]
+        self._opcodes[size : size + count] = other._opcodes[start:stop]
+        self._qubit_offsets[size + 1 : size + count + 1] = (
+            other._qubit_offsets[start + 1 : stop + 1] - q_start + q_end
+        )
+        self._qubits[q_end : q_end + q_stop - q_start] = (
+            other._qubits[q_start:q_stop] + qubits_offset
+        )
+        self._parameter_offsets[size + 1 : size + count + 1] = (
+            other._parameter_offsets[start + 1 : stop + 1] - p_start + p_end
+        )
+        self._parameters[p_end : p_end + p_stop - p_start] = other._parameters[
+            p_start:p_stop
+        ]
+        for i, expr in other._exact_parameters.items():
+            if p_start <= i < p_stop:
+                self._exact_parameters[int(i - p_start + p_end)] = expr
+        for i, obj in other._objects.items():
+            if start <= i < stop:
+                self._objects[i - start + size] = obj
+        self._size += count
+        self.version += 1
+
+    def records(self, start: int = 0) -> Iterator[tuple[int, list[int], list[Any]]]:
+        """Iterates over the opcodes, qubits (controls first) and parameters of
+        the instructions, without building any gate. The instructions stored
+        as objects (see :attr:`objects`) have the opcode ``-1``, and no qubits
+        nor parameters.
+
+        Args:
+            start: Index of the first instruction to iterate over.
+
+        Example:
+            >>> list(CompactInstructions([Rx(0.3, 0), CNOT(2, 1), Barrier()]).records())
+            [(10, [0], [0.3]), (0, [2, 1], []), (-1, [], [])]
+
+        """
+        qubits = self.qubits.tolist()
+        qubit_offsets = self.qubit_offsets.tolist()
+        parameters = self.parameters.tolist()
+        parameter_offsets = self.parameter_offsets.tolist()
+        opcodes = self.opcodes.tolist()
+        for index in range(start, self._size):
+            opcode = opcodes[index]
+            if opcode == -1:
+                yield -1, [], []
+                continue
+            gate_qubits = qubits[qubit_offsets[index] : qubit_offsets[index + 1]]
+            first, stop = parameter_offsets[index], parameter_offsets[index + 1]
+            gate_parameters = parameters[first:stop]
+            if self._exact_parameters:
+                for i in range(first, stop):
+                    if i in self._exact_parameters:
+                        gate_parameters[i - first] = self._exact_parameters[i]
+            yield opcode, gate_qubits, gate_parameters
+
+    def templates(self, start: int = 0) -> Iterator[tuple[Instruction, list[int]]]:
+        """See :func:`iter_templates`."""
+        for index, (opcode, gate_qubits, gate_parameters) in enumerate(
+            self.records(start), start
+        ):
+            if opcode == -1:
+                obj = self._objects[index]
+                yield obj, _qubits(obj)
+                continue
+            key = (opcode, len(gate_qubits), *gate_parameters)
+            template = _TEMPLATES.get(key)
+            if template is None:
+                if len(_TEMPLATES) >= _MAX_TEMPLATES:
+                    _TEMPLATES.clear()
+                template = _build(
+                    OPCODES[opcode], list(range(len(gate_qubits))), gate_parameters
+                )
+                _TEMPLATES[key] = template
+            yield template, gate_qubits
+
+
+def iter_templates(
+    instructions: list[Instruction] | CompactInstructions,
+    start: int = 0,
+) -> Iterator[tuple[Instruction, list[int]]]:
+    """Iterates over instructions together with the qubits they act on
+    (controls first for the controlled gates).
+
+    For a :class:`CompactInstructions`, the native gates are not built for
+    each instruction: a *template* gate, acting on the first qubits, is shared
+    between all the instructions with the same gate and parameters. The
+    templates must not be modified. This is meant for the translators and
+    simulators, which only need the gate, its parameters and its qubits.
+
+    Args:
+        instructions: The instructions to iterate over.
+        start: Index of the first instruction to iterate over.
+
+    Yields:
+        Each instruction (or its template) and its qubits.
+
+    Example:
+        >>> instructions = CompactInstructions([Rx(0.3, 0), CNOT(2, 1), Rx(0.3, 2)])
+        >>> templates = list(iter_templates(instructions))
+        >>> templates
+        [(Rx(0.3, 0), [0]), (CNOT(0, 1), [2, 1]), (Rx(0.3, 0), [2])]
+        >>> templates[0][0] is templates[2][0]
+        True
+
+    """
+    if isinstance(instructions, CompactInstructions):
+        yield from instructions.templates(start)
+    else:
+        for instruction in instructions[start:]:
+            yield instruction, _qubits(instruction)
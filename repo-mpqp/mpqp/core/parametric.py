@@ -0,0 +1,222 @@
+"""Binding values to a symbolic circuit with :meth:`QCircuit.subs
+<mpqp.core.circuit.QCircuit.subs>` deep-copies the circuit and substitutes
+the variables instruction by instruction with ``sympy``, which dominates the
+cost of each evaluation of a variational algorithm.
+
+A :class:`ParametricCircuit` is compiled once from a symbolic circuit: the
+circuit is stored in compact form (see
+:class:`~mpqp.core.instruction_store.CompactInstructions`), the positions of
+its symbolic parameters in the parameter table are recorded, and their
+expressions are compiled to a single ``numpy`` function. Binding values is
+then an evaluation of this function and a copy of the arrays of the circuit,
+without ``sympy`` nor deepcopy:
+
+    >>> theta, phi = symbols("θ φ")
+    >>> circuit = QCircuit([H(0), Rx(theta, 0), CNOT(0, 1), Rz(2 * phi + theta, 1)])
+    >>> template = ParametricCircuit(circuit)
+    >>> template.parameters
+    [θ, φ]
+    >>> template.bind([0.5, 0.25]).instructions
+    CompactInstructions([H(0), Rx(0.5, 0), CNOT(0, 1), Rz(1.0, 1)])
+
+A :class:`ParametricCircuit` can be given directly to
+:func:`~mpqp.execution.runner.run`, together with the values of its
+parameters."""
+
+from __future__ import annotations
+
+from copy import copy
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.circuit import QCircuit
+from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
+from mpqp.core.instruction_store import CompactInstructions
+
+if TYPE_CHECKING:
+    from numbers import Complex
+
+    from sympy import Expr
+
+    from mpqp.core.instruction.instruction import Instruction
+
+
+@typechecked
+class ParametricCircuit:
+    """Symbolic circuit compiled for a fast binding of the values of its
+    parameters.
+
+    The native gates of the circuit are bound through the parameter table of
+    its compact form. The other instructions depending on the parameters
+    (gates with a label for instance) are substituted with ``sympy`` at each
+    binding, and the remaining ones are shared between the bound circuits, so
+    they should not be modified in place.
+
+    Args:
+        circuit: The symbolic circuit.
+        parameters: The variables of the circuit, in the order of the values
+            given to :meth:`bind`. Defaults to the variables of the circuit
+            sorted by name.
+
+    Raises:
+        ValueError: If some variables of the circuit are missing from
+            ``parameters``.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> template = ParametricCircuit(QCircuit([Ry(theta, 0), CNOT(0, 1)]))
+        >>> template
+        ParametricCircuit(QCircuit([Ry(θ, 0), CNOT(0, 1)]), [θ])
+        >>> template.bind({theta: np.pi}) == QCircuit([Ry(np.pi, 0), CNOT(0, 1)])
+        True
+
+    """
+
+    def __init__(
+        self,
+        circuit: QCircuit,
+        parameters: Optional[Sequence[Expr | str]] = None,
+    ):
+        from sympy import Expr, Symbol, lambdify
+
+        self._source = circuit.to_compact()
+        instructions = self._source.instructions
+        if TYPE_CHECKING:
+            assert isinstance(instructions, CompactInstructions)
+        # the variables are the symbols of the parameters, hence expressions
+        variables: dict[str, Expr] = {
+            str(var): var for var in circuit.variables() if isinstance(var, Expr)
+        }
+        if parameters is None:
+            self.parameters: list[Expr] = sorted(variables.values(), key=str)
+        else:
+            self.parameters = [
+                variables.get(param, Symbol(param)) if isinstance(param, str) else param
+                for param in parameters
+            ]
+        """The variables of the circuit, in the order of the values given to
+        :meth:`bind`."""
+        missing = set(variables.values()) - set(self.parameters)
+        if len(missing) != 0:
+            raise ValueError(
+                f"Values are missing for the variables {', '.join(map(str, missing))}."
+            )
+
+        table = instructions.parameters.copy()
+        slots: list[int] = []
+        expressions: list[Expr] = []
+        for slot, expr in instructions.symbolic_parameters.items():
+            if len(expr.free_symbols) == 0:
+                table[slot] = float(expr)
+            else:
+                slots.append(slot)
+                expressions.append(expr)
+        self._table = table
+        self._slots = np.array(slots, dtype=np.int64)
+        self._evaluate: Callable[..., Any] = lambdify(
+            self.parameters, expressions, "numpy", cse=True
+        )
+        self._symbolic_objects: dict[int, Instruction] = {
+            index: obj
+            for index, obj in instructions.objects.items()
+            if isinstance(obj, ParametrizedGate)
+            and any(
+                len(getattr(param, "free_symbols", ())) != 0 for param in obj.parameters
+            )
+        }
+        self.label = circuit.label
+        """Label of the bound circuits."""
+        # the bound circuits are shallow copies of this circuit without
+        # instructions
+        self._shell = copy(self._source)
+        self._shell.instructions = CompactInstructions()
+
+    def bind(self, values: dict[Expr | str, Complex] | npt.ArrayLike) -> QCircuit:
+        """Circuit with the values of the parameters bound.
+
+        Args:
+            values: Values of the parameters, either as a mapping between the
+                variables (or their names) and their values, or as a sequence
+                in the order of :attr:`parameters`.
+
+        Returns:
+            The numerical circuit, in compact form.
+
+        Raises:
+            ValueError: If values are missing, if the sequence does not match
+                the parameters, or if a value is not real.
+
+        Example:
+            >>> theta, k = symbols("θ k")
+            >>> template = ParametricCircuit(QCircuit([Rx(theta, 0), CRk(k, 0, 1)]))
+            >>> template.bind({"θ": 0.5, "k": 2}).instructions
+            CompactInstructions([Rx(0.5, 0), CRk(2, 0, 1)])
+
+        """
+        vector = self._vector(values)
+        table = self._table.copy()
+        if len(self._slots) != 0:
+            table[self._slots] = self._evaluate(*vector)
+        objects = None
+        if len(self._symbolic_objects) != 0:
+            substitutions = dict(zip(self.parameters, vector))
+            objects = {
+                # the type checker does not know that floats are numbers.Complex
+                index: obj.subs(
+                    substitutions, True  # pyright: ignore[reportArgumentType]
+                )
+                for index, obj in self._symbolic_objects.items()
+            }
+        circuit = copy(self._shell)
+        instructions = self._source.instructions
+        if TYPE_CHECKING:
+            assert isinstance(instructions, CompactInstructions)
+        circuit.instructions = instructions.with_parameters(table, objects)
+        circuit.noises = list(circuit.noises)
+        circuit.label = self.label
+        return circuit
+
+    def _vector(self, values: dict[Expr | str, Complex] | npt.ArrayLike) -> list[float]:
+        """Values of the parameters in the order of :attr:`parameters`.
+
+        Raises:
+            ValueError: If values are missing, if the sequence does not match
+                the parameters, or if a value is not real.
+        """
+        if isinstance(values, dict):
+            vector: list[float] = []
+            for param in self.parameters:
+                if param in values:
+                    value = complex(values[param])
+                elif str(param) in values:
+                    value = complex(values[str(param)])
+                else:
+                    raise ValueError(f"No value given for the variable {param}.")
+                if value.imag != 0:
+                    raise ValueError(
+                        f"The variable {param} is given the complex value "
+                        f"{value}, but the parameters of the gates are real."
+                    )
+                vector.append(value.real)
+            return vector
+        array = np.asarray(values)
+        if np.iscomplexobj(array):
+            if np.any(array.imag != 0):
+                raise ValueError(
+                    f"The parameters {self.parameters} are given the complex "
+                    f"values {array}, but the parameters of the gates are real."
+                )
+            array = array.real
+        array = array.astype(np.float64)
+        if array.shape != (len(self.parameters),):
+            raise ValueError(
+                f"Expected {len(self.parameters)} values for the parameters "
+                f"{self.parameters}, but got an array of shape {array.shape}."
+            )
+        return array.tolist()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({repr(self._source)}, {self.parameters})"
@@ -0,0 +1,270 @@
+"""Translating a circuit with :meth:`QCircuit.to_other_language
+<mpqp.core.circuit.QCircuit.to_other_language>` or :meth:`QCircuit.to_other_device
+<mpqp.core.circuit.QCircuit.to_other_device>` (and transpiling it for the IBM
+devices) is a large part of the latency of the execution of a circuit. When
+the same circuit is run again, the translation is taken from the
+:data:`translation_cache`, where the translations are stored by
+:meth:`fingerprint <mpqp.core.circuit.QCircuit.fingerprint>` of the circuit,
+target language or device, and translation options.
+
+The cache is disabled by default, and enabled by giving it a size:
+
+    >>> translation_cache.maxsize = 128
+    >>> circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure()])
+    >>> qiskit_circuit = circuit.to_other_language(Language.QISKIT)
+    >>> qiskit_circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure()]).to_other_language(Language.QISKIT)
+    >>> translation_cache.info()
+    TranslationCacheInfo(hits=1, misses=1, disk_hits=0, size=1, maxsize=128)
+    >>> translation_cache.maxsize = 0
+    >>> translation_cache.clear()
+
+The cache keeps the ``maxsize`` translations used last in memory. When
+:attr:`TranslationCache.directory` is set, the Qiskit circuits translated for a
+device (thus transpiled) are also saved in this directory in the ``qpy``
+format, so that they can be reused across sessions.
+
+Each translation is copied when taken from the cache, so it can be modified
+by the caller. Since the circuits are recognized by their fingerprint, a
+circuit whose instructions objects were modified in place (which is not
+supported, see :attr:`QCircuit.instructions
+<mpqp.core.circuit.QCircuit.instructions>`) could get an outdated translation.
+Replacing, inserting or removing instructions is safe."""
+
+from __future__ import annotations
+
+import os
+import threading
+import warnings
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from mpqp.core.languages import Language
+
+if TYPE_CHECKING:
+    from mpqp.core.circuit import QCircuit
+
+
+@dataclass
+class TranslationCacheInfo:
+    """Statistics of a :class:`TranslationCache`."""
+
+    hits: int
+    """Number of translations taken from the memory."""
+    misses: int
+    """Number of translations computed."""
+    disk_hits: int
+    """Number of translations loaded from the disk."""
+    size: int
+    """Number of translations currently in memory."""
+    maxsize: int
+    """Maximum number of translations kept in memory."""
+
+
+@dataclass
+class _Entry:
+    translation: Any
+    # attributes of the circuit set by the translation, ``None`` when unchanged
+    gphase: Optional[float]
+    noise_model: Any
+    # warnings raised by the translation, raised again each time it is used
+    caught: list[warnings.WarningMessage] = field(default_factory=list)
+
+    def warn(self):
+        for warning in self.caught:
+            warnings.warn_explicit(
+                warning.message, warning.category, warning.filename, warning.lineno
+            )
+
+
+class TranslationCache:
+    """Least recently used cache of the translations of the circuits.
+
+    Args:
+        maxsize: Maximum number of translations kept in memory. With ``0``, the
+            translations are not kept in memory.
+        directory: Directory where the transpiled Qiskit circuits are saved,
+            ``None`` to keep the translations only in memory.
+
+    Example:
+        >>> cache = TranslationCache(maxsize=2)
+        >>> circuit = QCircuit([H(0), CNOT(0, 1)])
+        >>> _ = cache.translate(circuit, Language.CIRQ, (), lambda: circuit.to_other_language(Language.CIRQ))
+        >>> _ = cache.translate(circuit, Language.CIRQ, (), lambda: circuit.to_other_language(Language.CIRQ))
+        >>> cache.info()
+        TranslationCacheInfo(hits=1, misses=1, disk_hits=0, size=1, maxsize=2)
+
+    """
+
+    def __init__(self, maxsize: int = 0, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        """Maximum number of translations kept in memory, the translations
+        used least recently are discarded first."""
+        self.directory = directory
+        """Directory where the transpiled Qiskit circuits are saved."""
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries: OrderedDict[tuple[Any, ...], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the translations are cached at all."""
+        return self.maxsize > 0 or self.directory is not None
+
+    def translate(
+        self,
+        circuit: QCircuit,
+        target: Any,
+        options: tuple[Any, ...],
+        translate: Callable[[], Any],
+    ) -> Any:
+        """Returns the translation of a circuit, computed by ``translate`` if
+        it is not in the cache.
+
+        Args:
+            circuit: The translated circuit.
+            target: Language or device of the translation.
+            options: Other parameters the translation depends on.
+            translate: Function computing the translation.
+
+        Returns:
+            A copy of the translation.
+        """
+        if not self.enabled:
+            return translate()
+        key = (circuit.fingerprint(), circuit.label, target, *options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None and self._on_disk(target):
+            entry = self._load(key)
+            if entry is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._store(key, entry)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            gphase, noise_model = circuit.gphase, circuit.transpiled_noise_model
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                translation = translate()
+            entry = _Entry(
+                _copy(translation),
+                circuit.gphase if circuit.gphase != gphase else None,
+                (
+                    circuit.transpiled_noise_model
+                    if circuit.transpiled_noise_model is not noise_model
+                    else None
+                ),
+                caught,
+            )
+            entry.warn()
+            self._store(key, entry)
+            if self._on_disk(target):
+                self._save(key, entry)
+            return translation
+        if entry.gphase is not None:
+            circuit.gphase = entry.gphase
+        if entry.noise_model is not None:
+            circuit.transpiled_noise_model = entry.noise_model
+        entry.warn()
+        return _copy(entry.translation)
+
+    def info(self) -> TranslationCacheInfo:
+        """Statistics of the cache."""
+        return TranslationCacheInfo(
+            self.hits, self.misses, self.disk_hits, len(self._entries), self.maxsize
+        )
+
+    def clear(self, disk: bool = False):
+        """Empties the cache and resets its statistics.
+
+        Args:
+            disk: If ``True``, the translations saved in :attr:`directory` are
+                also removed.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = 0
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".qpy"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _store(self, key: tuple[Any, ...], entry: _Entry):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _on_disk(self, target: Any) -> bool:
+        return self.directory is not None and not isinstance(target, Language)
+
+    def _path(self, key: tuple[Any, ...]) -> str:
+        from mpqp.core.fingerprint import new_hasher
+
+        assert self.directory is not None
+        hasher = new_hasher()
+        hasher.update(repr(key).encode())
+        return os.path.join(self.directory, f"{hasher.hexdigest()}.qpy")
+
+    def _save(self, key: tuple[Any, ...], entry: _Entry):
+        from qiskit import QuantumCircuit, qpy
+
+        # the noise model of the Aer simulator cannot be saved with the circuit
+        if not isinstance(entry.translation, QuantumCircuit) or entry.noise_model:
+            return
+        qiskit_circuit = entry.translation.copy()
+        if entry.gphase is not None:
+            qiskit_circuit.metadata = {
+                **(qiskit_circuit.metadata or {}),
+                "mpqp_gphase": entry.gphase,
+            }
+        assert self.directory is not None
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        # written under another name first so that a concurrent load does not
+        # read a partial file
+        with open(f"{path}.{threading.get_ident()}.tmp", "wb") as file:
+            qpy.dump(qiskit_circuit, file)
+        os.replace(f"{path}.{threading.get_ident()}.tmp", path)
+
+    def _load(self, key: tuple[Any, ...]) -> Optional[_Entry]:
+        path = self._path(key)
+        if not os.path.isfile(path):
+            return None
+        from qiskit import qpy
+
+        with open(path, "rb") as file:
+            qiskit_circuit = qpy.load(file)[0]
+        metadata = dict(qiskit_circuit.metadata or {})
+        gphase = metadata.pop("mpqp_gphase", None)
+        qiskit_circuit.metadata = metadata
+        return _Entry(qiskit_circuit, gphase, None)
+
+
+def _copy(translation: Any) -> Any:
+    """Copy of a translation, through the ``copy`` method of the circuits of
+    Qiskit, Braket and Cirq when available."""
+    if isinstance(translation, str):
+        return translation
+    if callable(getattr(translation, "copy", None)):
+        return translation.copy()
+    return deepcopy(translation)
+
+
+translation_cache = TranslationCache()
+"""Cache used by :meth:`QCircuit.to_other_language
+<mpqp.core.circuit.QCircuit.to_other_language>` and :meth:`QCircuit.to_other_device
+<mpqp.core.circuit.QCircuit.to_other_device>`, modify its attributes to tune
+it (it is disabled until ``translation_cache.maxsize`` or
+``translation_cache.directory`` is set)."""
@@ -6,13 +6,28 @@ from .devices import (
     GOOGLEDevice,
     IBMDevice,
     AZUREDevice,
+    MPQPDevice,
 )
 from .simulated_devices import IBMSimulatedDevice
 from .job import Job, JobStatus, JobType
-from .result import BatchResult, Result, Sample, StateVector
-from .runner import adjust_measure, run, submit
+from .fusion import FusionReport, fuse_gates
+from .result import BatchResult, Result, Sample, StateVector, SweepResult
+from .runner import (
+    adjust_measure,
+    run,
+    run_async,
+    run_native_batch,
+    run_sharded,
+    run_sweep,
+    submit,
+    submit_async,
+)
 
 # This import has to be done after the loading of result to work, `pass` is a
 # trick to avoid isort to move this line above
 pass
-from .remote_handler import get_remote_result
+from .remote_handler import (
+    get_remote_result,
+    get_remote_result_async,
+    get_remote_status,
+)
@@ -10,6 +10,10 @@ Each supported provider has its available devices listed as these enums:
 - :class:`GOOGLEDevice`.
 - :class:`AZUREDevice`.
 
+In addition to these, ``MPQP`` ships its own local simulators, listed in
+:class:`MPQPDevice`. They only rely on ``numpy``, so they can be used without
+any provider SDK.
+
 Not all combinations of :class:`AvailableDevice` and
 :class:`~mpqp.execution.job.JobType` are possible. Here is the list of
 compatible jobs types and devices.
@@ -497,3 +501,65 @@ class AZUREDevice(AvailableDevice):
 
     def supports_observable_ideal(self) -> bool:
         return False
+
+
+class MPQPDevice(AvailableDevice):
+    """Enum regrouping the local simulators implemented in ``MPQP`` itself.
+
+    These simulators work directly on the ``MPQP`` circuit, without any
+    translation to a provider SDK.
+
+    - ``STATEVECTOR_SIMULATOR``: the state is kept as a tensor with one axis
+      per qubit, and each gate is only contracted with the axes of the qubits
+      it acts on (see :mod:`mpqp.execution.simulators.statevector`).
+    - ``DENSITY_MATRIX_SIMULATOR``: noisy simulator, the density matrix is kept
+      as a tensor with two axes per qubit, and gates and noise channels are
+      only applied on the axes they affect (see
+      :mod:`mpqp.execution.simulators.density_matrix`).
+    - ``TRAJECTORY_SIMULATOR``: noisy simulator, the noise is sampled on many
+      state vectors (trajectories) run in parallel, which scales to more qubits
+      than the density matrix (see :mod:`mpqp.execution.simulators.trajectories`).
+    - ``MPS_SIMULATOR``: the state is kept as a matrix product state, which is
+      efficient for weakly entangled states, even on many qubits (see
+      :mod:`mpqp.execution.simulators.mps`). Observables are evaluated on their
+      Pauli string representation.
+    - ``STABILIZER_SIMULATOR``: the state is kept as a stabilizer tableau, which
+      only handles Clifford circuits, but in polynomial time, even on hundreds
+      of qubits (see :mod:`mpqp.execution.simulators.stabilizer`). The
+      ``STATEVECTOR_SIMULATOR`` automatically delegates to it samplings of
+      Clifford circuits, and expectation values of observables given as Pauli
+      strings on Clifford circuits.
+    """
+
+    STATEVECTOR_SIMULATOR = "statevector"
+    DENSITY_MATRIX_SIMULATOR = "density_matrix"
+    TRAJECTORY_SIMULATOR = "trajectory"
+    MPS_SIMULATOR = "mps"
+    STABILIZER_SIMULATOR = "stabilizer"
+
+    def is_remote(self) -> bool:
+        return False
+
+    def is_gate_based(self) -> bool:
+        return True
+
+    def is_simulator(self) -> bool:
+        return True
+
+    def is_noisy_simulator(self) -> bool:
+        return self in (
+            MPQPDevice.DENSITY_MATRIX_SIMULATOR,
+            MPQPDevice.TRAJECTORY_SIMULATOR,
+        )
+
+    def supports_samples(self) -> bool:
+        return True
+
+    def supports_state_vector(self) -> bool:
+        return self in (MPQPDevice.STATEVECTOR_SIMULATOR, MPQPDevice.MPS_SIMULATOR)
+
+    def supports_observable(self) -> bool:
+        return True
+
+    def supports_observable_ideal(self) -> bool:
+        return True
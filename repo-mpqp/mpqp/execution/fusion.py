@@ -0,0 +1,238 @@
+"""Deep circuits often contain long sequences of small gates (typically single
+qubit rotations) acting on the same qubits. Each of these gates comes with a
+fixed cost, in the simulators as well as in the translation to the providers'
+SDKs. :func:`fuse_gates` reduces this cost by merging the consecutive gates
+acting on a few neighbouring qubits into a single
+:class:`~mpqp.core.instruction.gates.custom_gate.CustomGate`.
+
+Fusion can also be requested directly when running a circuit, using the
+``gate_fusion`` argument of :func:`~mpqp.execution.runner.run`. The gate count
+reduction is then reported in the ``fusion`` attribute of the job of the
+result."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.circuit import QCircuit
+from mpqp.core.instruction.gates.custom_gate import CustomGate
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.gates.gate_definition import UnitaryMatrix
+from mpqp.execution.simulators.noise import noise_sites
+from mpqp.execution.simulators.statevector import apply_matrix
+
+if TYPE_CHECKING:
+    from mpqp.core.instruction.instruction import Instruction
+
+
+_FusedGate = tuple[Gate, list[int], npt.NDArray[np.complex128]]
+"""Gate being fused, with the qubits its matrix acts on, and the said matrix."""
+
+
+@dataclass
+class FusionReport:
+    """Summary of a gate fusion, see :func:`fuse_gates`.
+
+    Example:
+        >>> print(FusionReport(2, 1000, 120))
+        Gate fusion (blocks of at most 2 qubits): 1000 gates -> 120 gates (8.33x fewer)
+
+    """
+
+    max_qubits: int
+    """Maximal size of the fused blocks."""
+    gates_before: int
+    """Number of gates in the circuit before the fusion."""
+    gates_after: int
+    """Number of gates in the circuit after the fusion."""
+
+    @property
+    def reduction(self) -> float:
+        """Ratio between the number of gates before and after the fusion."""
+        return self.gates_before / self.gates_after if self.gates_after else 1.0
+
+    def __str__(self):
+        return (
+            f"Gate fusion (blocks of at most {self.max_qubits} qubits): "
+            f"{self.gates_before} gates -> {self.gates_after} gates "
+            f"({self.reduction:.2f}x fewer)"
+        )
+
+
+class _Block:
+    """Gates being fused, acting on the contiguous qubits from ``low`` to
+    ``high`` (both included)."""
+
+    __slots__ = ("low", "high", "gates")
+
+    def __init__(self, low: int, high: int, gates: list[_FusedGate]):
+        self.low = low
+        self.high = high
+        self.gates = gates
+
+    def to_gate(self) -> Gate:
+        if len(self.gates) == 1:
+            return self.gates[0][0]
+        size = self.high - self.low + 1
+        dimension = 2**size
+        all_qubits = list(range(self.low, self.high + 1))
+        matrix = np.eye(dimension, dtype=np.complex128)
+        for _, qubits, gate_mat in self.gates:
+            if qubits == all_qubits:
+                matrix = gate_mat @ matrix
+            else:
+                matrix = apply_matrix(
+                    matrix.reshape((2,) * size + (dimension,)),
+                    gate_mat,
+                    [qubit - self.low for qubit in qubits],
+                ).reshape(dimension, dimension)
+        return CustomGate(UnitaryMatrix(matrix), all_qubits)
+
+
+def _numeric_matrix(gate: Gate) -> Optional[npt.NDArray[np.complex128]]:
+    """Matrix of the gate, or ``None`` if the gate is symbolic (in which case
+    it cannot be fused). Like :func:`_gate_qubits`, this is a non type-checked
+    version of :func:`~mpqp.execution.simulators.statevector.gate_matrix`."""
+    try:
+        return np.asarray(gate.to_canonical_matrix(), dtype=np.complex128)
+    except TypeError:
+        return None
+
+
+def _gate_qubits(gate: Gate) -> list[int]:
+    """Non type-checked version of
+    :func:`~mpqp.execution.simulators.statevector.gate_qubits`, this function
+    is called for each gate of potentially very large circuits."""
+    controls = getattr(gate, "controls", [])
+    return list(controls) + list(gate.targets)
+
+
+@typechecked
+def fuse_gates(circuit: QCircuit, max_qubits: int = 2) -> QCircuit:
+    """Merges the consecutive gates of a circuit acting on at most
+    ``max_qubits`` contiguous qubits into
+    :class:`~mpqp.core.instruction.gates.custom_gate.CustomGate`.
+
+    The circuit is traversed once, greedily growing blocks of gates: a gate is
+    added to the blocks it overlaps if the resulting block still spans at
+    most ``max_qubits`` qubits, otherwise these blocks are closed and a new
+    one is started. The following elements are never fused, and close the
+    blocks they touch:
+
+    - barriers, breakpoints and measurements (all the blocks are closed);
+    - gates larger than ``max_qubits`` or still containing symbolic
+      parameters;
+    - gates on which a noise model of the circuit would be applied, so the
+      noisy simulations are left unchanged.
+
+    Args:
+        circuit: The circuit to optimize.
+        max_qubits: Maximal number of qubits of the fused blocks.
+
+    Returns:
+        A new circuit, equivalent to the input one. The gates that could not
+        be fused are shared with the input circuit.
+
+    Raises:
+        ValueError: If ``max_qubits`` is not positive.
+
+    Example:
+        >>> circuit = QCircuit([H(0), Rz(0.3, 0), CNOT(0, 1), Rx(0.2, 1), Barrier(), X(1)])
+        >>> fused = fuse_gates(circuit)
+        >>> [type(instruction).__name__ for instruction in fused.instructions]
+        ['CustomGate', 'Barrier', 'X']
+        >>> fused.is_equivalent(circuit)
+        True
+
+    """
+    if max_qubits <= 0:
+        raise ValueError(f"Blocks must span at least one qubit, got {max_qubits}.")
+
+    unrestricted_targets: set[int] = set()
+    for noise in circuit.noises:
+        if len(noise.gates) == 0:
+            unrestricted_targets.update(noise.targets)
+    restricted_noises = [noise for noise in circuit.noises if len(noise.gates) != 0]
+
+    instructions: list[Instruction] = []
+    owners: list[Optional[_Block]] = [None] * circuit.nb_qubits
+
+    def close(block: _Block):
+        instructions.append(block.to_gate())
+        for qubit in range(block.low, block.high + 1):
+            owners[qubit] = None
+
+    def close_all():
+        for block in {id(block): block for block in owners if block}.values():
+            close(block)
+
+    def touched_blocks(qubits: range | list[int]) -> list[_Block]:
+        blocks = {id(owners[q]): owners[q] for q in qubits if owners[q] is not None}
+        return list(blocks.values())  # pyright: ignore[reportReturnType]
+
+    for instruction in circuit.instructions:
+        if not isinstance(instruction, Gate):
+            close_all()
+            instructions.append(instruction)
+            continue
+
+        qubits = _gate_qubits(instruction)
+        low, high = min(qubits), max(qubits)
+        span = range(low, high + 1)
+        matrix = None
+        if (
+            high - low < max_qubits
+            and unrestricted_targets.isdisjoint(span)
+            and not any(noise_sites(noise, instruction) for noise in restricted_noises)
+        ):
+            matrix = _numeric_matrix(instruction)
+        if matrix is None:
+            for block in touched_blocks(qubits):
+                close(block)
+            instructions.append(instruction)
+            continue
+
+        element = (instruction, qubits, matrix)
+        candidates = touched_blocks(span)
+        new_low = min([low] + [block.low for block in candidates])
+        new_high = max([high] + [block.high for block in candidates])
+        if new_high - new_low < max_qubits:
+            gates = [gate for block in candidates for gate in block.gates]
+            block = _Block(new_low, new_high, gates + [element])
+        else:
+            for block in candidates:
+                close(block)
+            block = _Block(low, high, [element])
+        for qubit in range(block.low, block.high + 1):
+            owners[qubit] = block
+    close_all()
+
+    fused = circuit._shallow_copy(instructions)  # pyright: ignore[reportPrivateUsage]
+    fused.transpiled_circuit = None
+    fused.transpiled_noise_model = None
+    return fused
+
+
+def fusion_report(circuit: QCircuit, fused: QCircuit, max_qubits: int) -> FusionReport:
+    """Compares the number of gates of a circuit before and after a fusion.
+
+    Args:
+        circuit: The original circuit.
+        fused: The circuit returned by :func:`fuse_gates`.
+        max_qubits: The maximal size of the fused blocks.
+
+    Returns:
+        The summary of the fusion.
+
+    Example:
+        >>> circuit = QCircuit([Rx(0.1 * i, i % 3) for i in range(30)])
+        >>> print(fusion_report(circuit, fuse_gates(circuit, 1), 1))
+        Gate fusion (blocks of at most 1 qubits): 30 gates -> 3 gates (10.00x fewer)
+
+    """
+    return FusionReport(max_qubits, len(circuit.gates), len(fused.gates))
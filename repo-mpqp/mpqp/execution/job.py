@@ -14,7 +14,7 @@ would in principle never need to instantiate one yourself.
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from aenum import Enum, NoAlias, auto
 from typeguard import typechecked
@@ -26,6 +26,8 @@ from mpqp.tools.generics import MessageEnum
 if TYPE_CHECKING:
     from enum import Enum
 
+    from mpqp.execution.fusion import FusionReport
+
 from mpqp.core.instruction.measurement import BasisMeasure, ExpectationMeasure, Measure
 
 from ..core.circuit import QCircuit
@@ -33,7 +35,7 @@ from ..tools.errors import IBMRemoteExecutionError, QLMRemoteExecutionError
 from .connection.azure_connection import get_jobs_by_id
 from .connection.ibm_connection import get_QiskitRuntimeService
 from .connection.qlm_connection import get_QLMaaSConnection
-from .devices import ATOSDevice, AvailableDevice, AWSDevice, AZUREDevice, IBMDevice
+from .devices import AvailableDevice
 
 
 class JobStatus(MessageEnum):
@@ -71,6 +73,10 @@ class JobType(Enum):
     or the samples. This type is ideal too: it requires some trickery to 
     retrieve the expectation value in an optimal manner."""
 
+    def __reduce_ex__(self, protocol: object):
+        # the members cannot be looked up by value, so they are pickled by name
+        return getattr, (JobType, self.name)
+
 
 @typechecked
 class Job:
@@ -132,6 +138,24 @@ class Job:
                 self.measure._user_set_c_targets = (  # pyright: ignore[reportPrivateUsage]
                     True
                 )
+        self.fusion: Optional[FusionReport] = None
+        """Summary of the gate fusion applied to the circuit before its
+        execution, ``None`` if no fusion was requested (see
+        :func:`~mpqp.execution.fusion.fuse_gates`)."""
+        self.symbolic_circuit: Optional[QCircuit] = None
+        """Symbolic circuit of which :attr:`circuit` is the numerical version,
+        ``None`` if the values of the variables were only substituted. When it
+        is set, the local simulators translate this circuit, which translation
+        does not depend on the values and can thus be cached (see
+        :mod:`~mpqp.core.translation_cache`), and bind the :attr:`values` to
+        the parameters of the translated circuit."""
+        self.values: dict[str, float] = {}
+        """Values of the variables of :attr:`symbolic_circuit`, by name."""
+        self.seed: Optional[int] = None
+        """Seed of the random generator drawing the shots of a ``SAMPLE`` job,
+        ``None`` for the default seeding of the simulator. It is used by the
+        simulators of ``MPQP``, the AER simulators and the local simulator of
+        ``cirq``, and ignored by the other devices."""
         self.id: Optional[str] = None
         """Contains the id of the remote job, used to retrieve the result from 
         the remote provider.  ``None`` if the job is local. It can take a little
@@ -141,7 +165,9 @@ class Job:
 
     @property
     def status(self):
-        """Update and return the current job status. Mainly relevant for remote jobs."""
+        """Update and return the current job status. Mainly relevant for remote
+        jobs, whose status is retrieved through the
+        :data:`~mpqp.execution.job_monitor.job_monitor`."""
         if self._status not in [
             JobStatus.DONE,
             JobStatus.ERROR,
@@ -150,26 +176,82 @@ class Job:
             # in the remote case, we need to check the current status of the job.
             # in the local case, it is updated automatically after each step
             if self.device.is_remote():
+                from mpqp.execution.job_monitor import job_monitor
+
                 if TYPE_CHECKING:
                     assert isinstance(self.id, str)
-                if isinstance(self.device, ATOSDevice):
-                    self._status = get_qlm_job_status(self.id)
-                elif isinstance(self.device, IBMDevice):
-                    self._status = get_ibm_job_status(self.id)
-                elif isinstance(self.device, AWSDevice):
-                    self._status = get_aws_job_status(self.id)
-                elif isinstance(self.device, AZUREDevice):
-                    self._status = get_azure_job_status(self.id)
-                else:
-                    raise NotImplementedError(
-                        f"Cannot update job status for the device {self.device} yet"
-                    )
+                self._status = job_monitor.status(self.id, self.device)
         return self._status
 
     @status.setter
     def status(self, job_status: JobStatus):
         self._status = job_status
 
+    @property
+    def fingerprint(self) -> str:
+        """Structural hash of the job: two jobs of the same type, on the same
+        device, with the same circuit (see :meth:`QCircuit.fingerprint
+        <mpqp.core.circuit.QCircuit.fingerprint>`) and the same measure have the
+        same fingerprint.
+
+        The fingerprint of the circuit is kept by the circuit, so this is cheap
+        to compute again once the circuit was hashed.
+
+        Example:
+            >>> circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=100)])
+            >>> job = Job(JobType.SAMPLE, circuit, IBMDevice.AER_SIMULATOR, circuit.measurements[0])
+            >>> job.fingerprint == Job(JobType.SAMPLE, circuit, IBMDevice.AER_SIMULATOR, circuit.measurements[0]).fingerprint
+            True
+            >>> job.fingerprint == Job(JobType.SAMPLE, circuit, MPQPDevice.MPS_SIMULATOR, circuit.measurements[0]).fingerprint
+            False
+
+        """
+        from mpqp.core.fingerprint import instruction_token, new_hasher, update
+
+        hasher = new_hasher()
+        update(
+            hasher,
+            self.job_type.name.encode(),
+            str(self.device).encode(),
+            self.circuit.fingerprint().encode(),
+            b"" if self.measure is None else instruction_token(self.measure),
+        )
+        return hasher.hexdigest()
+
+    def translate(self, translate: Callable[[QCircuit], Any]) -> Any:
+        """Translates the circuit of the job, or its :attr:`symbolic_circuit`
+        when it is set. In the latter case, the attributes the translation sets
+        on the circuit (such as :attr:`QCircuit.gphase
+        <mpqp.core.circuit.QCircuit.gphase>`) are copied to :attr:`circuit`,
+        and the translation depends on the variables, which are bound by the
+        caller to the :attr:`values`.
+
+        Args:
+            translate: Function translating a circuit.
+
+        Returns:
+            The translation of the circuit.
+
+        Example:
+            >>> theta = symbols("θ")
+            >>> job = generate_job(QCircuit([Rx(theta, 0)]), IBMDevice.AER_SIMULATOR, {theta: 0.5})
+            >>> job.values
+            {'θ': 0.5}
+            >>> print(job.translate(lambda circuit: circuit.to_other_language(Language.QISKIT)))
+               ┌───────┐
+            q: ┤ Rx(θ) ├
+               └───────┘
+
+        """
+        if self.symbolic_circuit is None:
+            return translate(self.circuit)
+        translation = translate(self.symbolic_circuit)
+        self.circuit.gphase = self.symbolic_circuit.gphase
+        self.circuit.transpiled_noise_model = (
+            self.symbolic_circuit.transpiled_noise_model
+        )
+        return translation
+
     def __repr__(self) -> str:
         measure = ", " + repr(self.measure) if self.measure is not None else ""
         return f"{type(self).__name__}({self.job_type}, {repr(self.circuit)}, {self.device}{measure})"
@@ -0,0 +1,424 @@
+"""The status of the remote jobs is followed by a single :class:`JobMonitor`,
+:data:`job_monitor`, instead of one polling loop for each job. The jobs it
+watches are polled together: at each round, the status of all the jobs of a
+provider which are due is queried at once, with the status fetcher of this
+provider. The interval between the polls of a job grows exponentially, with
+some jitter so that the jobs submitted together are not polled in lockstep.
+When the status fetcher of a provider fails, its jobs are polled again later
+in the same way, a job failing only after :attr:`JobMonitor.max_errors`
+consecutive errors.
+When a job is over, the future returned by :meth:`JobMonitor.watch` is resolved
+with its final status, and the callback given, if any, is called.
+
+    >>> monitor = JobMonitor({IBMDevice: lambda ids: {i: JobStatus.DONE for i in ids}})
+    >>> future = monitor.watch("job_id", IBMDevice.IBM_BRISBANE)
+    >>> future.result(timeout=10)
+    <JobStatus.DONE: 6>
+
+The statuses retrieved are cached for :attr:`JobMonitor.status_ttl` seconds,
+so reading :attr:`Job.status <mpqp.execution.job.Job.status>` repeatedly does
+not query the provider each time.
+
+The status fetchers can be replaced, for instance by stand-ins of the
+providers in tests, or by fetchers using the batch queries of a provider."""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, Optional
+
+from mpqp.execution.devices import (
+    ATOSDevice,
+    AvailableDevice,
+    AWSDevice,
+    AZUREDevice,
+    IBMDevice,
+)
+from mpqp.execution.job import JobStatus
+
+if TYPE_CHECKING:
+    from mpqp.execution.job import Job
+
+StatusFetcher = Callable[[list[str]], "dict[str, JobStatus]"]
+"""Function retrieving the status of several jobs of a provider from their
+ids. The jobs missing from the dictionary returned are polled again later."""
+
+FINAL_STATUSES = (JobStatus.DONE, JobStatus.ERROR, JobStatus.CANCELLED)
+"""Statuses after which a job is no longer watched."""
+
+
+def _one_by_one(get_status: Callable[[str], JobStatus]) -> StatusFetcher:
+    def fetch(job_ids: list[str]) -> dict[str, JobStatus]:
+        return {job_id: get_status(job_id) for job_id in job_ids}
+
+    return fetch
+
+
+def default_status_fetchers() -> dict[type[AvailableDevice], StatusFetcher]:
+    """Status fetchers of the providers, querying the status of the jobs one
+    after the other with the functions of :mod:`mpqp.execution.job`."""
+    from mpqp.execution.job import (
+        get_aws_job_status,
+        get_azure_job_status,
+        get_ibm_job_status,
+        get_qlm_job_status,
+    )
+
+    return {
+        ATOSDevice: _one_by_one(get_qlm_job_status),
+        AWSDevice: _one_by_one(get_aws_job_status),
+        AZUREDevice: _one_by_one(get_azure_job_status),
+        IBMDevice: _one_by_one(get_ibm_job_status),
+    }
+
+
+@dataclass
+class JobMonitorInfo:
+    """Statistics of a :class:`JobMonitor`."""
+
+    watched: int
+    """Number of jobs currently watched."""
+    queries: int
+    """Number of calls made to the status fetchers."""
+    statuses: int
+    """Number of job statuses retrieved by these calls."""
+    cache_hits: int
+    """Number of statuses taken from the cache."""
+
+
+class _Watch:
+    __slots__ = ("device", "future", "interval", "due", "errors")
+
+    def __init__(
+        self, device: AvailableDevice, future: Future[JobStatus], interval: float
+    ):
+        self.device = device
+        self.future = future
+        self.interval = interval
+        self.due = 0.0
+        self.errors = 0
+
+
+class JobMonitor:
+    """Watches the status of remote jobs, polling the jobs of each provider
+    together.
+
+    Args:
+        fetchers: Status fetcher of each provider, by device class. Defaults to
+            :func:`default_status_fetchers`.
+        poll_interval: Time (in seconds) waited before the second poll of a
+            job.
+        max_poll_interval: Maximal time (in seconds) waited between two polls
+            of a job.
+        backoff: Factor by which the interval between two polls of a job grows
+            after each poll.
+        jitter: Relative variation applied at random to each interval.
+        status_ttl: Time (in seconds) during which a status retrieved is used
+            without querying the provider again.
+        clock: Function returning the current time, in seconds.
+        threaded: If ``False``, the watched jobs are not polled in a background
+            thread, but only when :meth:`poll` is called.
+        cache_size: Maximal number of statuses cached.
+        max_errors: Number of consecutive errors of the status fetcher after
+            which the jobs polled fail with the last error.
+
+    Example:
+        >>> polls = []
+        >>> def fetch(ids):
+        ...     polls.append(sorted(ids))
+        ...     return {i: JobStatus.DONE if len(polls) > 1 else JobStatus.RUNNING for i in ids}
+        >>> monitor = JobMonitor({AWSDevice: fetch}, poll_interval=0.01, threaded=False)
+        >>> futures = [monitor.watch(i, AWSDevice.BRAKET_SV1_SIMULATOR) for i in "abc"]
+        >>> while monitor.poll() is not None:
+        ...     pass
+        >>> [future.result() for future in futures]
+        [<JobStatus.DONE: 6>, <JobStatus.DONE: 6>, <JobStatus.DONE: 6>]
+        >>> polls
+        [['a', 'b', 'c'], ['a', 'b', 'c']]
+
+    """
+
+    def __init__(
+        self,
+        fetchers: Optional[dict[type[AvailableDevice], StatusFetcher]] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        backoff: float = 2.0,
+        jitter: float = 0.1,
+        status_ttl: float = 1.0,
+        clock: Callable[[], float] = monotonic,
+        threaded: bool = True,
+        cache_size: int = 65536,
+        max_errors: int = 5,
+    ):
+        self.fetchers = default_status_fetchers() if fetchers is None else fetchers
+        """Status fetcher of each provider, by device class."""
+        self.poll_interval = poll_interval
+        """See parameter description."""
+        self.max_poll_interval = max_poll_interval
+        """See parameter description."""
+        self.backoff = backoff
+        """See parameter description."""
+        self.jitter = jitter
+        """See parameter description."""
+        self.status_ttl = status_ttl
+        """See parameter description."""
+        self.clock = clock
+        """See parameter description."""
+        self.threaded = threaded
+        """See parameter description."""
+        self.cache_size = cache_size
+        """See parameter description."""
+        self.max_errors = max_errors
+        """See parameter description."""
+        self.queries = 0
+        self.statuses = 0
+        self.cache_hits = 0
+        self._watches: dict[tuple[AvailableDevice, str], _Watch] = {}
+        self._cache: OrderedDict[
+            tuple[AvailableDevice, str], tuple[JobStatus, float]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def status(self, job_id: str, device: AvailableDevice) -> JobStatus:
+        """Returns the status of a job, queried from its provider unless it was
+        retrieved less than :attr:`status_ttl` seconds ago (or is final).
+
+        Args:
+            job_id: Id of the job on the remote device.
+            device: Remote device on which the job was launched.
+
+        Returns:
+            The status of the job.
+        """
+        key = (device, job_id)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and (
+                cached[0] in FINAL_STATUSES
+                or self.clock() - cached[1] < self.status_ttl
+            ):
+                self.cache_hits += 1
+                return cached[0]
+        status = self._fetch(self._provider(device), [key]).get(job_id)
+        if status is None:
+            raise ValueError(f"The status of the job {job_id} was not retrieved.")
+        return status
+
+    def watch(
+        self,
+        job: Job | str,
+        device: Optional[AvailableDevice] = None,
+        callback: Optional[Callable[[str, JobStatus], None]] = None,
+    ) -> Future[JobStatus]:
+        """Starts watching a job, until its status is final.
+
+        Args:
+            job: The job, or its id on the remote device.
+            device: Remote device on which the job was launched, needed only if
+                ``job`` is the identifier of the job.
+            callback: Function called with the id of the job and its final
+                status when the job is over.
+
+        Returns:
+            A future resolved with the final status of the job, or with the
+            error raised by the status fetcher. A job watched several times
+            shares the same future.
+        """
+        job_id, device = _job_key(job, device)
+        key = (device, job_id)
+        future: Future[JobStatus]
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] in FINAL_STATUSES:
+                self.cache_hits += 1
+                future = Future()
+                future.set_result(cached[0])
+            elif key in self._watches:
+                future = self._watches[key].future
+            else:
+                self._provider(device)
+                watch = _Watch(device, Future(), self.poll_interval)
+                watch.due = self.clock()
+                self._watches[key] = watch
+                future = watch.future
+                if self.threaded:
+                    self._start()
+
+        if callback is not None:
+
+            def call(future: Future[JobStatus]):
+                if future.exception() is None:
+                    callback(job_id, future.result())
+
+            future.add_done_callback(call)
+        self._wake_up.set()
+        return future
+
+    def poll(self) -> Optional[float]:
+        """Polls, provider by provider, the watched jobs which are due. The
+        jobs due soon (in less than half of :attr:`poll_interval`, plus the
+        :attr:`jitter` of their interval) are polled as well, so that the jobs
+        submitted around the same time are polled together.
+
+        This is done in a background thread started by :meth:`watch`, it can
+        be called directly to poll the jobs synchronously.
+
+        Returns:
+            The time (in seconds) until the next job is due, ``None`` if no job
+            is watched anymore.
+        """
+        now = self.clock()
+        batches: dict[type[AvailableDevice], list[tuple[AvailableDevice, str]]] = {}
+        with self._lock:
+            if any(watch.due <= now for watch in self._watches.values()):
+                for key, watch in self._watches.items():
+                    slack = self.poll_interval / 2 + self.jitter * watch.interval
+                    if watch.due <= now + slack:
+                        provider = self._provider(watch.device)
+                        batches.setdefault(provider, []).append(key)
+        for provider, keys in batches.items():
+            try:
+                statuses = self._fetch(provider, keys)
+            except Exception as error:
+                self._retry(keys, error)
+            else:
+                self._update(keys, statuses)
+        with self._lock:
+            if len(self._watches) == 0:
+                return None
+            return max(
+                0.0, min(watch.due for watch in self._watches.values()) - self.clock()
+            )
+
+    def info(self) -> JobMonitorInfo:
+        """Statistics of the monitor."""
+        return JobMonitorInfo(
+            len(self._watches), self.queries, self.statuses, self.cache_hits
+        )
+
+    def clear(self):
+        """Forgets the statuses cached and resets the statistics, the watched
+        jobs are still watched."""
+        with self._lock:
+            self._cache.clear()
+            self.queries = self.statuses = self.cache_hits = 0
+
+    def _provider(self, device: AvailableDevice) -> type[AvailableDevice]:
+        for provider in self.fetchers:
+            if isinstance(device, provider):
+                return provider
+        raise NotImplementedError(
+            f"Cannot retrieve the status of jobs on the device {device} yet."
+        )
+
+    def _fetch(
+        self,
+        provider: type[AvailableDevice],
+        keys: list[tuple[AvailableDevice, str]],
+    ) -> dict[str, JobStatus]:
+        statuses = self.fetchers[provider]([job_id for _, job_id in keys])
+        now = self.clock()
+        with self._lock:
+            self.queries += 1
+            self.statuses += len(statuses)
+            for key in keys:
+                if key[1] in statuses:
+                    self._cache[key] = (statuses[key[1]], now)
+                    self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return statuses
+
+    def _update(
+        self, keys: list[tuple[AvailableDevice, str]], statuses: dict[str, JobStatus]
+    ):
+        done: list[tuple[_Watch, JobStatus]] = []
+        now = self.clock()
+        with self._lock:
+            for key in keys:
+                # the job may have been resolved by a concurrent poll
+                watch = self._watches.get(key)
+                if watch is None:
+                    continue
+                watch.errors = 0
+                status = statuses.get(key[1])
+                if status is not None and status in FINAL_STATUSES:
+                    del self._watches[key]
+                    done.append((watch, status))
+                else:
+                    self._reschedule(watch, now)
+        for watch, status in done:
+            watch.future.set_result(status)
+
+    def _retry(self, keys: list[tuple[AvailableDevice, str]], error: Exception):
+        failed: list[_Watch] = []
+        now = self.clock()
+        with self._lock:
+            for key in keys:
+                watch = self._watches.get(key)
+                if watch is None:
+                    continue
+                watch.errors += 1
+                if watch.errors >= self.max_errors:
+                    del self._watches[key]
+                    failed.append(watch)
+                else:
+                    self._reschedule(watch, now)
+        for watch in failed:
+            watch.future.set_exception(error)
+
+    def _reschedule(self, watch: _Watch, now: float):
+        """Sets the time of the next poll of a job (the lock must be held)."""
+        jitter = 1 + self.jitter * random.uniform(-1, 1)
+        watch.due = now + watch.interval * jitter
+        watch.interval = min(watch.interval * self.backoff, self.max_poll_interval)
+
+    def _start(self):
+        """Starts the polling thread if it is not running (the lock must be
+        held)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="mpqp-job-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake_up.clear()
+            delay = self.poll()
+            if delay is None:
+                with self._lock:
+                    # a job may have been watched since the last poll
+                    if len(self._watches) == 0:
+                        self._thread = None
+                        return
+                continue
+            self._wake_up.wait(delay)
+
+
+def _job_key(
+    job: Job | str, device: Optional[AvailableDevice]
+) -> tuple[str, AvailableDevice]:
+    if isinstance(job, str):
+        if device is None:
+            raise ValueError(
+                "To watch a job from its id, please also provide its device."
+            )
+        return job, device
+    if job.id is None:
+        raise ValueError("Can't watch a job whose id is None.")
+    return job.id, job.device
+
+
+job_monitor = JobMonitor()
+"""Monitor of the remote jobs, used by :attr:`Job.status
+<mpqp.execution.job.Job.status>` and
+:func:`~mpqp.execution.remote_handler.get_remote_result_async`."""
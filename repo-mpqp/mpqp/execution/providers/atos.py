@@ -3,7 +3,7 @@ from __future__ import annotations
 import warnings
 from itertools import permutations
 from statistics import mean
-from typing import TYPE_CHECKING, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import numpy as np
 from typeguard import typechecked
@@ -85,13 +85,156 @@ def job_pre_processing(job: Job, translation_warning: bool = True) -> "Circuit":
             )
 
     if job.circuit.transpiled_circuit is None:
-        myqlm_circuit = job.circuit.to_other_device(job.device, translation_warning)
+        myqlm_circuit = job.translate(
+            lambda circuit: circuit.to_other_device(job.device, translation_warning)
+        )
+        if job.symbolic_circuit is not None:
+            myqlm_circuit = myqlm_circuit.bind_variables(job.values)
     else:
         myqlm_circuit = job.circuit.transpiled_circuit
 
     return myqlm_circuit
 
 
+@typechecked
+def symbolic_circuit_to_myqlm(circuit: QCircuit) -> "Circuit":
+    """Translates a symbolic circuit to a myQLM circuit depending on variables
+    of the same names, to be bound with ``Circuit.bind_variables``. The
+    translation through QASM 2.0 used for numerical circuits does not support
+    variables.
+
+    Args:
+        circuit: The circuit to translate, the measures, barriers and
+            breakpoints are ignored.
+
+    Returns:
+        The myQLM circuit, with its variables unbound.
+
+    Raises:
+        NotImplementedError: If the circuit contains a gate that cannot be
+            translated.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> myqlm_circuit = symbolic_circuit_to_myqlm(QCircuit([H(0), CRk(2, 0, 1), Ry(2 * theta, 1)]))
+        >>> myqlm_circuit.get_variables()
+        ['θ']
+
+    """
+    import qat.core.variables as qat_variables
+    from qat.lang.AQASM.gates import CCNOT as QLM_CCNOT
+    from qat.lang.AQASM.gates import CNOT as QLM_CNOT
+    from qat.lang.AQASM.gates import CSIGN, PH, RX, RY, RZ
+    from qat.lang.AQASM.gates import SWAP as QLM_SWAP
+    from qat.lang.AQASM.gates import CustomGate as QLMCustomGate
+    from qat.lang.AQASM.gates import H as QLM_H
+    from qat.lang.AQASM.gates import I as QLM_I
+    from qat.lang.AQASM.gates import S as QLM_S
+    from qat.lang.AQASM.gates import T as QLM_T
+    from qat.lang.AQASM.gates import X as QLM_X
+    from qat.lang.AQASM.gates import Y as QLM_Y
+    from qat.lang.AQASM.gates import Z as QLM_Z
+    from qat.lang.AQASM.program import Program
+    from sympy import Expr, lambdify
+
+    from mpqp.core.instruction.barrier import Barrier
+    from mpqp.core.instruction.breakpoint import Breakpoint
+    from mpqp.core.instruction.measurement.measure import Measure
+    from mpqp.core.instruction_store import iter_templates
+    from mpqp.gates import (
+        CP,
+        CZ,
+        SWAP,
+        TOF,
+        CRk_dagger,
+        CustomControlledGate,
+        CustomGate,
+        H,
+        Id,
+        P,
+        Rk_dagger,
+        Rx,
+        Ry,
+        Rz,
+        S,
+        S_dagger,
+        T,
+        U,
+        X,
+        Y,
+        Z,
+    )
+
+    program = Program()
+    qubits = program.qalloc(circuit.nb_qubits)
+    symbols = sorted(circuit.variables(), key=str)
+    variables = [program.new_var(float, str(symbol)) for symbol in symbols]
+    functions = {
+        "cos": qat_variables.cos,
+        "sin": qat_variables.sin,
+        "exp": qat_variables.exp,
+        "sqrt": qat_variables.sqrt,
+        "log": qat_variables.ln,
+    }
+
+    def parameter(value: Any) -> Any:
+        if isinstance(value, Expr) and len(value.free_symbols) != 0:
+            return lambdify(symbols, value, [functions, "math"])(*variables)
+        return float(value)
+
+    fixed_gates = {
+        Id: QLM_I,
+        X: QLM_X,
+        Y: QLM_Y,
+        Z: QLM_Z,
+        H: QLM_H,
+        S: QLM_S,
+        S_dagger: QLM_S.dag(),
+        T: QLM_T,
+        SWAP: QLM_SWAP,
+        CNOT: QLM_CNOT,
+        CZ: CSIGN,
+        TOF: QLM_CCNOT,
+    }
+    rotations = {Rx: RX, Ry: RY, Rz: RZ}
+
+    def myqlm_gates(gate: Any) -> list[Any]:
+        """myQLM gates to apply successively on the qubits of ``gate``."""
+        if type(gate) in fixed_gates:
+            return [fixed_gates[type(gate)]]
+        if type(gate) in rotations:
+            return [rotations[type(gate)](parameter(gate.theta))]
+        if isinstance(gate, (P, Rk, Rk_dagger)):
+            return [PH(parameter(gate.theta))]
+        if isinstance(gate, (CP, CRk, CRk_dagger)):
+            return [PH(parameter(gate.theta)).ctrl()]
+        if isinstance(gate, U):
+            return [
+                PH(parameter(gate.gamma)),
+                RY(parameter(gate.theta)),
+                PH(parameter(gate.phi)),
+            ]
+        if isinstance(gate, CustomGate):
+            return [QLMCustomGate(gate.to_canonical_matrix())]
+        if isinstance(gate, CustomControlledGate):
+            return [
+                myqlm_gate.ctrl(len(gate.controls))
+                for myqlm_gate in myqlm_gates(gate.non_controlled_gate)
+            ]
+        raise NotImplementedError(
+            f"{type(gate).__name__} cannot be translated to a symbolic myQLM "
+            "circuit."
+        )
+
+    for instruction, targets in iter_templates(circuit.instructions):
+        if isinstance(instruction, (Measure, Barrier, Breakpoint)):
+            continue
+        for myqlm_gate in myqlm_gates(instruction):
+            program.apply(myqlm_gate, [qubits[target] for target in targets])
+
+    return program.to_circ()
+
+
 @typechecked
 def get_local_qpu(device: ATOSDevice) -> "QPUHandler":
     """Returns the myQLM local QPU associated with the ATOSDevice given in
@@ -686,6 +829,93 @@ def run_atos(job: Job, translation_warning: bool = True) -> Result:
     )
 
 
+def _myqlm_job(job: Job, translation_warning: bool = True) -> "JobQLM":
+    """Generates the myQLM job corresponding to the type of ``job``, see
+    :func:`run_myQLM`."""
+    myqlm_circuit = job_pre_processing(job, translation_warning)
+
+    if job.job_type == JobType.STATE_VECTOR:
+        myqlm_job = generate_state_vector_job(myqlm_circuit)
+
+    elif job.job_type == JobType.SAMPLE:
+        myqlm_job = generate_sample_job(myqlm_circuit, job)
+
+    elif job.job_type == JobType.OBSERVABLE:
+        # TODO: update this to take into account the case when we have list of Observables
+        myqlm_job = generate_observable_job(myqlm_circuit, job)
+
+    else:
+        raise ValueError(f"Job type {job.job_type} not handled")
+
+    return myqlm_job
+
+
+@typechecked
+def run_atos_batch(
+    jobs: list[Job], translation_warning: bool = True
+) -> list[Result | Exception]:
+    """Executes several jobs on an ATOS device. On the local myQLM simulators,
+    the jobs are submitted together, in a single myQLM ``Batch``.
+
+    Args:
+        jobs: Jobs to be executed, on the same device.
+        translation_warning: If `True`, a warning will be raised.
+
+    Returns:
+        The result of each job, or the error raised by its execution. An error
+        raised by the execution of the ``Batch`` is given to all its jobs.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run_native_batch` instead.
+    """
+    from qat.core.wrappers.batch import Batch
+
+    if len(jobs) == 0:
+        return []
+    device = jobs[0].device
+    if TYPE_CHECKING:
+        assert isinstance(device, ATOSDevice)
+    results: dict[int, Result | Exception] = {}
+    if device.is_remote():
+        # the remote QPU depends on the noise of each job
+        for index, job in enumerate(jobs):
+            try:
+                results[index] = run_QLM(job, translation_warning)
+            except Exception as error:
+                results[index] = error
+        return [results[index] for index in range(len(jobs))]
+
+    myqlm_jobs = []
+    packed: list[int] = []
+    for index, job in enumerate(jobs):
+        try:
+            myqlm_jobs.append(_myqlm_job(job, translation_warning))
+        except Exception as error:
+            results[index] = error
+            continue
+        packed.append(index)
+
+    if len(packed) != 0:
+        try:
+            qpu = get_local_qpu(device)
+            if any(jobs[index].job_type == JobType.OBSERVABLE for index in packed):
+                from qat.plugins.observable_splitter import ObservableSplitter
+
+                qpu = ObservableSplitter() | qpu
+            for index in packed:
+                jobs[index].status = JobStatus.RUNNING
+            myqlm_results = qpu.submit(Batch(jobs=myqlm_jobs)).results
+            for index, myqlm_result in zip(packed, myqlm_results):
+                results[index] = extract_result(myqlm_result, jobs[index], device)
+                jobs[index].status = JobStatus.DONE
+        except Exception as error:
+            for index in packed:
+                results.setdefault(index, error)
+
+    return [results[index] for index in range(len(jobs))]
+
+
 @typechecked
 def run_myQLM(job: Job, translation_warning: bool = True) -> Result:
     """Executes the job on the local myQLM simulator.
@@ -706,8 +936,6 @@ def run_myQLM(job: Job, translation_warning: bool = True) -> Result:
     myqlm_result = None
     qpu = None
 
-    myqlm_circuit = job_pre_processing(job, translation_warning)
-
     if TYPE_CHECKING:
         assert isinstance(job.device, ATOSDevice)
     qpu = get_local_qpu(job.device)
@@ -716,18 +944,7 @@ def run_myQLM(job: Job, translation_warning: bool = True) -> Result:
 
         qpu = ObservableSplitter() | qpu
 
-    if job.job_type == JobType.STATE_VECTOR:
-        myqlm_job = generate_state_vector_job(myqlm_circuit)
-
-    elif job.job_type == JobType.SAMPLE:
-        myqlm_job = generate_sample_job(myqlm_circuit, job)
-
-    elif job.job_type == JobType.OBSERVABLE:
-        # TODO: update this to take into account the case when we have list of Observables
-        myqlm_job = generate_observable_job(myqlm_circuit, job)
-
-    else:
-        raise ValueError(f"Job type {job.job_type} not handled")
+    myqlm_job = _myqlm_job(job, translation_warning)
 
     job.status = JobStatus.RUNNING
     myqlm_result = qpu.submit(
@@ -766,24 +983,11 @@ def submit_QLM(job: Job, translation_warning: bool = True) -> tuple[str, "AsyncR
     myqlm_job = None
     qpu = None
 
-    myqlm_circuit = job_pre_processing(job, translation_warning)
-
     if TYPE_CHECKING:
         assert isinstance(job.device, ATOSDevice)
     qpu = get_remote_qpu(job.device, job)
 
-    if job.job_type == JobType.STATE_VECTOR:
-        myqlm_job = generate_state_vector_job(myqlm_circuit)
-
-    elif job.job_type == JobType.SAMPLE:
-        myqlm_job = generate_sample_job(myqlm_circuit, job)
-
-    elif job.job_type == JobType.OBSERVABLE:
-        # TODO: update this to take into account the case when we have list of Observables
-        myqlm_job = generate_observable_job(myqlm_circuit, job)
-
-    else:
-        raise ValueError(f"Job type {job.job_type} not handled")
+    myqlm_job = _myqlm_job(job, translation_warning)
 
     # TODO: update this to take into account the case when we have list of Observables
     job.status = JobStatus.RUNNING
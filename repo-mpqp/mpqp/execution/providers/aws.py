@@ -1,5 +1,5 @@
 import math
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 from typeguard import typechecked
@@ -147,6 +147,23 @@ def submit_job_braket(
         This function is not meant to be used directly, please use
         :func:`~mpqp.execution.runner.run` instead.
     """
+    is_noisy = _check_job(job)
+    if TYPE_CHECKING:
+        assert isinstance(job.device, AWSDevice)
+    device = get_braket_device(job.device, is_noisy=is_noisy)
+    braket_circuit, shots, inputs = _braket_task(job, translation_warning)
+    job.status = JobStatus.RUNNING
+    task = device.run(braket_circuit, shots=shots, inputs=inputs)
+
+    return (
+        task.id,
+        task,
+    )  # TODO : [multi-obs] update this to take into account the case when we have list of Observables
+
+
+def _check_job(job: Job) -> bool:
+    """Checks that the job can be submitted to AWS Braket, see
+    :func:`submit_job_braket`, and returns whether it is noisy."""
     if not isinstance(job.device, AWSDevice):
         raise ValueError(
             "`job` must correspond to an `AWSDevice`, but corresponds to a "
@@ -169,12 +186,28 @@ def submit_job_braket(
             f"Job of type {job.job_type} is not supported for noisy circuits."
         )
 
-    from braket.circuits import Circuit
+    return is_noisy
 
-    device = get_braket_device(job.device, is_noisy=is_noisy)
 
+def _braket_task(
+    job: Job, translation_warning: bool = True
+) -> tuple["Circuit", int, Optional[dict[str, float]]]:
+    """Returns the ``braket`` circuit of the job, with the result types of the
+    job added to it, the number of shots and the inputs of the task (the
+    values of the parameters of the circuit), see :func:`submit_job_braket`."""
+    from braket.circuits import Circuit
+
+    inputs = None
     if job.circuit.transpiled_circuit is None:
-        braket_circuit = job.circuit.to_other_device(job.device, translation_warning)
+        braket_circuit = job.translate(
+            lambda circuit: circuit.to_other_device(job.device, translation_warning)
+        )
+        if job.symbolic_circuit is not None:
+            # the variables are ``FreeParameter`` of the circuit
+            inputs = {
+                param.name: job.values[param.name]
+                for param in braket_circuit.parameters
+            }
     else:
         braket_circuit = job.circuit.transpiled_circuit
 
@@ -183,14 +216,12 @@ def submit_job_braket(
 
     if job.job_type == JobType.STATE_VECTOR:
         braket_circuit.state_vector()  # pyright: ignore[reportAttributeAccessIssue]
-        job.status = JobStatus.RUNNING
-        task = device.run(braket_circuit, shots=0, inputs=None)
+        return braket_circuit, 0, inputs
 
     elif job.job_type == JobType.SAMPLE:
         if TYPE_CHECKING:
             assert job.measure is not None
-        job.status = JobStatus.RUNNING
-        task = device.run(braket_circuit, shots=job.measure.shots, inputs=None)
+        return braket_circuit, job.measure.shots, inputs
 
     elif job.job_type == JobType.OBSERVABLE:
         # TODO : [multi-obs] update this to take into account the case when we have list of Observables
@@ -200,17 +231,100 @@ def submit_job_braket(
         braket_circuit.expectation(  # pyright: ignore[reportAttributeAccessIssue]
             observable=herm_op, target=job.measure.targets
         )
-
-        job.status = JobStatus.RUNNING
-        task = device.run(braket_circuit, shots=job.measure.shots, inputs=None)
+        return braket_circuit, job.measure.shots, inputs
 
     else:
         raise NotImplementedError(f"Job of type {job.job_type} not handled.")
 
-    return (
-        task.id,
-        task,
-    )  # TODO : [multi-obs] update this to take into account the case when we have list of Observables
+
+@typechecked
+def run_braket_batch(
+    jobs: list[Job], translation_warning: bool = True
+) -> list[Result | Exception]:
+    """Executes several jobs on an AWS Braket device. On the remote devices,
+    the jobs with the same number of shots are submitted together, in a
+    single batch of tasks.
+
+    On the local simulator, the jobs are run one after the other:
+    ``LocalSimulator.run_batch`` runs the tasks in a pool of processes, which
+    costs more than it saves for small circuits.
+
+    Args:
+        jobs: Jobs to be executed, on the same device.
+        translation_warning: If `True`, a warning will be raised.
+
+    Returns:
+        The result of each job, or the error raised by its execution (an
+        :class:`~mpqp.tools.errors.AWSBraketRemoteExecutionError` when its
+        task failed). An error raised by the submission of a batch of tasks is
+        given to all its jobs.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run_native_batch` instead.
+    """
+    results: dict[int, Result | Exception] = {}
+    tasks = {}
+    groups: dict[tuple[bool, int], list[int]] = {}
+    for index, job in enumerate(jobs):
+        try:
+            is_noisy = _check_job(job)
+            braket_circuit, shots, inputs = _braket_task(job, translation_warning)
+        except Exception as error:
+            results[index] = error
+            continue
+        tasks[index] = (braket_circuit, inputs)
+        groups.setdefault((is_noisy, shots), []).append(index)
+
+    for (is_noisy, shots), indices in groups.items():
+        aws_device = jobs[indices[0]].device
+        if TYPE_CHECKING:
+            assert isinstance(aws_device, AWSDevice)
+        for index in indices:
+            jobs[index].status = JobStatus.RUNNING
+        braket_results: list[Any] = []
+        try:
+            device = get_braket_device(aws_device, is_noisy=is_noisy)
+            if aws_device.is_remote():
+                batch = device.run_batch(
+                    [tasks[index][0] for index in indices],
+                    shots=shots,
+                    max_parallel=None,
+                    inputs=[tasks[index][1] or {} for index in indices],
+                )
+                for index, task in zip(
+                    indices, batch.tasks  # pyright: ignore[reportAttributeAccessIssue]
+                ):
+                    jobs[index].id = task.id
+                braket_results = batch.results()
+            else:
+                # the tasks are run one by one, so an error concerns its task only
+                for index in indices:
+                    try:
+                        braket_results.append(
+                            device.run(
+                                tasks[index][0], shots=shots, inputs=tasks[index][1]
+                            ).result()
+                        )
+                    except Exception as error:
+                        results[index] = error
+                        braket_results.append(None)
+        except Exception as error:
+            results.update(dict.fromkeys(indices, error))
+            continue
+        for index, braket_result in zip(indices, braket_results):
+            if index in results:
+                continue
+            try:
+                if braket_result is None:
+                    raise AWSBraketRemoteExecutionError(
+                        f"The task {jobs[index].id} of the batch failed."
+                    )
+                results[index] = extract_result(braket_result, jobs[index], aws_device)
+            except Exception as error:
+                results[index] = error
+
+    return [results[index] for index in range(len(jobs))]
 
 
 @typechecked
@@ -2,14 +2,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Sequence
 
+import numpy as np
+import numpy.typing as npt
+
 from mpqp.core.instruction.measurement.pauli_string import PauliString
 from mpqp.tools.errors import DeviceJobIncompatibleError
 
 if TYPE_CHECKING:
+    from sympy import Expr
     from cirq.sim.state_vector_simulator import StateVectorTrialResult
+    from cirq.circuits.circuit import Circuit as CirqCircuit
     from cirq.study.result import Result as CirqResult
     from cirq.work.observable_measurement_data import ObservableMeasuredResult
 
+    from mpqp.core.circuit import QCircuit
+
 from typeguard import typechecked
 
 from mpqp import Language
@@ -17,7 +24,7 @@ from mpqp.core.instruction.measurement.basis_measure import BasisMeasure
 from mpqp.core.instruction.measurement.expectation_value import ExpectationMeasure
 from mpqp.execution.devices import GOOGLEDevice
 from mpqp.execution.job import Job, JobType
-from mpqp.execution.result import Result, Sample, StateVector
+from mpqp.execution.result import Result, Sample, StateVector, SweepResult
 
 
 @typechecked
@@ -126,7 +133,6 @@ def run_local(job: Job, translation_warning: bool = True) -> Result:
             f"{job.device} instead"
         )
 
-    from cirq.circuits.circuit import Circuit as CirqCircuit
     from cirq.ops.pauli_string import PauliString as CirqPauliString
     from cirq.sim.sparse_simulator import Simulator
     from cirq.work.observable_measurement import (
@@ -137,22 +143,9 @@ def run_local(job: Job, translation_warning: bool = True) -> Result:
     if job.device.is_processor():
         return run_local_processor(job)
 
-    if job.circuit.transpiled_circuit is None:
-        if job.job_type == JobType.STATE_VECTOR:
-            # 3M-TODO: careful, if we ever support several measurements, the
-            # line bellow will have to changer
-            circuit = job.circuit.without_measurements() + job.circuit.pre_measure()
-            cirq_circuit = circuit.to_other_device(job.device, translation_warning)
-            job.circuit.gphase = circuit.gphase
-        else:
-            cirq_circuit = job.circuit.to_other_device(job.device, translation_warning)
-    else:
-        cirq_circuit = job.circuit.transpiled_circuit
-
-    if TYPE_CHECKING:
-        assert isinstance(cirq_circuit, CirqCircuit)
+    cirq_circuit = _local_circuit(job, translation_warning)
 
-    simulator = Simulator(noise=None)
+    simulator = Simulator(noise=None, seed=job.seed)
 
     if job.job_type == JobType.STATE_VECTOR:
         return extract_result_STATE_VECTOR(simulator.simulate(cirq_circuit), job)
@@ -202,6 +195,174 @@ def run_local(job: Job, translation_warning: bool = True) -> Result:
         raise ValueError(f"Job type {job.job_type} not handled")
 
 
+def _local_circuit(job: Job, translation_warning: bool = True) -> "CirqCircuit":
+    """Returns the ``cirq`` circuit of the job, its parameters being resolved,
+    see :func:`run_local`."""
+    from cirq.circuits.circuit import Circuit as CirqCircuit
+
+    if job.circuit.transpiled_circuit is None:
+
+        def translate(circuit: QCircuit) -> CirqCircuit:
+            if job.job_type == JobType.STATE_VECTOR:
+                # 3M-TODO: careful, if we ever support several measurements, the
+                # line bellow will have to changer
+                prepared = circuit.without_measurements() + circuit.pre_measure()
+                cirq_circuit = prepared.to_other_device(job.device, translation_warning)
+                circuit.gphase = prepared.gphase
+            else:
+                cirq_circuit = circuit.to_other_device(job.device, translation_warning)
+            if TYPE_CHECKING:
+                assert isinstance(cirq_circuit, CirqCircuit)
+            return cirq_circuit
+
+        cirq_circuit = job.translate(translate)
+        if job.symbolic_circuit is not None:
+            from cirq.protocols.resolve_parameters import resolve_parameters
+
+            cirq_circuit = resolve_parameters(
+                cirq_circuit, job.values  # pyright: ignore[reportArgumentType]
+            )
+    else:
+        cirq_circuit = job.circuit.transpiled_circuit
+
+    if TYPE_CHECKING:
+        assert isinstance(cirq_circuit, CirqCircuit)
+
+    return cirq_circuit
+
+
+@typechecked
+def run_google_batch(
+    jobs: list[Job], translation_warning: bool = True
+) -> list[Result | Exception]:
+    """Executes several jobs on a Google device. On the local simulator, the
+    ``SAMPLE`` jobs are run together, in a single batch of the simulator.
+
+    Args:
+        jobs: Jobs to be executed, on the same device.
+        translation_warning: If `True`, a warning will be raised.
+
+    Returns:
+        The result of each job, or the error raised by its execution. An error
+        raised by the batch of the simulator is given to all its jobs.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run_native_batch` instead.
+    """
+    from cirq.sim.sparse_simulator import Simulator
+
+    results: dict[int, Result | Exception] = {}
+    sampled = []
+    programs = []
+    repetitions = []
+    for index, job in enumerate(jobs):
+        try:
+            if (
+                job.device == GOOGLEDevice.CIRQ_LOCAL_SIMULATOR
+                and job.job_type == JobType.SAMPLE
+            ):
+                if TYPE_CHECKING:
+                    assert isinstance(job.measure, BasisMeasure)
+                program = _local_circuit(job, translation_warning)
+                programs.append(program)
+                repetitions.append(job.measure.shots)
+                sampled.append(index)
+            else:
+                results[index] = run_google(job, translation_warning)
+        except Exception as error:
+            results[index] = error
+
+    if len(sampled) != 0:
+        try:
+            trials = Simulator(noise=None).run_batch(programs, repetitions=repetitions)
+            for index, (trial,) in zip(sampled, trials):
+                results[index] = extract_result_SAMPLE(trial, jobs[index])
+        except Exception as error:
+            for index in sampled:
+                results.setdefault(index, error)
+
+    return [results[index] for index in range(len(jobs))]
+
+
+@typechecked
+def sweep_local(
+    job: Job,
+    parameters: list[Expr],
+    values: npt.NDArray[np.float64],
+    translation_warning: bool = True,
+) -> SweepResult:
+    """Executes the job of a symbolic circuit on the local ``cirq`` simulator,
+    for a batch of values of its parameters. The circuit is translated once,
+    and all the points are run in a single sweep of the simulator.
+
+    Args:
+        job: Job to be executed, of type ``SAMPLE`` or ``STATE_VECTOR``, its
+            circuit still containing the ``parameters``.
+        parameters: The variables of the circuit.
+        values: Values of the ``parameters``, one line per point.
+        translation_warning: If `True`, a warning will be raised.
+
+    Returns:
+        The results of all the points.
+
+    Raises:
+        ValueError: If the job's device is not the local simulator, or if the
+            job type is ``OBSERVABLE``.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run_sweep` instead.
+    """
+    if job.device != GOOGLEDevice.CIRQ_LOCAL_SIMULATOR:
+        raise ValueError(
+            "`job` must correspond to `GOOGLEDevice.CIRQ_LOCAL_SIMULATOR`, but "
+            f"corresponds to {job.device} instead"
+        )
+    if job.job_type == JobType.OBSERVABLE:
+        raise ValueError("Sweeps of observables are not supported on cirq.")
+
+    from cirq.sim.sparse_simulator import Simulator
+    from cirq.study.resolver import ParamResolver
+
+    from mpqp.tools.maths import normalize
+
+    resolvers = [
+        ParamResolver(
+            {str(param): float(value) for param, value in zip(parameters, point)}
+        )
+        for point in values
+    ]
+    simulator = Simulator(noise=None)
+
+    if job.job_type == JobType.STATE_VECTOR:
+        circuit = job.circuit.without_measurements() + job.circuit.pre_measure()
+        cirq_circuit = circuit.to_other_device(job.device, translation_warning)
+        if TYPE_CHECKING:
+            assert isinstance(cirq_circuit, CirqCircuit)
+        states = np.array(
+            [
+                normalize(trial.final_state_vector)
+                for trial in simulator.simulate_sweep(cirq_circuit, resolvers)
+            ]
+        )
+        return SweepResult(job, parameters, values, states, np.zeros(len(values)))
+
+    if TYPE_CHECKING:
+        assert isinstance(job.measure, BasisMeasure)
+    cirq_circuit = job.circuit.to_other_device(job.device, translation_warning)
+    if TYPE_CHECKING:
+        assert isinstance(cirq_circuit, CirqCircuit)
+    counts = np.zeros((len(values), 2**job.measure.nb_qubits), dtype=np.int64)
+    for point, trial in enumerate(
+        simulator.run_sweep(cirq_circuit, resolvers, repetitions=job.measure.shots)
+    ):
+        bits = np.hstack([trial.records[key][:, 0] for key in sorted(trial.records)])
+        indices = bits @ (1 << np.arange(bits.shape[1])[::-1])
+        counts[point] = np.bincount(indices, minlength=counts.shape[1])
+    return SweepResult(job, parameters, values, counts, None, job.measure.shots)
+
+
 @typechecked
 def run_local_processor(job: Job) -> Result:
     """Executes the job locally on processor.
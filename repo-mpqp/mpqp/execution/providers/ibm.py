@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import math
 import warnings
-from copy import deepcopy
-from typing import TYPE_CHECKING, Optional
+from copy import copy, deepcopy
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
+import numpy.typing as npt
 from mpqp.core.circuit import QCircuit
 from mpqp.core.instruction.gates import Gate, Id
 from mpqp.core.instruction.gates.native_gates import NativeGate
@@ -18,7 +19,7 @@ from mpqp.execution.connection.ibm_connection import (
 )
 from mpqp.execution.devices import AZUREDevice, IBMDevice
 from mpqp.execution.job import Job, JobStatus, JobType
-from mpqp.execution.result import Result, Sample, StateVector
+from mpqp.execution.result import Result, Sample, StateVector, SweepResult
 from mpqp.noise import DimensionalNoiseModel
 from mpqp.tools.errors import (
     DeviceJobIncompatibleError,
@@ -29,6 +30,7 @@ from mpqp.tools.errors import (
 from typeguard import typechecked
 
 if TYPE_CHECKING:
+    from sympy import Expr
     from qiskit import QuantumCircuit
     from qiskit.primitives import (
         EstimatorResult,
@@ -89,6 +91,25 @@ def compute_expectation_value(
         This function is not meant to be used directly, please use
         :func:`~mpqp.execution.runner.run` instead.
     """
+    from mpqp.execution.simulated_devices import IBMSimulatedDevice
+
+    estimator, pub = _estimator_pub(ibm_circuit, job, simulator)
+    job.status = JobStatus.RUNNING
+    job_expectation = estimator.run([pub])
+    estimator_result = job_expectation.result()
+
+    if TYPE_CHECKING:
+        assert isinstance(job.device, (IBMDevice, IBMSimulatedDevice))
+
+    return extract_result(estimator_result, job, job.device)
+
+
+def _estimator_pub(
+    ibm_circuit: "QuantumCircuit", job: Job, simulator: Optional["AerSimulator"]
+) -> tuple[Any, tuple["QuantumCircuit", list["SparsePauliOp"]]]:
+    """Returns the estimator computing the expectation values of the job, and
+    the PUB (circuit and observables) to give to it, see
+    :func:`compute_expectation_value`."""
     from qiskit.quantum_info import SparsePauliOp
 
     from mpqp.execution.simulated_devices import IBMSimulatedDevice
@@ -138,14 +159,7 @@ def compute_expectation_value(
         }
         estimator = Estimator(options=options)
 
-    job.status = JobStatus.RUNNING
-    job_expectation = estimator.run([(ibm_circuit, qiskit_observables)])
-    estimator_result = job_expectation.result()
-
-    if TYPE_CHECKING:
-        assert isinstance(job.device, (IBMDevice, IBMSimulatedDevice))
-
-    return extract_result(estimator_result, job, job.device)
+    return estimator, (ibm_circuit, qiskit_observables)
 
 
 @typechecked
@@ -438,27 +452,11 @@ def run_aer(job: Job):
     """
     check_job_compatibility(job)
 
-    from qiskit import QuantumCircuit
     from qiskit_aer import AerSimulator
 
     from mpqp.execution.simulated_devices import IBMSimulatedDevice
 
-    if job.circuit.transpiled_circuit is None:
-        qiskit_circuit = (
-            (
-                # 3M-TODO: careful, if we ever support several measurements, the
-                # line bellow will have to changer
-                job.circuit.without_measurements()
-                + job.circuit.pre_measure()
-            ).to_other_device(job.device)
-            if (job.job_type == JobType.STATE_VECTOR)
-            else job.circuit.to_other_device(job.device)
-        )
-    else:
-        qiskit_circuit = job.circuit.transpiled_circuit
-
-    if TYPE_CHECKING:
-        assert isinstance(qiskit_circuit, QuantumCircuit)
+    qiskit_circuit = _aer_circuit(job)
 
     if isinstance(job.device, IBMSimulatedDevice):
         if len(job.circuit.noises) != 0:
@@ -505,7 +503,8 @@ def run_aer(job: Job):
             #  but without it, it doesn't woghk
             qiskit_circuit = transpile(qiskit_circuit, backend_sim)
 
-        job_sim = backend_sim.run(qiskit_circuit, shots=job.measure.shots)
+        options = {} if job.seed is None else {"seed_simulator": job.seed}
+        job_sim = backend_sim.run(qiskit_circuit, shots=job.measure.shots, **options)
         result_sim = job_sim.result()
         if TYPE_CHECKING:
             assert isinstance(job.device, (IBMDevice, IBMSimulatedDevice))
@@ -521,6 +520,98 @@ def run_aer(job: Job):
     return result
 
 
+def _aer_circuit(job: Job) -> "QuantumCircuit":
+    """Translates the circuit of the job for the AER simulator, see
+    :func:`run_aer`."""
+    from qiskit import QuantumCircuit
+
+    if job.circuit.transpiled_circuit is None:
+        qiskit_circuit = job.translate(
+            lambda circuit: (
+                (
+                    # 3M-TODO: careful, if we ever support several measurements, the
+                    # line bellow will have to changer
+                    circuit.without_measurements()
+                    + circuit.pre_measure()
+                ).to_other_device(job.device)
+                if (job.job_type == JobType.STATE_VECTOR)
+                else circuit.to_other_device(job.device)
+            )
+        )
+        if job.symbolic_circuit is not None:
+            qiskit_circuit = qiskit_circuit.assign_parameters(
+                {param: job.values[param.name] for param in qiskit_circuit.parameters}
+            )
+    else:
+        qiskit_circuit = job.circuit.transpiled_circuit
+
+    if TYPE_CHECKING:
+        assert isinstance(qiskit_circuit, QuantumCircuit)
+    return qiskit_circuit
+
+
+@typechecked
+def sweep_aer(
+    job: Job, parameters: list[Expr], values: npt.NDArray[np.float64]
+) -> SweepResult:
+    """Samples the symbolic circuit of the job on the AER simulator, for a
+    batch of values of its parameters. The circuit is translated once, and
+    all the points are bound natively by the simulator (``parameter_binds``).
+
+    Args:
+        job: Job to be executed, of type ``SAMPLE``, its circuit still
+            containing the ``parameters``.
+        parameters: The variables of the circuit.
+        values: Values of the ``parameters``, one line per point.
+
+    Returns:
+        The results of all the points.
+
+    Raises:
+        ValueError: If a parameter of the translated circuit is not one of
+            the ``parameters`` (which happens when a gate parameter is an
+            expression of several variables).
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run_sweep` instead.
+    """
+    check_job_compatibility(job)
+    if TYPE_CHECKING:
+        assert isinstance(job.device, IBMDevice)
+        assert isinstance(job.measure, BasisMeasure)
+
+    from qiskit import QuantumCircuit
+    from qiskit_aer import AerSimulator
+
+    qiskit_circuit = job.circuit.to_other_device(job.device)
+    if TYPE_CHECKING:
+        assert isinstance(qiskit_circuit, QuantumCircuit)
+    names = [str(param) for param in parameters]
+    unknown = [p.name for p in qiskit_circuit.parameters if p.name not in names]
+    if len(unknown) != 0:
+        raise ValueError(
+            f"Parameters {unknown} of the translated circuit cannot be bound."
+        )
+    binds = {
+        param: values[:, names.index(param.name)].tolist()
+        for param in qiskit_circuit.parameters
+    }
+
+    job.status = JobStatus.RUNNING
+    result = (
+        AerSimulator(method=job.device.value)
+        .run(qiskit_circuit, shots=job.measure.shots, parameter_binds=[binds])
+        .result()
+    )
+    counts = np.zeros((len(values), 2**job.measure.nb_qubits), dtype=np.int64)
+    for point in range(len(values)):
+        for bin_str, count in result.get_counts(point).items():
+            counts[point, int(bin_str, 2)] = count
+    job.status = JobStatus.DONE
+    return SweepResult(job, parameters, values, counts, None, job.measure.shots)
+
+
 @typechecked
 def submit_remote_ibm(job: Job) -> tuple[str, "RuntimeJobV2"]:
     """Submits the job on the remote IBM device (quantum computer or simulator).
@@ -535,46 +626,73 @@ def submit_remote_ibm(job: Job) -> tuple[str, "RuntimeJobV2"]:
         This function is not meant to be used directly, please use
         :func:`~mpqp.execution.runner.run` instead.
     """
+    ibm_job = _submit_remote_pubs([job])
+    assert job.id is not None
+    return job.id, ibm_job
+
+
+def _submit_remote_pubs(jobs: list[Job]) -> "RuntimeJobV2":
+    """Submits the jobs in a single ``qiskit`` runtime job, each of them being a
+    PUB of the primitive. The jobs must be of the same type, with the same
+    number of shots, on the same device.
+
+    Args:
+        jobs: Jobs to be executed.
+
+    Returns:
+        The ``qiskit`` job, whose id is set to the jobs.
+    """
     from qiskit import QuantumCircuit
     from qiskit_ibm_runtime import EstimatorV2 as Runtime_Estimator
     from qiskit_ibm_runtime import SamplerV2 as Runtime_Sampler
     from qiskit_ibm_runtime import Session
 
+    job = jobs[0]
     meas = job.measure
 
-    check_job_compatibility(job)
+    for job_ in jobs:
+        check_job_compatibility(job_)
 
     service = get_QiskitRuntimeService()
     if TYPE_CHECKING:
         assert isinstance(job.device, IBMDevice)
     backend = get_backend(job.device)
-    job.device = IBMDevice(backend.name)
+    for job_ in jobs:
+        job_.device = IBMDevice(backend.name)
     session = Session(service=service, backend=backend)
 
-    if job.circuit.transpiled_circuit is None:
-        qiskit_circ = job.circuit.to_other_device(job.device)
-    else:
-        qiskit_circ = job.circuit.transpiled_circuit
-
-    if TYPE_CHECKING:
-        assert isinstance(qiskit_circ, QuantumCircuit)
+    qiskit_circuits = []
+    for job_ in jobs:
+        if job_.circuit.transpiled_circuit is None:
+            qiskit_circ = job_.circuit.to_other_device(job_.device)
+        else:
+            qiskit_circ = job_.circuit.transpiled_circuit
+        if TYPE_CHECKING:
+            assert isinstance(qiskit_circ, QuantumCircuit)
+        qiskit_circuits.append(qiskit_circ)
 
     if job.job_type == JobType.OBSERVABLE:
         if TYPE_CHECKING:
             assert isinstance(meas, ExpectationMeasure)
         estimator = Runtime_Estimator(mode=session)
-        qiskit_observables = [
-            obs.to_other_language(Language.QISKIT) for obs in meas.observables
-        ]
-        if TYPE_CHECKING:
-            assert all(isinstance(obs, SparsePauliOp) for obs in qiskit_observables)
+        pubs = []
+        for job_, qiskit_circ in zip(jobs, qiskit_circuits):
+            if TYPE_CHECKING:
+                assert isinstance(job_.measure, ExpectationMeasure)
+            qiskit_observables = [
+                obs.to_other_language(Language.QISKIT)
+                for obs in job_.measure.observables
+            ]
+            if TYPE_CHECKING:
+                assert all(isinstance(obs, SparsePauliOp) for obs in qiskit_observables)
 
-        qiskit_observables = [
-            obs.apply_layout(  # pyright: ignore[reportAttributeAccessIssue]
-                qiskit_circ.layout
-            )
-            for obs in qiskit_observables
-        ]
+            qiskit_observables = [
+                obs.apply_layout(  # pyright: ignore[reportAttributeAccessIssue]
+                    qiskit_circ.layout
+                )
+                for obs in qiskit_observables
+            ]
+            pubs.append((qiskit_circ, qiskit_observables))
 
         # We have to disable all the twirling options and set manually the number of circuits and shots per circuits
         twirling = getattr(estimator.options, "twirling", None)
@@ -586,21 +704,22 @@ def submit_remote_ibm(job: Job) -> tuple[str, "RuntimeJobV2"]:
 
         setattr(estimator.options, "default_shots", meas.shots)
 
-        ibm_job = estimator.run([(qiskit_circ, qiskit_observables)])
+        ibm_job = estimator.run(pubs)
 
     elif job.job_type == JobType.SAMPLE:
         if TYPE_CHECKING:
             assert isinstance(meas, BasisMeasure)
         sampler = Runtime_Sampler(mode=session)
-        ibm_job = sampler.run([qiskit_circ], shots=meas.shots)
+        ibm_job = sampler.run(qiskit_circuits, shots=meas.shots)
     else:
         raise NotImplementedError(
             f"{job.job_type} not handled by remote remote IBM devices."
         )
 
-    job.id = ibm_job.job_id()
+    for job_ in jobs:
+        job_.id = ibm_job.job_id()
 
-    return job.id, ibm_job
+    return ibm_job
 
 
 @typechecked
@@ -626,6 +745,126 @@ def run_remote_ibm(job: Job) -> Result:
     return extract_result(ibm_result, job, job.device)
 
 
+@typechecked
+def run_ibm_batch(jobs: list[Job]) -> list[Result | Exception]:
+    """Executes several jobs on an IBM device, packing them in as few
+    ``qiskit`` executions as possible: the jobs of the same type and with the
+    same number of shots are run together, in a single call to the AER
+    simulator (or to its estimator), or in a single runtime job whose PUBs are
+    the jobs for the remote devices.
+
+    The noisy jobs and the jobs on a
+    :class:`~mpqp.execution.simulated_devices.IBMSimulatedDevice` are executed
+    one by one.
+
+    Args:
+        jobs: Jobs to be executed, on the same device.
+
+    Returns:
+        The result of each job, or the error raised by its execution. An error
+        raised by a ``qiskit`` execution is given to all the jobs it packs,
+        without stopping the other executions.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run_native_batch` instead.
+    """
+    from mpqp.execution.simulated_devices import IBMSimulatedDevice
+
+    results: dict[int, Result | Exception] = {}
+    groups: dict[tuple[JobType, int], list[int]] = {}
+    for index, job in enumerate(jobs):
+        try:
+            if (
+                isinstance(job.device, IBMSimulatedDevice)
+                or len(job.circuit.noises) != 0
+            ):
+                results[index] = run_ibm(job)
+                continue
+            check_job_compatibility(job)
+        except Exception as error:
+            results[index] = error
+            continue
+        shots = 0 if job.measure is None else job.measure.shots
+        groups.setdefault((job.job_type, shots), []).append(index)
+
+    for (job_type, shots), indices in groups.items():
+        group = [jobs[index] for index in indices]
+        device = group[0].device
+        if TYPE_CHECKING:
+            assert isinstance(device, IBMDevice)
+        try:
+            if device.is_remote():
+                ibm_job = _submit_remote_pubs(group)
+                ibm_result = ibm_job.result()
+                group_results = [
+                    extract_result(_pub_result(ibm_result, i), job, device)
+                    for i, job in enumerate(group)
+                ]
+            else:
+                group_results = _run_aer_group(group, job_type, shots)
+        except Exception as error:
+            group_results = [error] * len(group)
+        for index, result in zip(indices, group_results):
+            results[index] = result
+
+    return [results[index] for index in range(len(jobs))]
+
+
+def _run_aer_group(jobs: list[Job], job_type: JobType, shots: int) -> list[Result]:
+    """Runs in a single execution of the AER simulator noiseless jobs of the
+    same type and number of shots, see :func:`run_ibm_batch`."""
+    from qiskit_aer import AerSimulator
+
+    device = jobs[0].device
+    if TYPE_CHECKING:
+        assert isinstance(device, IBMDevice)
+    simulator = AerSimulator(method=device.value)
+    qiskit_circuits = [_aer_circuit(job) for job in jobs]
+    for job in jobs:
+        job.status = JobStatus.RUNNING
+
+    if job_type == JobType.OBSERVABLE:
+        estimator = None
+        pubs = []
+        for job, qiskit_circuit in zip(jobs, qiskit_circuits):
+            estimator, pub = _estimator_pub(qiskit_circuit, job, simulator)
+            pubs.append(pub)
+        assert estimator is not None
+        estimator_result = estimator.run(pubs).result()
+        results = [
+            extract_result(_pub_result(estimator_result, i), job, device)
+            for i, job in enumerate(jobs)
+        ]
+    else:
+        if job_type == JobType.STATE_VECTOR:
+            for qiskit_circuit in qiskit_circuits:
+                qiskit_circuit.save_statevector()  # pyright: ignore[reportAttributeAccessIssue]
+        result_sim = simulator.run(qiskit_circuits, shots=shots).result()
+        results = [
+            extract_result(_experiment_result(result_sim, i), job, device)
+            for i, job in enumerate(jobs)
+        ]
+
+    for job in jobs:
+        job.status = JobStatus.DONE
+    return results
+
+
+def _pub_result(result: "PrimitiveResult[Any]", index: int) -> "PrimitiveResult[Any]":
+    """Result of the PUB of index ``index`` of a primitive."""
+    from qiskit.primitives import PrimitiveResult
+
+    return PrimitiveResult([result[index]], result.metadata)
+
+
+def _experiment_result(result: "QiskitResult", index: int) -> "QiskitResult":
+    """Result of the experiment (circuit) of index ``index`` of an execution."""
+    experiment = copy(result)
+    experiment.results = [result.results[index]]
+    return experiment
+
+
 @typechecked
 def extract_result(
     result: "QiskitResult | EstimatorResult | PrimitiveResult[PubResult | SamplerPubResult]",
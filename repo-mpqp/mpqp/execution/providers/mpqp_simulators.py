@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import replace
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.instruction.measurement.basis_measure import BasisMeasure
+from mpqp.core.instruction.measurement.expectation_value import ExpectationMeasure
+from mpqp.execution.devices import MPQPDevice
+from mpqp.execution.job import Job, JobStatus, JobType
+from mpqp.execution.result import Result, Sample, StateVector, SweepResult
+from mpqp.execution.simulators.density_matrix import (
+    expectation_from_density_matrix,
+    simulate_density_matrix,
+)
+from mpqp.execution.simulators.mps import simulate_mps
+from mpqp.execution.simulators.sampling import Sampler, random_generator
+from mpqp.execution.simulators.stabilizer import (
+    CLIFFORD_GATES,
+    is_clifford,
+    simulate_stabilizer,
+)
+from mpqp.execution.simulators.statevector import (
+    expectation_from_state,
+    expectations_from_states,
+    marginal_probabilities,
+    sample_counts,
+    simulate_state_vector,
+    simulate_state_vector_batch,
+)
+from mpqp.execution.simulators.trajectories import (
+    sample_trajectories,
+    trajectory_config,
+    trajectory_expectations,
+)
+from mpqp.tools.errors import DeviceJobIncompatibleError
+
+if TYPE_CHECKING:
+    from sympy import Expr
+
+    from mpqp.core.circuit import QCircuit
+
+
+@typechecked
+def run_mpqp(job: Job, translation_warning: bool = True) -> Result:
+    """Executes the job on the ``MPQP`` simulator precised in the job in
+    parameter. No third party SDK is involved: the circuit is never
+    translated.
+
+    Args:
+        job: Job to be executed, it MUST be corresponding to a
+            :class:`~mpqp.execution.devices.MPQPDevice`.
+        translation_warning: Unused, the circuit is not translated. Kept for
+            consistency with the other providers.
+
+    Returns:
+        The result of the job.
+
+    Raises:
+        ValueError: If the job's device is not an instance of MPQPDevice.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run` instead.
+    """
+    if not isinstance(job.device, MPQPDevice):
+        raise ValueError(
+            "`job` must correspond to an `MPQPDevice`, but corresponds to a "
+            f"{job.device} instead"
+        )
+    check_job_compatibility(job)
+
+    job.status = JobStatus.RUNNING
+    # 3M-TODO: careful, if we ever support several measurements, the line
+    # bellow will have to change
+    circuit = job.circuit.without_measurements() + job.circuit.pre_measure()
+    if job.device == MPQPDevice.STABILIZER_SIMULATOR or (
+        job.device == MPQPDevice.STATEVECTOR_SIMULATOR
+        and _prefers_stabilizer(circuit, job)
+    ):
+        result = run_stabilizer(circuit, job)
+    elif job.device == MPQPDevice.STATEVECTOR_SIMULATOR:
+        result = run_statevector(circuit, job)
+    elif job.device == MPQPDevice.DENSITY_MATRIX_SIMULATOR:
+        result = run_density_matrix(circuit, job)
+    elif job.device == MPQPDevice.TRAJECTORY_SIMULATOR:
+        result = run_trajectories(circuit, job)
+    elif job.device == MPQPDevice.MPS_SIMULATOR:
+        result = run_mps(circuit, job)
+    else:
+        raise NotImplementedError(f"Device {job.device} not handled.")
+    job.status = JobStatus.DONE
+    return result
+
+
+@typechecked
+def sweep_mpqp(
+    job: Job, parameters: list[Expr], values: npt.NDArray[np.float64]
+) -> SweepResult:
+    """Executes the job of a symbolic circuit on the statevector simulator,
+    for a batch of values of its parameters. All the points are simulated at
+    once by
+    :func:`~mpqp.execution.simulators.statevector.simulate_state_vector_batch`.
+
+    Args:
+        job: Job to be executed, its circuit still containing the
+            ``parameters``.
+        parameters: The variables of the circuit.
+        values: Values of the ``parameters``, one line per point.
+
+    Returns:
+        The results of all the points.
+
+    Raises:
+        ValueError: If the job's device is not the statevector simulator.
+
+    Note:
+        This function is not meant to be used directly, please use
+        :func:`~mpqp.execution.runner.run_sweep` instead.
+    """
+    if job.device != MPQPDevice.STATEVECTOR_SIMULATOR:
+        raise ValueError(
+            "Only the statevector simulator can run a sweep at once, but `job` "
+            f"corresponds to {job.device}."
+        )
+    check_job_compatibility(job)
+
+    job.status = JobStatus.RUNNING
+    circuit = job.circuit.without_measurements() + job.circuit.pre_measure()
+    states = simulate_state_vector_batch(circuit, parameters, values)
+    rng = random_generator(job.seed)
+
+    if job.job_type == JobType.STATE_VECTOR:
+        # see _state_vector_result, the circuit of the user is left untouched
+        job.circuit = copy(job.circuit)
+        job.circuit.gphase = 0
+        result = SweepResult(job, parameters, values, states, np.zeros(len(values)))
+    elif job.job_type == JobType.SAMPLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, BasisMeasure)
+        probabilities = marginal_probabilities(
+            np.square(np.abs(states)), job.measure.targets
+        )
+        counts = sample_counts(probabilities, job.measure.shots, rng)
+        result = SweepResult(job, parameters, values, counts, None, job.measure.shots)
+    else:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, ExpectationMeasure)
+        shots = job.measure.shots
+        expectations = [
+            expectations_from_states(
+                states, np.asarray(obs.matrix, dtype=np.complex128), shots, rng
+            )
+            for obs in job.measure.observables
+        ]
+        result = SweepResult(
+            job,
+            parameters,
+            values,
+            np.stack([value for value, _ in expectations], axis=1),
+            np.stack([error for _, error in expectations], axis=1),
+            shots,
+        )
+    job.status = JobStatus.DONE
+    return result
+
+
+@typechecked
+def check_job_compatibility(job: Job):
+    """Checks whether the job in parameter can be run on its device.
+
+    Args:
+        job: Job for which we want to check compatibility.
+
+    Raises:
+        DeviceJobIncompatibleError: If the job type is not supported by the
+            device, or if the circuit is noisy and the device cannot simulate
+            noise.
+    """
+    device = job.device
+    if job.job_type == JobType.STATE_VECTOR and not device.supports_state_vector():
+        raise DeviceJobIncompatibleError(
+            f"Cannot reconstruct state vector with {device.name}, please add a "
+            "measure to the circuit or use a statevector simulator instead."
+        )
+    if job.job_type == JobType.SAMPLE and not device.supports_samples():
+        raise DeviceJobIncompatibleError(f"{device.name} cannot sample circuits.")
+    if job.job_type == JobType.OBSERVABLE and not device.supports_observable():
+        raise DeviceJobIncompatibleError(
+            f"Expectation values cannot be computed with {device.name}."
+        )
+    if len(job.circuit.noises) != 0 and not device.is_noisy_simulator():
+        raise DeviceJobIncompatibleError(
+            f"Device {device.name} cannot simulate circuits containing NoiseModels."
+        )
+    if device == MPQPDevice.STABILIZER_SIMULATOR and not is_clifford(
+        job.circuit.without_measurements() + job.circuit.pre_measure()
+    ):
+        raise DeviceJobIncompatibleError(
+            f"Device {device.name} can only simulate circuits made of the gates "
+            f"{', '.join(gate.__name__ for gate in CLIFFORD_GATES)}."
+        )
+
+
+def _prefers_stabilizer(circuit: QCircuit, job: Job) -> bool:
+    """Checks if a job sent to the statevector simulator can be run on the
+    stabilizer tableau instead: its circuit is a Clifford circuit, and its
+    observables (if any) are already given as Pauli strings."""
+    if job.job_type == JobType.OBSERVABLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, ExpectationMeasure)
+        if not all(obs.has_pauli_string for obs in job.measure.observables):
+            return False
+    elif job.job_type != JobType.SAMPLE:
+        return False
+    return is_clifford(circuit)
+
+
+@typechecked
+def run_statevector(circuit: QCircuit, job: Job) -> Result:
+    """Simulates the job with
+    :func:`~mpqp.execution.simulators.statevector.simulate_state_vector`.
+
+    Args:
+        circuit: The circuit of the job, pre-measure included.
+        job: Job to be executed.
+
+    Returns:
+        The result of the job.
+    """
+    state = simulate_state_vector(circuit)
+
+    if job.job_type == JobType.STATE_VECTOR:
+        return _state_vector_result(job, state, 0)
+
+    return extract_result(
+        job,
+        np.square(np.abs(state)),
+        lambda observable, shots, rng: expectation_from_state(
+            state, observable, shots, rng
+        ),
+    )
+
+
+@typechecked
+def run_density_matrix(circuit: QCircuit, job: Job) -> Result:
+    """Simulates the job with
+    :func:`~mpqp.execution.simulators.density_matrix.simulate_density_matrix`.
+
+    Args:
+        circuit: The circuit of the job, pre-measure included.
+        job: Job to be executed.
+
+    Returns:
+        The result of the job.
+    """
+    rho = simulate_density_matrix(circuit)
+    return extract_result(
+        job,
+        np.clip(rho.diagonal().real, 0, None),
+        lambda observable, shots, rng: expectation_from_density_matrix(
+            rho, observable, shots, rng
+        ),
+    )
+
+
+@typechecked
+def run_trajectories(circuit: QCircuit, job: Job) -> Result:
+    """Simulates the job with the trajectories of
+    :mod:`~mpqp.execution.simulators.trajectories`, parametrized by
+    :data:`~mpqp.execution.simulators.trajectories.trajectory_config`.
+
+    Args:
+        circuit: The circuit of the job, pre-measure included.
+        job: Job to be executed.
+
+    Returns:
+        The result of the job. Its error is the standard error of the
+        simulation over the trajectories.
+    """
+    config = None if job.seed is None else replace(trajectory_config, seed=job.seed)
+    if job.job_type == JobType.SAMPLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, BasisMeasure)
+        counts, error = sample_trajectories(
+            circuit, job.measure.targets, job.measure.shots, config
+        )
+        samples = [
+            Sample(job.measure.nb_qubits, index=index, count=counts[index])
+            for index in sorted(counts)
+        ]
+        return Result(job, samples, error, job.measure.shots)
+
+    if TYPE_CHECKING:
+        assert isinstance(job.measure, ExpectationMeasure)
+    values = trajectory_expectations(
+        circuit,
+        [np.asarray(obs.matrix, dtype=np.complex64) for obs in job.measure.observables],
+        job.measure.shots,
+        config,
+    )
+    return _expectation_result(job, values)
+
+
+@typechecked
+def run_mps(circuit: QCircuit, job: Job) -> Result:
+    """Simulates the job with
+    :func:`~mpqp.execution.simulators.mps.simulate_mps`, parametrized by
+    :data:`~mpqp.execution.simulators.mps.mps_config`.
+
+    Args:
+        circuit: The circuit of the job, pre-measure included.
+        job: Job to be executed.
+
+    Returns:
+        The result of the job. For state vectors and samples, its error is the
+        truncation error of the MPS. For expectation values, it is the
+        statistical error when shots are used, and the truncation error
+        otherwise.
+    """
+    mps = simulate_mps(circuit)
+
+    if job.job_type == JobType.STATE_VECTOR:
+        return _state_vector_result(job, mps.to_state_vector(), mps.truncation_error)
+
+    if job.job_type == JobType.SAMPLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, BasisMeasure)
+        counts = mps.sample(
+            job.measure.targets, job.measure.shots, random_generator(job.seed)
+        )
+        samples = [
+            Sample(job.measure.nb_qubits, index=index, count=counts[index])
+            for index in sorted(counts)
+        ]
+        return Result(job, samples, mps.truncation_error, job.measure.shots)
+
+    if TYPE_CHECKING:
+        assert isinstance(job.measure, ExpectationMeasure)
+    shots = job.measure.shots
+    rng = random_generator(job.seed)
+    values = [
+        mps.expectation(obs.pauli_string, shots, rng) for obs in job.measure.observables
+    ]
+    if shots == 0:
+        values = [(value, mps.truncation_error) for value, _ in values]
+    return _expectation_result(job, values)
+
+
+@typechecked
+def run_stabilizer(circuit: QCircuit, job: Job) -> Result:
+    """Simulates the job with
+    :func:`~mpqp.execution.simulators.stabilizer.simulate_stabilizer`. The
+    cost of the simulation is polynomial in the number of qubits, and the
+    cost of the shots does not depend on the size of the circuit.
+
+    Args:
+        circuit: The circuit of the job, pre-measure included. It must be a
+            Clifford circuit.
+        job: Job to be executed.
+
+    Returns:
+        The result of the job.
+    """
+    tableau = simulate_stabilizer(circuit)
+
+    if job.job_type == JobType.SAMPLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, BasisMeasure)
+        counts = tableau.sample(
+            job.measure.targets, job.measure.shots, random_generator(job.seed)
+        )
+        samples = [
+            Sample(job.measure.nb_qubits, index=index, count=counts[index])
+            for index in sorted(counts)
+        ]
+        return Result(job, samples, None, job.measure.shots)
+
+    if TYPE_CHECKING:
+        assert isinstance(job.measure, ExpectationMeasure)
+    rng = random_generator(job.seed)
+    values = [
+        tableau.expectation(obs.pauli_string, job.measure.shots, rng)
+        for obs in job.measure.observables
+    ]
+    return _expectation_result(job, values)
+
+
+@typechecked
+def extract_result(
+    job: Job,
+    probabilities: npt.NDArray[np.float64],
+    expectation: Callable[
+        [npt.NDArray[np.complex64], int, np.random.Generator], tuple[float, float]
+    ],
+) -> Result:
+    """Builds the result of a ``SAMPLE`` or ``OBSERVABLE`` job from the final
+    state of its circuit.
+
+    Args:
+        job: The job the state was computed for.
+        probabilities: Probabilities of each basis state of the full register.
+        expectation: Function computing the expectation value of an observable,
+            and its error, for a given number of shots, drawn with a given
+            random generator.
+
+    Returns:
+        The corresponding result.
+    """
+    # a single generator for the job, so that the draws of its observables
+    # are independent
+    rng = random_generator(job.seed)
+    if job.job_type == JobType.SAMPLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, BasisMeasure)
+        probabilities = marginal_probabilities(probabilities, job.measure.targets)
+        counts = Sampler(probabilities, rng).counts(job.measure.shots, sparse=True)
+        if TYPE_CHECKING:
+            assert isinstance(counts, dict)
+        samples = [
+            Sample(job.measure.nb_qubits, index=index, count=count)
+            for index, count in counts.items()
+        ]
+        return Result(job, samples, None, job.measure.shots)
+
+    elif job.job_type == JobType.OBSERVABLE:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, ExpectationMeasure)
+        shots = job.measure.shots
+        values = [
+            expectation(np.asarray(obs.matrix, dtype=np.complex64), shots, rng)
+            for obs in job.measure.observables
+        ]
+        return _expectation_result(job, values)
+
+    else:
+        raise NotImplementedError(f"Job type {job.job_type} not handled.")
+
+
+def _state_vector_result(
+    job: Job, state: npt.NDArray[np.complex128], error: float
+) -> Result:
+    """Result of a state vector job simulated here. The global phase
+    correction of :class:`~mpqp.execution.result.Result` only concerns the
+    circuits translated to other SDKs, while our simulations are exact, so the
+    job is given a copy of its circuit without global phase (the circuit of
+    the user is left untouched)."""
+    job.circuit = copy(job.circuit)
+    job.circuit.gphase = 0
+    return Result(job, StateVector(state, job.circuit.nb_qubits), error, 0)
+
+
+def _expectation_result(job: Job, values: list[tuple[float, float]]) -> Result:
+    """Packs the expectation values, and their errors, of the observables of
+    an ``OBSERVABLE`` job in a result."""
+    if TYPE_CHECKING:
+        assert isinstance(job.measure, ExpectationMeasure)
+    shots = job.measure.shots
+    if len(values) == 1:
+        return Result(job, values[0][0], values[0][1], shots)
+    labels = job.measure.observables_labels
+    return Result(
+        job,
+        {label: value for label, (value, _) in zip(labels, values)},
+        {label: error for label, (_, error) in zip(labels, values)},
+        shots,
+    )
@@ -1,9 +1,16 @@
 """After the jobs are submitted, one can use the functions of this module to
 retrieve the results from a job_id or the job directly, and list all job
-attached to the configured accounts."""
+attached to the configured accounts.
+
+:func:`get_remote_result` blocks until the job is done. In an ``asyncio``
+application, :func:`get_remote_result_async` can be awaited instead: the job is
+watched by the :data:`~mpqp.execution.job_monitor.job_monitor`, which polls
+the status of all the watched jobs together, so many remote jobs can be
+awaited concurrently on a single event loop."""
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
 from mpqp.execution import Result
@@ -20,14 +27,34 @@ from mpqp.execution.devices import (
     GOOGLEDevice,
     IBMDevice,
 )
-from mpqp.execution.job import Job
+from mpqp.execution.job import Job, JobStatus
+from mpqp.execution.job_monitor import JobMonitor, job_monitor
 from mpqp.execution.providers.atos import get_result_from_qlm_job_id
 from mpqp.execution.providers.aws import get_result_from_aws_task_arn
 from mpqp.execution.providers.azure import get_result_from_azure_job_id
 from mpqp.execution.providers.ibm import get_result_from_ibm_job_id
+from mpqp.tools.errors import RemoteExecutionError
 from typeguard import typechecked
 
 
+def _remote_job(
+    job_data: str | Job, device: Optional[AvailableDevice]
+) -> tuple[str, AvailableDevice]:
+    """Returns the id of the job and the remote device on which it was
+    launched, see :func:`get_remote_result` for the parameters."""
+    if isinstance(job_data, Job):
+        if job_data.id is None:
+            raise ValueError("Can't retrieve remote result for a job whose id is None.")
+        return job_data.id, job_data.device
+
+    if device is None:
+        raise ValueError(
+            "To get a remote result from a job it, please also provide the "
+            "device to get the data from."
+        )
+    return job_data, device
+
+
 @typechecked
 def get_remote_result(
     job_data: str | Job, device: Optional[AvailableDevice] = None
@@ -80,18 +107,7 @@ def get_remote_result(
          Number of qubits: 2
 
     """
-    if isinstance(job_data, Job):
-        if job_data.id is None:
-            raise ValueError("Can't retrieve remote result for a job whose id is None.")
-
-        device = job_data.device
-        job_data = job_data.id
-    else:
-        if device is None:
-            raise ValueError(
-                "To get a remote result from a job it, please also provide the "
-                "device to get the data from."
-            )
+    job_id, device = _remote_job(job_data, device)
 
     if not device.is_remote():
         raise ValueError(
@@ -99,19 +115,105 @@ def get_remote_result(
         )
 
     if isinstance(device, IBMDevice):
-        return get_result_from_ibm_job_id(job_data)
+        return get_result_from_ibm_job_id(job_id)
     elif isinstance(device, ATOSDevice):
-        return get_result_from_qlm_job_id(job_data)
+        return get_result_from_qlm_job_id(job_id)
     elif isinstance(device, AWSDevice):
-        return get_result_from_aws_task_arn(job_data)
+        return get_result_from_aws_task_arn(job_id)
     elif isinstance(device, AZUREDevice):
-        return get_result_from_azure_job_id(job_data)
+        return get_result_from_azure_job_id(job_id)
     else:
         raise NotImplementedError(
             f"The device {device.name} is not supported for remote features."
         )
 
 
+@typechecked
+def get_remote_status(
+    job_data: str | Job, device: Optional[AvailableDevice] = None
+) -> JobStatus:
+    """Retrieve the status of a remote job from its job_id and device, without
+    waiting for the job to be done. The status is cached for a short time by
+    the :data:`~mpqp.execution.job_monitor.job_monitor`.
+
+    Args:
+        job_data: Either the :class:`~mpqp.execution.job.Job` object or the
+            job id used to identify the job on the remote device.
+        device: Remote device on which the job was launched, needed only if
+            ``job_data`` is the identifier of the job.
+
+    Returns:
+        The current status of the remote job.
+
+    Example:
+        >>> get_remote_status('Job141933', ATOSDevice.QLM_LINALG) # doctest: +SKIP
+        <JobStatus.DONE: 6>
+
+    """
+    job_id, device = _remote_job(job_data, device)
+
+    if not device.is_remote():
+        raise ValueError(
+            "Trying to retrieve a remote status while the device of the job was local."
+        )
+
+    return job_monitor.status(job_id, device)
+
+
+@typechecked
+async def get_remote_result_async(
+    job_data: str | Job,
+    device: Optional[AvailableDevice] = None,
+    monitor: Optional[JobMonitor] = None,
+) -> Result:
+    """Awaitable version of :func:`get_remote_result`.
+
+    The job is watched by ``monitor`` until it is done, and the result is then
+    retrieved in the default executor of the event loop. No thread is held
+    while the job waits in the queue of the provider.
+
+    Args:
+        job_data: Either the :class:`~mpqp.execution.job.Job` object or the
+            job id used to identify the job on the remote device.
+        device: Remote device on which the job was launched, needed only if
+            ``job_data`` is the identifier of the job.
+        monitor: Monitor polling the status of the job, defaults to
+            :data:`~mpqp.execution.job_monitor.job_monitor`.
+
+    Returns:
+        The result(s) associated with the desired remote job in parameter.
+
+    Raises:
+        RemoteExecutionError: When the job is cancelled or failed.
+
+    Example:
+        >>> result = asyncio.run(get_remote_result_async(
+        ...     'Job141933', ATOSDevice.QLM_LINALG
+        ... )) # doctest: +SKIP
+
+    """
+    job_id, device = _remote_job(job_data, device)
+    if not device.is_remote():
+        raise ValueError(
+            "Trying to retrieve a remote result while the device of the job was local."
+        )
+    if monitor is None:
+        monitor = job_monitor
+
+    status = await asyncio.wrap_future(monitor.watch(job_id, device))
+    if status != JobStatus.DONE:
+        raise RemoteExecutionError(
+            f"Trying to retrieve a result for a job in status {status.name}"
+        )
+
+    result = await asyncio.get_running_loop().run_in_executor(
+        None, get_remote_result, job_id, device
+    )
+    if isinstance(job_data, Job):
+        job_data.status = JobStatus.DONE
+    return result
+
+
 def get_all_remote_job_ids() -> dict[type[AvailableDevice], list[str]]:
     """Retrieve from the remote providers all the job-ids associated with this
     account.
@@ -36,6 +36,11 @@ from mpqp.execution.devices import AvailableDevice
 from mpqp.tools.display import clean_1D_array, clean_number_repr
 from mpqp.tools.errors import ResultAttributeError
 
+if TYPE_CHECKING:
+    from mpqp.core.instruction.measurement.expectation_value import (
+        ExpectationMeasure,
+    )
+
 
 @typechecked
 class StateVector:
@@ -59,7 +64,7 @@ class StateVector:
 
     def __init__(
         self,
-        vector: list[Complex] | npt.NDArray[np.complex64],
+        vector: list[Complex] | npt.NDArray[np.complex64] | npt.NDArray[np.complex128],
         nb_qubits: Optional[int] = None,
         probabilities: Optional[list[float] | npt.NDArray[np.float32]] = None,
     ):
@@ -82,6 +87,31 @@ class StateVector:
         """Return the amplitudes of the state vector"""
         return self.vector
 
+    def sample(
+        self, shots: int, seed: Optional[int] = None, sparse: bool = False
+    ) -> npt.NDArray[np.int64] | dict[int, int]:
+        """Samples the measure of all the qubits of this state, without
+        simulating the circuit again.
+
+        Args:
+            shots: Number of shots.
+            seed: Seed of the random generator, see
+                :class:`~mpqp.execution.simulators.sampling.Sampler`.
+            sparse: If ``True``, the counts are returned as a dictionary
+                containing only the observed outcomes.
+
+        Returns:
+            The number of occurrences of each basis state.
+
+        Example:
+            >>> StateVector(np.array([1, 0, 0, 1]) / np.sqrt(2)).sample(10**7, 3, True)
+            {0: 4999572, 3: 5000428}
+
+        """
+        from mpqp.execution.simulators.sampling import Sampler
+
+        return Sampler(self.probabilities, seed).counts(shots, sparse)
+
     def __str__(self):
         return f"""  State vector: {clean_1D_array(self.vector)}
   Probabilities: {clean_1D_array(self.probabilities)}
@@ -343,35 +373,23 @@ class Result:
             self._samples = data
             is_counts = all([sample.count is not None for sample in data])
             is_probas = all([sample.probability is not None for sample in data])
-            if is_probas:
-                probas = [0.0] * (2**self.job.measure.nb_qubits)
-                for sample in data:
-                    probas[sample.index] = sample.probability
-                self._probabilities = np.array(probas, dtype=float)
-
-                if not is_counts:
-                    counts = [
-                        int(count)
-                        for count in np.round(
-                            self.job.measure.shots * self._probabilities
-                        )
-                    ]
-                    self._counts = counts
-                    for sample in self._samples:
-                        sample.count = self._counts[sample.index]
-            if is_counts:
-                counts: list[int] = [0] * (2**self.job.measure.nb_qubits)
-                for sample in data:
+            # the dense counts and probabilities are only built on demand, so
+            # that results on many qubits can be handled through their samples
+            if is_probas and not is_counts:
+                for sample in self._samples:
                     if TYPE_CHECKING:
-                        assert sample.count is not None
-                    counts[sample.index] = sample.count
-                self._counts = counts
+                        assert sample.probability is not None
+                    sample.count = int(
+                        np.round(self.job.measure.shots * sample.probability)
+                    )
+            elif is_counts:
                 assert shots != 0
                 if not is_probas:
-                    self._probabilities = np.array(counts, dtype=float) / self.shots
                     for sample in self._samples:
-                        sample.probability = self._probabilities[sample.index]
-            elif not is_probas:
+                        if TYPE_CHECKING:
+                            assert sample.count is not None
+                        sample.probability = sample.count / self.shots
+            else:
                 raise ValueError(
                     f"For {JobType.SAMPLE.name} jobs, all samples must contain"
                     " either `count` or `probability` (and the non-None "
@@ -439,8 +457,15 @@ class Result:
                 "Cannot get probabilities if the job was not of"
                 " type SAMPLE or STATE_VECTOR"
             )
-        if TYPE_CHECKING:
-            assert self._probabilities is not None
+        if self._probabilities is None:
+            if TYPE_CHECKING:
+                assert self._samples is not None and self.job.measure is not None
+            probas = [0.0] * (2**self.job.measure.nb_qubits)
+            for sample in self._samples:
+                if TYPE_CHECKING:
+                    assert sample.probability is not None
+                probas[sample.index] = sample.probability
+            self._probabilities = np.array(probas, dtype=float)
         return self._probabilities
 
     @property
@@ -451,8 +476,15 @@ class Result:
                 "Cannot get counts if the job was not of type SAMPLE"
             )
 
-        if TYPE_CHECKING:
-            assert self._counts is not None
+        if self._counts is None:
+            if TYPE_CHECKING:
+                assert self._samples is not None and self.job.measure is not None
+            counts: list[int] = [0] * (2**self.job.measure.nb_qubits)
+            for sample in self._samples:
+                if TYPE_CHECKING:
+                    assert sample.count is not None
+                counts[sample.index] = sample.count
+            self._counts = counts
         return self._counts
 
     def __str__(self):
@@ -488,7 +520,7 @@ class Result:
                 for sample, probability in zip(self.samples, probabilities)
             )
             return f"""{header}
-  Counts: {self._counts}
+  Counts: {self.counts}
   Probabilities: {clean_1D_array(self.probabilities)}
   Samples:
 {samples_str}
@@ -718,6 +750,9 @@ class BatchResult:
 
     Args:
         results: List of results.
+        errors: Errors raised by the items of the batch which failed, by index
+            of the item in the batch.
+        durations: Duration of the execution of each item of the batch.
 
     Example:
         >>> result1 = Result(
@@ -769,24 +804,56 @@ class BatchResult:
 
     """
 
-    def __init__(self, results: list[Result]):
+    def __init__(
+        self,
+        results: list[Result],
+        errors: Optional[dict[int, Exception]] = None,
+        durations: Optional[list[float]] = None,
+    ):
         self.results = results
         """See parameter description."""
+        self.errors = {} if errors is None else errors
+        """Errors raised by the items of the batch which failed, by index of
+        the item in the batch. The results of the other items are in
+        :attr:`results`, in the order of the batch, so the result of an item
+        is better retrieved by indexing the batch result with the index of
+        the item (see :meth:`__getitem__`)."""
+        self.durations = [] if durations is None else durations
+        """Duration (in seconds) of the execution of each item of the batch,
+        in the order of the batch (including the items which failed)."""
 
     def __str__(self):
         header = f"BatchResult: {len(self.results)} results\n"
-        body = "\n".join(
-            "    " + line
-            for result in self.results
-            for line in str(result).splitlines()
-        )
-        return header + body
+        lines = [line for result in self.results for line in str(result).splitlines()]
+        if len(self.errors) != 0:
+            lines.append(f"{len(self.errors)} errors")
+            lines.extend(
+                f"    Item {index}: {error!r}"
+                for index, error in sorted(self.errors.items())
+            )
+        return header + "\n".join("    " + line for line in lines)
 
     def __repr__(self):
         return f"BatchResult({self.results})"
 
-    def __getitem__(self, index: int):
-        return self.results[index]
+    def __getitem__(self, index: int) -> Result:
+        """Result of the item of the batch at this index. If this item failed,
+        the error it raised is raised again.
+
+        Args:
+            index: Index of the item in the batch (each circuit on each
+                device), as in :attr:`errors`.
+        """
+        if len(self.errors) == 0:
+            return self.results[index]
+        size = len(self.results) + len(self.errors)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Item {index} is not in a batch of {size} items")
+        if index in self.errors:
+            raise self.errors[index]
+        return self.results[index - sum(1 for failed in self.errors if failed < index)]
 
     def plot(self, show: bool = True):
         """Display the result(s) using ``matplotlib.pyplot``.
@@ -843,3 +910,214 @@ class BatchResult:
         from mpqp.local_storage.save import insert_results
 
         return insert_results(self)
+
+
+@typechecked
+class SweepResult:
+    """Results of the execution of a symbolic circuit for a batch of values of
+    its parameters (see :func:`~mpqp.execution.runner.run_sweep`).
+
+    Instead of one :class:`Result` per point of the sweep, the data of all the
+    points is packed in arrays, the first axis being the index of the point:
+
+    +-------------+----------------------------------------------------+
+    | Job Type    | Data                                               |
+    +=============+====================================================+
+    | OBSERVABLE  | expectation values, one column per observable      |
+    +-------------+----------------------------------------------------+
+    | SAMPLE      | counts, one column per outcome of the measure      |
+    +-------------+----------------------------------------------------+
+    | STATE_VECTOR| amplitudes, one column per basis state             |
+    +-------------+----------------------------------------------------+
+
+    The :class:`Result` of a point is only built when indexing this object.
+
+    Args:
+        job: Job of the symbolic circuit.
+        parameters: The variables of the circuit.
+        values: Values of the ``parameters``, one line per point.
+        data: Data of the points, as described above.
+        errors: Errors of the points, one line per point (and one column per
+            observable for ``OBSERVABLE`` jobs), if available.
+        shots: Number of shots of each point.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> circuit = QCircuit([Ry(theta, 0), BasisMeasure([0], shots=100)])
+        >>> sweep = run_sweep(
+        ...     circuit, MPQPDevice.STATEVECTOR_SIMULATOR, [[0], [np.pi]]
+        ... )
+        >>> sweep.counts
+        array([[100,   0],
+               [  0, 100]])
+        >>> print(sweep[1]) # doctest: +NORMALIZE_WHITESPACE
+        Result: MPQPDevice, STATEVECTOR_SIMULATOR
+          Counts: [0, 100]
+          Probabilities: [0, 1]
+          Samples:
+            State: 1, Index: 1, Count: 100, Probability: 1
+          Error: None
+
+    """
+
+    def __init__(
+        self,
+        job: Job,
+        parameters: list[Any],
+        values: npt.NDArray[np.float64],
+        data: npt.NDArray[Any],
+        errors: Optional[npt.NDArray[np.float64]] = None,
+        shots: int = 0,
+    ):
+        self.job = job
+        """See parameter description."""
+        self.parameters = parameters
+        """See parameter description."""
+        self.values = values
+        """See parameter description."""
+        self.data = data
+        """See parameter description."""
+        self.errors = errors
+        """See parameter description."""
+        self.shots = shots
+        """See parameter description."""
+
+    @property
+    def device(self) -> AvailableDevice:
+        """Device on which the sweep was run"""
+        return self.job.device
+
+    def __len__(self):
+        return len(self.values)
+
+    def point(self, index: int) -> dict[Any, float]:
+        """Values of the parameters for one point of the sweep.
+
+        Args:
+            index: Index of the point.
+
+        Returns:
+            The mapping between the parameters and their values.
+        """
+        return {
+            param: float(value)
+            for param, value in zip(self.parameters, self.values[index])
+        }
+
+    @property
+    def expectation_values(
+        self,
+    ) -> npt.NDArray[np.float64] | dict[str, npt.NDArray[np.float64]]:
+        """Expectation values of each point, keyed by observable label if the
+        job has several observables"""
+        if self.job.job_type != JobType.OBSERVABLE:
+            raise ResultAttributeError(
+                f"Job type: {self.job.job_type.name} but cannot get expectation"
+                " values if the job type is not OBSERVABLE."
+            )
+        if self.data.shape[1] == 1:
+            return self.data[:, 0]
+        if TYPE_CHECKING:
+            assert isinstance(self.job.measure, ExpectationMeasure)
+        return {
+            label: self.data[:, i]
+            for i, label in enumerate(self.job.measure.observables_labels)
+        }
+
+    @property
+    def amplitudes(self) -> npt.NDArray[np.complex128]:
+        """Amplitudes of the state of each point"""
+        if self.job.job_type != JobType.STATE_VECTOR:
+            raise ResultAttributeError(
+                "Cannot get amplitudes if the job was not of type STATE_VECTOR"
+            )
+        return self.data
+
+    @property
+    def counts(self) -> npt.NDArray[np.int64]:
+        """Counts of each outcome, for each point"""
+        if self.job.job_type != JobType.SAMPLE:
+            raise ResultAttributeError(
+                "Cannot get counts if the job was not of type SAMPLE"
+            )
+        return self.data
+
+    @property
+    def probabilities(self) -> npt.NDArray[np.float64]:
+        """Probabilities of each outcome (or basis state), for each point"""
+        if self.job.job_type == JobType.SAMPLE:
+            return self.data / self.shots
+        if self.job.job_type == JobType.STATE_VECTOR:
+            return np.square(np.abs(self.data))
+        raise ResultAttributeError(
+            "Cannot get probabilities if the job was not of"
+            " type SAMPLE or STATE_VECTOR"
+        )
+
+    def __getitem__(self, index: int) -> Result:
+        job = Job(
+            self.job.job_type,
+            # the type checker does not know that floats are numbers.Complex
+            self.job.circuit.subs(
+                self.point(index), True  # pyright: ignore[reportArgumentType]
+            ),
+            self.job.device,
+            self.job.measure,
+        )
+        errors = None if self.errors is None else self.errors[index]
+        if self.job.job_type == JobType.SAMPLE:
+            if TYPE_CHECKING:
+                assert self.job.measure is not None
+            samples = [
+                Sample(self.job.measure.nb_qubits, index=int(i), count=int(count))
+                for i, count in enumerate(self.data[index])
+                if count != 0
+            ]
+            return Result(job, samples, _error_value(errors), self.shots)
+        if self.job.job_type == JobType.STATE_VECTOR:
+            state = StateVector(self.data[index], self.job.circuit.nb_qubits)
+            return Result(job, state, _error_value(errors), self.shots)
+        if self.data.shape[1] == 1:
+            return Result(
+                job,
+                float(self.data[index, 0]),
+                None if errors is None else _error_value(errors[0]),
+                self.shots,
+            )
+        if TYPE_CHECKING:
+            assert isinstance(self.job.measure, ExpectationMeasure)
+        labels = self.job.measure.observables_labels
+        return Result(
+            job,
+            {label: float(value) for label, value in zip(labels, self.data[index])},
+            None if errors is None else dict(zip(labels, map(_error_value, errors))),
+            self.shots,
+        )
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    def __str__(self):
+        label = "" if self.job.circuit.label is None else self.job.circuit.label + ", "
+        header = (
+            f"SweepResult: {label}{type(self.device).__name__}, {self.device.name}"
+            f", {len(self)} points"
+        )
+        return (
+            f"{header}\n  Parameters: {', '.join(map(str, self.parameters))}\n  "
+            f"{self.job.job_type.name.capitalize()} data of shape {self.data.shape}"
+        )
+
+    def __repr__(self):
+        return (
+            f"SweepResult({repr(self.job)}, {self.parameters}, {repr(self.values)}, "
+            f"{repr(self.data)}, {repr(self.errors)}, {self.shots})"
+        )
+
+
+def _error_value(error: Any) -> Optional[float]:
+    """Converts the error of a point of a sweep to the format of the
+    :class:`Result`, ``nan`` standing for a missing error."""
+    if error is None or np.isnan(error):
+        return None
+    return float(error)
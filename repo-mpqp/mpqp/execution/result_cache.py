@@ -0,0 +1,407 @@
+"""Running the same circuit again on a simulator computes the same result
+again. When a job is deterministic, its result can instead be taken from the
+:data:`result_cache`, where the results are stored by :attr:`fingerprint
+<mpqp.execution.job.Job.fingerprint>` of the job (type, device, circuit and
+measure, including the number of shots), values of its variables, and seed of
+the simulator.
+
+The cache is disabled by default, and enabled by giving it a size:
+
+    >>> result_cache.maxsize = 64
+    >>> circuit = QCircuit([H(0), CNOT(0, 1)])
+    >>> result = run(circuit, IBMDevice.AER_SIMULATOR)
+    >>> result = run(circuit, IBMDevice.AER_SIMULATOR)
+    >>> result_cache.info()
+    ResultCacheInfo(hits=1, misses=1, disk_hits=0, skipped=0, size=1, maxsize=64)
+    >>> result_cache.maxsize = 0
+    >>> result_cache.clear()
+
+Only the deterministic jobs are cached, the other ones are counted as
+``skipped``:
+
+- the exact jobs on local simulators: state vectors, and expectation values
+  without shots, of noiseless circuits (or computed from the density matrix);
+- the jobs of the local simulators of ``MPQP`` when they are seeded, for
+  instance through :attr:`SamplingConfig.seed
+  <mpqp.execution.simulators.sampling.SamplingConfig.seed>` for the samples;
+- the samples of the jobs given a :attr:`seed <mpqp.execution.job.Job.seed>`,
+  on the simulators using it.
+
+The cache keeps the ``maxsize`` results used last in memory. When
+:attr:`ResultCache.database` is set, the results are also saved in this
+SQLite database, so that they can be reused across sessions. It can be the
+database of the local storage (see :mod:`mpqp.local_storage`), the results
+being saved in a table of their own:
+
+    >>> result_cache.database = get_env_variable("DB_PATH")  # doctest: +SKIP
+
+The results older than :attr:`ResultCache.ttl` seconds are discarded, and only
+the :attr:`ResultCache.disk_maxsize` results used last are kept in the
+database.
+
+Each result is copied when taken from the cache, and given the job it is
+requested for, so it can be modified by the caller."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+from collections import OrderedDict
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+    from mpqp.execution.job import Job
+    from mpqp.execution.result import Result
+
+
+@dataclass
+class ResultCacheInfo:
+    """Statistics of a :class:`ResultCache`."""
+
+    hits: int
+    """Number of results taken from the memory."""
+    misses: int
+    """Number of results of deterministic jobs not found in the cache."""
+    disk_hits: int
+    """Number of results loaded from the database."""
+    skipped: int
+    """Number of jobs not cached, since they are not deterministic."""
+    size: int
+    """Number of results currently in memory."""
+    maxsize: int
+    """Maximum number of results kept in memory."""
+
+
+class ResultCache:
+    """Least recently used cache of the results of the deterministic jobs.
+
+    Args:
+        maxsize: Maximum number of results kept in memory. With ``0``, the
+            results are not kept in memory.
+        database: Path of the SQLite database where the results are saved,
+            ``None`` to keep the results only in memory.
+        ttl: Duration (in seconds) after which a result is discarded,
+            ``None`` to keep the results until they are evicted.
+        disk_maxsize: Maximum number of results kept in the database.
+        clock: Function giving the current time, in seconds.
+
+    Example:
+        >>> cache = ResultCache(maxsize=2)
+        >>> job = generate_job(QCircuit([H(0)]), IBMDevice.AER_SIMULATOR)
+        >>> result = cache.run(job, lambda: run(QCircuit([H(0)]), IBMDevice.AER_SIMULATOR))
+        >>> cache.get(job).amplitudes
+        array([0.70710678+0.j, 0.70710678+0.j])
+        >>> cache.info()
+        ResultCacheInfo(hits=1, misses=1, disk_hits=0, skipped=0, size=1, maxsize=2)
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        database: Optional[str] = None,
+        ttl: Optional[float] = None,
+        disk_maxsize: int = 10000,
+        clock: Callable[[], float] = time,
+    ):
+        self.maxsize = maxsize
+        """Maximum number of results kept in memory, the results used least
+        recently are discarded first."""
+        self.database = database
+        """Path of the SQLite database where the results are saved."""
+        self.ttl = ttl
+        """Duration (in seconds) after which a result is discarded."""
+        self.disk_maxsize = disk_maxsize
+        """Maximum number of results kept in the database, the results used
+        least recently are discarded first."""
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.skipped = 0
+        # results stored without their job, with the time they were computed
+        self._entries: OrderedDict[str, tuple[float, Result]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the results are cached at all."""
+        return self.maxsize > 0 or self.database is not None
+
+    def key(self, job: Job) -> Optional[str]:
+        """Key of the result of a job in the cache.
+
+        Args:
+            job: The job whose result is cached.
+
+        Returns:
+            The key of the result, or ``None`` if the job is not deterministic.
+
+        Example:
+            >>> circuit = QCircuit([H(0), BasisMeasure(shots=100)])
+            >>> result_cache.key(generate_job(circuit, IBMDevice.AER_SIMULATOR)) is None
+            True
+            >>> key = result_cache.key(generate_job(circuit.without_measurements(), IBMDevice.AER_SIMULATOR))
+            >>> len(key)
+            32
+
+        """
+        from mpqp.core.fingerprint import new_hasher, update
+
+        seeds = _seeds(job)
+        if seeds is None:
+            return None
+        hasher = new_hasher()
+        update(
+            hasher,
+            job.fingerprint.encode(),
+            repr(sorted(job.values.items())).encode(),
+            repr(seeds).encode(),
+        )
+        return hasher.hexdigest()
+
+    def get(self, job: Job) -> Optional[Result]:
+        """Returns the result of a job, if it is in the cache.
+
+        Args:
+            job: The job whose result is requested.
+
+        Returns:
+            A copy of the result, given ``job``, or ``None`` if the result is
+            not in the cache.
+        """
+        if not self.enabled:
+            return None
+        key = self.key(job)
+        if key is None:
+            with self._lock:
+                self.skipped += 1
+            return None
+        return self._get(key, job)
+
+    def put(self, job: Job, result: Result):
+        """Stores the result of a job in the cache, if the job is
+        deterministic.
+
+        Args:
+            job: The job of the result.
+            result: The result to store.
+        """
+        if not self.enabled:
+            return
+        key = self.key(job)
+        if key is not None:
+            self._put(key, result)
+
+    def run(self, job: Job, compute: Callable[[], Result]) -> Result:
+        """Returns the result of a job, computed by ``compute`` if it is not in
+        the cache.
+
+        Args:
+            job: The job whose result is requested.
+            compute: Function computing the result of the job.
+
+        Returns:
+            The result of the job.
+        """
+        if not self.enabled:
+            return compute()
+        key = self.key(job)
+        if key is None:
+            with self._lock:
+                self.skipped += 1
+            return compute()
+        result = self._get(key, job)
+        if result is None:
+            result = compute()
+            self._put(key, result)
+        return result
+
+    def info(self) -> ResultCacheInfo:
+        """Statistics of the cache."""
+        return ResultCacheInfo(
+            self.hits,
+            self.misses,
+            self.disk_hits,
+            self.skipped,
+            len(self._entries),
+            self.maxsize,
+        )
+
+    def clear(self, disk: bool = False):
+        """Empties the cache and resets its statistics.
+
+        Args:
+            disk: If ``True``, the results saved in :attr:`database` are also
+                removed.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = self.skipped = 0
+        if disk and self.database is not None:
+            with self._connect() as connection:
+                connection.execute("DELETE FROM result_cache")
+
+    def _get(self, key: str, job: Job) -> Optional[Result]:
+        from mpqp.execution.job import JobStatus
+
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0], now):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None and self.database is not None:
+            entry = self._load(key, now)
+            if entry is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._store(key, entry)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        result = deepcopy(entry[1])
+        result.job = job
+        job.status = JobStatus.DONE
+        return result
+
+    def _put(self, key: str, result: Result):
+        detached = copy(result)
+        detached.job = None  # pyright: ignore[reportAttributeAccessIssue]
+        entry = (self.clock(), deepcopy(detached))
+        self._store(key, entry)
+        if self.database is not None:
+            self._save(key, entry)
+
+    def _store(self, key: str, entry: tuple[float, Result]):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl is not None and now - created >= self.ttl
+
+    def _connect(self) -> Connection:
+        from sqlite3 import connect
+
+        assert self.database is not None
+        connection = connect(self.database)
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS result_cache (
+                key TEXT PRIMARY KEY,
+                result BLOB NOT NULL,
+                created REAL NOT NULL,
+                used REAL NOT NULL
+            )
+            """
+        )
+        return connection
+
+    def _save(self, key: str, entry: tuple[float, Result]):
+        created, result = entry
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO result_cache VALUES (?, ?, ?, ?)",
+                    (key, pickle.dumps(result), created, created),
+                )
+                if self.ttl is not None:
+                    connection.execute(
+                        "DELETE FROM result_cache WHERE created <= ?",
+                        (created - self.ttl,),
+                    )
+                connection.execute(
+                    """
+                    DELETE FROM result_cache WHERE key IN (
+                        SELECT key FROM result_cache ORDER BY used DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.disk_maxsize,),
+                )
+        finally:
+            connection.close()
+
+    def _load(self, key: str, now: float) -> Optional[tuple[float, Result]]:
+        connection = self._connect()
+        try:
+            with connection:
+                row = connection.execute(
+                    "SELECT result, created FROM result_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if self._expired(row[1], now):
+                    connection.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+                    return None
+                connection.execute(
+                    "UPDATE result_cache SET used = ? WHERE key = ?", (now, key)
+                )
+        finally:
+            connection.close()
+        return row[1], pickle.loads(row[0])
+
+
+def _seeds(job: Job) -> Optional[tuple[Any, ...]]:
+    """Settings of the simulator on which the result of the job depends, or
+    ``None`` if the job is not deterministic."""
+    from mpqp.execution.devices import GOOGLEDevice, IBMDevice, MPQPDevice
+    from mpqp.execution.job import JobType
+    from mpqp.execution.simulated_devices import SimulatedDevice
+    from mpqp.execution.simulators.mps import mps_config
+    from mpqp.execution.simulators.sampling import sampling_config
+    from mpqp.execution.simulators.trajectories import trajectory_config
+
+    device = job.device
+    if device.is_remote() or isinstance(device, SimulatedDevice):
+        return None
+    exact = job.job_type != JobType.SAMPLE and (
+        job.measure is None or job.measure.shots == 0
+    )
+    if job.job_type == JobType.SAMPLE and job.seed is not None:
+        # the seed of the job is only used by some simulators
+        if device == MPQPDevice.TRAJECTORY_SIMULATOR:
+            return ("job", job.seed, repr(trajectory_config))
+        if device == MPQPDevice.MPS_SIMULATOR:
+            return ("job", job.seed, repr(mps_config))
+        if isinstance(device, (MPQPDevice, IBMDevice)) or (
+            device == GOOGLEDevice.CIRQ_LOCAL_SIMULATOR
+        ):
+            return ("job", job.seed)
+        return None
+    if device == MPQPDevice.TRAJECTORY_SIMULATOR:
+        # as for the other simulators, the expectation values estimated with
+        # shots are not cached
+        sampled = job.job_type == JobType.OBSERVABLE and not exact
+        if sampled or (job.seed is None and trajectory_config.seed is None):
+            return None
+        return ("job", job.seed, repr(trajectory_config))
+    if isinstance(device, MPQPDevice):
+        settings = (repr(mps_config),) if device == MPQPDevice.MPS_SIMULATOR else ()
+        if job.job_type == JobType.SAMPLE and sampling_config.seed is not None:
+            return (sampling_config.seed, *settings)
+        return settings if exact else None
+    if len(job.circuit.noises) != 0 or not exact:
+        return None
+    return ()
+
+
+result_cache = ResultCache()
+"""Cache used by :func:`~mpqp.execution.runner.run` and
+:func:`~mpqp.execution.runner.run_native_batch`, modify its attributes to tune
+it (for instance ``result_cache.maxsize = 64`` enables it)."""
@@ -14,22 +14,67 @@ return the corresponding job id and :class:`~mpqp.execution.job.Job` object.
 
 .. note::
     Unlike :func:`run`, we can only submit on one device at a time.
+
+To run many circuits on a single device, :func:`run_native_batch` submits them
+together, in a single native batch of the provider when it has one.
+
+A circuit sampled with a very large number of shots can be run with
+:func:`run_sharded`, which splits its shots into shards run concurrently.
+
+The results of the deterministic jobs can be reused from one execution to the
+next, see :mod:`~mpqp.execution.result_cache`.
+
+To evaluate a symbolic circuit for many values of its parameters, use
+:func:`run_sweep`, which prepares the circuit only once and returns a compact
+:class:`~mpqp.execution.result.SweepResult`.
+
+The items of a batch (each circuit on each device) are run one after the other
+by default. They can also be run concurrently, by giving an ``executor`` to
+:func:`run`: a pool of threads suits the remote devices and the simulators
+releasing the GIL, while a pool of processes suits the other simulators.
+
+In an ``asyncio`` application, :func:`run_async` and :func:`submit_async` can
+be awaited instead: the local simulations are run in an executor, and the
+remote jobs are awaited with
+:func:`~mpqp.execution.remote_handler.get_remote_result_async`, which polls
+them without holding a thread for each job.
 """
 
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from multiprocessing import get_context
 from numbers import Complex
 from textwrap import indent
-from typing import TYPE_CHECKING, Iterable, Optional
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Optional, Sequence
 
 import numpy as np
+import numpy.typing as npt
 from mpqp.core.circuit import QCircuit
 from mpqp.core.instruction.breakpoint import Breakpoint
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
 from mpqp.core.instruction.measurement.basis_measure import BasisMeasure
 from mpqp.core.instruction.measurement.expectation_value import (
     ExpectationMeasure,
     Observable,
 )
+from mpqp.core.instruction.measurement.pauli_string import (
+    I,
+    PauliString,
+    PauliStringMonomial,
+)
+from mpqp.core.parametric import ParametricCircuit
 from mpqp.execution.devices import (
     ATOSDevice,
     AvailableDevice,
@@ -37,15 +82,30 @@ from mpqp.execution.devices import (
     AZUREDevice,
     GOOGLEDevice,
     IBMDevice,
+    MPQPDevice,
 )
+from mpqp.execution.fusion import fuse_gates, fusion_report
 from mpqp.execution.job import Job, JobStatus, JobType
-from mpqp.execution.providers.atos import run_atos, submit_QLM
-from mpqp.execution.providers.aws import run_braket, submit_job_braket
+from mpqp.execution.job_monitor import JobMonitor
+from mpqp.execution.providers.atos import run_atos, run_atos_batch, submit_QLM
+from mpqp.execution.providers.aws import (
+    run_braket,
+    run_braket_batch,
+    submit_job_braket,
+)
 from mpqp.execution.providers.azure import run_azure, submit_job_azure
-from mpqp.execution.providers.google import run_google
-from mpqp.execution.providers.ibm import run_ibm, submit_remote_ibm
-from mpqp.execution.result import BatchResult, Result
+from mpqp.execution.providers.google import run_google, run_google_batch, sweep_local
+from mpqp.execution.providers.ibm import (
+    run_ibm,
+    run_ibm_batch,
+    submit_remote_ibm,
+    sweep_aer,
+)
+from mpqp.execution.providers.mpqp_simulators import run_mpqp, sweep_mpqp
+from mpqp.execution.result import BatchResult, Result, Sample, SweepResult
+from mpqp.execution.result_cache import result_cache
 from mpqp.execution.simulated_devices import IBMSimulatedDevice, SimulatedDevice
+from mpqp.execution.simulators.statevector import is_symbolic
 from mpqp.tools.display import state_vector_ket_shape
 from mpqp.tools.errors import DeviceJobIncompatibleError, RemoteExecutionError
 from mpqp.tools.generics import OneOrMany, find_index, flatten
@@ -73,15 +133,41 @@ def adjust_measure(measure: ExpectationMeasure, circuit: QCircuit):
     Returns:
         The measure padded with identities before and after.
     """
-    Id_before = np.eye(2 ** measure.rearranged_targets[0])
-    Id_after = np.eye(2 ** (circuit.nb_qubits - measure.rearranged_targets[-1] - 1))
-
-    tweaked_observables = [
-        Observable(np.kron(np.kron(Id_before, obs.matrix), Id_after))
-        # TODO: avoid to force using matrix representation to add identities if the observable is defined by
-        #  pauli string (use I @ obs @ I) or diagonal coefficients (perform kron product with [1,1] instead of I matrix)
-        for obs in measure.observables
-    ]
+    nb_before = measure.rearranged_targets[0]
+    nb_after = circuit.nb_qubits - measure.rearranged_targets[-1] - 1
+
+    # labels shared by several observables (for instance generated by other
+    # measures) would collide in the results, they are generated again instead
+    labels = [obs.label for obs in measure.observables]
+    tweaked_observables = []
+    for obs in measure.observables:
+        label = obs.label if labels.count(obs.label) == 1 else None
+        if (
+            obs._matrix is None  # pyright: ignore[reportPrivateUsage]
+            and obs._pauli_string is not None  # pyright: ignore[reportPrivateUsage]
+        ):
+            # padding the pauli string spares us the matrix of the observable,
+            # which is out of reach for the simulators working on many qubits
+            padded = PauliString(
+                [
+                    PauliStringMonomial(
+                        # the monomials of an observable have real coefficients
+                        mono.coef,  # pyright: ignore[reportArgumentType]
+                        [I] * nb_before + mono.atoms + [I] * nb_after,
+                    )
+                    for mono in obs.pauli_string.monomials
+                ]
+            )
+            tweaked_observables.append(Observable(padded, label))
+        else:
+            # TODO: avoid to force using matrix representation to add identities
+            #  if the observable is defined by diagonal coefficients (perform
+            #  kron product with [1,1] instead of I matrix)
+            Id_before = np.eye(2**nb_before)
+            Id_after = np.eye(2**nb_after)
+            tweaked_observables.append(
+                Observable(np.kron(np.kron(Id_before, obs.matrix), Id_after), label)
+            )
 
     tweaked_measure = ExpectationMeasure(
         tweaked_observables,
@@ -93,7 +179,10 @@ def adjust_measure(measure: ExpectationMeasure, circuit: QCircuit):
 
 @typechecked
 def generate_job(
-    circuit: QCircuit, device: AvailableDevice, values: dict[Expr | str, Complex] = {}
+    circuit: QCircuit | ParametricCircuit,
+    device: AvailableDevice,
+    values: dict[Expr | str, Complex] = {},
+    remove_symbolic: bool = True,
 ) -> Job:
     """Creates the Job of appropriate type and containing the information needed
     for the execution of the circuit.
@@ -103,14 +192,23 @@ def generate_job(
     substitutions.
 
     Args:
-        circuit: Circuit to be run.
+        circuit: Circuit to be run. For a
+            :class:`~mpqp.core.parametric.ParametricCircuit`, the ``values``
+            are bound without substitution.
         device: Device on which the circuit will be run.
         values: Set of values to substitute for symbolic variables.
+        remove_symbolic: Whether the symbolic values should be replaced by
+            their numeric counterparts. It must be ``False`` if some variables
+            are not given a value.
 
     Returns:
         The Job containing information about the execution of the circuit.
     """
-    circuit = circuit.subs(values, True)
+    symbolic_circuit = circuit
+    if isinstance(circuit, ParametricCircuit):
+        circuit = circuit.bind(values)
+    else:
+        circuit = circuit.subs(values, remove_symbolic)
 
     m_list = circuit.measurements
     nb_meas = len(m_list)
@@ -141,9 +239,41 @@ def generate_job(
             "circuit."
         )
 
+    if remove_symbolic:
+        _bind_natively(job, symbolic_circuit, values)
     return job
 
 
+def _bind_natively(
+    job: Job,
+    circuit: QCircuit | ParametricCircuit,
+    values: dict[Expr | str, Complex],
+):
+    """Sets the symbolic circuit of the job and the values of its variables,
+    for the providers to bind the values to the translated circuit (see
+    :attr:`Job.symbolic_circuit <mpqp.execution.job.Job.symbolic_circuit>`).
+    Nothing is set for the remote devices, for numerical circuits, or if some
+    values are complex."""
+    if job.device.is_remote():
+        return
+    if isinstance(circuit, ParametricCircuit):
+        source = circuit._source  # pyright: ignore[reportPrivateUsage]
+        variables = circuit.parameters
+    else:
+        source = circuit
+        variables = source.variables()
+    if len(variables) == 0 or len(source.breakpoints) != 0:
+        return
+    bound = {str(var): value for var, value in values.items()}
+    if any(
+        str(var) not in bound or complex(bound[str(var)]).imag != 0 for var in variables
+    ):
+        return
+    # the translation sets attributes of the circuit, such as its global phase
+    job.symbolic_circuit = source._shallow_copy()  # pyright: ignore[reportPrivateUsage]
+    job.values = {str(var): complex(bound[str(var)]).real for var in variables}
+
+
 @typechecked
 def _run_diagonal_observables(
     circuit: QCircuit,
@@ -189,23 +319,34 @@ def _run_diagonal_observables(
 
 @typechecked
 def _run_single(
-    circuit: QCircuit,
+    circuit: QCircuit | ParametricCircuit,
     device: AvailableDevice,
     values: dict[Expr | str, Complex],
     display_breakpoints: bool = True,
     translation_warning: bool = True,
+    gate_fusion: Optional[int] = None,
+    seed: Optional[int] = None,
 ) -> Result:
     """Runs the circuit on the ``backend``. If the circuit depends on variables,
     the ``values`` given in parameters are used to do the substitution.
 
     Args:
-        circuit: QCircuit to be run.
+        circuit: QCircuit to be run, or a
+            :class:`~mpqp.core.parametric.ParametricCircuit` to be bound to
+            the ``values``.
         device: Device, on which the circuit will be run.
         values: Set of values to substitute symbolic variables. Defaults to ``{}``.
         display_breakpoints: If ``False``, breakpoints will be disabled. Each
             breakpoint adds an execution of the circuit(s), so you may use this
             option for performance if need be.
         translation_warning: If `True`, a warning will be raised.
+        gate_fusion: If given, consecutive gates acting on at most this number
+            of qubits are fused before the execution (see
+            :func:`~mpqp.execution.fusion.fuse_gates`). The gate count
+            reduction is stored in the ``fusion`` attribute of the job of the
+            result.
+        seed: Seed of the shots of the job, see :attr:`Job.seed
+            <mpqp.execution.job.Job.seed>`.
 
     Returns:
         The Result containing information about the measurement required.
@@ -230,12 +371,29 @@ def _run_single(
 
     """
 
+    template = None
+    if isinstance(circuit, ParametricCircuit):
+        template = circuit
+        circuit = circuit.bind(values)
+
     if display_breakpoints:
         for k in range(len(circuit.breakpoints)):
             display_kth_breakpoint(circuit, k, device)
 
-    circuit = circuit.without_breakpoints()
+    # the circuit is not modified below, so it is only copied if needed
+    if len(circuit.breakpoints) != 0:
+        circuit = circuit.without_breakpoints()
+    original_circuit = circuit
+    if gate_fusion is not None:
+        if len(values) != 0:
+            circuit = circuit.subs(values, True)
+        circuit = fuse_gates(circuit, gate_fusion)
     job = generate_job(circuit, device, values)
+    if template is not None and gate_fusion is None:
+        _bind_natively(job, template, values)
+    if gate_fusion is not None:
+        job.fusion = fusion_report(original_circuit, circuit, gate_fusion)
+    job.seed = seed
     job.status = JobStatus.INIT
 
     if len(circuit.measurements) == 1:
@@ -246,16 +404,13 @@ def _run_single(
                     circuit, measure, device, job, values, translation_warning
                 )
 
-    if len(circuit.noises) != 0:
-        if not device.is_noisy_simulator():
-            raise DeviceJobIncompatibleError(
-                f"Device {device} cannot simulate circuits containing NoiseModels."
-            )
-        elif not isinstance(
-            device, (ATOSDevice, AWSDevice, IBMDevice, SimulatedDevice)
-        ):
-            raise NotImplementedError(f"Noisy simulations not supported on {device}.")
+    _check_noise(circuit, device)
+
+    return result_cache.run(job, lambda: _run_job(job, device, translation_warning))
 
+
+def _run_job(job: Job, device: AvailableDevice, translation_warning: bool) -> Result:
+    """Runs the job on the provider of the ``device``, see :func:`_run_single`."""
     if isinstance(device, (IBMDevice, IBMSimulatedDevice)):
         return run_ibm(job, translation_warning)
     elif isinstance(device, ATOSDevice):
@@ -266,24 +421,45 @@ def _run_single(
         return run_google(job, translation_warning)
     elif isinstance(device, AZUREDevice):
         return run_azure(job, translation_warning)
+    elif isinstance(device, MPQPDevice):
+        return run_mpqp(job, translation_warning)
     else:
         raise NotImplementedError(f"Device {device} not handled")
 
 
+def _check_noise(circuit: QCircuit, device: AvailableDevice):
+    """Checks that the device can simulate the noise of the circuit, see
+    :func:`_run_single`."""
+    if len(circuit.noises) != 0:
+        if not device.is_noisy_simulator():
+            raise DeviceJobIncompatibleError(
+                f"Device {device} cannot simulate circuits containing NoiseModels."
+            )
+        elif not isinstance(
+            device, (ATOSDevice, AWSDevice, IBMDevice, MPQPDevice, SimulatedDevice)
+        ):
+            raise NotImplementedError(f"Noisy simulations not supported on {device}.")
+
+
 @typechecked
 def run(
-    circuit: OneOrMany[QCircuit],
+    circuit: OneOrMany[QCircuit | ParametricCircuit],
     device: OneOrMany[AvailableDevice],
     values: Optional[dict[Expr | str, Complex]] = None,
     display_breakpoints: bool = True,
     translation_warning: bool = True,
+    gate_fusion: Optional[int] = None,
+    executor: Optional[Executor | Literal["thread", "process"]] = None,
+    max_workers: Optional[int] = None,
 ) -> Result | BatchResult:
     """Runs the circuit on the backend, or list of backend, provided in
     parameter.
 
     If the circuit contains symbolic variables (see section :ref:`VQA` for more
     information on them), the ``values`` parameter is used perform the necessary
-    substitutions.
+    substitutions. When the same symbolic circuit is run for many values, it
+    can be compiled once in a :class:`~mpqp.core.parametric.ParametricCircuit`,
+    which binds the values without ``sympy``.
 
     Args:
         circuit: Circuit, or list of circuits, to be run.
@@ -293,6 +469,21 @@ def run(
             breakpoint adds an execution of the circuit(s), so you may use this
             option for performance if need be.
         translation_warning: If `True`, a warning will be raised.
+        gate_fusion: If given, consecutive gates acting on at most this number
+            of qubits are fused before the execution (see
+            :func:`~mpqp.execution.fusion.fuse_gates`). The gate count
+            reduction is stored in the ``fusion`` attribute of the job of the
+            result.
+        executor: How the items of a batch (each circuit on each device) are
+            run: one after the other if ``None``, concurrently in a pool of
+            threads for ``"thread"`` or of processes for ``"process"``, or
+            concurrently in the executor given. When they are run
+            concurrently, an error raised by an item does not stop the others,
+            it is stored in the ``errors`` of the
+            :class:`~mpqp.execution.result.BatchResult`.
+        max_workers: Maximum number of items of the batch run at the same
+            time by the ``executor``, defaults to the number of items for a
+            given executor, and to the default of the pool otherwise.
 
     Returns:
         The Result containing information about the measurement required.
@@ -347,36 +538,776 @@ def run(
               Samples:
                 State: 11, Index: 3, Count: 1000, Probability: 1
               Error: None
+        >>> batch_result = run([c, c2], IBMDevice.AER_SIMULATOR, executor="thread")
+        >>> [result.job.circuit.label for result in batch_result.results]
+        ['X CNOT circuit', 'X circuit']
+        >>> len(batch_result.durations)
+        2
 
     """
     if values is None:
         values = {}
 
-    def namer(circ: QCircuit, i: int):
+    def namer(circ: QCircuit | ParametricCircuit, i: int):
+        # the templates are bound when their item is run, see _run_single
         circ.label = f"circuit {i}" if circ.label is None else circ.label
         return circ
 
     # TODO: here detect that we have a full diag observable job
 
     if isinstance(circuit, Iterable) or isinstance(device, Iterable):
-        return BatchResult(
-            [
-                _run_single(
-                    namer(circ, i + 1),
-                    dev,
+        items = [
+            (
+                namer(circ, i + 1),
+                dev,
+                values,
+                display_breakpoints,
+                translation_warning,
+                gate_fusion,
+            )
+            for i, circ in enumerate(flatten(circuit))
+            for dev in flatten(device)
+        ]
+        if executor is None:
+            results = []
+            durations = []
+            for item in items:
+                start = perf_counter()
+                results.append(_run_single(*item))
+                durations.append(perf_counter() - start)
+            return BatchResult(results, durations=durations)
+        return _run_batch(items, executor, max_workers)
+    else:
+        return _run_single(
+            circuit,
+            device,
+            values,
+            display_breakpoints,
+            translation_warning,
+            gate_fusion,
+        )
+
+
+def _timed_run(item: tuple[Any, ...]) -> tuple[Result | Exception, float]:
+    """Runs an item of a batch (see :func:`_run_single`), and returns its
+    result (or the error it raised) with the duration of the execution."""
+    start = perf_counter()
+    try:
+        outcome = _run_single(*item)
+    except Exception as error:
+        outcome = error
+    return outcome, perf_counter() - start
+
+
+def _run_batch(
+    items: list[tuple[Any, ...]],
+    executor: Executor | Literal["thread", "process"],
+    max_workers: Optional[int],
+) -> BatchResult:
+    """Runs the items of a batch concurrently, see :func:`run`.
+
+    Args:
+        items: The arguments of :func:`_run_single` for each item.
+        executor: The executor running the items, or the kind of pool to
+            create for them.
+        max_workers: Maximum number of items run at the same time.
+
+    Returns:
+        The results of the items which succeeded, the errors of the others,
+        and the duration of each item, in the order of ``items``.
+    """
+    if isinstance(executor, str):
+        with _pool(executor, max_workers) as pool:
+            return _run_batch(items, pool, max_workers)
+
+    outcomes: dict[int, tuple[Result | Exception, float]] = {}
+    pending: dict[Future[tuple[Result | Exception, float]], int] = {}
+
+    def collect(futures: Iterable[Future[tuple[Result | Exception, float]]]):
+        for future in futures:
+            index = pending.pop(future)
+            try:
+                outcomes[index] = future.result()
+            except Exception as error:
+                # the item could not be sent to the executor, or its result
+                # could not be retrieved from it
+                outcomes[index] = (error, 0.0)
+
+    limit = len(items) if max_workers is None else max_workers
+    for index, (circuit, *arguments) in enumerate(items):
+        if len(pending) >= limit:
+            collect(wait(pending, return_when=FIRST_COMPLETED).done)
+        if isinstance(circuit, QCircuit):
+            # the items sharing a circuit may run at the same time, so each one
+            # fills the caches of its own copy of the circuit
+            circuit = circuit._shallow_copy()  # pyright: ignore[reportPrivateUsage]
+        elif isinstance(executor, ProcessPoolExecutor):
+            # the compiled functions of the templates cannot be pickled
+            circuit = circuit.bind(arguments[1])
+        future = executor.submit(_timed_run, (circuit, *arguments))
+        pending[future] = index
+    collect(wait(pending).done)
+
+    ordered = [outcomes[index] for index in range(len(items))]
+    return BatchResult(
+        [outcome for outcome, _ in ordered if isinstance(outcome, Result)],
+        {
+            index: outcome
+            for index, (outcome, _) in enumerate(ordered)
+            if not isinstance(outcome, Result)
+        },
+        [duration for _, duration in ordered],
+    )
+
+
+@typechecked
+def run_native_batch(
+    circuits: Sequence[QCircuit | ParametricCircuit],
+    device: AvailableDevice,
+    values: Optional[dict[Expr | str, Complex]] = None,
+    translation_warning: bool = True,
+) -> BatchResult:
+    """Runs several circuits on a device, submitting them together in as few
+    native executions of the provider as possible: a single ``qiskit`` AER
+    execution or runtime job with one PUB per circuit, a single AWS Braket
+    batch of tasks, a single myQLM ``Batch`` or a single ``cirq`` batch.
+
+    Unlike :func:`run`, which creates a job on the provider for each circuit,
+    the cost of the submission (connection, queue, compilation of the
+    simulator) is paid once for the whole batch. The jobs that cannot be
+    packed (for instance the noisy jobs on IBM devices, or the devices without
+    native batches) are executed one by one.
+
+    Args:
+        circuits: Circuits to be run.
+        device: Device on which the circuits will be run.
+        values: Set of values to substitute symbolic variables.
+        translation_warning: If `True`, a warning will be raised.
+
+    Returns:
+        The results of the circuits, in the order of ``circuits``. The
+        circuits which could not be prepared for the device, or whose native
+        execution failed, are reported in the ``errors`` of the batch result:
+        an error raised by a native execution is recorded for all the circuits
+        it packs, and does not stop the other executions. Since the circuits
+        are executed together, no duration is given for each of them.
+
+    Note:
+        The breakpoints of the circuits are ignored.
+
+    Example:
+        >>> circuits = [
+        ...     QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=1000)], label="Bell"),
+        ...     QCircuit([X(0), BasisMeasure([0], shots=1000)], label="X"),
+        ... ]
+        >>> batch_result = run_native_batch(circuits, IBMDevice.AER_SIMULATOR)
+        >>> [result.job.circuit.label for result in batch_result.results]
+        ['Bell', 'X']
+        >>> print(batch_result[1])
+        Result: X, IBMDevice, AER_SIMULATOR
+          Counts: [0, 1000]
+          Probabilities: [0, 1]
+          Samples:
+            State: 1, Index: 1, Count: 1000, Probability: 1
+          Error: None
+
+    """
+    if values is None:
+        values = {}
+
+    outcomes: list[Optional[Result | Exception]] = [None] * len(circuits)
+    jobs: list[Job] = []
+    packed: list[int] = []
+    for index, circuit in enumerate(circuits):
+        template = None
+        if isinstance(circuit, ParametricCircuit):
+            template = circuit
+            circuit = circuit.bind(values)
+        if circuit.label is None:
+            circuit.label = f"circuit {index + 1}"
+        if len(circuit.breakpoints) != 0:
+            circuit = circuit.without_breakpoints()
+        try:
+            job = generate_job(circuit, device, values)
+            if template is not None:
+                _bind_natively(job, template, values)
+            job.status = JobStatus.INIT
+            measure = job.measure
+            if (
+                isinstance(measure, ExpectationMeasure)
+                and measure.optim_diagonal
+                and measure.are_all_diagonal()
+            ):
+                outcomes[index] = _run_diagonal_observables(
+                    circuit, measure, device, job, values, translation_warning
+                )
+                continue
+            _check_noise(circuit, device)
+        except Exception as error:
+            outcomes[index] = error
+            continue
+        outcomes[index] = result_cache.get(job)
+        if outcomes[index] is None:
+            jobs.append(job)
+            packed.append(index)
+
+    if isinstance(device, (IBMDevice, IBMSimulatedDevice)):
+        results = run_ibm_batch(jobs)
+    elif isinstance(device, ATOSDevice):
+        results = run_atos_batch(jobs, translation_warning)
+    elif isinstance(device, AWSDevice):
+        results = run_braket_batch(jobs, translation_warning)
+    elif isinstance(device, GOOGLEDevice):
+        results = run_google_batch(jobs, translation_warning)
+    elif isinstance(device, (AZUREDevice, MPQPDevice)):
+        # these devices have no native batch, the jobs are run one by one
+        results = []
+        for job in jobs:
+            try:
+                results.append(_run_job(job, device, translation_warning))
+            except Exception as error:
+                results.append(error)
+    else:
+        raise NotImplementedError(f"Device {device} not handled")
+    for index, job, result in zip(packed, jobs, results):
+        if isinstance(result, Result):
+            result_cache.put(job, result)
+        outcomes[index] = result
+
+    return BatchResult(
+        [outcome for outcome in outcomes if isinstance(outcome, Result)],
+        {
+            index: outcome
+            for index, outcome in enumerate(outcomes)
+            if isinstance(outcome, Exception)
+        },
+    )
+
+
+def _pool(kind: Literal["thread", "process"], max_workers: Optional[int]) -> Executor:
+    """Creates a pool of threads or of processes to run the items of a batch."""
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers)
+    # forking a process while the simulators hold locks in other threads can
+    # deadlock the child process, so it is spawned
+    return ProcessPoolExecutor(max_workers, get_context("spawn"))
+
+
+@typechecked
+def run_sharded(
+    circuit: QCircuit | ParametricCircuit,
+    device: AvailableDevice,
+    shards: Optional[int] = None,
+    max_shots: Optional[int] = None,
+    values: Optional[dict[Expr | str, Complex]] = None,
+    seed: Optional[int] = None,
+    target_error: Optional[float] = None,
+    executor: Executor | Literal["thread", "process"] = "thread",
+    max_workers: Optional[int] = None,
+    translation_warning: bool = True,
+) -> Result:
+    """Runs a circuit sampled with a large number of shots by splitting the
+    shots into shards, run concurrently as independent jobs, and merging the
+    counts of the shards in a single result.
+
+    Each shard is given its own seed, derived from ``seed`` (see
+    :attr:`Job.seed <mpqp.execution.job.Job.seed>`), so the counts of the
+    shards are independent, and reproducible on the simulators using the seed
+    of the jobs. On a remote device, each shard is a remote job, so
+    ``max_shots`` can be used to comply with the limit of shots per job of the
+    provider.
+
+    The error of the result is the largest standard error of the estimated
+    probabilities of the outcomes, ``sqrt(p * (1 - p) / shots)``. When a
+    ``target_error`` is given, no more shard is started once it is reached, and
+    the result only contains the shots of the shards which were run.
+
+    Args:
+        circuit: Circuit to be run, its only measure must be a
+            :class:`~mpqp.core.instruction.measurement.basis_measure.BasisMeasure`
+            with shots.
+        device: Device on which the circuit will be run.
+        shards: Number of shards, the number of CPUs by default.
+        max_shots: Maximum number of shots of a shard, more shards are used if
+            needed.
+        values: Set of values to substitute symbolic variables.
+        seed: Seed from which the seeds of the shards are derived.
+        target_error: Standard error after which no more shard is started.
+        executor: The executor running the shards, or the kind of pool to
+            create for them.
+        max_workers: Maximum number of shards run at the same time, the number
+            of CPUs by default.
+        translation_warning: If `True`, a warning will be raised.
+
+    Returns:
+        The result of the circuit, with the merged counts of the shards.
+
+    Raises:
+        ValueError: If the circuit is not measured by a single
+            ``BasisMeasure`` with shots.
+
+    Example:
+        >>> circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=100_000)])
+        >>> result = run_sharded(circuit, IBMDevice.AER_SIMULATOR, shards=4, seed=12)
+        >>> result.shots, len(result.job.circuit.measurements)
+        (100000, 1)
+        >>> sorted(sample.bin_str for sample in result.samples)
+        ['00', '11']
+        >>> result.error < 0.002
+        True
+        >>> result = run_sharded(
+        ...     circuit,
+        ...     MPQPDevice.STATEVECTOR_SIMULATOR,
+        ...     shards=100,
+        ...     target_error=0.01,
+        ...     max_workers=2,
+        ... )
+        >>> result.shots < 100_000
+        True
+
+    """
+    if values is None:
+        values = {}
+    if isinstance(circuit, ParametricCircuit):
+        circuit = circuit.bind(values)
+    measure = circuit.measurements[0] if len(circuit.measurements) == 1 else None
+    if not isinstance(measure, BasisMeasure) or measure.shots <= 0:
+        raise ValueError(
+            "Only the circuits measured by a single `BasisMeasure` with shots "
+            "can be split into shards."
+        )
+
+    nb_shards = (os.cpu_count() or 1) if shards is None else shards
+    if max_shots is not None:
+        nb_shards = max(nb_shards, -(-measure.shots // max_shots))
+    nb_shards = max(1, min(nb_shards, measure.shots))
+
+    if isinstance(executor, str):
+        with _pool(executor, max_workers) as pool:
+            return run_sharded(
+                circuit,
+                device,
+                nb_shards,
+                None,
+                values,
+                seed,
+                target_error,
+                pool,
+                max_workers,
+                translation_warning,
+            )
+
+    shard_shots = [
+        measure.shots // nb_shards + (index < measure.shots % nb_shards)
+        for index in range(nb_shards)
+    ]
+    seeds = [
+        int(sequence.generate_state(1)[0])
+        for sequence in np.random.SeedSequence(seed).spawn(nb_shards)
+    ]
+
+    counts: dict[int, int] = {}
+    total = 0
+    error = None
+    pending: set[Future[Result]] = set()
+    limit = (os.cpu_count() or 1) if max_workers is None else max_workers
+    shard = 0
+    while shard < nb_shards or len(pending) != 0:
+        reached = (
+            target_error is not None and error is not None and error <= target_error
+        )
+        while shard < nb_shards and len(pending) < limit and not reached:
+            shard_circuit = _with_shots(circuit, measure, shard_shots[shard])
+            pending.add(
+                executor.submit(
+                    _run_single,
+                    shard_circuit,
+                    device,
                     values,
-                    display_breakpoints,
+                    False,
                     translation_warning,
+                    None,
+                    seeds[shard],
                 )
-                for i, circ in enumerate(flatten(circuit))
-                for dev in flatten(device)
-            ]
+            )
+            shard += 1
+        if len(pending) == 0:
+            break
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                shard_result = future.result()
+            except Exception:
+                for other in pending:
+                    other.cancel()
+                raise
+            for sample in shard_result.samples:
+                if TYPE_CHECKING:
+                    assert sample.count is not None
+                counts[sample.index] = counts.get(sample.index, 0) + sample.count
+            total += shard_result.shots
+        error = max(
+            np.sqrt(count / total * (1 - count / total) / total)
+            for count in counts.values()
+        )
+
+    job = generate_job(
+        circuit if total == measure.shots else _with_shots(circuit, measure, total),
+        device,
+        values,
+    )
+    job.status = JobStatus.DONE
+    samples = [
+        Sample(measure.nb_qubits, index=index, count=count)
+        for index, count in counts.items()
+    ]
+    return Result(job, samples, float(error or 0), total)
+
+
+def _with_shots(circuit: QCircuit, measure: BasisMeasure, shots: int) -> QCircuit:
+    """Copy of a circuit measured by ``measure``, with another number of shots,
+    see :func:`run_sharded`."""
+    sharded = circuit.without_measurements()
+    sharded.add(
+        BasisMeasure(
+            measure.targets,
+            measure.c_targets,
+            shots=shots,
+            basis=measure.basis,
+            label=measure.label,
+        )
+    )
+    return sharded
+
+
+@typechecked
+async def run_async(
+    circuit: OneOrMany[QCircuit | ParametricCircuit],
+    device: OneOrMany[AvailableDevice],
+    values: Optional[dict[Expr | str, Complex]] = None,
+    display_breakpoints: bool = True,
+    translation_warning: bool = True,
+    gate_fusion: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    monitor: Optional[JobMonitor] = None,
+) -> Result | BatchResult:
+    """Awaitable version of :func:`run`.
+
+    The items of a batch (each circuit on each device) are run concurrently.
+    On the local devices, they are run by ``executor``. On the remote devices,
+    they are submitted with :func:`submit_async` and their results are awaited
+    with :func:`~mpqp.execution.remote_handler.get_remote_result_async`, so
+    the remote jobs waiting in the queue of their provider do not hold any
+    thread. As for the concurrent executions of :func:`run`, an error raised
+    by an item of a batch does not stop the others, it is stored in the
+    ``errors`` of the :class:`~mpqp.execution.result.BatchResult`.
+
+    Args:
+        circuit: Circuit, or list of circuits, to be run.
+        device: Device, or list of devices, on which the circuit will be run.
+        values: Set of values to substitute symbolic variables. Defaults to ``{}``.
+        display_breakpoints: If ``False``, breakpoints will be disabled.
+        translation_warning: If `True`, a warning will be raised.
+        gate_fusion: If given, consecutive gates acting on at most this number
+            of qubits are fused before the execution, see :func:`run`.
+        executor: Executor running the local simulations, defaults to the
+            default executor of the event loop.
+        monitor: Monitor polling the status of the remote jobs, defaults to
+            :data:`~mpqp.execution.job_monitor.job_monitor`.
+
+    Returns:
+        The Result containing information about the measurement required.
+
+    Example:
+        >>> c = QCircuit(
+        ...     [X(0), CNOT(0, 1), BasisMeasure([0, 1], shots=1000)],
+        ...     label="X CNOT circuit",
+        ... )
+        >>> result = asyncio.run(run_async(c, IBMDevice.AER_SIMULATOR))
+        >>> print(result.counts)
+        [0, 0, 0, 1000]
+        >>> batch_result = asyncio.run(run_async(
+        ...     c, [IBMDevice.AER_SIMULATOR, GOOGLEDevice.CIRQ_LOCAL_SIMULATOR]
+        ... ))
+        >>> [result.device.name for result in batch_result.results]
+        ['AER_SIMULATOR', 'CIRQ_LOCAL_SIMULATOR']
+
+    """
+    if values is None:
+        values = {}
+
+    if isinstance(circuit, Iterable) or isinstance(device, Iterable):
+        circuits: list[QCircuit] = []
+        for i, circ in enumerate(flatten(circuit)):
+            if isinstance(circ, ParametricCircuit):
+                circ = circ.bind(values)
+            circ.label = f"circuit {i + 1}" if circ.label is None else circ.label
+            circuits.append(circ)
+        items = [
+            # the items sharing a circuit run at the same time, so each one
+            # fills the caches of its own copy of the circuit
+            (
+                circ._shallow_copy(),  # pyright: ignore[reportPrivateUsage]
+                dev,
+                values,
+                display_breakpoints,
+                translation_warning,
+                gate_fusion,
+            )
+            for circ in circuits
+            for dev in flatten(device)
+        ]
+        outcomes = await asyncio.gather(
+            *(_timed_run_async(item, executor, monitor) for item in items)
+        )
+        return BatchResult(
+            [outcome for outcome, _ in outcomes if isinstance(outcome, Result)],
+            {
+                index: outcome
+                for index, (outcome, _) in enumerate(outcomes)
+                if not isinstance(outcome, Result)
+            },
+            [duration for _, duration in outcomes],
         )
+
+    outcome, _ = await _timed_run_async(
+        (
+            circuit,
+            device,
+            values,
+            display_breakpoints,
+            translation_warning,
+            gate_fusion,
+        ),
+        executor,
+        monitor,
+    )
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+async def _timed_run_async(
+    item: tuple[Any, ...], executor: Optional[Executor], monitor: Optional[JobMonitor]
+) -> tuple[Result | Exception, float]:
+    """Awaitable version of :func:`_timed_run`, see :func:`run_async`."""
+    from mpqp.execution.remote_handler import get_remote_result_async
+
+    circuit, device, values, display_breakpoints, _, gate_fusion = item
+    loop = asyncio.get_running_loop()
+    start = perf_counter()
+    try:
+        if not device.is_remote():
+            outcome = await loop.run_in_executor(executor, _run_single, *item)
+        else:
+            circuit = await loop.run_in_executor(
+                executor,
+                _prepare_submission,
+                circuit,
+                values,
+                display_breakpoints,
+                gate_fusion,
+            )
+            _, job = await submit_async(circuit, device, values, executor)
+            outcome = await get_remote_result_async(job, monitor=monitor)
+    except Exception as error:
+        outcome = error
+    return outcome, perf_counter() - start
+
+
+def _prepare_submission(
+    circuit: QCircuit | ParametricCircuit,
+    values: dict[Expr | str, Complex],
+    display_breakpoints: bool,
+    gate_fusion: Optional[int],
+) -> QCircuit:
+    """Prepares a circuit to be submitted to a remote device the way
+    :func:`_run_single` prepares it to be run."""
+    if isinstance(circuit, ParametricCircuit):
+        circuit = circuit.bind(values)
+    if display_breakpoints:
+        for k in range(len(circuit.breakpoints)):
+            display_kth_breakpoint(circuit, k)
+    if len(circuit.breakpoints) != 0:
+        circuit = circuit.without_breakpoints()
+    if gate_fusion is not None:
+        if len(values) != 0:
+            circuit = circuit.subs(values, True)
+        circuit = fuse_gates(circuit, gate_fusion)
+    return circuit
+
+
+@typechecked
+def run_sweep(
+    circuit: QCircuit,
+    device: AvailableDevice,
+    values_batch: npt.ArrayLike,
+    parameters: Optional[Sequence[Expr | str]] = None,
+    translation_warning: bool = True,
+) -> SweepResult:
+    """Runs a symbolic circuit (see section :ref:`VQA`) for a batch of values
+    of its parameters.
+
+    Unlike calling :func:`run` for each point, the circuit is only prepared
+    once:
+
+    - on ``MPQPDevice.STATEVECTOR_SIMULATOR``, all the points are simulated at
+      once, the states being stacked along a batch dimension;
+    - on ``GOOGLEDevice.CIRQ_LOCAL_SIMULATOR`` (samples and state vectors),
+      and on the local ``IBMDevice`` simulators (samples, when the gate
+      parameters are plain variables), the circuit is translated once and the
+      points are bound natively by the provider;
+    - on the other devices, the points are run one after the other.
+
+    In all cases, the results are packed in a single
+    :class:`~mpqp.execution.result.SweepResult`.
+
+    Args:
+        circuit: Symbolic circuit to be run.
+        device: Device on which the circuit will be run.
+        values_batch: Values of the parameters, of shape ``(B, nb_params)``:
+            one line per point, one column per parameter. A 1D array is
+            accepted for circuits with a single parameter.
+        parameters: The variables of the circuit, in the order of the columns
+            of ``values_batch``. Defaults to the variables of the circuit
+            sorted by name.
+        translation_warning: If `True`, a warning will be raised.
+
+    Returns:
+        The results of all the points.
+
+    Raises:
+        ValueError: If the shape of ``values_batch`` does not match the
+            ``parameters``, or if some variables of the circuit are missing
+            from ``parameters``.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> circuit = QCircuit(
+        ...     [Rx(theta, 0), ExpectationMeasure(Observable(np.diag([1, -1])))]
+        ... )
+        >>> angles = np.linspace(0, np.pi, 5)
+        >>> sweep = run_sweep(circuit, MPQPDevice.STATEVECTOR_SIMULATOR, angles)
+        >>> sweep.expectation_values.round(5)
+        array([ 1.     ,  0.70711,  0.     , -0.70711, -1.     ])
+
+    """
+    from sympy import Symbol
+
+    # the variables are the symbols of the parameters, hence expressions
+    variables: dict[str, Expr] = {
+        str(var): var for var in circuit.variables() if isinstance(var, Expr)
+    }
+    if parameters is None:
+        params = sorted(variables.values(), key=str)
     else:
-        return _run_single(
-            circuit, device, values, display_breakpoints, translation_warning
+        params = [
+            variables.get(param, Symbol(param)) if isinstance(param, str) else param
+            for param in parameters
+        ]
+    missing = set(variables.values()) - set(params)
+    if len(missing) != 0:
+        raise ValueError(
+            f"Values are missing for the variables {', '.join(map(str, missing))}."
+        )
+
+    values = np.asarray(values_batch, dtype=np.float64)
+    if values.ndim == 1 and len(params) == 1:
+        values = values.reshape(-1, 1)
+    if values.ndim != 2 or values.shape[1] != len(params):
+        raise ValueError(
+            f"Expected values of shape (B, {len(params)}) for the parameters "
+            f"{params}, but got an array of shape {values.shape}."
         )
 
+    circuit = circuit.without_breakpoints()
+    # the gates without variables are evaluated once and for all
+    circuit.instructions = [
+        inst if isinstance(inst, Gate) and is_symbolic(inst) else inst.subs({}, True)
+        for inst in circuit.instructions
+    ]
+    job = generate_job(circuit, device, remove_symbolic=False)
+    job.status = JobStatus.INIT
+
+    if len(circuit.noises) == 0:
+        if device == MPQPDevice.STATEVECTOR_SIMULATOR:
+            return sweep_mpqp(job, params, values)
+        if (
+            device == GOOGLEDevice.CIRQ_LOCAL_SIMULATOR
+            and job.job_type != JobType.OBSERVABLE
+        ):
+            return sweep_local(job, params, values, translation_warning)
+        if (
+            isinstance(device, IBMDevice)
+            and not device.is_remote()
+            and job.job_type == JobType.SAMPLE
+            and _has_plain_variables(circuit)
+        ):
+            return sweep_aer(job, params, values)
+
+    template = ParametricCircuit(circuit, params)
+    results = [
+        _run_single(template.bind(point), device, {}, False, translation_warning)
+        for point in values
+    ]
+    return _pack_results(job, params, values, results)
+
+
+def _has_plain_variables(circuit: QCircuit) -> bool:
+    """Checks that the symbolic parameters of the gates of a circuit are all
+    plain variables (and not expressions of variables)."""
+    from sympy import Expr
+
+    return all(
+        not isinstance(param, Expr) or param.is_Symbol
+        for gate in circuit.gates
+        if isinstance(gate, ParametrizedGate)
+        for param in gate.parameters
+    )
+
+
+def _pack_results(
+    job: Job,
+    parameters: list[Expr],
+    values: npt.NDArray[np.float64],
+    results: list[Result],
+) -> SweepResult:
+    """Packs the results of the points of a sweep, run one by one, in a
+    :class:`~mpqp.execution.result.SweepResult`. Missing errors are replaced
+    by ``nan``, or by ``None`` if no point has an error."""
+
+    def to_array(errors: list[Any]) -> Optional[npt.NDArray[np.float64]]:
+        array = np.array(errors, dtype=object)
+        if all(error is None for error in array.flat):
+            return None
+        return np.array(
+            [np.nan if error is None else float(error) for error in array.flat]
+        ).reshape(array.shape)
+
+    shots = 0 if job.measure is None else job.measure.shots
+    errors = [result.error for result in results]
+    if job.job_type == JobType.SAMPLE:
+        data = np.array([result.counts for result in results], dtype=np.int64)
+    elif job.job_type == JobType.STATE_VECTOR:
+        data = np.array([result.amplitudes for result in results])
+    else:
+        if TYPE_CHECKING:
+            assert isinstance(job.measure, ExpectationMeasure)
+        labels = job.measure.observables_labels
+        expectations = []
+        errors = []
+        for result in results:
+            expectation_values = result.expectation_values
+            if isinstance(expectation_values, dict):
+                expectations.append([expectation_values[label] for label in labels])
+                error = result.error if isinstance(result.error, dict) else {}
+                errors.append([error.get(label) for label in labels])
+            else:
+                expectations.append([expectation_values])
+                errors.append([result.error])
+        data = np.array(expectations, dtype=float)
+    return SweepResult(job, parameters, values, data, to_array(errors), shots)
+
 
 @typechecked
 def submit(
@@ -439,6 +1370,42 @@ def submit(
     return job_id, job
 
 
+@typechecked
+async def submit_async(
+    circuit: QCircuit,
+    device: AvailableDevice,
+    values: Optional[dict[Expr | str, Complex]] = None,
+    executor: Optional[Executor] = None,
+) -> tuple[str, Job]:
+    """Awaitable version of :func:`submit`, the submission being made in
+    ``executor``.
+
+    Args:
+        circuit: QCircuit to be run.
+        device: Remote device to which the circuit will be submitted.
+        values: Values to substitute for symbolic variables. Defaults to ``{}``.
+        executor: Executor making the submission, defaults to the default
+            executor of the event loop.
+
+    Returns:
+        The job id provided by the remote device after submission of the job.
+
+    Example:
+        >>> circuit = QCircuit([H(0), CNOT(0,1), BasisMeasure([0,1], shots=10)])
+        >>> job_id, job = asyncio.run(submit_async(
+        ...     circuit, ATOSDevice.QLM_LINALG
+        ... )) # doctest: +SKIP
+
+    """
+    if not device.is_remote():
+        raise RemoteExecutionError(
+            "submit_async(...) function is only made for remote device."
+        )
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, submit, circuit, device, values
+    )
+
+
 def display_kth_breakpoint(
     circuit: QCircuit, k: int, device: AvailableDevice = ATOSDevice.MYQLM_CLINALG
 ):
@@ -0,0 +1,36 @@
+# pyright: reportUnusedImport=false
+from .density_matrix import (
+    apply_channel,
+    expectation_from_density_matrix,
+    simulate_density_matrix,
+)
+from .mps import MPS, MPSConfig, mps_config, simulate_mps
+from .noise import noisy_operations
+from .sampling import Sampler, SamplingConfig, sampling_config
+from .stabilizer import (
+    CLIFFORD_GATES,
+    StabilizerTableau,
+    is_clifford,
+    simulate_stabilizer,
+)
+from .statevector import (
+    apply_matrices,
+    apply_matrix,
+    circuit_unitary,
+    gate_matrices,
+    gate_matrix,
+    gate_qubits,
+    is_symbolic,
+    marginal_probabilities,
+    simulate_state_vector,
+    simulate_state_vector_batch,
+    sparse_circuit_unitary,
+    sparse_operator,
+    unitary_column_blocks,
+)
+from .trajectories import (
+    TrajectoryConfig,
+    sample_trajectories,
+    trajectory_config,
+    trajectory_expectations,
+)
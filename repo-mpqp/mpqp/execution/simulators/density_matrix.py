@@ -0,0 +1,132 @@
+"""Density matrix simulation written directly on top of ``numpy``.
+
+The density matrix `\\rho` of a register of `n` qubits is stored as a tensor of
+rank `2n` and shape `(2,)*2n`: the first `n` axes are the row (ket) indices and
+the last `n` axes the column (bra) indices. A gate `U` acting on `k` qubits is
+applied as `U\\rho U^\\dagger` by contracting `U` with the `k` row axes of the
+qubits, and `U^*` with the corresponding column axes. Noise channels are
+applied the same way, one Kraus operator at a time, and only on the qubits
+they affect (see :mod:`mpqp.execution.simulators.noise`).
+
+Each operation thus costs `O(4^{n+k})` instead of the `O(8^n)` of dense matrix
+products, and no operator of the size of the register is ever built."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.execution.simulators.noise import noisy_operations
+from mpqp.execution.simulators.sampling import Seed
+from mpqp.execution.simulators.statevector import apply_matrix, sampled_expectation
+
+if TYPE_CHECKING:
+    from mpqp.core.circuit import QCircuit
+
+
+def apply_channel(
+    rho: npt.NDArray[np.complex128],
+    kraus_operators: list[npt.NDArray[np.complex128]],
+    qubits: list[int],
+) -> npt.NDArray[np.complex128]:
+    """Applies `\\rho \\leftarrow \\sum_K K\\rho K^\\dagger` on some qubits of a
+    density matrix tensor.
+
+    Args:
+        rho: Density matrix, as a tensor of shape ``(2,)*2n``.
+        kraus_operators: The Kraus operators of the channel. A single unitary
+            operator corresponds to a gate.
+        qubits: The qubits on which the operators act.
+
+    Returns:
+        The density matrix after the application of the channel.
+
+    Example:
+        >>> rho = np.zeros((2, 2), dtype=complex)
+        >>> rho[0, 0] = 1
+        >>> bit_flip = [np.sqrt(0.9) * np.eye(2), np.sqrt(0.1) * np.array([[0, 1], [1, 0]])]
+        >>> apply_channel(rho, bit_flip, [0]).real.round(5)
+        array([[0.9, 0. ],
+               [0. , 0.1]])
+
+    """
+    nb_qubits = rho.ndim // 2
+    conjugated_axes = [qubit + nb_qubits for qubit in qubits]
+    result = None
+    for k in kraus_operators:
+        term = apply_matrix(apply_matrix(rho, k, qubits), k.conj(), conjugated_axes)
+        result = term if result is None else result + term
+    if result is None:
+        raise ValueError("A channel needs at least one Kraus operator.")
+    return result
+
+
+@typechecked
+def simulate_density_matrix(circuit: QCircuit) -> npt.NDArray[np.complex128]:
+    """Computes the density matrix at the end of a (potentially) noisy circuit,
+    starting from `|0...0\\rangle`. Measurements, barriers and breakpoints are
+    ignored.
+
+    Args:
+        circuit: The circuit to simulate.
+
+    Returns:
+        The final density matrix, of shape ``(2**n, 2**n)``.
+
+    Example:
+        >>> circuit = QCircuit([H(0), CNOT(0, 1), Depolarizing(0.2, [1])])
+        >>> simulate_density_matrix(circuit).diagonal().real.round(5)
+        array([0.45, 0.05, 0.05, 0.45])
+
+    """
+    nb_qubits = circuit.nb_qubits
+    rho = np.zeros((2,) * (2 * nb_qubits), dtype=np.complex128)
+    rho[(0,) * (2 * nb_qubits)] = 1
+
+    for kraus_operators, qubits in noisy_operations(circuit):
+        rho = apply_channel(rho, kraus_operators, qubits)
+
+    return rho.reshape(2**nb_qubits, 2**nb_qubits)
+
+
+@typechecked
+def expectation_from_density_matrix(
+    rho: npt.NDArray[np.complex128],
+    observable: npt.NDArray[np.complex64] | npt.NDArray[np.complex128],
+    shots: int = 0,
+    seed: Seed = None,
+) -> tuple[float, float]:
+    """Expectation value `\\mathrm{Tr}(\\rho O)` of an observable spanning the
+    whole register.
+
+    When ``shots`` is not zero, the value is estimated by sampling the
+    eigenbasis of the observable, in order to mimic shot noise.
+
+    Args:
+        rho: The density matrix.
+        observable: Hermitian matrix of the observable.
+        shots: Number of shots, ``0`` for the exact value.
+        seed: Seed of the random generator, or the generator itself. If
+            ``None``, :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+            is used.
+
+    Returns:
+        The expectation value and its standard error.
+
+    Example:
+        >>> z = np.diag([1, -1]).astype(complex)
+        >>> expectation_from_density_matrix(np.diag([0.25, 0.75]).astype(complex), z)
+        (-0.5, 0.0)
+
+    """
+    if shots == 0:
+        return float(np.real(np.einsum("ij,ji->", rho, observable))), 0.0
+
+    eigen_values, eigen_vectors = np.linalg.eigh(observable)
+    probabilities = np.real(
+        np.einsum("ji,jk,ki->i", eigen_vectors.conj(), rho, eigen_vectors)
+    )
+    return sampled_expectation(eigen_values, probabilities, shots, seed)
@@ -0,0 +1,363 @@
+"""Matrix product state (MPS) simulation of noiseless circuits.
+
+The state of `n` qubits is stored as a chain of `n` tensors `A_i` of shape
+`(\\chi_{i}, 2, \\chi_{i+1})`, where the bond dimensions `\\chi` grow with the
+entanglement of the state. For weakly entangled states (shallow circuits with
+local interactions), the bond dimensions stay small and the memory and time
+needed are polynomial in the number of qubits.
+
+A gate acting on several qubits is applied by bringing its qubits next to each
+other with swaps, contracting the resulting block of tensors with the gate,
+and splitting the block back with singular value decompositions. The MPS is
+kept in canonical form, so the singular values discarded at this step are
+optimal. The bond dimension can be capped with
+:attr:`MPSConfig.max_bond_dimension`, in which case the sum of the squared
+singular values discarded (the *truncation error*) is accumulated, and reported
+in the :class:`~mpqp.execution.result.Result`."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, cast
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.instruction.barrier import Barrier
+from mpqp.core.instruction.breakpoint import Breakpoint
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.measurement.measure import Measure
+from mpqp.core.instruction.measurement.pauli_string import (
+    PauliString,
+    PauliStringMonomial,
+)
+from mpqp.execution.simulators.sampling import random_generator
+from mpqp.execution.simulators.statevector import (
+    gate_matrix,
+    gate_qubits,
+    sampled_pauli_expectation,
+)
+
+if TYPE_CHECKING:
+    from mpqp.core.circuit import QCircuit
+
+_SWAP_MATRIX = np.eye(4, dtype=np.complex128)[[0, 2, 1, 3]]
+
+
+@dataclass
+class MPSConfig:
+    """Settings of the MPS simulation, used by
+    :attr:`~mpqp.execution.devices.MPQPDevice.MPS_SIMULATOR` through
+    :data:`mps_config`.
+
+    Example:
+        >>> mps_config.max_bond_dimension = 64  # doctest: +SKIP
+
+    """
+
+    max_bond_dimension: Optional[int] = None
+    """Maximal bond dimension of the MPS, no limit if ``None``."""
+    cutoff: float = 1e-12
+    """Singular values (relative to the largest one) below this value are
+    discarded."""
+
+
+mps_config = MPSConfig()
+"""Settings used by the MPS simulator, modify its attributes to tune the
+simulation."""
+
+
+class MPS:
+    """Matrix product state of a register of qubits, initialized to
+    `|0...0\\rangle`.
+
+    Args:
+        nb_qubits: Number of qubits of the register.
+        config: Settings of the simulation, :data:`mps_config` if not given.
+
+    Example:
+        >>> mps = MPS(3)
+        >>> mps.apply_gate(H(0))
+        >>> mps.apply_gate(CNOT(0, 2))
+        >>> mps.bond_dimensions
+        [2, 2]
+        >>> np.abs(mps.to_state_vector()).round(5)
+        array([0.70711, 0.     , 0.     , 0.     , 0.     , 0.70711, 0.     ,
+               0.     ])
+
+    """
+
+    def __init__(self, nb_qubits: int, config: Optional[MPSConfig] = None):
+        self.nb_qubits = nb_qubits
+        """See parameter description."""
+        self.config = mps_config if config is None else config
+        """See parameter description."""
+        self.tensors: list[npt.NDArray[np.complex128]] = []
+        """Tensors of the chain, of shape ``(left bond, 2, right bond)``."""
+        for _ in range(nb_qubits):
+            tensor = np.zeros((1, 2, 1), dtype=np.complex128)
+            tensor[0, 0, 0] = 1
+            self.tensors.append(tensor)
+        self.truncation_error = 0.0
+        """Sum of the squared (normalized) singular values discarded so far."""
+        self._center = 0
+
+    @property
+    def bond_dimensions(self) -> list[int]:
+        """Dimensions of the ``nb_qubits - 1`` bonds of the chain."""
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    def _move_center(self, site: int):
+        """Moves the orthogonality center of the MPS to ``site``, the tensors
+        on its left being left-canonical, and those on its right
+        right-canonical."""
+        while self._center < site:
+            tensor = self.tensors[self._center]
+            left, _, right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(left * 2, right))
+            self.tensors[self._center] = q.reshape(left, 2, -1)
+            self.tensors[self._center + 1] = np.tensordot(
+                r, self.tensors[self._center + 1], axes=1
+            )
+            self._center += 1
+        while self._center > site:
+            tensor = self.tensors[self._center]
+            left, _, right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(left, 2 * right).T)
+            self.tensors[self._center] = q.T.reshape(-1, 2, right)
+            self.tensors[self._center - 1] = np.tensordot(
+                self.tensors[self._center - 1], r.T, axes=1
+            )
+            self._center -= 1
+
+    def _apply_block(self, matrix: npt.NDArray[np.complex128], start: int):
+        """Applies a matrix on the contiguous sites ``start`` to
+        ``start + k - 1``, the first site corresponding to the most
+        significant bit of the matrix indices."""
+        k = int(np.log2(len(matrix)))
+        self._move_center(start)
+        block = self.tensors[start]
+        for site in range(start + 1, start + k):
+            block = np.tensordot(block, self.tensors[site], axes=1)
+        left, right = block.shape[0], block.shape[-1]
+        block = block.reshape(left, 2**k, right)
+        block = np.einsum("ij,ajb->aib", matrix, block)
+
+        for site in range(start, start + k - 1):
+            block = block.reshape(left * 2, -1)
+            u, s, v = np.linalg.svd(block, full_matrices=False)
+            kept = self._truncate(s)
+            self.tensors[site] = u[:, :kept].reshape(left, 2, kept)
+            block = s[:kept, None] * v[:kept]
+            left = kept
+        self.tensors[start + k - 1] = block.reshape(left, 2, right)
+        self._center = start + k - 1
+
+    def _truncate(self, singular_values: npt.NDArray[np.float64]) -> int:
+        """Number of singular values kept at a bond. The discarded weight is
+        added to :attr:`truncation_error`, and the kept singular values are
+        renormalized in place."""
+        norm = float(np.sum(singular_values**2))
+        kept = int(
+            np.count_nonzero(singular_values > self.config.cutoff * singular_values[0])
+        )
+        kept = max(1, kept)
+        if self.config.max_bond_dimension is not None:
+            kept = min(kept, self.config.max_bond_dimension)
+        discarded = float(np.sum(singular_values[kept:] ** 2)) / norm
+        if kept < len(singular_values):
+            self.truncation_error += discarded
+            singular_values[:kept] /= np.sqrt(1 - discarded)
+        return kept
+
+    def _swap(self, site: int):
+        """Swaps the qubits of sites ``site`` and ``site + 1``."""
+        self._apply_block(_SWAP_MATRIX, site)
+
+    def apply_gate(self, gate: Gate):
+        """Applies a gate on the MPS.
+
+        Args:
+            gate: The gate to apply.
+        """
+        qubits = gate_qubits(gate)
+        matrix = gate_matrix(gate)
+        k = len(qubits)
+        if k == 1:
+            site = qubits[0]
+            self.tensors[site] = np.einsum("ij,ajb->aib", matrix, self.tensors[site])
+            return
+
+        # the block is made of the qubits of the gate in increasing order, so
+        # the matrix has to be reordered accordingly
+        order = sorted(range(k), key=lambda i: qubits[i])
+        tensor = matrix.reshape((2,) * (2 * k))
+        matrix = tensor.transpose(order + [k + i for i in order]).reshape(2**k, 2**k)
+
+        # the qubits are moved next to the first one, and moved back after
+        start = min(qubits)
+        swaps = []
+        for position, qubit in enumerate(sorted(qubits)):
+            for site in range(qubit - 1, start + position - 1, -1):
+                self._swap(site)
+                swaps.append(site)
+        self._apply_block(matrix, start)
+        for site in reversed(swaps):
+            self._swap(site)
+
+    def to_state_vector(self) -> npt.NDArray[np.complex128]:
+        """Contracts the MPS into a dense state vector (exponential in the
+        number of qubits).
+
+        Returns:
+            The state vector of size ``2**nb_qubits``.
+        """
+        state = self.tensors[0]
+        for tensor in self.tensors[1:]:
+            state = np.tensordot(state, tensor, axes=1)
+        return state.reshape(-1)
+
+    def expectation(
+        self,
+        pauli_string: PauliString,
+        shots: int = 0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> tuple[float, float]:
+        """Expectation value of an observable given as a Pauli string spanning
+        the whole register, computed by contracting the MPS with each monomial.
+
+        When ``shots`` is not zero, each monomial is measured ``shots`` times,
+        in order to mimic shot noise.
+
+        Args:
+            pauli_string: The observable.
+            shots: Number of shots, ``0`` for the exact value.
+            rng: Random generator to use, seeded by
+                :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+                if not given.
+
+        Returns:
+            The expectation value of the observable and its standard error.
+
+        Example:
+            >>> from mpqp.measures import I, X, Z
+            >>> mps = MPS(2)
+            >>> mps.apply_gate(H(0))
+            >>> mps.apply_gate(CNOT(0, 1))
+            >>> value, error = mps.expectation(Z @ Z + 0.5 * X @ I)
+            >>> round(value, 5), error
+            (1.0, 0.0)
+
+        """
+        monomials = pauli_string.monomials
+        return sampled_pauli_expectation(
+            # the coefficients are numbers once the variables are bound
+            [complex(cast(complex, mono.coef)).real for mono in monomials],
+            [self._monomial_expectation(mono) for mono in monomials],
+            shots,
+            rng,
+        )
+
+    def _monomial_expectation(self, monomial: PauliStringMonomial) -> float:
+        """Expectation value of a Pauli monomial without its coefficient."""
+        atoms = monomial.atoms
+        self._move_center(0)
+        # all the tensors being right-canonical, the sites after the last non
+        # identity atom do not contribute
+        last = max((i for i, atom in enumerate(atoms) if atom.label != "I"), default=-1)
+        environment = np.ones((1, 1), dtype=np.complex128)
+        for site in range(last + 1):
+            tensor = self.tensors[site]
+            if atoms[site].label == "I":
+                operated = tensor
+            else:
+                operated = np.einsum(
+                    "ij,ajb->aib", np.asarray(atoms[site].matrix), tensor
+                )
+            environment = np.einsum(
+                "ab,asc,bsd->cd", environment, tensor.conj(), operated
+            )
+        return float(np.real(np.trace(environment)))
+
+    def sample(
+        self, targets: list[int], shots: int, rng: Optional[np.random.Generator] = None
+    ) -> dict[int, int]:
+        """Samples the measure of some qubits in the computational basis. All
+        the shots are drawn together, one qubit at a time.
+
+        Args:
+            targets: The qubits measured, the first one being the most
+                significant bit of the outcomes.
+            shots: Number of shots.
+            rng: Random generator to use, seeded by
+                :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+                if not given.
+
+        Returns:
+            The number of occurrences of each outcome observed.
+
+        Example:
+            >>> mps = MPS(3)
+            >>> mps.apply_gate(X(1))
+            >>> mps.sample([1, 2], 100)
+            {2: 100}
+
+        """
+        if rng is None:
+            rng = random_generator()
+        self._move_center(0)
+        last = max(targets)
+        bits = np.zeros((shots, last + 1), dtype=np.uint8)
+        left = np.ones((shots, 1), dtype=np.complex128)
+        for site in range(last + 1):
+            projected = np.einsum("sa,abc->sbc", left, self.tensors[site])
+            weights = np.sum(np.abs(projected) ** 2, axis=2)
+            probability_one = weights[:, 1] / weights.sum(axis=1)
+            outcomes = (rng.random(shots) < probability_one).astype(np.uint8)
+            bits[:, site] = outcomes
+            left = projected[np.arange(shots), outcomes]
+            left /= np.sqrt(weights[np.arange(shots), outcomes])[:, None]
+
+        rows, counts = np.unique(bits[:, targets], axis=0, return_counts=True)
+        return {
+            int("".join(map(str, row)), 2) if len(row) != 0 else 0: int(count)
+            for row, count in zip(rows, counts)
+        }
+
+
+@typechecked
+def simulate_mps(circuit: QCircuit, config: Optional[MPSConfig] = None) -> MPS:
+    """Computes the MPS at the end of a noiseless circuit. Measurements,
+    barriers and breakpoints are ignored.
+
+    Args:
+        circuit: The circuit to simulate.
+        config: Settings of the simulation, :data:`mps_config` if not given.
+
+    Returns:
+        The final MPS.
+
+    Raises:
+        ValueError: If the circuit contains noise.
+
+    Example:
+        >>> circuit = QCircuit([H(0)] + [CNOT(i, i + 1) for i in range(49)])
+        >>> mps = simulate_mps(circuit)
+        >>> max(mps.bond_dimensions), mps.truncation_error
+        (2, 0.0)
+
+    """
+    if len(circuit.noises) != 0:
+        raise ValueError(
+            "MPS simulation does not support noise, use a noisy simulator instead."
+        )
+    mps = MPS(circuit.nb_qubits, config)
+    for instruction in circuit.instructions:
+        if isinstance(instruction, Gate):
+            mps.apply_gate(instruction)
+        elif not isinstance(instruction, (Barrier, Breakpoint, Measure)):
+            raise NotImplementedError(
+                f"Instruction {type(instruction).__name__} cannot be simulated."
+            )
+    return mps
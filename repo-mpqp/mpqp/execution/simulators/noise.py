@@ -0,0 +1,135 @@
+"""Noise handling shared by the noisy simulators of ``MPQP``.
+
+A noisy circuit is flattened into a list of *operations*, each operation being
+a list of Kraus operators together with the qubits they act on. A gate is an
+operation with a single (unitary) Kraus operator. The noise models are placed
+after the gates they affect, and only act on the qubits of the gate they can be
+applied to, following the same rules as the ones used when translating noise
+models to the providers:
+
+- a noise model is applied after each gate when it has no ``gates`` restriction,
+  or if the type of the gate is in ``gates``;
+- a single qubit noise only affects the qubits of the gate that are in its
+  ``targets``, each of them independently;
+- a :class:`~mpqp.noise.noise_model.DimensionalNoiseModel` of dimension `d>1`
+  is only applied on gates of size `d` fully included in its ``targets``;
+- the qubits not touched by any gate receive once the noise models without
+  ``gates`` restriction, at the end of the circuit.
+
+Since the operators are never expanded to the size of the register, the cost of
+the noise is linear in the number of noise sites."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.instruction.barrier import Barrier
+from mpqp.core.instruction.breakpoint import Breakpoint
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.measurement.measure import Measure
+from mpqp.execution.simulators.statevector import gate_matrix, gate_qubits
+from mpqp.noise.noise_model import DimensionalNoiseModel, NoiseModel
+
+if TYPE_CHECKING:
+    from mpqp.core.circuit import QCircuit
+
+Operation = tuple[list[npt.NDArray[np.complex128]], list[int]]
+"""Kraus operators of an operation, and the qubits they act on."""
+
+
+@typechecked
+def noise_sites(noise: NoiseModel, gate: Gate) -> list[list[int]]:
+    """Groups of qubits on which the noise acts after the gate in parameter.
+
+    Args:
+        noise: The noise model.
+        gate: The gate that was just applied.
+
+    Returns:
+        Each element of the list is a group of qubits on which one instance of
+        the noise channel acts. The list is empty if the noise does not affect
+        this gate.
+
+    Examples:
+        >>> noise_sites(Depolarizing(0.1, [0, 2]), CNOT(0, 1))
+        [[0]]
+        >>> noise_sites(Depolarizing(0.1, [0, 1], dimension=2), CNOT(0, 1))
+        [[0, 1]]
+        >>> noise_sites(BitFlip(0.1, gates=[H]), X(0))
+        []
+
+    """
+    if len(noise.gates) != 0 and type(gate) not in noise.gates:
+        return []
+    qubits = gate_qubits(gate)
+    targets = set(noise.targets)
+    if isinstance(noise, DimensionalNoiseModel) and noise.dimension > 1:
+        if len(qubits) == noise.dimension and targets.issuperset(qubits):
+            return [sorted(qubits)]
+        return []
+    return [[qubit] for qubit in sorted(qubits) if qubit in targets]
+
+
+@typechecked
+def noise_kraus_operators(noise: NoiseModel) -> list[npt.NDArray[np.complex128]]:
+    """Numerical Kraus operators of a noise model, without null operators.
+
+    Args:
+        noise: The noise model.
+
+    Returns:
+        The Kraus operators of the noise, as complex ``numpy`` arrays.
+    """
+    return [
+        np.asarray(k, dtype=np.complex128)
+        for k in noise.to_kraus_operators()
+        if np.any(k)
+    ]
+
+
+@typechecked
+def noisy_operations(circuit: QCircuit) -> list[Operation]:
+    """Flattens a (potentially) noisy circuit into a list of operations.
+    Measurements, barriers and breakpoints are ignored.
+
+    Args:
+        circuit: The circuit to flatten.
+
+    Returns:
+        The operations of the circuit, in order.
+
+    Example:
+        >>> circuit = QCircuit([H(0), CNOT(0, 1), BitFlip(0.1)], nb_qubits=3)
+        >>> [qubits for _, qubits in noisy_operations(circuit)]
+        [[0], [0], [0, 1], [0], [1], [2]]
+
+    """
+    channels = [(noise, noise_kraus_operators(noise)) for noise in circuit.noises]
+    operations: list[Operation] = []
+    connected: set[int] = set()
+
+    for instruction in circuit.instructions:
+        if isinstance(instruction, Gate):
+            operations.append(([gate_matrix(instruction)], gate_qubits(instruction)))
+            connected.update(instruction.connections())
+            for noise, kraus in channels:
+                for qubits in noise_sites(noise, instruction):
+                    operations.append((kraus, qubits))
+        elif not isinstance(instruction, (Barrier, Breakpoint, Measure)):
+            raise NotImplementedError(
+                f"Instruction {type(instruction).__name__} cannot be simulated."
+            )
+
+    for noise, kraus in channels:
+        if len(noise.gates) != 0:
+            continue
+        if isinstance(noise, DimensionalNoiseModel) and noise.dimension > 1:
+            continue
+        for qubit in sorted(set(noise.targets) - connected):
+            operations.append((kraus, [qubit]))
+
+    return operations
@@ -0,0 +1,196 @@
+"""Sampling of measurement outcomes from a probability vector, such as the
+``probabilities`` of a :class:`~mpqp.execution.result.StateVector` or of a
+:class:`~mpqp.execution.result.Result`, without going through any third party
+SDK.
+
+A :class:`Sampler` prepares the distribution once (its support and cumulative
+sum), after what:
+
+- the counts of the outcomes are drawn at once from a multinomial
+  distribution, whose cost depends on the size of the support but not on the
+  number of shots;
+- the individual shots are drawn by inverting the cumulative sum with a binary
+  search, and can be streamed in chunks of bounded size for very large shot
+  budgets.
+
+The local simulators use it for ``SAMPLE`` jobs, seeded by
+:attr:`SamplingConfig.seed` for reproducibility."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+Seed = Union[int, np.random.Generator, None]
+"""Seed of the random generator, or the generator itself."""
+
+
+@dataclass
+class SamplingConfig:
+    """Settings of the sampling of the local simulators, used through
+    :data:`sampling_config`.
+
+    Example:
+        >>> sampling_config.seed = 42  # doctest: +SKIP
+
+    """
+
+    seed: Optional[int] = None
+    """Seed of the random generator used for each ``SAMPLE`` job, for
+    reproducibility. With ``None``, fresh entropy is used for each job."""
+    chunk_size: int = 2**20
+    """Number of shots drawn at once by :meth:`Sampler.stream`."""
+
+
+sampling_config = SamplingConfig()
+"""Settings used by the local simulators to sample the outcomes, modify its
+attributes to tune the sampling."""
+
+
+def random_generator(seed: Seed = None) -> np.random.Generator:
+    """Builds the random generator used for sampling. With a seed set in
+    :data:`sampling_config`, each call returns a generator restarting the same
+    stream, so the functions drawing several times for a job (for instance
+    for each observable) must build one generator and use it for all the
+    draws.
+
+    Args:
+        seed: Seed of the generator, or the generator itself (returned as is).
+            If ``None``, :attr:`SamplingConfig.seed` is used.
+
+    Returns:
+        The random generator.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(sampling_config.seed if seed is None else seed)
+
+
+@typechecked
+class Sampler:
+    """Draws outcomes from a probability distribution over the basis states.
+
+    Only the outcomes of non zero probability are kept, so sampling a sparse
+    distribution (for instance a GHZ state on many qubits) is cheap, and the
+    counts can be returned as a dictionary of the observed outcomes instead of
+    a dense array.
+
+    Args:
+        probabilities: Probability of each outcome. Negative values (coming
+            from numerical noise) are set to zero, and the distribution is
+            normalized.
+        seed: Seed of the random generator, or the generator itself. If
+            ``None``, :attr:`SamplingConfig.seed` is used.
+
+    Raises:
+        ValueError: If ``probabilities`` is not a non empty 1D array with a
+            positive sum.
+
+    Example:
+        >>> state = StateVector(np.array([1, 0, 0, 1]) / np.sqrt(2))
+        >>> sampler = Sampler(state.probabilities, seed=3)
+        >>> sampler.counts(1000)
+        array([496,   0,   0, 504])
+        >>> sampler.counts(1000, sparse=True)
+        {0: 495, 3: 505}
+        >>> sampler.shots(8)
+        array([0, 0, 0, 0, 3, 0, 0, 3])
+
+    """
+
+    def __init__(
+        self,
+        probabilities: npt.NDArray[np.float64] | list[float],
+        seed: Seed = None,
+    ):
+        weights = np.clip(np.asarray(probabilities, dtype=np.float64), 0, None)
+        if weights.ndim != 1 or weights.sum() <= 0:
+            raise ValueError(
+                "Expected a 1D array of probabilities with a positive sum, got "
+                f"an array of shape {weights.shape}."
+            )
+        self.nb_outcomes = len(weights)
+        """Number of outcomes of the distribution, including the ones of
+        probability zero."""
+        self.support = np.flatnonzero(weights)
+        """Outcomes of non zero probability."""
+        self.weights = weights[self.support] / weights.sum()
+        """Probability of each outcome of the support."""
+        self._cdf = np.cumsum(self.weights)
+        self._cdf /= self._cdf[-1]
+        self.rng = random_generator(seed)
+        """Random generator used for the draws."""
+
+    def counts(
+        self, shots: int, sparse: bool = False
+    ) -> npt.NDArray[np.int64] | dict[int, int]:
+        """Draws the number of occurrences of each outcome over ``shots``
+        shots.
+
+        Args:
+            shots: Number of shots.
+            sparse: If ``True``, the counts are returned as a dictionary
+                containing only the observed outcomes.
+
+        Returns:
+            The count of each outcome.
+        """
+        support_counts = self.rng.multinomial(shots, self.weights)
+        if sparse:
+            observed = np.flatnonzero(support_counts)
+            return dict(
+                zip(
+                    self.support[observed].tolist(),
+                    support_counts[observed].tolist(),
+                )
+            )
+        counts = np.zeros(self.nb_outcomes, dtype=np.int64)
+        counts[self.support] = support_counts
+        return counts
+
+    def shots(self, shots: int) -> npt.NDArray[np.int64]:
+        """Draws the outcomes of ``shots`` independent shots.
+
+        Args:
+            shots: Number of shots.
+
+        Returns:
+            The outcome of each shot, in order.
+        """
+        drawn = np.searchsorted(self._cdf, self.rng.random(shots), side="right")
+        # rounding of the last value of the cumulative sum
+        np.minimum(drawn, len(self.support) - 1, out=drawn)
+        return self.support[drawn]
+
+    def stream(
+        self, shots: int, chunk_size: Optional[int] = None
+    ) -> Iterator[npt.NDArray[np.int64]]:
+        """Draws the outcomes of ``shots`` shots, in chunks, so that the
+        memory used does not grow with the number of shots.
+
+        Args:
+            shots: Total number of shots.
+            chunk_size: Maximal number of shots per chunk,
+                :attr:`SamplingConfig.chunk_size` if not given.
+
+        Yields:
+            The outcomes of the shots of each chunk.
+
+        Example:
+            >>> sampler = Sampler(np.array([0.5, 0, 0.5]), seed=0)
+            >>> [len(chunk) for chunk in sampler.stream(2500, 1000)]
+            [1000, 1000, 500]
+
+        """
+        if chunk_size is None:
+            chunk_size = sampling_config.chunk_size
+        if chunk_size <= 0:
+            raise ValueError(
+                f"Chunks must contain at least one shot, got {chunk_size}."
+            )
+        for start in range(0, shots, chunk_size):
+            yield self.shots(min(chunk_size, shots - start))
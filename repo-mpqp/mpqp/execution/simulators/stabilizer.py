@@ -0,0 +1,485 @@
+"""Stabilizer (CHP) simulation of Clifford circuits.
+
+A circuit only made of Clifford gates (see :data:`CLIFFORD_GATES`) maps
+`|0...0\\rangle` to a *stabilizer state*, entirely described by the `n` Pauli
+operators stabilizing it. Following Aaronson and Gottesman (*Improved
+simulation of stabilizer circuits*, 2004), these operators are stored, together
+with `n` destabilizers, in a binary tableau of size `2n\\times(2n+1)` updated in
+`O(n)` per gate. The simulation is thus polynomial in the number of qubits.
+
+The outcomes of the measure of a stabilizer state in the computational basis
+are uniformly distributed over an affine subspace: a reference outcome plus
+any combination of the X parts of the stabilizers. The shots are drawn from
+this subspace directly, so their cost does not depend on the size of the
+circuit."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, cast
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.instruction.barrier import Barrier
+from mpqp.core.instruction.breakpoint import Breakpoint
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.gates.native_gates import (
+    CNOT,
+    CZ,
+    SWAP,
+    H,
+    Id,
+    S,
+    S_dagger,
+    X,
+    Y,
+    Z,
+)
+from mpqp.core.instruction.measurement.measure import Measure
+from mpqp.core.instruction.measurement.pauli_string import (
+    PauliString,
+    PauliStringAtom,
+    PauliStringMonomial,
+)
+from mpqp.execution.simulators.sampling import random_generator
+from mpqp.execution.simulators.statevector import sampled_pauli_expectation
+
+if TYPE_CHECKING:
+    from mpqp.core.circuit import QCircuit
+
+CLIFFORD_GATES: tuple[type[Gate], ...] = (Id, X, Y, Z, H, S, S_dagger, CNOT, CZ, SWAP)
+"""Gates handled by the stabilizer simulation."""
+
+
+@typechecked
+def is_clifford(circuit: QCircuit) -> bool:
+    """Checks if a circuit can be simulated by the stabilizer simulation: it
+    has no noise, and all its gates are in :data:`CLIFFORD_GATES`.
+
+    Args:
+        circuit: The circuit to check.
+
+    Returns:
+        ``True`` if the circuit only contains Clifford gates.
+
+    Examples:
+        >>> is_clifford(QCircuit([H(0), CNOT(0, 1), S(1), BasisMeasure()]))
+        True
+        >>> is_clifford(QCircuit([H(0), T(0)]))
+        False
+
+    """
+    return len(circuit.noises) == 0 and all(
+        type(gate) in CLIFFORD_GATES for gate in circuit.gates
+    )
+
+
+class StabilizerTableau:
+    """Tableau of the stabilizers and destabilizers of a register of qubits,
+    initialized to `|0...0\\rangle`.
+
+    Rows ``0`` to ``n-1`` are the destabilizers, rows ``n`` to ``2n-1`` the
+    stabilizers. A Pauli operator is encoded by its X and Z bits on each
+    qubit (both being set for Y), and a sign bit.
+
+    Args:
+        nb_qubits: Number of qubits of the register.
+
+    Example:
+        >>> tableau = StabilizerTableau(2)
+        >>> tableau.apply_gate(H(0))
+        >>> tableau.apply_gate(CNOT(0, 1))
+        >>> print(tableau)
+        +XX
+        +ZZ
+
+    """
+
+    def __init__(self, nb_qubits: int):
+        self.nb_qubits = nb_qubits
+        """See parameter description."""
+        identity = np.eye(nb_qubits, dtype=np.bool_)
+        zeros = np.zeros((nb_qubits, nb_qubits), dtype=np.bool_)
+        self.x = np.vstack([identity, zeros])
+        """X bits of the rows of the tableau."""
+        self.z = np.vstack([zeros, identity])
+        """Z bits of the rows of the tableau."""
+        self.r = np.zeros(2 * nb_qubits, dtype=np.bool_)
+        """Sign bits of the rows of the tableau (``True`` for `-1`)."""
+
+    def copy(self) -> StabilizerTableau:
+        """Copy of the tableau."""
+        tableau = StabilizerTableau(0)
+        tableau.nb_qubits = self.nb_qubits
+        tableau.x, tableau.z, tableau.r = self.x.copy(), self.z.copy(), self.r.copy()
+        return tableau
+
+    def __str__(self):
+        labels = np.array(["I", "X", "Z", "Y"])
+        n = self.nb_qubits
+        return "\n".join(
+            ("-" if self.r[i] else "+")
+            + "".join(labels[self.x[i].astype(int) + 2 * self.z[i].astype(int)])
+            for i in range(n, 2 * n)
+        )
+
+    def _h(self, a: int):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def _s(self, a: int):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.z[:, a] ^= self.x[:, a]
+
+    def _cnot(self, control: int, target: int):
+        x, z = self.x, self.z
+        self.r ^= x[:, control] & z[:, target] & ~(x[:, target] ^ z[:, control])
+        x[:, target] ^= x[:, control]
+        z[:, control] ^= z[:, target]
+
+    def apply_gate(self, gate: Gate):
+        """Updates the tableau with a Clifford gate.
+
+        Args:
+            gate: The gate to apply, its type must be in
+                :data:`CLIFFORD_GATES`.
+
+        Raises:
+            ValueError: If the gate is not a Clifford gate.
+        """
+        if isinstance(gate, (CNOT, CZ)):
+            control, target = gate.controls[0], gate.targets[0]
+            if isinstance(gate, CZ):
+                self._h(target)
+            self._cnot(control, target)
+            if isinstance(gate, CZ):
+                self._h(target)
+            return
+        if isinstance(gate, SWAP):
+            a, b = gate.targets
+            self.x[:, [a, b]] = self.x[:, [b, a]]
+            self.z[:, [a, b]] = self.z[:, [b, a]]
+            return
+
+        a = gate.targets[0]
+        if isinstance(gate, H):
+            self._h(a)
+        elif isinstance(gate, S):
+            self._s(a)
+        elif isinstance(gate, S_dagger):
+            self._s(a)
+            self.r ^= self.x[:, a]
+        elif isinstance(gate, X):
+            self.r ^= self.z[:, a]
+        elif isinstance(gate, Y):
+            self.r ^= self.x[:, a] ^ self.z[:, a]
+        elif isinstance(gate, Z):
+            self.r ^= self.x[:, a]
+        elif not isinstance(gate, Id):
+            raise ValueError(f"{type(gate).__name__} is not a Clifford gate.")
+
+    def _rowsum(
+        self,
+        x: npt.NDArray[np.bool_],
+        z: npt.NDArray[np.bool_],
+        r: npt.NDArray[np.bool_],
+        row: int,
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """Multiplies the Pauli operators given by ``x``, ``z`` and ``r`` (one
+        per line) by the operator of the row ``row`` of the tableau, on the
+        left.
+
+        Returns:
+            The X bits, Z bits and signs of the products.
+        """
+        x1, z1 = self.x[row], self.z[row]
+        total = (
+            2 * r.astype(int)
+            + 2 * int(self.r[row])
+            + _phase_exponents(x1, z1, x, z).sum(axis=-1)
+        )
+        return x ^ x1, z ^ z1, (total % 4) == 2
+
+    def _product_sign(self, rows: npt.NDArray[np.intp]) -> bool:
+        """Sign of the product of some rows of the tableau, which must commute.
+
+        The partial products are all computed at once, as cumulative XORs of
+        the bits of the rows.
+        """
+        x, z = self.x[rows], self.z[rows]
+        previous_x = np.logical_xor.accumulate(x, axis=0)[:-1]
+        previous_z = np.logical_xor.accumulate(z, axis=0)[:-1]
+        total = 2 * int(self.r[rows].sum()) + int(
+            _phase_exponents(x[1:], z[1:], previous_x, previous_z).sum()
+        )
+        return total % 4 == 2
+
+    def measure(self, qubit: int, outcome_if_random: bool = False) -> bool:
+        """Measures a qubit in the computational basis, updating the tableau.
+
+        Args:
+            qubit: The qubit to measure.
+            outcome_if_random: Outcome to pick if the measure is not
+                deterministic.
+
+        Returns:
+            The outcome of the measure.
+        """
+        n = self.nb_qubits
+        anticommuting = np.flatnonzero(self.x[n:, qubit])
+        if len(anticommuting) != 0:
+            p = n + anticommuting[0]
+            rows = np.flatnonzero(self.x[:, qubit])
+            rows = rows[rows != p]
+            self.x[rows], self.z[rows], self.r[rows] = self._rowsum(
+                self.x[rows], self.z[rows], self.r[rows], p
+            )
+            self.x[p - n], self.z[p - n], self.r[p - n] = (
+                self.x[p].copy(),
+                self.z[p].copy(),
+                self.r[p],
+            )
+            self.x[p], self.z[p] = False, False
+            self.z[p, qubit] = True
+            self.r[p] = outcome_if_random
+            return outcome_if_random
+
+        return self._product_sign(n + np.flatnonzero(self.x[:n, qubit]))
+
+    def pauli_expectation(self, atoms: list[str]) -> float:
+        """Expectation value of a Pauli operator (without coefficient) on the
+        stabilizer state: `\\pm 1` if it belongs to the stabilizer group (up to
+        its sign), `0` otherwise.
+
+        Args:
+            atoms: The Pauli operator as a list of ``"I"``, ``"X"``, ``"Y"``
+                and ``"Z"``, one per qubit.
+
+        Returns:
+            The expectation value.
+
+        Example:
+            >>> tableau = StabilizerTableau(2)
+            >>> tableau.apply_gate(H(0))
+            >>> tableau.apply_gate(CNOT(0, 1))
+            >>> [tableau.pauli_expectation(list(p)) for p in ["XX", "ZI", "YY"]]
+            [1.0, 0.0, -1.0]
+
+        """
+        n = self.nb_qubits
+        x = np.array([atom in "XY" for atom in atoms], dtype=np.bool_)
+        z = np.array([atom in "ZY" for atom in atoms], dtype=np.bool_)
+        # symplectic product with each row, odd when the operators anticommute
+        anticommute = ((self.x & z) ^ (self.z & x)).sum(axis=1) % 2 == 1
+        if np.any(anticommute[n:]):
+            return 0.0
+        # the operator is (up to its sign) the product of the stabilizers whose
+        # destabilizer anticommutes with it
+        sign = self._product_sign(n + np.flatnonzero(anticommute[:n]))
+        return -1.0 if sign else 1.0
+
+    def expectation(
+        self,
+        pauli_string: PauliString,
+        shots: int = 0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> tuple[float, float]:
+        """Expectation value of an observable given as a Pauli string spanning
+        the whole register.
+
+        When ``shots`` is not zero, each monomial is measured ``shots`` times,
+        in order to mimic shot noise.
+
+        Args:
+            pauli_string: The observable.
+            shots: Number of shots, ``0`` for the exact value.
+            rng: Random generator to use, seeded by
+                :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+                if not given.
+
+        Returns:
+            The expectation value of the observable and its standard error.
+        """
+        monomials: list[PauliStringMonomial] = pauli_string.monomials
+        return sampled_pauli_expectation(
+            # the coefficients are numbers once the variables are bound
+            [complex(cast(complex, mono.coef)).real for mono in monomials],
+            [
+                self.pauli_expectation([atom.label for atom in mono.atoms])
+                * float(np.prod([_atom_sign(atom) for atom in mono.atoms]))
+                for mono in monomials
+            ],
+            shots,
+            rng,
+        )
+
+    def sample(
+        self, targets: list[int], shots: int, rng: Optional[np.random.Generator] = None
+    ) -> dict[int, int]:
+        """Samples the measure of some qubits in the computational basis,
+        without modifying the tableau.
+
+        Args:
+            targets: The qubits measured, the first one being the most
+                significant bit of the outcomes.
+            shots: Number of shots.
+            rng: Random generator to use, seeded by
+                :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+                if not given.
+
+        Returns:
+            The number of occurrences of each outcome observed.
+
+        Example:
+            >>> tableau = StabilizerTableau(3)
+            >>> tableau.apply_gate(X(1))
+            >>> tableau.sample([1, 2], 100)
+            {2: 100}
+
+        """
+        if rng is None:
+            rng = random_generator()
+        k = len(targets)
+        weights = [1 << (k - 1 - i) for i in range(k)]
+
+        reference = self.copy()
+        offset = sum(
+            weight
+            for weight, target in zip(weights, targets)
+            if reference.measure(target)
+        )
+        generators = [
+            sum(weight for weight, bit in zip(weights, row) if bit)
+            for row in _row_echelon(self.x[self.nb_qubits :][:, targets])
+        ]
+
+        if len(generators) <= 20:
+            # all the outcomes are equally likely
+            nb_outcomes = 1 << len(generators)
+            combinations = rng.multinomial(shots, [1 / nb_outcomes] * nb_outcomes)
+            counts: dict[int, int] = {}
+            for combination in np.flatnonzero(combinations):
+                outcome = offset
+                for j, generator in enumerate(generators):
+                    if combination >> j & 1:
+                        outcome ^= generator
+                counts[outcome] = int(combinations[combination])
+            return counts
+
+        # the outcomes are stored as big-endian 64 bits words, and the
+        # generators are combined 8 by 8 through tables of their 256 XORs
+        nb_words = (k + 63) // 64
+
+        def to_words(outcome: int) -> npt.NDArray[np.uint64]:
+            return np.frombuffer(outcome.to_bytes(8 * nb_words, "big"), ">u8")
+
+        words = np.tile(to_words(offset), (shots, 1))
+        for start in range(0, len(generators), 8):
+            group = [to_words(g) for g in generators[start : start + 8]]
+            table = np.zeros((1 << len(group), nb_words), dtype=">u8")
+            for j, generator_words in enumerate(group):
+                table[1 << j : 2 << j] = table[: 1 << j] ^ generator_words
+            words ^= table[rng.integers(0, len(table), shots)]
+        outcomes, outcome_counts = np.unique(
+            words.view(np.dtype((np.void, 8 * nb_words))).reshape(-1),
+            return_counts=True,
+        )
+        return {
+            int.from_bytes(outcome.tobytes(), "big"): int(count)
+            for outcome, count in zip(outcomes, outcome_counts)
+        }
+
+
+_PAULI_MATRICES = {
+    "I": np.eye(2),
+    "X": np.array([[0, 1], [1, 0]]),
+    "Y": np.array([[0, -1j], [1j, 0]]),
+    "Z": np.diag([1, -1]),
+}
+
+
+def _atom_sign(atom: PauliStringAtom) -> float:
+    """Sign of the matrix of an atom with respect to the Pauli operator of the
+    same label, so the expectation values are the ones of
+    :meth:`PauliString.to_matrix`, as for the other simulators."""
+    return float(
+        np.real(np.trace(np.asarray(atom.matrix) @ _PAULI_MATRICES[atom.label])) / 2
+    )
+
+
+def _phase_exponents(
+    x1: npt.NDArray[np.bool_],
+    z1: npt.NDArray[np.bool_],
+    x2: npt.NDArray[np.bool_],
+    z2: npt.NDArray[np.bool_],
+) -> npt.NDArray[np.int8]:
+    """Exponents of `i` picked on each qubit when multiplying the Pauli operator
+    ``(x1, z1)`` by ``(x2, z2)`` on the left (function `g` of Aaronson and
+    Gottesman)."""
+    x, z = x2.astype(np.int8), z2.astype(np.int8)
+    return np.where(
+        x1 & z1,
+        z - x,
+        np.where(x1, z * (2 * x - 1), np.where(z1, x * (1 - 2 * z), 0)),
+    ).astype(np.int8)
+
+
+def _row_echelon(matrix: npt.NDArray[np.bool_]) -> list[npt.NDArray[np.bool_]]:
+    """Basis of the row space (over `\\mathbb{F}_2`) of a binary matrix."""
+    matrix = matrix.copy()
+    basis = []
+    row = 0
+    for column in range(matrix.shape[1]):
+        pivots = np.flatnonzero(matrix[row:, column])
+        if len(pivots) == 0:
+            continue
+        pivot = row + pivots[0]
+        matrix[[row, pivot]] = matrix[[pivot, row]]
+        others = np.flatnonzero(matrix[:, column])
+        others = others[others != row]
+        matrix[others] ^= matrix[row]
+        basis.append(matrix[row].copy())
+        row += 1
+        if row == matrix.shape[0]:
+            break
+    return basis
+
+
+@typechecked
+def simulate_stabilizer(circuit: QCircuit) -> StabilizerTableau:
+    """Computes the stabilizer tableau at the end of a Clifford circuit.
+    Measurements, barriers and breakpoints are ignored.
+
+    Args:
+        circuit: The circuit to simulate.
+
+    Returns:
+        The final tableau.
+
+    Raises:
+        ValueError: If the circuit is not a Clifford circuit (see
+            :func:`is_clifford`).
+
+    Example:
+        >>> circuit = QCircuit([H(0)] + [CNOT(i, i + 1) for i in range(499)])
+        >>> counts = simulate_stabilizer(circuit).sample([0, 250, 499], 1000000)
+        >>> sorted(counts)
+        [0, 7]
+
+    """
+    if not is_clifford(circuit):
+        raise ValueError(
+            "Only noiseless circuits made of Clifford gates "
+            f"({', '.join(gate.__name__ for gate in CLIFFORD_GATES)}) can be "
+            "simulated by the stabilizer simulation."
+        )
+    tableau = StabilizerTableau(circuit.nb_qubits)
+    for instruction in circuit.instructions:
+        if isinstance(instruction, Gate):
+            tableau.apply_gate(instruction)
+        elif not isinstance(instruction, (Barrier, Breakpoint, Measure)):
+            raise NotImplementedError(
+                f"Instruction {type(instruction).__name__} cannot be simulated."
+            )
+    return tableau
@@ -0,0 +1,761 @@
+"""Statevector simulation written directly on top of ``numpy``.
+
+The state of a register of `n` qubits is stored as a tensor of shape
+`(2,)*n`, the `i^{th}` axis corresponding to the `i^{th}` qubit (qubit 0 being
+the most significant bit, as everywhere else in ``MPQP``). A `k`-qubit gate is
+then applied by contracting its `2^k\\times 2^k` canonical matrix, reshaped to
+`(2,)*2k`, with the `k` axes it acts on only. This costs `O(2^{n+k})`
+operations instead of the `O(4^n)` of the dense matrix product, and never
+requires the matrix of the gate on the whole register."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.core.instruction.barrier import Barrier
+from mpqp.core.instruction.breakpoint import Breakpoint
+from mpqp.core.instruction.gates.controlled_gate import ControlledGate
+from mpqp.core.instruction.gates.gate import Gate
+from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
+from mpqp.core.instruction.measurement.measure import Measure
+from mpqp.core.instruction_store import CompactInstructions, iter_templates
+from mpqp.execution.simulators.sampling import Seed, random_generator
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+    from sympy import Expr
+
+    from mpqp.core.circuit import QCircuit
+
+
+@typechecked
+def gate_qubits(gate: Gate) -> list[int]:
+    """Qubits on which the canonical matrix of a gate acts, in the order of
+    the rows/columns of the said matrix.
+
+    Args:
+        gate: The gate to analyze.
+
+    Returns:
+        The list of qubits, controls first for controlled gates.
+
+    Examples:
+        >>> gate_qubits(CNOT(2, 0))
+        [2, 0]
+        >>> gate_qubits(TOF([3, 1], 0))
+        [3, 1, 0]
+        >>> gate_qubits(SWAP(1, 4))
+        [1, 4]
+
+    """
+    if isinstance(gate, ControlledGate):
+        return gate.controls + gate.targets
+    return list(gate.targets)
+
+
+@typechecked
+def gate_matrix(gate: Gate) -> npt.NDArray[np.complex128]:
+    """Numerical canonical matrix of a gate, acting on :func:`gate_qubits`.
+
+    Args:
+        gate: The gate to convert.
+
+    Returns:
+        The canonical matrix of the gate, as a complex ``numpy`` array.
+
+    Raises:
+        ValueError: If the gate still contains symbolic parameters.
+
+    Example:
+        >>> gate_matrix(X(1))
+        array([[0.+0.j, 1.+0.j],
+               [1.+0.j, 0.+0.j]])
+
+    """
+    try:
+        return np.asarray(gate.to_canonical_matrix(), dtype=np.complex128)
+    except TypeError as e:
+        raise ValueError(
+            f"Gate {gate} cannot be simulated, its parameters are still symbolic."
+            " Please substitute them first."
+        ) from e
+
+
+def apply_matrix(
+    tensor: npt.NDArray[np.complex128],
+    matrix: npt.NDArray[np.complex128],
+    axes: Sequence[int],
+) -> npt.NDArray[np.complex128]:
+    """Applies a matrix on some axes of a tensor of qubits, leaving the other
+    axes untouched.
+
+    Args:
+        tensor: Tensor where each axis of dimension 2 is a qubit. Extra axes
+            (for instance for batches, or for the second half of a density
+            matrix) are allowed, as long as they are not listed in ``axes``.
+        matrix: Matrix of size `2^k\\times 2^k` to apply.
+        axes: The `k` axes of ``tensor`` the matrix acts on, in the order of
+            the rows of ``matrix``.
+
+    Returns:
+        The tensor after the application of the matrix.
+
+    Example:
+        >>> state = np.zeros((2, 2), dtype=complex)
+        >>> state[0, 0] = 1
+        >>> apply_matrix(state, gate_matrix(X(0)), [1]).reshape(-1)
+        array([0.+0.j, 1.+0.j, 0.+0.j, 0.+0.j])
+
+    """
+    k = len(axes)
+    first = min(axes)
+    if sorted(axes) == list(range(first, first + k)):
+        # contiguous axes: a (broadcast) matrix product is enough, and avoids
+        # the transpositions of ``tensordot``
+        if list(axes) != sorted(axes):
+            order = list(np.argsort(axes))
+            matrix = (
+                matrix.reshape((2,) * (2 * k))
+                .transpose(order + [k + index for index in order])
+                .reshape(2**k, 2**k)
+            )
+        shape = tensor.shape
+        left = int(np.prod(shape[:first]))
+        result = matrix @ tensor.reshape(left, 2**k, -1)
+        return result.reshape(shape)
+    operator = matrix.reshape((2,) * (2 * k))
+    result = np.tensordot(operator, tensor, axes=(list(range(k, 2 * k)), list(axes)))
+    return np.moveaxis(result, list(range(k)), list(axes))
+
+
+def sparse_operator(
+    matrix: npt.NDArray[np.complex128], qubits: Sequence[int], nb_qubits: int
+) -> csr_matrix:
+    """Sparse matrix of an operator acting as ``matrix`` on some qubits of a
+    register, and as the identity on the other ones.
+
+    The non-zero elements are placed by index arithmetic: each non-zero
+    element of ``matrix`` gives `2^{n-k}` elements of the result, so
+    permutation and diagonal gates yield operators with `2^n` non-zero
+    elements only.
+
+    Args:
+        matrix: Matrix of size `2^k\\times 2^k` to expand.
+        qubits: The `k` qubits the matrix acts on, in the order of its rows.
+        nb_qubits: Number of qubits `n` of the register.
+
+    Returns:
+        The `2^n\\times 2^n` operator, in the CSR format.
+
+    Example:
+        >>> print(sparse_operator(gate_matrix(CNOT(1, 0)), [1, 0], 2).toarray().real)
+        [[1. 0. 0. 0.]
+         [0. 0. 0. 1.]
+         [0. 0. 1. 0.]
+         [0. 1. 0. 0.]]
+
+    """
+    from scipy.sparse import csr_matrix
+
+    k = len(qubits)
+    dimension = 2**nb_qubits
+    indices = np.arange(dimension)
+    shifts = [nb_qubits - 1 - qubit for qubit in qubits]
+    local = np.zeros(dimension, dtype=np.int64)
+    for shift in shifts:
+        local = (local << 1) | ((indices >> shift) & 1)
+    others = indices & ~sum(1 << shift for shift in shifts)
+    spread = np.zeros(2**k, dtype=np.int64)
+    for position, shift in enumerate(shifts):
+        spread |= ((np.arange(2**k) >> (k - 1 - position)) & 1) << shift
+    columns_of = [indices[local == value] for value in range(2**k)]
+
+    rows, columns, data = [], [], []
+    for row, column in zip(*np.nonzero(matrix)):
+        rows.append(others[columns_of[column]] | spread[row])
+        columns.append(columns_of[column])
+        data.append(np.full(len(columns_of[column]), matrix[row, column]))
+    if len(data) == 0:
+        return csr_matrix((dimension, dimension), dtype=np.complex128)
+    return csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(columns))),
+        shape=(dimension, dimension),
+        dtype=np.complex128,
+    )
+
+
+def apply_matrices(
+    tensor: npt.NDArray[np.complex128],
+    matrices: npt.NDArray[np.complex128],
+    axes: Sequence[int],
+) -> npt.NDArray[np.complex128]:
+    """Applies a batch of matrices on some axes of a batch of tensors of
+    qubits, the `i^{th}` matrix being applied on the `i^{th}` tensor.
+
+    Args:
+        tensor: Tensors stacked along the first axis, each of the following
+            axes of dimension 2 being a qubit.
+        matrices: Matrices of size `2^k\\times 2^k`, stacked along the first
+            axis.
+        axes: The `k` qubits the matrices act on, in the order of their rows
+            (the first axis, for the batch, is not counted).
+
+    Returns:
+        The tensors after the application of the matrices.
+
+    Example:
+        >>> states = np.zeros((2, 2), dtype=complex)
+        >>> states[:, 0] = 1
+        >>> apply_matrices(states, np.array([np.eye(2), gate_matrix(X(0))]), [0])
+        array([[1.+0.j, 0.+0.j],
+               [0.+0.j, 1.+0.j]])
+
+    """
+    k = len(axes)
+    batch_axes = [axis + 1 for axis in axes]
+    moved = np.moveaxis(tensor, batch_axes, list(range(1, k + 1)))
+    result = matrices @ moved.reshape(len(tensor), 2**k, -1)
+    return np.moveaxis(result.reshape(moved.shape), list(range(1, k + 1)), batch_axes)
+
+
+def is_symbolic(gate: Gate) -> bool:
+    """Checks if some parameters of a gate are still symbolic.
+
+    Args:
+        gate: The gate to check.
+
+    Returns:
+        ``True`` if at least one parameter of the gate depends on a variable.
+
+    Example:
+        >>> is_symbolic(Rx(symbols("θ"), 0)), is_symbolic(Rx(np.pi, 0))
+        (True, False)
+
+    """
+    from sympy import Expr
+
+    return isinstance(gate, ParametrizedGate) and any(
+        isinstance(param, Expr) and len(param.free_symbols) != 0
+        for param in gate.parameters
+    )
+
+
+@typechecked
+def gate_matrices(
+    gate: Gate, parameters: Sequence[Expr], values: npt.NDArray[np.float64]
+) -> npt.NDArray[np.complex128]:
+    """Numerical canonical matrices of a symbolic gate, for a batch of values
+    of its parameters. The symbolic matrix is compiled to a ``numpy`` function
+    once, and evaluated on the whole batch at once.
+
+    Args:
+        gate: The gate to convert.
+        parameters: The variables the gate depends on.
+        values: The values of the ``parameters``, one line per point of the
+            batch, in the order of ``parameters``.
+
+    Returns:
+        The canonical matrices of the gate, stacked along the first axis.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> gate_matrices(Rz(theta, 0), [theta], np.array([[0], [np.pi]])).round(5) + 0
+        array([[[1.+0.j, 0.+0.j],
+                [0.+0.j, 1.+0.j]],
+        <BLANKLINE>
+               [[0.-1.j, 0.+0.j],
+                [0.+0.j, 0.+1.j]]])
+
+    """
+    from sympy import lambdify
+
+    matrix = np.asarray(gate.to_canonical_matrix())
+    evaluate = lambdify(list(parameters), list(matrix.flat), "numpy")
+    entries = evaluate(*values.T)
+    batch = len(values)
+    return np.stack(
+        [
+            np.broadcast_to(np.asarray(entry, dtype=np.complex128), batch)
+            for entry in entries
+        ],
+        axis=-1,
+    ).reshape((batch,) + matrix.shape)
+
+
+def zero_state(nb_qubits: int) -> npt.NDArray[np.complex128]:
+    """Tensor of the `|0...0\\rangle` state.
+
+    Args:
+        nb_qubits: Number of qubits of the register.
+
+    Returns:
+        A tensor of shape ``(2,)*nb_qubits``.
+    """
+    state = np.zeros((2,) * nb_qubits, dtype=np.complex128)
+    state[(0,) * nb_qubits] = 1
+    return state
+
+
+@typechecked
+def simulate_state_vector(
+    circuit: QCircuit, initial_state: Optional[npt.NDArray[np.complex128]] = None
+) -> npt.NDArray[np.complex128]:
+    """Computes the state at the end of a noiseless circuit. Measurements,
+    barriers and breakpoints are ignored.
+
+    Args:
+        circuit: The circuit to simulate.
+        initial_state: The state to start from, `|0...0\\rangle` if not given.
+
+    Returns:
+        The final state vector, of size ``2**circuit.nb_qubits``.
+
+    Raises:
+        ValueError: If the circuit contains noise.
+
+    Example:
+        >>> simulate_state_vector(QCircuit([H(0), CNOT(0, 1)])).round(5)
+        array([0.70711+0.j, 0.     +0.j, 0.     +0.j, 0.70711+0.j])
+
+    """
+    if len(circuit.noises) != 0:
+        raise ValueError(
+            "Statevector simulation does not support noise, use a noisy simulator "
+            "instead."
+        )
+    nb_qubits = circuit.nb_qubits
+    if initial_state is None:
+        state = zero_state(nb_qubits)
+    else:
+        state = np.asarray(initial_state, dtype=np.complex128).reshape((2,) * nb_qubits)
+
+    # the gates of a compact circuit sharing a template share their matrix
+    # (the template is kept alongside its matrix so its id cannot be reused)
+    matrices: dict[int, tuple[Gate, npt.NDArray[np.complex128]]] = {}
+    compact = isinstance(circuit.instructions, CompactInstructions)
+    for instruction, qubits in iter_templates(circuit.instructions):
+        if isinstance(instruction, Gate):
+            if compact and id(instruction) in matrices:
+                matrix = matrices[id(instruction)][1]
+            else:
+                matrix = gate_matrix(instruction)
+                if compact:
+                    matrices[id(instruction)] = (instruction, matrix)
+            state = apply_matrix(state, matrix, qubits)
+        elif not isinstance(instruction, (Barrier, Breakpoint, Measure)):
+            raise NotImplementedError(
+                f"Instruction {type(instruction).__name__} cannot be simulated."
+            )
+
+    return state.reshape(-1)
+
+
+@typechecked
+def simulate_state_vector_batch(
+    circuit: QCircuit, parameters: Sequence[Expr], values: npt.NDArray[np.float64]
+) -> npt.NDArray[np.complex128]:
+    """Computes the states at the end of a noiseless symbolic circuit, for a
+    batch of values of its parameters. All the states are evolved at once,
+    the gates without variables being applied a single time to the whole
+    batch.
+
+    Args:
+        circuit: The circuit to simulate.
+        parameters: The variables of the circuit.
+        values: The values of the ``parameters``, one line per point of the
+            batch, in the order of ``parameters``.
+
+    Returns:
+        The final state vectors, one per line.
+
+    Raises:
+        ValueError: If the circuit contains noise.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> circuit = QCircuit([Ry(theta, 0), CNOT(0, 1)])
+        >>> simulate_state_vector_batch(circuit, [theta], np.array([[0], [np.pi]])).real.round(5)
+        array([[1., 0., 0., 0.],
+               [0., 0., 0., 1.]])
+
+    """
+    if len(circuit.noises) != 0:
+        raise ValueError(
+            "Statevector simulation does not support noise, use a noisy simulator "
+            "instead."
+        )
+    nb_qubits = circuit.nb_qubits
+    states = np.zeros((len(values),) + (2,) * nb_qubits, dtype=np.complex128)
+    states[(slice(None),) + (0,) * nb_qubits] = 1
+
+    for instruction in circuit.instructions:
+        if isinstance(instruction, Gate):
+            qubits = gate_qubits(instruction)
+            if is_symbolic(instruction):
+                states = apply_matrices(
+                    states, gate_matrices(instruction, parameters, values), qubits
+                )
+            else:
+                states = apply_matrix(
+                    states,
+                    gate_matrix(instruction),
+                    [qubit + 1 for qubit in qubits],
+                )
+        elif not isinstance(instruction, (Barrier, Breakpoint, Measure)):
+            raise NotImplementedError(
+                f"Instruction {type(instruction).__name__} cannot be simulated."
+            )
+
+    return states.reshape(len(values), -1)
+
+
+@typechecked
+def marginal_probabilities(
+    probabilities: npt.NDArray[np.float64], targets: list[int]
+) -> npt.NDArray[np.float64]:
+    """Probabilities of the outcomes of the measure of some of the qubits
+    only, the first target being the most significant bit.
+
+    Args:
+        probabilities: Probabilities of each basis state of the full register,
+            along the last axis (the other axes being batch axes).
+        targets: Qubits measured.
+
+    Returns:
+        The probabilities of the ``2**len(targets)`` possible outcomes.
+
+    Example:
+        >>> marginal_probabilities(np.array([0.1, 0.2, 0.3, 0.4]), [1])
+        array([0.4, 0.6])
+
+    """
+    nb_qubits = int(np.log2(probabilities.shape[-1]))
+    if targets == list(range(nb_qubits)):
+        return probabilities
+    batch = probabilities.shape[:-1]
+    tensor = probabilities.reshape(batch + (2,) * nb_qubits)
+    others = tuple(len(batch) + q for q in range(nb_qubits) if q not in targets)
+    marginal = tensor.sum(axis=others)
+    kept = sorted(targets)
+    marginal = np.transpose(
+        marginal,
+        list(range(len(batch))) + [len(batch) + kept.index(t) for t in targets],
+    )
+    return marginal.reshape(batch + (-1,))
+
+
+@typechecked
+def sample_counts(
+    probabilities: npt.NDArray[np.float64], shots: int, seed: Seed = None
+) -> npt.NDArray[np.int64]:
+    """Draws ``shots`` outcomes from a probability distribution. For a single
+    distribution, :class:`~mpqp.execution.simulators.sampling.Sampler` offers
+    more options.
+
+    Args:
+        probabilities: The probability of each outcome, along the last axis
+            (the other axes being batch axes).
+        shots: Number of draws.
+        seed: Seed of the random generator, or the generator itself. If
+            ``None``, :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+            is used.
+
+    Returns:
+        The number of times each outcome was drawn.
+    """
+    rng = random_generator(seed)
+    probabilities = np.clip(probabilities, 0, None)
+    return rng.multinomial(
+        shots, probabilities / probabilities.sum(axis=-1, keepdims=True)
+    )
+
+
+@typechecked
+def expectation_from_state(
+    state: npt.NDArray[np.complex128],
+    observable: npt.NDArray[np.complex64] | npt.NDArray[np.complex128],
+    shots: int = 0,
+    seed: Seed = None,
+) -> tuple[float, float]:
+    """Expectation value of an observable spanning the whole register.
+
+    When ``shots`` is not zero, the value is estimated by sampling the
+    eigenbasis of the observable, in order to mimic shot noise.
+
+    Args:
+        state: The state vector.
+        observable: Hermitian matrix of the observable.
+        shots: Number of shots, ``0`` for the exact value.
+        seed: Seed of the random generator, or the generator itself. If
+            ``None``, :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+            is used.
+
+    Returns:
+        The expectation value and its standard error.
+
+    Example:
+        >>> z = np.diag([1, -1]).astype(complex)
+        >>> expectation_from_state(np.array([0, 1], dtype=complex), z)
+        (-1.0, 0.0)
+
+    """
+    if shots == 0:
+        return float(np.real(np.vdot(state, observable @ state))), 0.0
+
+    eigen_values, eigen_vectors = np.linalg.eigh(observable)
+    probabilities = np.square(np.abs(eigen_vectors.conj().T @ state))
+    return sampled_expectation(eigen_values, probabilities, shots, seed)
+
+
+@typechecked
+def expectations_from_states(
+    states: npt.NDArray[np.complex128],
+    observable: npt.NDArray[np.complex64] | npt.NDArray[np.complex128],
+    shots: int = 0,
+    seed: Seed = None,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Expectation values of an observable spanning the whole register, for a
+    batch of states (see :func:`expectation_from_state`).
+
+    Args:
+        states: The state vectors, one per line.
+        observable: Hermitian matrix of the observable.
+        shots: Number of shots, ``0`` for the exact values.
+        seed: Seed of the random generator, or the generator itself. If
+            ``None``, :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+            is used.
+
+    Returns:
+        The expectation values and their standard errors.
+
+    Example:
+        >>> z = np.diag([1, -1]).astype(complex)
+        >>> expectations_from_states(np.eye(2, dtype=complex), z)
+        (array([ 1., -1.]), array([0., 0.]))
+
+    """
+    if shots == 0:
+        values = np.einsum("bi,ij,bj->b", states.conj(), observable, states).real
+        return values, np.zeros(len(states))
+
+    eigen_values, eigen_vectors = np.linalg.eigh(observable)
+    counts = sample_counts(
+        np.square(np.abs(states @ eigen_vectors.conj())), shots, seed
+    )
+    means = counts @ eigen_values / shots
+    variances = (counts * (eigen_values - means[:, np.newaxis]) ** 2).sum(-1) / shots
+    return means, np.sqrt(variances / shots)
+
+
+@typechecked
+def sampled_expectation(
+    eigen_values: npt.NDArray[np.float64],
+    probabilities: npt.NDArray[np.float64],
+    shots: int,
+    seed: Seed = None,
+) -> tuple[float, float]:
+    """Estimates an expectation value from ``shots`` measurements in the
+    eigenbasis of the observable.
+
+    Args:
+        eigen_values: The eigenvalues of the observable.
+        probabilities: The probability to measure each of the eigenvectors.
+        shots: Number of measurements.
+        seed: Seed of the random generator, or the generator itself. If
+            ``None``, :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+            is used.
+
+    Returns:
+        The estimated expectation value and its standard error.
+    """
+    counts = sample_counts(probabilities, shots, seed)
+    mean = float(counts @ eigen_values) / shots
+    variance = float(counts @ (eigen_values - mean) ** 2) / shots
+    return mean, float(np.sqrt(variance / shots))
+
+
+@typechecked
+def sampled_pauli_expectation(
+    coefficients: list[float],
+    expectations: list[float],
+    shots: int,
+    seed: Seed = None,
+) -> tuple[float, float]:
+    """Estimates the expectation value of a Pauli string from the exact
+    expectation values of its monomials, each monomial being measured
+    ``shots`` times (as done on hardware).
+
+    Args:
+        coefficients: The coefficients of the monomials.
+        expectations: The exact expectation values of the monomials (without
+            their coefficients), in `[-1, 1]`.
+        shots: Number of measurements of each monomial, ``0`` for the exact
+            value.
+        seed: Seed of the random generator, or the generator itself. If
+            ``None``, :attr:`~mpqp.execution.simulators.sampling.SamplingConfig.seed`
+            is used.
+
+    Returns:
+        The estimated expectation value and its standard error.
+
+    Example:
+        >>> sampled_pauli_expectation([2.0, -1.0], [1.0, -1.0], 0)
+        (3.0, 0.0)
+
+    """
+    coefs = np.array(coefficients, dtype=float)
+    values = np.clip(np.array(expectations, dtype=float), -1, 1)
+    if shots == 0:
+        return float(coefs @ values), 0.0
+    rng = random_generator(seed)
+    estimates = 2 * rng.binomial(shots, (1 + values) / 2) / shots - 1
+    variances = (1 - estimates**2) / shots
+    return float(coefs @ estimates), float(np.sqrt(coefs**2 @ variances))
+
+
+_BLOCK_ELEMENTS = 2**19
+"""Default number of elements of the blocks of columns in
+:func:`circuit_unitary`."""
+
+
+def _unitary_operations(
+    circuit: QCircuit,
+) -> list[tuple[npt.NDArray[np.complex128], list[int]]]:
+    """Matrices of the gates of a circuit, with the qubits they act on."""
+    operations = []
+    for instruction in circuit.instructions:
+        if isinstance(instruction, Gate):
+            operations.append((gate_matrix(instruction), gate_qubits(instruction)))
+        elif isinstance(instruction, Measure):
+            raise ValueError(
+                "Measurements are not unitary, remove them from the circuit "
+                "(see `QCircuit.without_measurements`) to compute its matrix."
+            )
+        elif not isinstance(instruction, (Barrier, Breakpoint)):
+            raise NotImplementedError(
+                f"Instruction {type(instruction).__name__} has no matrix."
+            )
+    return operations
+
+
+@typechecked
+def unitary_column_blocks(
+    circuit: QCircuit, block_size: int
+) -> Iterator[tuple[int, npt.NDArray[np.complex128]]]:
+    """Computes the unitary matrix of a circuit by blocks of columns.
+
+    Each block of columns is obtained by simulating the circuit starting from
+    the corresponding columns of the identity, so only the memory for the
+    current block is needed. Noise models are ignored.
+
+    Args:
+        circuit: The circuit of which the matrix is computed.
+        block_size: Number of columns of each block (the last one can be
+            smaller).
+
+    Yields:
+        The index of the first column of the block, and the block itself, of
+        shape ``(2**circuit.nb_qubits, block_size)``.
+
+    Raises:
+        ValueError: If the circuit contains measurements or symbolic
+            parameters, or if ``block_size`` is not positive.
+
+    Example:
+        >>> for start, block in unitary_column_blocks(QCircuit([X(0), CNOT(0, 1)]), 2):
+        ...     print(start, block.real.tolist())
+        0 [[0.0, 0.0], [0.0, 0.0], [0.0, 1.0], [1.0, 0.0]]
+        2 [[1.0, 0.0], [0.0, 1.0], [0.0, 0.0], [0.0, 0.0]]
+
+    """
+    if block_size <= 0:
+        raise ValueError(f"The block size must be positive, got {block_size}.")
+    operations = _unitary_operations(circuit)
+    nb_qubits = circuit.nb_qubits
+    dimension = 2**nb_qubits
+    for start in range(0, dimension, block_size):
+        size = min(block_size, dimension - start)
+        block = np.zeros((dimension, size), dtype=np.complex128)
+        block[start + np.arange(size), np.arange(size)] = 1
+        tensor = block.reshape((2,) * nb_qubits + (size,))
+        for matrix, qubits in operations:
+            tensor = apply_matrix(tensor, matrix, qubits)
+        yield start, tensor.reshape(dimension, size)
+
+
+@typechecked
+def circuit_unitary(
+    circuit: QCircuit, block_size: Optional[int] = None
+) -> npt.NDArray[np.complex128]:
+    """Computes the unitary matrix of a circuit, without relying on any SDK.
+    Barriers and breakpoints are ignored, as well as the noise models.
+
+    Args:
+        circuit: The circuit of which the matrix is computed.
+        block_size: If given, the matrix is computed by blocks of this number
+            of columns (see :func:`unitary_column_blocks`), directly in the
+            output array. The memory needed on top of the output is then
+            proportional to the block size instead of the size of the matrix.
+            By default, blocks of `2^{19}` elements are used.
+
+    Returns:
+        The unitary matrix of the circuit.
+
+    Raises:
+        ValueError: If the circuit contains measurements or symbolic
+            parameters.
+
+    Example:
+        >>> circuit_unitary(QCircuit([H(0), CNOT(0, 1)])).real.round(5)
+        array([[ 0.70711,  0.     ,  0.70711,  0.     ],
+               [ 0.     ,  0.70711,  0.     ,  0.70711],
+               [ 0.     ,  0.70711,  0.     , -0.70711],
+               [ 0.70711,  0.     , -0.70711,  0.     ]])
+
+    """
+    dimension = 2**circuit.nb_qubits
+    if block_size is None:
+        # blocks of about 8MB stay in the CPU caches
+        block_size = max(1, _BLOCK_ELEMENTS // dimension)
+    if block_size >= dimension:
+        return next(unitary_column_blocks(circuit, dimension))[1]
+    unitary = np.empty((dimension, dimension), dtype=np.complex128)
+    for start, block in unitary_column_blocks(circuit, block_size):
+        unitary[:, start : start + block.shape[1]] = block
+    return unitary
+
+
+@typechecked
+def sparse_circuit_unitary(circuit: QCircuit) -> csr_matrix:
+    """Computes the unitary matrix of a circuit as a ``scipy`` sparse matrix,
+    from the product of the sparse operators of the gates (see
+    :func:`sparse_operator`). This is efficient for circuits mostly made of
+    permutation and diagonal gates. Barriers and breakpoints are ignored, as
+    well as the noise models.
+
+    Args:
+        circuit: The circuit of which the matrix is computed.
+
+    Returns:
+        The unitary matrix of the circuit, in the CSR format.
+
+    Raises:
+        ValueError: If the circuit contains measurements or symbolic
+            parameters.
+
+    Example:
+        >>> sparse_circuit_unitary(QCircuit([X(0), CNOT(0, 2), SWAP(1, 2)])).nnz
+        8
+
+    """
+    from scipy.sparse import csr_matrix, identity
+
+    nb_qubits = circuit.nb_qubits
+    unitary = csr_matrix(identity(2**nb_qubits, dtype="complex128"))
+    for matrix, qubits in _unitary_operations(circuit):
+        unitary = sparse_operator(matrix, qubits, nb_qubits) @ unitary
+    return unitary
@@ -0,0 +1,476 @@
+"""Monte-Carlo (quantum trajectories) simulation of noisy circuits.
+
+Instead of evolving a density matrix, which requires `4^n` amplitudes, each
+*trajectory* evolves a state vector of `2^n` amplitudes. After each gate, for
+each noise site (see :mod:`mpqp.execution.simulators.noise`), a single Kraus
+operator `K_j` is drawn with probability `\\|K_j|\\psi\\rangle\\|^2` and the
+state is replaced by `K_j|\\psi\\rangle`, renormalized. Averaging the results
+of the trajectories converges towards the results of the density matrix
+simulation.
+
+The trajectories are independent, so they can be split in chunks executed in a
+pool of processes (see :attr:`TrajectoryConfig.max_workers`), which is kept for
+the next simulations. Small simulations are run in the current process, where
+spawning the processes would cost more than it saves. Each trajectory has its
+own seed, derived from :attr:`TrajectoryConfig.seed`, so the results do not
+depend on the number of processes used.
+
+The error reported for a run is the standard error of the estimated quantity
+over the trajectories (the largest one amongst the outcomes for a ``SAMPLE``
+job), it gives an estimate of the convergence of the simulation: increase
+:attr:`TrajectoryConfig.nb_trajectories` to decrease it. When a single
+trajectory is simulated (for a noiseless circuit), the error only comes from
+the finite number of shots, and is the standard error of the sampling."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
+
+import numpy as np
+import numpy.typing as npt
+from typeguard import typechecked
+
+from mpqp.execution.simulators.noise import Operation, noisy_operations
+from mpqp.execution.simulators.statevector import (
+    apply_matrix,
+    marginal_probabilities,
+    sampled_expectation,
+    zero_state,
+)
+
+if TYPE_CHECKING:
+    from mpqp.core.circuit import QCircuit
+
+Channel = tuple[
+    list[npt.NDArray[np.complex128]], list[int], Optional[npt.NDArray[np.float64]]
+]
+"""Operation ready to be sampled: its Kraus operators, the qubits they act on,
+and the probability of each operator when those do not depend on the state
+(``None`` otherwise)."""
+
+
+@dataclass
+class TrajectoryConfig:
+    """Settings of the trajectory simulation, used by
+    :attr:`~mpqp.execution.devices.MPQPDevice.TRAJECTORY_SIMULATOR` through
+    :data:`trajectory_config`.
+
+    Example:
+        >>> trajectory_config.nb_trajectories = 500  # doctest: +SKIP
+
+    """
+
+    nb_trajectories: int = 100
+    """Number of trajectories to simulate. When the circuit is not noisy, a
+    single trajectory is simulated. For sampling jobs, it is capped by the
+    number of shots, since each trajectory gives at least one shot."""
+    max_workers: Optional[int] = None
+    """Number of processes used to run the trajectories. If ``None`` or ``1``,
+    the trajectories are run one after the other in the current process."""
+    seed: Optional[int] = None
+    """Seed used to derive the seed of each trajectory, for reproducibility."""
+    parallel_threshold: int = 2**20
+    """Minimum number of amplitudes simulated (the number of trajectories times
+    ``2**nb_qubits``) for the trajectories to be run in several processes, the
+    smaller simulations being run in the current process."""
+
+
+trajectory_config = TrajectoryConfig()
+"""Settings used by the trajectory simulator, modify its attributes to tune the
+simulation."""
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_size = 0
+_pool_users: dict[ProcessPoolExecutor, int] = {}
+"""Number of simulations using each pool, the pools replaced being shut down
+once they are no longer used."""
+_pool_lock = threading.Lock()
+
+
+def prepare_channels(operations: list[Operation]) -> list[Channel]:
+    """Precomputes the probabilities of the operations which are mixtures of
+    unitaries (such as gates, :class:`~mpqp.noise.noise_model.Depolarizing`
+    or :class:`~mpqp.noise.noise_model.BitFlip`). Since these probabilities do
+    not depend on the state, drawing a branch of those does not require to
+    apply all the operators. The operators are rescaled to unitaries.
+
+    Args:
+        operations: The operations of the circuit.
+
+    Returns:
+        The channels corresponding to the operations.
+
+    Example:
+        >>> _, _, probabilities = prepare_channels(
+        ...     noisy_operations(QCircuit([BitFlip(0.1, [0])], nb_qubits=1))
+        ... )[0]
+        >>> probabilities.round(5)
+        array([0.9, 0.1])
+
+    """
+    channels: list[Channel] = []
+    for kraus_operators, qubits in operations:
+        weights = []
+        for k in kraus_operators:
+            product = k.conj().T @ k
+            weight = product[0, 0].real
+            if not np.allclose(product, weight * np.eye(len(k))):
+                channels.append((kraus_operators, qubits, None))
+                break
+            weights.append(weight)
+        else:
+            probabilities = np.array(weights) / sum(weights)
+            unitaries = [k / np.sqrt(w) for k, w in zip(kraus_operators, weights)]
+            channels.append((unitaries, qubits, probabilities))
+    return channels
+
+
+def sample_trajectory(
+    channels: list[Channel], nb_qubits: int, rng: np.random.Generator
+) -> npt.NDArray[np.complex128]:
+    """Simulates a single trajectory of a noisy circuit.
+
+    Args:
+        channels: The channels of the circuit, see :func:`prepare_channels`.
+        nb_qubits: Number of qubits of the circuit.
+        rng: Random generator used to draw the Kraus operators.
+
+    Returns:
+        The final (normalized) state of the trajectory, of size
+        ``2**nb_qubits``.
+
+    Example:
+        >>> circuit = QCircuit([X(0), BitFlip(0.5)], nb_qubits=1)
+        >>> channels = prepare_channels(noisy_operations(circuit))
+        >>> state = sample_trajectory(channels, 1, np.random.default_rng(1))
+        >>> bool(np.isclose(np.linalg.norm(state), 1))
+        True
+
+    """
+    state = zero_state(nb_qubits)
+    for operators, qubits, probabilities in channels:
+        if len(operators) == 1:
+            state = apply_matrix(state, operators[0], qubits)
+        elif probabilities is not None:
+            branch = rng.choice(len(operators), p=probabilities)
+            state = apply_matrix(state, operators[branch], qubits)
+        else:
+            state = _draw_kraus_branch(state, operators, qubits, rng.random())
+    return state.reshape(-1)
+
+
+def _draw_kraus_branch(
+    state: npt.NDArray[np.complex128],
+    operators: list[npt.NDArray[np.complex128]],
+    qubits: list[int],
+    threshold: float,
+) -> npt.NDArray[np.complex128]:
+    """Applies the Kraus operator selected by ``threshold``, the branches being
+    evaluated one at a time until their cumulated probability reaches it."""
+    cumulated = 0
+    candidate, norm = state, 1.0
+    for k in operators:
+        branch = apply_matrix(state, k, qubits)
+        branch_norm = float(np.vdot(branch, branch).real)
+        if branch_norm > 0:
+            candidate, norm = branch, branch_norm
+        cumulated += branch_norm
+        if threshold < cumulated:
+            break
+    return candidate / np.sqrt(norm)
+
+
+def _split_shots(shots: int, nb_trajectories: int) -> list[int]:
+    shares = [shots // nb_trajectories] * nb_trajectories
+    for i in range(shots % nb_trajectories):
+        shares[i] += 1
+    return shares
+
+
+def _sample_chunk(
+    channels: list[Channel],
+    nb_qubits: int,
+    targets: list[int],
+    shots: list[int],
+    seeds: list[np.random.SeedSequence],
+) -> list[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]]:
+    """Samples ``shots[i]`` outcomes from the ``i``-th trajectory, the
+    outcomes of each trajectory being returned as the indices drawn and their
+    counts."""
+    outcomes = []
+    for trajectory_shots, seed in zip(shots, seeds):
+        rng = np.random.default_rng(seed)
+        state = sample_trajectory(channels, nb_qubits, rng)
+        probabilities = marginal_probabilities(np.square(np.abs(state)), targets)
+        counts = rng.multinomial(trajectory_shots, probabilities / probabilities.sum())
+        indices = np.flatnonzero(counts)
+        outcomes.append((indices, counts[indices]))
+    return outcomes
+
+
+def _expectation_chunk(
+    channels: list[Channel],
+    nb_qubits: int,
+    observables: list[npt.NDArray[np.complex128]],
+    shots: list[int],
+    seeds: list[np.random.SeedSequence],
+) -> list[list[tuple[float, float]]]:
+    """Estimates the expectation values of the observables for each
+    trajectory, using ``shots[i]`` shots for the ``i``-th trajectory (exact
+    values if it is ``0``), together with the standard error of the sampling
+    (``0`` for the exact values)."""
+    eigen_decompositions = (
+        [np.linalg.eigh(observable) for observable in observables] if any(shots) else []
+    )
+    estimates: list[list[tuple[float, float]]] = []
+    for trajectory_shots, seed in zip(shots, seeds):
+        rng = np.random.default_rng(seed)
+        state = sample_trajectory(channels, nb_qubits, rng)
+        if trajectory_shots == 0:
+            values = [(float(np.vdot(state, o @ state).real), 0.0) for o in observables]
+        else:
+            values = [
+                sampled_expectation(
+                    eigen_values,
+                    np.square(np.abs(eigen_vectors.conj().T @ state)),
+                    trajectory_shots,
+                    rng,
+                )
+                for eigen_values, eigen_vectors in eigen_decompositions
+            ]
+        estimates.append(values)
+    return estimates
+
+
+def _run_chunks(
+    worker: Callable[..., list[Any]],
+    circuit: QCircuit,
+    measure_data: Any,
+    shots: list[int],
+    config: TrajectoryConfig,
+) -> list[Any]:
+    """Runs the trajectories (one per element of ``shots``) in chunks, in
+    parallel if the configuration allows it, and concatenates the outputs of
+    ``worker`` in the order of the trajectories."""
+    channels = prepare_channels(noisy_operations(circuit))
+    seeds = np.random.SeedSequence(config.seed).spawn(len(shots))
+    nb_chunks = min(config.max_workers or 1, len(shots))
+    if nb_chunks <= 1 or len(shots) * 2**circuit.nb_qubits < config.parallel_threshold:
+        return worker(channels, circuit.nb_qubits, measure_data, shots, seeds)
+
+    bounds = np.linspace(0, len(shots), nb_chunks + 1).astype(int)
+    with _process_pool(nb_chunks) as executor:
+        futures = [
+            executor.submit(
+                worker,
+                channels,
+                circuit.nb_qubits,
+                measure_data,
+                shots[start:stop],
+                seeds[start:stop],
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        return [output for future in futures for output in future.result()]
+
+
+@contextmanager
+def _process_pool(nb_workers: int) -> Generator[ProcessPoolExecutor, None, None]:
+    """Pool of processes running the trajectories. It is created on first use
+    and reused by the next simulations, a larger one replacing it when more
+    workers are needed. A pool replaced, or broken, is shut down when the last
+    simulation using it is over."""
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is None or _pool_size < nb_workers:
+            _replace_pool(
+                # forking a process while the simulators hold locks in other
+                # threads can deadlock the child process, so it is spawned
+                ProcessPoolExecutor(nb_workers, get_context("spawn")),
+                nb_workers,
+            )
+        executor = _pool
+        assert executor is not None
+        _pool_users[executor] += 1
+    try:
+        yield executor
+    except BrokenProcessPool:
+        with _pool_lock:
+            if _pool is executor:
+                _replace_pool(None, 0)
+        raise
+    finally:
+        with _pool_lock:
+            _pool_users[executor] -= 1
+        _shutdown_unused_pools()
+
+
+def _replace_pool(executor: Optional[ProcessPoolExecutor], size: int):
+    """Sets the pool used by the next simulations (the lock must be held)."""
+    global _pool, _pool_size
+    _pool, _pool_size = executor, size
+    if executor is not None:
+        _pool_users[executor] = 0
+
+
+def _shutdown_unused_pools():
+    with _pool_lock:
+        unused = [
+            executor
+            for executor, users in _pool_users.items()
+            if users == 0 and executor is not _pool
+        ]
+        for executor in unused:
+            del _pool_users[executor]
+    for executor in unused:
+        executor.shutdown(cancel_futures=True)
+
+
+@atexit.register
+def _shutdown_pools():
+    with _pool_lock:
+        _replace_pool(None, 0)
+    _shutdown_unused_pools()
+
+
+def _nb_trajectories(circuit: QCircuit, config: TrajectoryConfig) -> int:
+    if any(len(kraus) > 1 for kraus, _ in noisy_operations(circuit)):
+        return max(1, config.nb_trajectories)
+    return 1
+
+
+def _standard_errors(
+    estimates: npt.NDArray[np.float64], weights: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Standard errors of the weighted means of the columns of ``estimates``,
+    each row (trajectory) being weighted by the corresponding element of
+    ``weights``. For equal weights, it is the usual standard error of the
+    mean."""
+    total = weights.sum()
+    means = weights @ estimates / total
+    # unbiased weighted variance, the weights being frequencies of the shots
+    correction = total - np.square(weights).sum() / total
+    variances = weights @ np.square(estimates - means) / correction
+    return np.sqrt(variances * np.square(weights / total).sum())
+
+
+@typechecked
+def sample_trajectories(
+    circuit: QCircuit,
+    targets: list[int],
+    shots: int,
+    config: Optional[TrajectoryConfig] = None,
+) -> tuple[dict[int, int], float]:
+    """Samples the measure of some qubits at the end of a noisy circuit, the
+    shots being split between the trajectories.
+
+    Args:
+        circuit: The circuit to simulate, measurements are ignored.
+        targets: The qubits measured, the first one being the most significant
+            bit of the outcomes.
+        shots: Total number of shots.
+        config: Settings of the simulation, :data:`trajectory_config` if not
+            given.
+
+    Returns:
+        The number of occurrences of each outcome observed, and the largest
+        standard error of the estimated probabilities over the trajectories
+        (or of the sampling, when a single trajectory is simulated).
+
+    Example:
+        >>> counts, error = sample_trajectories(
+        ...     QCircuit([X(0), BitFlip(0.2)], nb_qubits=1),
+        ...     [0],
+        ...     1000,
+        ...     TrajectoryConfig(nb_trajectories=50, max_workers=1, seed=12),
+        ... )
+        >>> sorted(counts), sum(counts.values())
+        ([0, 1], 1000)
+
+    """
+    if config is None:
+        config = trajectory_config
+    nb_trajectories = min(_nb_trajectories(circuit, config), shots)
+    shares = _split_shots(shots, nb_trajectories)
+    outcomes = _run_chunks(_sample_chunk, circuit, targets, shares, config)
+
+    counts: dict[int, int] = {}
+    for indices, trajectory_counts in outcomes:
+        for index, count in zip(indices.tolist(), trajectory_counts.tolist()):
+            counts[index] = counts.get(index, 0) + count
+    if nb_trajectories < 2:
+        frequencies = np.array(list(counts.values())) / shots
+        errors = np.sqrt(frequencies * (1 - frequencies) / shots)
+        return counts, float(errors.max(initial=0))
+
+    # frequency of each observed outcome in each trajectory
+    columns = {index: i for i, index in enumerate(counts)}
+    frequencies = np.zeros((nb_trajectories, len(columns)))
+    for t, ((indices, trajectory_counts), share) in enumerate(zip(outcomes, shares)):
+        for index, count in zip(indices.tolist(), trajectory_counts.tolist()):
+            frequencies[t, columns[index]] = count / share
+    errors = _standard_errors(frequencies, np.array(shares))
+    return counts, float(errors.max())
+
+
+@typechecked
+def trajectory_expectations(
+    circuit: QCircuit,
+    observables: list[npt.NDArray[np.complex64] | npt.NDArray[np.complex128]],
+    shots: int = 0,
+    config: Optional[TrajectoryConfig] = None,
+) -> list[tuple[float, float]]:
+    """Estimates expectation values at the end of a noisy circuit.
+
+    Args:
+        circuit: The circuit to simulate, measurements are ignored.
+        observables: Hermitian matrices of the observables, spanning the whole
+            register.
+        shots: Total number of shots, split between the trajectories. If
+            ``0``, the exact expectation value of each trajectory is used.
+        config: Settings of the simulation, :data:`trajectory_config` if not
+            given.
+
+    Returns:
+        For each observable, the estimated expectation value and its standard
+        error over the trajectories (or of the sampling, when a single
+        trajectory is simulated).
+
+    Example:
+        >>> z = np.diag([1, -1]).astype(complex)
+        >>> trajectory_expectations(
+        ...     QCircuit([X(0), BitFlip(0.2, gates=[H])], nb_qubits=1),
+        ...     [z],
+        ...     config=TrajectoryConfig(max_workers=1),
+        ... )
+        [(-1.0, 0.0)]
+
+    """
+    if config is None:
+        config = trajectory_config
+    nb_trajectories = _nb_trajectories(circuit, config)
+    if shots != 0:
+        nb_trajectories = min(nb_trajectories, shots)
+    shares = _split_shots(shots, nb_trajectories)
+    matrices = [np.asarray(o, dtype=np.complex128) for o in observables]
+    outputs = np.array(
+        _run_chunks(_expectation_chunk, circuit, matrices, shares, config)
+    )
+    # the standard error of the sampling of each trajectory is already
+    # accounted for in the spread of the estimates of the trajectories
+    estimates, sampling_errors = outputs[..., 0], outputs[..., 1]
+
+    weights = np.array(shares) if shots != 0 else np.ones(nb_trajectories)
+    values = weights @ estimates / weights.sum()
+    if nb_trajectories < 2:
+        errors = sampling_errors[0]
+    else:
+        errors = _standard_errors(estimates, weights)
+    return [(float(v), float(e)) for v, e in zip(values, errors)]
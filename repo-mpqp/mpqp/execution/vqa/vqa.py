@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Collection, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
 from mpqp.core.circuit import QCircuit
 from mpqp.core.instruction import ExpectationMeasure
+from mpqp.core.parametric import ParametricCircuit
 from mpqp.execution.devices import AvailableDevice
 from mpqp.execution.runner import _run_single  # pyright: ignore[reportPrivateUsage]
 from mpqp.execution.vqa.optimizer import Optimizer
@@ -14,8 +15,6 @@ from scipy.optimize import minimize as scipy_minimize
 from sympy import Basic
 from typeguard import typechecked
 
-T1 = TypeVar("T1")
-T2 = TypeVar("T2")
 OptimizerInput = Union[list[float], npt.NDArray[np.float32]]
 OptimizableFunc = Callable[[OptimizerInput], float]
 OptimizerOptions = dict[str, Any]
@@ -35,15 +34,6 @@ OptimizerCallback = Union[
 # TODO: test the minimizer options
 
 
-def _maps(l1: Collection[T1], l2: Collection[T2]) -> dict[T1, T2]:
-    """Does like zip, but with a dictionary instead of a list of tuples"""
-    if len(l1) != len(l2):
-        ValueError(
-            f"Length of the two collections are not equal ({len(l1)} and {len(l2)})."
-        )
-    return {e1: e2 for e1, e2 in zip(l1, l2)}
-
-
 @typechecked
 def minimize(
     optimizable: QCircuit | OptimizableFunc,
@@ -292,14 +282,11 @@ def _minimize_local_circ(
                 f"Expected only one observable in the ExpectationMeasure but got {len(circ.measurements[0].observables)}"
             )
 
+    # the circuit is compiled once, each evaluation only binds the parameters
+    template = ParametricCircuit(circ, list(variables))  # pyright: ignore
+
     def eval_circ(params: OptimizerInput):
-        # pyright is bad with abstract numeric types:
-        # "float" is incompatible with "Complex"
-        result = _run_single(
-            circ,
-            device,
-            _maps(variables, params),  # pyright: ignore[reportArgumentType]
-        )
+        result = _run_single(template.bind(params), device, {})
         if TYPE_CHECKING:
             assert isinstance(result.expectation_values, float)
         return result.expectation_values
@@ -340,11 +340,55 @@ class Depolarizing(DimensionalNoiseModel):
             )
 
     def to_kraus_operators(self) -> list[npt.NDArray[np.complex64]]:
+        """See the documentation for this method in the abstract mother class
+        :class:`NoiseModel`.
+
+        When the dimension `d` of the noise is greater than 1, the operators
+        returned act on `d` qubits.
+
+        Examples:
+            >>> len(Depolarizing(0.1).to_kraus_operators())
+            4
+            >>> len(Depolarizing(0.1, [0, 1], dimension=2).to_kraus_operators())
+            16
+
+        """
+        if self.dimension == 1:
+            return [
+                np.sqrt(1 - 3 * self.prob / 4) * I.matrix,
+                np.sqrt(self.prob / 4) * X.matrix,
+                np.sqrt(self.prob / 4) * Y.matrix,
+                np.sqrt(self.prob / 4) * Z.matrix,
+            ]
+        nb_paulis = 4**self.dimension
+        paulis = [
+            reduce(np.kron, ops)
+            for ops in product(
+                [I.matrix, X.matrix, Y.matrix, Z.matrix], repeat=self.dimension
+            )
+        ]
+        return [
+            np.sqrt(max(0, 1 - (nb_paulis - 1) * self.prob / nb_paulis)) * paulis[0]
+        ] + [np.sqrt(self.prob / nb_paulis) * pauli for pauli in paulis[1:]]
+
+    def to_adjusted_kraus_operators(
+        self, targets: set[int], size: int
+    ) -> list[npt.NDArray[np.complex64]]:
+        if self.dimension == 1:
+            return super().to_adjusted_kraus_operators(targets, size)
+        if len(targets) != self.dimension:
+            raise ValueError(
+                f"A depolarizing noise of dimension {self.dimension} cannot be "
+                f"applied on {len(targets)} qubits."
+            )
+        from mpqp.execution.simulators.statevector import apply_matrix
+
+        identity = np.eye(2**size, dtype=np.complex128).reshape((2,) * (2 * size))
         return [
-            np.sqrt(1 - 3 * self.prob / 4) * I.matrix,
-            np.sqrt(self.prob / 4) * X.matrix,
-            np.sqrt(self.prob / 4) * Y.matrix,
-            np.sqrt(self.prob / 4) * Z.matrix,
+            apply_matrix(identity, k.astype(np.complex128), sorted(targets))
+            .reshape(2**size, 2**size)
+            .astype(np.complex64)
+            for k in self.to_kraus_operators()
         ]
 
     def __repr__(self):
@@ -644,10 +688,35 @@ class AmplitudeDamping(NoiseModel):
         """See parameter description."""
 
     def to_kraus_operators(self) -> list[npt.NDArray[np.complex64]]:
-        return [
-            np.diag(1, np.sqrt(1 - self.prob)),
-            np.array([[0, np.sqrt(self.prob)], [0, 0]]),
+        """See the documentation for this method in the abstract mother class
+        :class:`NoiseModel`.
+
+        For the standard amplitude damping (``prob=1``), only `E_0` and `E_1`
+        are returned, since `E_2` and `E_3` are null.
+
+        Example:
+            >>> for k in AmplitudeDamping(0.36).to_kraus_operators():
+            ...     print(k.real)
+            [[1.  0. ]
+             [0.  0.8]]
+            [[0.  0.6]
+             [0.  0. ]]
+
+        """
+        decay = np.sqrt(1 - self.gamma)
+        jump = np.sqrt(self.gamma)
+        kraus = [
+            np.sqrt(self.prob) * np.array([[1, 0], [0, decay]], dtype=np.complex64),
+            np.sqrt(self.prob) * np.array([[0, jump], [0, 0]], dtype=np.complex64),
         ]
+        if self.prob != 1:
+            kraus += [
+                np.sqrt(1 - self.prob)
+                * np.array([[decay, 0], [0, 1]], dtype=np.complex64),
+                np.sqrt(1 - self.prob)
+                * np.array([[0, 0], [jump, 0]], dtype=np.complex64),
+            ]
+        return kraus
 
     def __repr__(self):
         prob = f", {self.prob}" if self.prob != 1 else ""
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import re
+from io import StringIO
+from numbers import Integral
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, TextIO
+from warnings import warn
 
 import numpy as np
 from typeguard import typechecked
@@ -9,13 +13,17 @@ from typeguard import typechecked
 from mpqp.core.instruction.gates.custom_controlled_gate import CustomControlledGate
 
 if TYPE_CHECKING:
+    from sympy import Basic
+
     from mpqp.core.circuit import QCircuit
 
 from mpqp.core.instruction import Instruction
 from mpqp.core.instruction.breakpoint import Breakpoint
 from mpqp.core.instruction.gates import *
-from mpqp.core.instruction.gates.gate import SingleQubitGate
+from mpqp.core.instruction.gates.gate import Gate, SingleQubitGate
+from mpqp.core.instruction.gates.native_gates import NativeGate
 from mpqp.core.instruction.measurement import BasisMeasure, ExpectationMeasure
+from mpqp.core.instruction_store import OPCODES, CompactInstructions, iter_templates
 from mpqp.core.languages import Language
 
 
@@ -29,6 +37,57 @@ def float_to_qasm_str(f: float) -> str:
         return f"pi/{int(1 / f * np.pi)}" if (np.pi * (1 / f)).is_integer() else str(f)
 
 
+def parameter_to_qasm_str(parameter: Any) -> str:
+    """Writes a gate parameter in OpenQASM. A symbolic parameter is written as
+    an expression of its variables, which are only valid in OpenQASM 3.0 once
+    declared as inputs (see :func:`qasm3_input_declarations`).
+
+    Args:
+        parameter: The numerical or symbolic parameter.
+
+    Returns:
+        The OpenQASM expression of the parameter.
+
+    Example:
+        >>> theta = symbols("θ")
+        >>> parameter_to_qasm_str(np.pi / 2), parameter_to_qasm_str(2 * theta + 1)
+        ('pi/2', '2*θ + 1')
+
+    """
+    from sympy import Expr
+
+    if isinstance(parameter, Expr) and len(parameter.free_symbols) != 0:
+        return str(parameter)
+    return float_to_qasm_str(float(parameter))
+
+
+def qasm3_input_declarations(qasm3_str: str, variables: Iterable[Basic]) -> str:
+    """Declares the variables of a symbolic circuit as inputs of its OpenQASM
+    3.0 code, which Braket translates to ``FreeParameter``.
+
+    Args:
+        qasm3_str: The OpenQASM 3.0 code, with the symbolic parameters written
+            by :func:`parameter_to_qasm_str`.
+        variables: The variables to declare.
+
+    Returns:
+        The OpenQASM 3.0 code with the declarations of the inputs after its
+        header.
+
+    Example:
+        >>> print(qasm3_input_declarations("OPENQASM 3.0;\\nqubit[1] q;\\nrx(2*θ) q[0];", symbols("θ φ")))
+        OPENQASM 3.0;
+        input float[64] θ;
+        input float[64] φ;
+        qubit[1] q;
+        rx(2*θ) q[0];
+
+    """
+    header, _, body = qasm3_str.partition(";")
+    declarations = "".join(f"\ninput float[64] {var};" for var in variables)
+    return header + ";" + declarations + body
+
+
 @typechecked
 def _simplify_instruction_to_qasm(
     instruction: SingleQubitGate | BasisMeasure,
@@ -69,6 +128,50 @@ def _simplify_instruction_to_qasm(
     return final_str
 
 
+_K_SIGNS = {Rk: 1, CRk: 1, Rk_dagger: -1, CRk_dagger: -1}
+"""Gates parametrized by ``k``, with the sign of their angle."""
+_MAX_PREFIXES = 4096
+
+
+def _native_gate_prefix(gate: type[NativeGate], parameters: list[Any]) -> str:
+    """Part of the QASM 2.0 line of a native gate preceding its qubits, as
+    written by its ``to_other_language`` method but without instantiating
+    the gate."""
+    if len(parameters) == 0:
+        return gate.qasm2_gate
+    if gate in _K_SIGNS:
+        from sympy import pi
+
+        k = parameters[0]
+        if isinstance(k, float) and k.is_integer():
+            k = int(k)
+        p = np.pi if isinstance(k, Integral) else pi
+        parameters = [
+            _K_SIGNS[gate] * p / 2 ** (k - 1)  # pyright: ignore[reportOperatorIssue]
+        ]
+    return f"{gate.qasm2_gate}({','.join(map(parameter_to_qasm_str, parameters))})"
+
+
+def _native_gate_to_qasm2(
+    gate: type[NativeGate],
+    qubits: list[int],
+    parameters: list[Any],
+    prefixes: dict[tuple[Any, ...], str],
+) -> str:
+    """QASM 2.0 line of a native gate applied on ``qubits`` (controls first).
+    The part of the line preceding the qubits only depends on the gate and its
+    parameters, so it is computed once for the successive instructions with
+    the same gate and parameters (at most :data:`_MAX_PREFIXES` are kept)."""
+    key = (gate, *parameters)
+    prefix = prefixes.get(key)
+    if prefix is None:
+        if len(prefixes) >= _MAX_PREFIXES:
+            prefixes.clear()
+        prefix = _native_gate_prefix(gate, parameters)
+        prefixes[key] = prefix
+    return f"\n{prefix} " + ",".join(f"q[{qubit}]" for qubit in qubits) + ";"
+
+
 def _instruction_to_qasm2(instruction: Instruction) -> tuple[str, float]:
     if isinstance(instruction, (Breakpoint, ExpectationMeasure)):
         return "", 0
@@ -84,6 +187,217 @@ def _instruction_to_qasm2(instruction: Instruction) -> tuple[str, float]:
         return "\n" + instruction, 0
 
 
+def _instructions_to_qasm2(
+    qcircuit: QCircuit,
+) -> Iterator[tuple[str, float, bool]]:
+    """QASM 2.0 code of each instruction of the circuit, one at a time so that
+    the code of the whole circuit is never held in memory.
+
+    Yields:
+        The code of the instruction (each line preceded by a line break), the
+        global phase it adds, and whether it is a measure (the measures are
+        written at the end of the code).
+    """
+    prefixes: dict[tuple[Any, ...], str] = {}
+    instructions = qcircuit.instructions
+    if isinstance(instructions, CompactInstructions):
+        # the gates are written from the arrays, without being built
+        objects = instructions.objects
+        for index, (opcode, qubits, parameters) in enumerate(instructions.records()):
+            if opcode != -1:
+                yield _native_gate_to_qasm2(
+                    OPCODES[opcode], qubits, parameters, prefixes
+                ), 0, False
+            else:
+                qasm, phase = _instruction_to_qasm2(objects[index])
+                yield qasm, phase, isinstance(objects[index], BasisMeasure)
+        return
+    for instruction, qubits in iter_templates(instructions):
+        if isinstance(instruction, NativeGate):
+            parameters = (
+                instruction.parameters
+                if isinstance(instruction, ParametrizedGate)
+                else []
+            )
+            yield _native_gate_to_qasm2(
+                type(instruction), qubits, parameters, prefixes
+            ), 0, False
+        else:
+            qasm, phase = _instruction_to_qasm2(instruction)
+            yield qasm, phase, isinstance(instruction, BasisMeasure)
+
+
+def _warn_noise_ignored(qcircuit: QCircuit):
+    if qcircuit.noises:
+        logging.warning(
+            "Instructions such as noise are not supported by QASM2 hence have "
+            "been ignored."
+        )
+
+
+@typechecked
+def write_qasm2(qcircuit: QCircuit, file: TextIO) -> float:
+    """Writes the OpenQASM 2.0 code of a circuit in a file, or any file-like
+    object, instruction by instruction. Only the code of the measures is kept
+    in memory until the end of the circuit, so large circuits can be exported
+    without building their code as a string.
+
+    Args:
+        qcircuit: The circuit to be converted.
+        file: The text stream in which the code is written.
+
+    Returns:
+        The global phase associated with the custom gates of the circuit.
+
+    Example:
+        >>> file = StringIO()
+        >>> write_qasm2(QCircuit([H(0), CNOT(0, 1), BasisMeasure()]), file)
+        0
+        >>> print(file.getvalue())
+        OPENQASM 2.0;
+        include "qelib1.inc";
+        qreg q[2];
+        creg c[2];
+        h q[0];
+        cx q[0],q[1];
+        measure q[0] -> c[0];
+        measure q[1] -> c[1];
+
+    """
+    _warn_noise_ignored(qcircuit)
+
+    file.write(
+        "OPENQASM 2.0;"
+        + "\ninclude \"qelib1.inc\";"
+        + f"\nqreg q[{qcircuit.nb_qubits}];"
+    )
+    if qcircuit.nb_cbits != 0:
+        file.write(f"\ncreg c[{qcircuit.nb_cbits}];")
+
+    measures: list[str] = []
+    gphase = 0
+    for qasm, phase, is_measure in _instructions_to_qasm2(qcircuit):
+        if is_measure:
+            measures.append(qasm)
+        else:
+            file.write(qasm)
+        gphase += phase
+    file.writelines(measures)
+    return gphase
+
+
+_QASM2_MEASURE = re.compile(r"measure\s+(.+?)\s+->\s+(.+);")
+
+
+def _qasm2_line_to_qasm3(line: str) -> str:
+    """OpenQASM 3.0 version of a line of the code of an instruction produced by
+    :func:`_instructions_to_qasm2`, following
+    :func:`~mpqp.qasm.open_qasm_2_and_3.open_qasm_2_to_3`."""
+    if line.startswith("u("):
+        return "u3" + line[1:]
+    if line.startswith("cu1("):
+        return "cp" + line[3:]
+    if line.startswith("measure"):
+        match = _QASM2_MEASURE.fullmatch(line)
+        if match is not None:
+            return f"{match.group(2)} = measure {match.group(1)};"
+    return line
+
+
+@typechecked
+def write_qasm3(
+    qcircuit: QCircuit, file: TextIO, translation_warning: bool = True
+) -> float:
+    """Writes the OpenQASM 3.0 code of a circuit in a file, or any file-like
+    object, instruction by instruction (see :func:`write_qasm2`). The code is
+    the one :func:`~mpqp.qasm.open_qasm_2_and_3.open_qasm_2_to_3` gives from
+    the OpenQASM 2.0 code of the circuit, but without writing the latter.
+
+    Args:
+        qcircuit: The circuit to be converted.
+        file: The text stream in which the code is written.
+        translation_warning: If ``True``, a warning is raised when the phase of
+            the ``u`` gates changes between the two versions.
+
+    Returns:
+        The global phase associated with the custom gates of the circuit.
+
+    Example:
+        >>> file = StringIO()
+        >>> write_qasm3(QCircuit([H(0), CNOT(0, 1), BasisMeasure()]), file)
+        0
+        >>> print(file.getvalue())
+        OPENQASM 3.0;
+        include "stdgates.inc";
+        <BLANKLINE>
+        qubit[2] q;
+        bit[2] c;
+        h q[0];
+        cx q[0],q[1];
+        c[0] = measure q[0];
+        c[1] = measure q[1];
+        <BLANKLINE>
+
+    """
+    from mpqp.tools.errors import OpenQASMTranslationWarning
+
+    _warn_noise_ignored(qcircuit)
+
+    file.write("OPENQASM 3.0;\n")
+    if any(isinstance(instruction, Gate) for instruction in qcircuit.instructions):
+        file.write('include "stdgates.inc";\n')
+    file.write(f"\nqubit[{qcircuit.nb_qubits}] q;\n")
+    if qcircuit.nb_cbits != 0:
+        file.write(f"bit[{qcircuit.nb_cbits}] c;\n")
+
+    measures: list[str] = []
+    gphase = 0
+    warned = not translation_warning
+    for qasm, phase, is_measure in _instructions_to_qasm2(qcircuit):
+        gphase += phase
+        for line in qasm.split("\n"):
+            if len(line) == 0:
+                continue
+            if not warned and line.startswith("u("):
+                warned = True
+                warn(
+                    """
+There is a phase e^(i(a+c)/2) difference between U(a,b,c) gate in 2.0 and 3.0.
+We handled that for you by adding the extra phase at the right place. 
+Be careful if you want to create a control gate from this circuit/gate, the
+phase can become non-global.""",
+                    OpenQASMTranslationWarning,
+                )
+            line = _qasm2_line_to_qasm3(line) + "\n"
+            if is_measure:
+                measures.append(line)
+            else:
+                file.write(line)
+    file.writelines(measures)
+    return gphase
+
+
+@typechecked
+def mpqp_to_qasm3(
+    qcircuit: QCircuit, translation_warning: bool = True
+) -> tuple[str, float]:
+    """Converts a :class:`~mpqp.core.circuit.QCircuit` object into a string in
+    QASM 3.0 format, see :func:`write_qasm3`.
+
+    Args:
+        qcircuit: The circuit to be converted.
+        translation_warning: If ``True``, a warning is raised when the phase of
+            the ``u`` gates changes between the two versions.
+
+    Returns:
+        A tuple containing, QASM 3.0 string representation of the provided
+        circuit, and a global phase value associated with custom gates.
+    """
+    file = StringIO()
+    gphase = write_qasm3(qcircuit, file, translation_warning)
+    return file.getvalue(), gphase
+
+
 @typechecked
 def mpqp_to_qasm2(qcircuit: QCircuit, simplify: bool = False) -> tuple[str, float]:
     """Converts a :class:`~mpqp.core.circuit.QCircuit` object into a string in
@@ -116,11 +430,12 @@ def mpqp_to_qasm2(qcircuit: QCircuit, simplify: bool = False) -> tuple[str, floa
         cx q[0],q[1];
         measure q -> c;
     """
-    if qcircuit.noises:
-        logging.warning(
-            "Instructions such as noise are not supported by QASM2 hence have "
-            "been ignored."
-        )
+    if not simplify:
+        file = StringIO()
+        gphase = write_qasm2(qcircuit, file)
+        return file.getvalue(), gphase
+
+    _warn_noise_ignored(qcircuit)
 
     qasm_str = (
         "OPENQASM 2.0;"
@@ -137,56 +452,48 @@ def mpqp_to_qasm2(qcircuit: QCircuit, simplify: bool = False) -> tuple[str, floa
     gphase = 0
 
     for instruction in qcircuit.instructions:
-        if simplify:
-            if isinstance(instruction, (SingleQubitGate, BasisMeasure)):
-                if previous is None:
-                    previous = instruction
-                elif type(instruction) != type(previous) or (
-                    isinstance(instruction, ParametrizedGate)
-                    and instruction.parameters
-                    != previous.parameters  # pyright: ignore[reportAttributeAccessIssue]
-                ):
-                    if isinstance(previous, BasisMeasure):
-                        qasm_measure += _simplify_instruction_to_qasm(
-                            previous, targets, c_targets
-                        )
-                    else:
-                        qasm_str += _simplify_instruction_to_qasm(
-                            previous, targets, c_targets
-                        )
-                    targets = {i: 0 for i in range(qcircuit.nb_qubits)}
-                    c_targets = {i: 0 for i in range(qcircuit.nb_qubits)}
-                    previous = instruction
-
-                for target in instruction.targets:
-                    targets[target] += 1
-                if isinstance(instruction, BasisMeasure):
-                    if instruction.c_targets is not None:
-                        for c_target in instruction.c_targets:
-                            c_targets[c_target] += 1
-                    else:
-                        for i in range(len(instruction.targets)):
-                            c_targets[i] += 1
-            else:
-                if previous:
-                    if isinstance(previous, BasisMeasure):
-                        qasm_measure += _simplify_instruction_to_qasm(
-                            previous, targets, c_targets
-                        )
-                    else:
-                        qasm_str += _simplify_instruction_to_qasm(
-                            previous, targets, c_targets
-                        )
-                    previous = None
-                    targets = {i: 0 for i in range(qcircuit.nb_qubits)}
-                    c_targets = {i: 0 for i in range(qcircuit.nb_qubits)}
-                qasm, phase = _instruction_to_qasm2(instruction)
-                if isinstance(instruction, BasisMeasure):
-                    qasm_measure += qasm
+        if isinstance(instruction, (SingleQubitGate, BasisMeasure)):
+            if previous is None:
+                previous = instruction
+            elif type(instruction) != type(previous) or (
+                isinstance(instruction, ParametrizedGate)
+                and instruction.parameters
+                != previous.parameters  # pyright: ignore[reportAttributeAccessIssue]
+            ):
+                if isinstance(previous, BasisMeasure):
+                    qasm_measure += _simplify_instruction_to_qasm(
+                        previous, targets, c_targets
+                    )
+                else:
+                    qasm_str += _simplify_instruction_to_qasm(
+                        previous, targets, c_targets
+                    )
+                targets = {i: 0 for i in range(qcircuit.nb_qubits)}
+                c_targets = {i: 0 for i in range(qcircuit.nb_qubits)}
+                previous = instruction
+
+            for target in instruction.targets:
+                targets[target] += 1
+            if isinstance(instruction, BasisMeasure):
+                if instruction.c_targets is not None:
+                    for c_target in instruction.c_targets:
+                        c_targets[c_target] += 1
                 else:
-                    qasm_str += qasm
-                gphase += phase
+                    for i in range(len(instruction.targets)):
+                        c_targets[i] += 1
         else:
+            if previous:
+                if isinstance(previous, BasisMeasure):
+                    qasm_measure += _simplify_instruction_to_qasm(
+                        previous, targets, c_targets
+                    )
+                else:
+                    qasm_str += _simplify_instruction_to_qasm(
+                        previous, targets, c_targets
+                    )
+                previous = None
+                targets = {i: 0 for i in range(qcircuit.nb_qubits)}
+                c_targets = {i: 0 for i in range(qcircuit.nb_qubits)}
             qasm, phase = _instruction_to_qasm2(instruction)
             if isinstance(instruction, BasisMeasure):
                 qasm_measure += qasm
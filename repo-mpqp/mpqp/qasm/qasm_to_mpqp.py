@@ -1,40 +1,585 @@
-from __future__ import annotations
+"""OpenQASM code is translated to a :class:`~mpqp.core.circuit.QCircuit` by a
+single pass parser: the code is read piece by piece (for instance line by line
+from a file), and each statement is turned into instructions as soon as it is
+complete, so the code is never held in memory as a whole. The gates defined in
+the code are compiled once in a table of definitions, and expanded from it each
+time they are used.
+
+:func:`qasm2_parse` parses a string, while :func:`qasm_parse_stream` and
+:func:`qasm_parse_file` parse files of any size, both in OpenQASM 2.0 and 3.0
+(for the subset of the language describing circuits: registers, gates,
+measures and barriers). As in the language, the block comments (``/* */``) are
+only accepted in OpenQASM 3.0 code."""
 
-from typing import TYPE_CHECKING
-from venv import logger
+from __future__ import annotations
 
-from ply.lex import lex
+import math
+import os
+import re
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
+
+from typeguard import typechecked
 
 if TYPE_CHECKING:
     from mpqp.core.circuit import QCircuit
 
 from mpqp.core.instruction import Barrier
+from mpqp.core.instruction.gates.native_gates import NativeGate
+from mpqp.core.instruction_store import OPCODES, CompactInstructions
 from mpqp.gates import *
-from mpqp.measures import *
-from mpqp.qasm.lexer_utils import *
-from mpqp.qasm.open_qasm_2_and_3 import remove_include_and_comment, remove_user_gates
+from mpqp.measures import BasisMeasure
+from mpqp.qasm.lexer_utils import (
+    one_parametrized_gate_qasm,
+    single_qubits_gate_qasm,
+    two_qubits_gate_qasm,
+    two_qubits_parametrized_gate_qasm,
+)
+from mpqp.qasm.open_qasm_2_and_3 import Instr, qasm_code
+
+
+def _natives(
+    gates: Mapping[str, type[NativeGate]], nb_parameters: int, nb_qubits: int
+) -> dict[str, tuple[int, int, int]]:
+    return {
+        name: (OPCODES.index(gate), nb_parameters, nb_qubits)
+        for name, gate in gates.items()
+    }
+
+
+_NATIVE_GATES = {
+    **_natives(single_qubits_gate_qasm, 0, 1),
+    **_natives(two_qubits_gate_qasm, 0, 2),
+    **_natives(one_parametrized_gate_qasm, 1, 1),
+    **_natives(two_qubits_parametrized_gate_qasm, 1, 2),
+    **_natives({"U": U, "u": U, "u3": U}, 3, 1),
+    **_natives({"u1": P, "phase": P}, 1, 1),
+    **_natives({"CX": CNOT}, 0, 2),
+    **_natives({"cu1": CP, "cphase": CP}, 1, 2),
+    **_natives({"ccx": TOF}, 0, 3),
+}
+"""Opcode (see :data:`~mpqp.core.instruction_store.OPCODES`), number of
+parameters and number of qubits of the gates translated to native gates. The
+other gates of the standard libraries are expanded from their definition in
+``qelib1.inc``."""
+_STANDARD_INCLUDES = {"qelib1.inc", "stdgates.inc", "braket_custom_include.inc"}
+
+_CONSTANTS = {"pi": math.pi, "π": math.pi, "tau": math.tau, "τ": math.tau}
+_FUNCTIONS = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "arcsin": math.asin,
+    "arccos": math.acos,
+    "arctan": math.atan,
+    "exp": math.exp,
+    "ln": math.log,
+    "sqrt": math.sqrt,
+}
+_NAMESPACE = {"__builtins__": {}, **_CONSTANTS, **_FUNCTIONS}
+
+_DELIMITER = re.compile(r"//|/\*|[;{}]")
+_STATEMENT = re.compile(r"([^\W\d]\w*)\s*(?:\((.*)\))?(.*)", re.S)
+_MEASURE_ASSIGNMENT = re.compile(r"(.+?)=\s*measure\b(.*)", re.S)
+_ARGUMENT = re.compile(r"\s*([^\W\d]\w*)\s*(?:\[\s*(\d+)\s*\])?\s*$")
+_OPENQASM2_REGISTER = re.compile(r"\s*([^\W\d]\w*)\s*\[\s*(\d+)\s*\]\s*$")
+_OPENQASM3_REGISTER = re.compile(r"\s*(?:\[\s*(\d+)\s*\])?\s*([^\W\d]\w*)\s*$")
+_GATE_HEADER = re.compile(r"gate\s+([^\W\d]\w*)\s*(?:\((.*)\))?(.*)", re.S)
+_EXPRESSION_TOKEN = re.compile(
+    r"\s*(?:(\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)"
+    r"|([^\W\d]\w*)|(\*\*|[-+*/^(),]))"
+)
+
+
+def _statements(
+    chunks: Iterable[str], block_comments: Callable[[], bool] = lambda: True
+) -> Iterator[tuple[str, str]]:
+    """Splits OpenQASM code, given in pieces of any size, into statements.
+
+    Args:
+        chunks: The pieces of the code, for instance its lines.
+        block_comments: Whether the block comments are allowed at this point of
+            the code, checked at each block comment.
+
+    Yields:
+        Each statement, without its comments, followed by its delimiter:
+        ``";"``, ``"{"`` or ``"}"``. An unterminated statement at the end of
+        the code is followed by ``""``.
+    """
+    pieces: list[str] = []
+    comment = None  # "//" or "/*" while in a comment
+    held = ""  # last character of a piece, which could start a delimiter
+    for chunk in chunks:
+        text, held = held + chunk, ""
+        position = 0
+        while position < len(text):
+            if comment is not None:
+                end = text.find("\n" if comment == "//" else "*/", position)
+                if end == -1:
+                    if comment == "/*" and text.endswith("*"):
+                        held = "*"
+                    break
+                position = end + (1 if comment == "//" else 2)
+                comment = None
+                continue
+            match = _DELIMITER.search(text, position)
+            if match is None:
+                if text.endswith("/"):
+                    held = "/"
+                pieces.append(text[position : len(text) - len(held)])
+                break
+            pieces.append(text[position : match.start()])
+            position = match.end()
+            delimiter = match.group()
+            if delimiter == "/*" and not block_comments():
+                raise SyntaxError("Block comments are not allowed in OpenQASM 2.0")
+            if delimiter in ("//", "/*"):
+                comment = delimiter
+                pieces.append(" ")
+            else:
+                yield "".join(pieces).strip(), delimiter
+                pieces = []
+    if comment is None:
+        pieces.append(held)
+    rest = "".join(pieces).strip()
+    if len(rest) != 0:
+        yield rest, ""
+
+
+def _top_level(
+    chunks: Iterable[str], block_comments: Callable[[], bool] = lambda: True
+) -> Iterator[tuple[str, Optional[list[str]]]]:
+    """Groups the statements of the bodies of the gate definitions.
+
+    Args:
+        chunks: The pieces of the code, for instance its lines.
+        block_comments: See :func:`_statements`.
+
+    Yields:
+        Each statement with ``None``, and each header of a gate definition
+        with the statements of its body.
+    """
+    header: Optional[str] = None
+    body: list[str] = []
+    for statement, delimiter in _statements(chunks, block_comments):
+        if delimiter == "":
+            raise SyntaxError(f"Missing ';' at the end of: {statement}")
+        if delimiter == "{":
+            if header is not None:
+                raise SyntaxError(f"Unexpected '{{' in the definition: {header}")
+            header, body = statement, []
+            continue
+        if len(statement) != 0:
+            if header is None:
+                yield statement, None
+            else:
+                body.append(statement)
+        if delimiter == "}":
+            if header is None:
+                raise SyntaxError("Unexpected '}'")
+            yield header, body
+            header = None
+    if header is not None:
+        raise SyntaxError(f"Missing '}}' at the end of the definition: {header}")
+
+
+def _split(text: str) -> list[str]:
+    """Splits a list of expressions on the commas outside of parentheses."""
+    items: list[str] = []
+    depth = start = 0
+    for index, character in enumerate(text):
+        if character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "," and depth == 0:
+            items.append(text[start:index])
+            start = index + 1
+    items.append(text[start:])
+    return items
+
+
+@lru_cache(maxsize=4096)
+def _compile_expression(
+    expression: str, names: tuple[str, ...] = ()
+) -> Callable[..., float]:
+    """Compiles an OpenQASM expression to a function of the values of the
+    parameters ``names``."""
+    python: list[str] = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _EXPRESSION_TOKEN.match(expression, position)
+        if match is None:
+            raise SyntaxError(f"Invalid expression: {expression}")
+        number, name, operator = match.groups()
+        if name is not None:
+            if name in names:
+                python.append(f"_{names.index(name)}")
+            elif name in _NAMESPACE:
+                python.append(name)
+            else:
+                raise SyntaxError(f"Unknown identifier {name} in: {expression}")
+        elif number is not None:
+            python.append(number)
+        else:
+            python.append("**" if operator == "^" else operator)
+        position = match.end()
+    arguments = ", ".join(f"_{i}" for i in range(len(names)))
+    try:
+        return eval(f"lambda {arguments}: {' '.join(python)}", dict(_NAMESPACE))
+    except SyntaxError:
+        raise SyntaxError(f"Invalid expression: {expression}") from None
+
+
+def _value(expression: str) -> float:
+    try:
+        return float(expression)
+    except ValueError:
+        return _compile_expression(expression)()
+
+
+def _measure_operands(statement: str) -> Optional[tuple[str, Optional[str]]]:
+    """Measured qubits and classical bits (``None`` if not given) of a
+    ``measure`` statement in OpenQASM 2.0 or 3.0, ``None`` for other
+    statements."""
+    if "=" in statement:
+        match = _MEASURE_ASSIGNMENT.match(statement)
+        if match is not None:
+            return match.group(2), match.group(1)
+    if statement.startswith("measure") and not statement[7:8].isidentifier():
+        qubits, _, cbits = statement[7:].partition("->")
+        return qubits, cbits if "->" in statement else None
+    return None
+
+
+class _Operation(NamedTuple):
+    name: str
+    parameters: list[Callable[..., float]]
+    qubits: list[int | str]
+    """Index of the qubit in the qubits of the gate, or qubit of the circuit."""
+    cbits: Optional[str] = None
+    """Classical bits of a measure."""
+
+
+class _GateDefinition(NamedTuple):
+    name: str
+    nb_parameters: int
+    nb_qubits: int
+    body: list[_Operation]
+
+
+def _define(
+    header: str, body: list[str], is_known: Callable[[str], bool]
+) -> _GateDefinition:
+    """Compiles the definition of a gate.
+
+    Args:
+        header: The statement before the body of the definition.
+        body: The statements of the body of the definition.
+        is_known: Function telling if a gate can be used in the body.
+
+    Returns:
+        The compiled definition, with the expressions of the parameters of the
+        gates compiled to functions of the parameters of the defined gate.
+    """
+    match = _GATE_HEADER.match(header)
+    if match is None:
+        raise SyntaxError(f"Unsupported block: {header}")
+    name, parameter_list, qubit_list = match.groups()
+    parameters = tuple(
+        parameter.strip()
+        for parameter in _split(parameter_list or "")
+        if len(parameter.strip()) != 0
+    )
+    qubits = [qubit.strip() for qubit in qubit_list.split(",")]
+    if any(not qubit.isidentifier() for qubit in qubits):
+        raise SyntaxError(f"Invalid qubits in the definition: {header}")
+
+    def operand(argument: str) -> int | str:
+        argument = argument.strip()
+        return qubits.index(argument) if argument in qubits else argument
+
+    operations: list[_Operation] = []
+    for statement in body:
+        measure = _measure_operands(statement)
+        if measure is not None:
+            operations.append(
+                _Operation("measure", [], [operand(measure[0])], measure[1])
+            )
+            continue
+        call = _STATEMENT.match(statement)
+        if call is None:
+            raise SyntaxError(
+                f"Invalid statement in the definition of {name}: {statement}"
+            )
+        gate, gate_parameters, arguments = call.groups()
+        if gate == "barrier":
+            operations.append(_Operation("barrier", [], []))
+            continue
+        if not is_known(gate):
+            raise SyntaxError(f"Unknown gate {gate} in the definition of {name}")
+        operations.append(
+            _Operation(
+                gate,
+                (
+                    []
+                    if gate_parameters is None
+                    else [
+                        _compile_expression(parameter, parameters)
+                        for parameter in _split(gate_parameters)
+                    ]
+                ),
+                [operand(argument) for argument in arguments.split(",")],
+            )
+        )
+    return _GateDefinition(name, len(parameters), len(qubits), operations)
+
+
+@lru_cache(maxsize=None)
+def _standard_definitions() -> dict[str, _GateDefinition]:
+    """Definitions of the gates of ``qelib1.inc``, used for the gates which
+    are not translated to native gates."""
+    definitions: dict[str, _GateDefinition] = {}
+    for header, body in _top_level([qasm_code(Instr.OQASM2_ALL_STDGATES)]):
+        if body is not None:
+            definition = _define(
+                header, body, lambda name: name in _NATIVE_GATES or name in definitions
+            )
+            definitions[definition.name] = definition
+    return definitions
+
+
+class _QasmParser:
+    """State of the parsing of an OpenQASM code: its registers, the gates it
+    defines and the instructions already parsed."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.included: set[str] = set()
+        self.qubits: dict[str, tuple[int, int]] = {}
+        """Offset and size of each quantum register."""
+        self.cbits: dict[str, tuple[int, int]] = {}
+        """Offset and size of each classical register."""
+        self.nb_qubits = 0
+        self.nb_cbits = 0
+        self.definitions: dict[str, _GateDefinition] = {}
+        self.instructions = CompactInstructions()
+        self.header_allowed = True
+        self.version: Optional[str] = None
+        """Major version given by the last header read."""
+
+    def parse(self, chunks: Iterable[str]):
+        for statement, body in _top_level(chunks, lambda: self.version != "2"):
+            if body is None:
+                self.execute(statement)
+            else:
+                definition = _define(statement, body, self.is_known)
+                self.definitions[definition.name] = definition
+            self.header_allowed = False
+
+    def is_known(self, name: str) -> bool:
+        return (
+            name in self.definitions
+            or name in _NATIVE_GATES
+            or name in _standard_definitions()
+        )
+
+    def execute(self, statement: str):
+        measure = _measure_operands(statement)
+        if measure is not None:
+            self.measure(*measure)
+            return
+        match = _STATEMENT.match(statement)
+        if match is None:
+            raise SyntaxError(f"Invalid statement: {statement}")
+        name, parameters, arguments = match.groups()
+        if name == "OPENQASM":
+            version = arguments.strip().split(".")[0]
+            if not self.header_allowed or version not in ("2", "3"):
+                raise SyntaxError(f"Invalid header: {statement}")
+            self.version = version
+        elif name == "include":
+            self.include(arguments.strip().strip("\"'"))
+        elif name in ("qreg", "creg") and parameters is None:
+            register = _OPENQASM2_REGISTER.match(arguments)
+            if register is None:
+                raise SyntaxError(f"Invalid register: {statement}")
+            self.declare(name == "qreg", register.group(1), int(register.group(2)))
+        elif name in ("qubit", "bit") and parameters is None:
+            register = _OPENQASM3_REGISTER.match(arguments)
+            if register is None:
+                raise SyntaxError(f"Invalid register: {statement}")
+            size = 1 if register.group(1) is None else int(register.group(1))
+            self.declare(name == "qubit", register.group(2), size)
+        elif name == "barrier":
+            self.instructions.append(Barrier())
+        else:
+            values = (
+                [] if parameters is None else [_value(p) for p in _split(parameters)]
+            )
+            operands = [
+                self.bits(argument, self.qubits) for argument in arguments.split(",")
+            ]
+            if len(operands) > 1 and self.nb_qubits_of(name) == 1:
+                # ``h q[0], q[1];`` is read as ``h q[0]; h q[1];``
+                for operand in operands:
+                    self.call(name, values, [operand])
+            else:
+                self.call(name, values, operands)
+
+    def call(
+        self, name: str, values: list[float], operands: list[tuple[list[int], bool]]
+    ):
+        sizes = {len(bits) for bits, whole in operands if whole}
+        if len(sizes) == 0:
+            self.apply(name, values, [bits[0] for bits, _ in operands])
+        elif len(sizes) > 1:
+            raise SyntaxError(f"Registers of different sizes given to {name}")
+        else:
+            # the gate is applied on each qubit of the registers
+            for index in range(sizes.pop()):
+                self.apply(
+                    name,
+                    values,
+                    [bits[index] if whole else bits[0] for bits, whole in operands],
+                )
 
-# TODO:
-# if: not handle
-# barrier: handled for all qubits ("q"), not for multiple qubits ("q[0],q[1]")
-# no ID name handle for qreg or creg
+    def nb_qubits_of(self, name: str) -> Optional[int]:
+        definition = self.definitions.get(name)
+        if definition is None and name in _NATIVE_GATES:
+            return _NATIVE_GATES[name][2]
+        if definition is None:
+            definition = _standard_definitions().get(name)
+        return None if definition is None else definition.nb_qubits
+
+    def include(self, file_name: str):
+        if file_name in _STANDARD_INCLUDES or file_name in self.included:
+            return
+        self.included.add(file_name)
+        with open(os.path.join(self.directory, file_name), "r") as file:
+            self.header_allowed = True
+            self.parse(file)
+
+    def declare(self, quantum: bool, name: str, size: int):
+        if name in self.qubits or name in self.cbits:
+            raise SyntaxError(f"Register {name} already declared")
+        if quantum:
+            self.qubits[name] = (self.nb_qubits, size)
+            self.nb_qubits += size
+        else:
+            self.cbits[name] = (self.nb_cbits, size)
+            self.nb_cbits += size
+
+    def bits(
+        self, argument: str, registers: dict[str, tuple[int, int]]
+    ) -> tuple[list[int], bool]:
+        """Bits designated by an argument, and whether it is a whole register."""
+        match = _ARGUMENT.match(argument)
+        if match is None or match.group(1) not in registers:
+            raise SyntaxError(f"Invalid argument: {argument}")
+        offset, size = registers[match.group(1)]
+        if match.group(2) is None:
+            return list(range(offset, offset + size)), True
+        index = int(match.group(2))
+        if index >= size:
+            raise SyntaxError(f"Index out of range: {argument}")
+        return [offset + index], False
+
+    def targets(
+        self, arguments: str, registers: dict[str, tuple[int, int]]
+    ) -> Optional[list[int]]:
+        """Targets of a measure, ``None`` for the whole circuit."""
+        operands = [self.bits(argument, registers) for argument in arguments.split(",")]
+        if len(operands) == 1 and operands[0][1] and len(registers) == 1:
+            return None
+        return [bit for bits, _ in operands for bit in bits]
+
+    def measure(self, qubits: str | list[int], cbits: Optional[str]):
+        self.instructions.append(
+            BasisMeasure(
+                (
+                    self.targets(qubits, self.qubits)
+                    if isinstance(qubits, str)
+                    else qubits
+                ),
+                None if cbits is None else self.targets(cbits, self.cbits),
+            )
+        )
+
+    def apply(self, name: str, values: list[float], qubits: list[int]):
+        definition = self.definitions.get(name)
+        if definition is None:
+            if name in _NATIVE_GATES:
+                opcode, nb_parameters, nb_qubits = _NATIVE_GATES[name]
+                if len(values) != nb_parameters or len(qubits) != nb_qubits:
+                    raise SyntaxError(
+                        f"{name} expects {nb_parameters} parameter(s) and "
+                        f"{nb_qubits} qubit(s), got {values} and {qubits}"
+                    )
+                if len(set(qubits)) != nb_qubits:
+                    raise SyntaxError(f"Duplicate qubits for {name}: {qubits}")
+                self.instructions._push(  # pyright: ignore[reportPrivateUsage]
+                    opcode, qubits, values
+                )
+                return
+            definition = _standard_definitions().get(name)
+            if definition is None:
+                raise SyntaxError(f"Unknown gate or unsupported statement: {name}")
+        if (
+            len(values) != definition.nb_parameters
+            or len(qubits) != definition.nb_qubits
+        ):
+            raise SyntaxError(
+                f"{name} expects {definition.nb_parameters} parameter(s) and "
+                f"{definition.nb_qubits} qubit(s), got {values} and {qubits}"
+            )
+        for operation in definition.body:
+            operands = [
+                qubits[qubit] if isinstance(qubit, int) else self.bit(qubit)
+                for qubit in operation.qubits
+            ]
+            if operation.name == "measure":
+                self.measure(operands, operation.cbits)
+            elif operation.name == "barrier":
+                self.instructions.append(Barrier())
+            else:
+                self.apply(
+                    operation.name,
+                    [parameter(*values) for parameter in operation.parameters],
+                    operands,
+                )
 
-lexer = None
+    def bit(self, argument: str) -> int:
+        bits, whole = self.bits(argument, self.qubits)
+        if whole:
+            raise SyntaxError(f"A single qubit is expected, got: {argument}")
+        return bits[0]
 
+    def circuit(self, compact: bool) -> QCircuit:
+        from mpqp.core.circuit import QCircuit
 
-def lex_openqasm(input_string: str) -> list[LexToken]:
-    global lexer
-    if lexer is None:
-        lexer = lex()
-    lexer.input(input_string)
-    tokens = []
-    tok = lexer.token()
-    while tok:
-        tokens.append(tok)
-        tok = lexer.token()
-    return tokens
+        nb_cbits = self.nb_cbits if len(self.cbits) != 0 else None
+        if not compact:
+            return QCircuit(
+                list(self.instructions), nb_qubits=self.nb_qubits, nb_cbits=nb_cbits
+            )
+        circuit = QCircuit(self.nb_qubits, nb_cbits=nb_cbits, compact=True)
+        circuit._append_compact(  # pyright: ignore[reportPrivateUsage]
+            self.instructions, 0
+        )
+        return circuit
 
 
+@typechecked
 def qasm2_parse(input_string: str) -> QCircuit:
     """
     Parses an OpenQASM 2.0 formatted string and returns a MPQP circuit.
@@ -67,285 +612,83 @@ def qasm2_parse(input_string: str) -> QCircuit:
                         0  1
 
     """
-    from mpqp.core.circuit import QCircuit
-
-    input_string = remove_user_gates(input_string, skip_qelib1=True)
-    input_string = remove_include_and_comment(input_string)
-    tokens = lex_openqasm(input_string)
-
-    if (
-        tokens[0].type != 'OPENQASM'
-        and tokens[1].type != 'REALN'
-        and tokens[1].value != '2.0'
-        and tokens[2].type != 'SEMICOLON'
-    ):
-        raise SyntaxError('Invalid OpenQASM, must start with OPENQASM 2.0;')
-
-    idx = 3
-    if idx < len(tokens) and tokens[idx].type == 'QREG':
-        if check_Id(tokens, idx + 1) and tokens[idx + 5].type != 'SEMICOLON':
-            raise SyntaxError(
-                'must  have a qreg with the number of qubit such as "qreg ID[INTN];": '
-                + f'{" ".join(str(token.value) for token in tokens[idx : idx + 5])}'
-            )
-        circuit = QCircuit(tokens[idx + 3].value)
-        idx += 6
-    else:
-        circuit = QCircuit(0)
-    i_max = len(tokens)
-    while idx < i_max:
-        logger.debug(circuit)
-        logger.debug('================================')
-        logger.debug('new line:', tokens[idx].value, idx)
-        idx = _TokenSwitch(circuit, tokens, idx)
-
-    return circuit
-
-
-def _TokenSwitch(circuit: QCircuit, tokens: list[LexToken], idx: int) -> int:
-    token = tokens[idx]
-    if token.type == 'CREG':
-        return _TokenCREG(circuit, tokens, idx)
-    elif token.type == 'MEASURE':
-        return _TokenMeasure(circuit, tokens, idx)
-    elif token.type == 'BARRIER':
-        return _TokenBarrier(circuit, tokens, idx)
-    elif token.type == 'ID':
-        return _TokenGate(circuit, tokens, idx)
-    else:
-        raise SyntaxError(f"Invalid token: {idx} {token.type}")
-
-
-def _TokenCREG(circuit: QCircuit, tokens: list[LexToken], idx: int) -> int:
-    idx += 1
-    if check_Id(tokens, idx) or tokens[idx + 4].type != 'SEMICOLON':
-        raise SyntaxError(' '.join(str(token.value) for token in tokens[idx : idx + 4]))
-    circuit.nb_cbits = tokens[idx + 2].value
-    return idx + 5
-
-
-def _TokenMeasure(circuit: QCircuit, tokens: list[LexToken], idx: int) -> int:
-    targets = []
-    idx += 1
-    while tokens[idx].type != 'SEMICOLON' and tokens[idx].type != 'ARROW':
-        if tokens[idx].type == 'ID' and tokens[idx + 1].type == 'ARROW':
-            targets = None
-            idx += 1
-            break
-        if check_Id(tokens, idx):
-            raise SyntaxError(
-                ' '.join(str(token.value) for token in tokens[idx : idx + 4])
-            )
-        targets.append(tokens[idx + 2].value)
-        idx += 4
-        if tokens[idx].type == 'COMMA':
-            idx += 1
-
-    c_targets = None
-    if tokens[idx].type == 'ARROW':
-        c_targets = []
-        idx += 1
-        while tokens[idx].type != 'SEMICOLON':
-            if tokens[idx].type == 'ID' and tokens[idx + 1].type == 'SEMICOLON':
-                c_targets = None
-                idx += 1
-                break
-            if check_Id(tokens, idx):
-                raise SyntaxError(
-                    ' '.join(str(token.value) for token in tokens[idx : idx + 4])
-                )
-            c_targets.append(tokens[idx + 2].value)
-            idx += 4
-            if tokens[idx].type == 'COMMA':
-                idx += 1
-
-    circuit.add(BasisMeasure(targets, c_targets))
-    return idx + 1
-
-
-def _TokenBarrier(circuit: QCircuit, tokens: list[LexToken], idx: int) -> int:
-    idx += 2
-    while (
-        tokens[idx].type != 'SEMICOLON'
-    ):  # 3M-TODO: to be removed if we handle multi target
-        idx += 1
-    if tokens[idx].type != 'SEMICOLON':
-        raise SyntaxError(f"Barrier: {idx} {tokens[idx]}")
-    circuit.add(Barrier())
-    return idx + 1
-
-
-def _TokenGate(circuit: QCircuit, tokens: list[LexToken], idx: int) -> int:
-    token = tokens[idx]
-    idx += 1
-    token_value = token.value.lower()
-    if token_value in single_qubits_gate_qasm:
-        return _Gate_single_qubits(circuit, token_value, tokens, idx)
-    elif token_value in two_qubits_gate_qasm:
-        return _Gate_two_qubits(circuit, token_value, tokens, idx)
-    elif token_value in one_parametrized_gate_qasm:
-        return _Gate_one_parametrized(circuit, token_value, tokens, idx)
-    elif token_value in u_gate_qasm:
-        return _Gate_U(circuit, token_value, tokens, idx)
-    elif token_value in two_qubits_parametrized_gate_qasm:
-        return _Gate_two_qubits_parametrized(circuit, token_value, tokens, idx)
-    elif token_value == "ccx":
-        return _Gate_tof(circuit, tokens, idx)
-    else:
-        raise SyntaxError(f"TokenGate: {idx} {token.value}")
-
-
-def _Gate_single_qubits(
-    circuit: QCircuit, gate_str: str, tokens: list[LexToken], idx: int
-) -> int:
-    if tokens[idx].type == 'ID' and tokens[idx + 1].type == 'SEMICOLON':
-        for i in range(circuit.nb_qubits):
-            circuit.add(single_qubits_gate_qasm[gate_str](i))
-        return idx + 2
-
-    multi = False
-    while tokens[idx].type != 'SEMICOLON':
-        if multi:
-            if tokens[idx].type != 'COMMA':
-                raise SyntaxError(f"Gate_single_qubits: {idx} {tokens[idx]}")
-            idx += 1
-        if check_Id(tokens, idx):
-            raise SyntaxError(
-                f'Gate_single_qubits: {" ".join(str(token.value) for token in tokens[idx : idx + 4])}'
-            )
-        circuit.add(single_qubits_gate_qasm[gate_str](tokens[idx + 2].value))
-        idx += 4
-        multi = True
-    return idx + 1
-
-
-def _Gate_two_qubits_parametrized(
-    circuit: QCircuit, gate_str: str, tokens: list[LexToken], idx: int
-) -> int:
-    if tokens[idx].type != 'LPAREN':
-        raise SyntaxError(f"Gate_one_parametrized: {idx} {tokens[idx]}")
-    idx += 1
-    parameter, idx = _eval_expr(tokens, idx)
-    if (
-        check_Id(tokens, idx)
-        or tokens[idx + 4].type != 'COMMA'
-        or check_Id(tokens, idx + 5)
-    ):
-        raise SyntaxError(
-            f'Gate_two_qubits: {" ".join(str(token.value) for token in tokens[idx : idx + 10])}'
-        )
+    return qasm_parse_stream([input_string], compact=False)
 
-    control = tokens[idx + 2].value
-    target = tokens[idx + 7].value
-    circuit.add(two_qubits_parametrized_gate_qasm[gate_str](parameter, control, target))
-    return idx + 10
 
+@typechecked
+def qasm_parse_stream(
+    source: Iterable[str], compact: bool = True, directory: Optional[str] = None
+) -> QCircuit:
+    """Parses OpenQASM 2.0 or 3.0 code read piece by piece, for instance from
+    an opened file, without holding the whole code in memory.
 
-def _Gate_two_qubits(
-    circuit: QCircuit, gate_str: str, tokens: list[LexToken], idx: int
-) -> int:
-    if (
-        check_Id(tokens, idx)
-        or tokens[idx + 4].type != 'COMMA'
-        or check_Id(tokens, idx + 5)
-    ):
-        raise SyntaxError(
-            f'Gate_two_qubits: {" ".join(str(token.value) for token in tokens[idx : idx + 10])}'
-        )
+    Args:
+        source: The code, as an iterable over pieces of any size (such as an
+            opened file, iterating over its lines), or as a string.
+        compact: If ``True``, the instructions of the circuit are stored in a
+            :class:`~mpqp.core.instruction_store.CompactInstructions`, which
+            uses much less memory for large circuits.
+        directory: Directory of the files included by the code, defaults to
+            the current directory.
 
-    control = tokens[idx + 2].value
-    target = tokens[idx + 7].value
-    circuit.add(two_qubits_gate_qasm[gate_str](control, target))
-    return idx + 10
+    Returns:
+        The circuit described by the code.
 
+    Raises:
+        SyntaxError: If the code is invalid, or uses unsupported features of
+            OpenQASM (such as classical control or gate modifiers).
 
-def _Gate_tof(circuit: QCircuit, tokens: list[LexToken], idx: int) -> int:
+    Example:
+        >>> lines = iter([
+        ...     'OPENQASM 3.0;',
+        ...     'include "stdgates.inc";',
+        ...     'gate bell a, b { h a; cx a, b; }',
+        ...     'qubit[2] q;',
+        ...     'bit[2] c;',
+        ...     'bell q[0], q[1];',
+        ...     'crz(pi/2) q[1], q[0];',
+        ...     'c = measure q;',
+        ... ])
+        >>> circuit = qasm_parse_stream(lines)
+        >>> print(circuit)  # doctest: +NORMALIZE_WHITESPACE
+             ┌───┐     ┌────────┐┌───┐┌─────────┐┌───┐┌─┐
+        q_0: ┤ H ├──■──┤ P(π/4) ├┤ X ├┤ P(-π/4) ├┤ X ├┤M├───
+             └───┘┌─┴─┐└────────┘└─┬─┘└─────────┘└─┬─┘└╥┘┌─┐
+        q_1: ─────┤ X ├────────────■───────────────■───╫─┤M├
+                  └───┘                                ║ └╥┘
+        c: 2/══════════════════════════════════════════╩══╩═
+                                                       0  1
 
-    if (
-        check_Id(tokens, idx)
-        or tokens[idx + 4].type != 'COMMA'
-        or check_Id(tokens, idx + 5)
-    ):
-        raise SyntaxError(
-            f'Gate_tof: {" ".join(str(token.value) for token in tokens[idx : idx + 10])}'
-        )
+    """
+    if isinstance(source, str):
+        source = [source]
+    parser = _QasmParser(directory if directory is not None else os.getcwd())
+    parser.parse(source)
+    return parser.circuit(compact)
 
-    qubits = []
-    multi = False
-    while tokens[idx].type != 'SEMICOLON':
-        if multi:
-            if tokens[idx].type != 'COMMA':
-                raise SyntaxError(f"Gate_single_qubits: {idx} {tokens[idx]}")
-            idx += 1
-        if check_Id(tokens, idx):
-            raise SyntaxError(
-                f'_Gate_tof: {" ".join(str(token.value) for token in tokens[idx : idx + 4])}'
-            )
-        qubits.append(tokens[idx + 2].value)
-        idx += 4
-        multi = True
 
-    if len(qubits) < 2:
-        raise SyntaxError("TOF: missing control or target qubit")
+@typechecked
+def qasm_parse_file(path: str, compact: bool = True) -> QCircuit:
+    """Parses an OpenQASM 2.0 or 3.0 file line by line, see
+    :func:`qasm_parse_stream`. The files it includes are looked for in its
+    directory.
 
-    control = qubits[:-1]
-    target = qubits[-1]
-    circuit.add(TOF(control, target))
-    return idx + 1
+    Args:
+        path: Path of the file.
+        compact: If ``True``, the instructions of the circuit are stored in a
+            :class:`~mpqp.core.instruction_store.CompactInstructions`.
 
+    Returns:
+        The circuit described by the file.
 
-def _eval_expr(tokens: list[LexToken], idx: int) -> tuple[Any, int]:
-    import numpy as np  # pyright: ignore[reportUnusedImport]
+    Example:
+        >>> circuit = qasm_parse_file("tests/qasm/qasm_examples/circular_dep_a.qasm")
+        >>> circuit.nb_qubits, circuit.nb_cbits
+        (4, 4)
 
-    expr = ""
-    while tokens[idx].type != 'COMMA' and tokens[idx].type != 'RPAREN':
-        if check_num_expr(tokens[idx].type):
-            raise SyntaxError(f"not a nb or expr: {idx}, {tokens[idx]}")
-        if tokens[idx].type == 'PI':
-            expr += "np.pi"
-        else:
-            expr += str(tokens[idx].value)
-        idx += 1
-    return eval(expr), idx + 1
-
-
-def _Gate_one_parametrized(
-    circuit: QCircuit, gate_str: str, tokens: list[LexToken], idx: int
-) -> int:
-    if tokens[idx].type != 'LPAREN':
-        raise SyntaxError(f"Gate_one_parametrized: {idx} {tokens[idx]}")
-    idx += 1
-    parameter, idx = _eval_expr(tokens, idx)
-
-    if check_Id(tokens, idx):
-        raise SyntaxError(
-            f'Gate_two_qubits: {" ".join(token.value for token in tokens[idx : idx + 3])}'
-        )
-    target = tokens[idx + 2].value
-    circuit.add(one_parametrized_gate_qasm[gate_str](parameter, target))
-    return idx + 5
-
-
-def _Gate_U(circuit: QCircuit, gate_str: str, tokens: list[LexToken], idx: int) -> int:
-    if tokens[idx].type != 'LPAREN':
-        raise SyntaxError(f"Gate_U: {idx} {tokens[idx]}")
-    idx += 1
-
-    theta, phi, lbda = 0, 0, 0
-    if gate_str == 'u1':
-        theta, idx = _eval_expr(tokens, idx)
-    elif gate_str == 'u2':
-        theta, idx = _eval_expr(tokens, idx)
-        phi, idx = _eval_expr(tokens, idx)
-    elif gate_str == 'u3' or gate_str == 'u' or gate_str == 'U':
-        theta, idx = _eval_expr(tokens, idx)
-        phi, idx = _eval_expr(tokens, idx)
-        lbda, idx = _eval_expr(tokens, idx)
-
-    if check_Id(tokens, idx):
-        raise SyntaxError(
-            f'GateU:  {" ".join(str(token.value) for token in tokens[idx : idx + 4])}'
-        )
-    target = tokens[idx + 2].value
-    circuit.add(U(theta, phi, lbda, target))
-    return idx + 5
+    """
+    parser = _QasmParser(os.path.dirname(path))
+    parser.included.add(os.path.basename(path))
+    with open(path, "r") as file:
+        parser.parse(file)
+    return parser.circuit(compact)
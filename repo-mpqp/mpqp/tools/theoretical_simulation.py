@@ -34,6 +34,7 @@ from typeguard import typechecked
 from mpqp import QCircuit
 from mpqp.execution import AvailableDevice, AWSDevice, Result
 from mpqp.execution.runner import _run_single  # pyright: ignore[reportPrivateUsage]
+from mpqp.execution.simulators.density_matrix import simulate_density_matrix
 from mpqp.measures import BasisMeasure
 
 
@@ -100,54 +101,26 @@ def theoretical_probs(
     circ: QCircuit,
 ) -> npt.NDArray[np.float32]:
     """Computes the theoretical probabilities of a (potentially) noisy circuit
-    execution.
+    execution, using
+    :func:`~mpqp.execution.simulators.density_matrix.simulate_density_matrix`.
+    The noise models are placed as described in
+    :mod:`~mpqp.execution.simulators.noise`, like in the noisy simulators of
+    the providers: after each gate, a noise model only acts on the qubits of
+    the gate that are in its targets.
 
     Args:
         circ: The circuit to run.
 
     Returns:
         The probabilities corresponding to each basis state.
-    """
-    d: int = 2**circ.nb_qubits
-
-    state = np.zeros((d, d), dtype=np.complex64)
-    state[0, 0] = 1
-    gates = circ.gates
-
-    for gate in gates:
-        g = gate.to_matrix(circ.nb_qubits).astype(np.complex64)
-        state = g @ state @ g.T.conj()
-        for noise in circ.noises:
-            if (
-                len(noise.gates) == 0
-                or type(gate) in noise.gates
-                and gate.connections().issubset(noise.targets)
-            ):
-                state = sum(
-                    (
-                        k @ state @ k.T.conj()
-                        for k in noise.to_adjusted_kraus_operators(
-                            gate.connections(), circ.nb_qubits
-                        )
-                    ),
-                    start=np.zeros((d, d), dtype=np.complex64),
-                )
 
-    connected_qubits = set().union(*[gate.connections() for gate in gates])
-    unconnected_qubits = set(range(circ.nb_qubits)).difference(connected_qubits)
-    for noise in circ.noises:
-        if len(noise.gates) == 0:
-            state = sum(
-                (
-                    k @ state @ k.T.conj()
-                    for k in noise.to_adjusted_kraus_operators(
-                        unconnected_qubits, circ.nb_qubits
-                    )
-                ),
-                start=np.zeros((d, d), dtype=np.complex64),
-            )
+    Example:
+        >>> theoretical_probs(QCircuit([H(0), CNOT(0, 1), BitFlip(0.1, [1])])).round(5)
+        array([0.45, 0.05, 0.05, 0.45], dtype=float32)
 
-    return state.diagonal().real
+    """
+    probabilities = simulate_density_matrix(circ).diagonal().real
+    return np.clip(probabilities, 0, None).astype(np.float32)
 
 
 @typechecked
@@ -1,10 +1,25 @@
 import numpy as np
 import numpy.typing as npt
 import pytest
+from sympy import I, cos, simplify, sin, symbols
 from mpqp.tools import matrix_eq
 
 from mpqp.core.circuit import QCircuit
-from mpqp.gates import SWAP, CustomGate, Gate, H, UnitaryMatrix, X, Z
+from mpqp.execution.simulators.statevector import apply_matrix, gate_qubits
+from mpqp.gates import (
+    CNOT,
+    CRk,
+    SWAP,
+    TOF,
+    CustomGate,
+    Gate,
+    H,
+    Rx,
+    U,
+    UnitaryMatrix,
+    X,
+    Z,
+)
 from mpqp.tools.errors import NumberQubitsWarning
 
 
@@ -145,3 +160,56 @@ def test_range(gates: list[Gate], targets: list[int]):
     circuit.add(gates)
 
     assert {instr.targets[0] for instr in circuit.instructions} == set(targets)
+
+
+def _embedded_reference(gate: Gate, nb_qubits: int):
+    dimension = 2**nb_qubits
+    identity = np.eye(dimension, dtype=np.complex128).reshape(
+        (2,) * nb_qubits + (dimension,)
+    )
+    matrix = np.asarray(gate.to_canonical_matrix(), dtype=np.complex128)
+    return apply_matrix(identity, matrix, gate_qubits(gate)).reshape(
+        dimension, dimension
+    )
+
+
+@pytest.mark.parametrize(
+    "gate",
+    [
+        X(2),
+        U(0.1, 0.2, 0.3, 1),
+        CNOT(3, 0),
+        CNOT(0, 3),
+        SWAP(3, 1),
+        CRk(3, 2, 0),
+        TOF([3, 0], 1),
+        CustomGate(UnitaryMatrix(np.kron(H(0).to_matrix(), X(0).to_matrix())), [1, 2]),
+    ],
+)
+def test_to_matrix_embedding(gate: Gate):
+    expected = _embedded_reference(gate, 5)
+    assert matrix_eq(gate.to_matrix(5), expected)
+    sparse = gate.to_sparse_matrix(5)
+    assert sparse.format == "csr"
+    assert matrix_eq(sparse.toarray(), expected)
+
+    qubits = gate_qubits(gate)
+    low, high = min(qubits), max(qubits)
+    assert matrix_eq(
+        np.kron(np.eye(2**low), gate.to_matrix()),
+        _embedded_reference(gate, high + 1),
+    )
+
+
+def test_to_matrix_symbolic():
+    theta = symbols("θ")
+    matrix = Rx(theta, 1).to_matrix(3)
+    assert matrix.shape == (8, 8)
+    assert simplify(matrix[0b010, 0b000] + I * sin(theta / 2)) == 0
+    assert simplify(matrix[0b101, 0b101] - cos(theta / 2)) == 0
+    assert matrix[0b010, 0b001] == 0
+
+
+def test_to_matrix_too_small():
+    with pytest.raises(ValueError):
+        CNOT(0, 3).to_matrix(3)
@@ -499,6 +499,46 @@ def test_to_matrix_random():
         matrix_eq(qcircuit.to_matrix(), expected_matrix)
 
 
+@pytest.mark.parametrize("seed", range(5))
+def test_to_matrix_matches_qiskit(seed: int):
+    from qiskit.quantum_info.operators import Operator
+
+    circuit = random_circuit(nb_qubits=4, nb_gates=30, seed=seed)
+    circuit.add(Barrier())
+    qiskit_circuit = circuit.to_other_language(Language.QISKIT)
+    if TYPE_CHECKING:
+        assert isinstance(qiskit_circuit, QiskitCircuit)
+    expected = Operator.from_circuit(qiskit_circuit).reverse_qargs().to_matrix()
+    assert isinstance(expected, np.ndarray)
+    assert matrix_eq(circuit.to_matrix(), expected)
+    assert matrix_eq(circuit.to_matrix(block_size=3), expected)
+    sparse = circuit.to_sparse_matrix()
+    assert sparse.format == "csr"
+    assert matrix_eq(sparse.toarray(), expected)
+
+
+def test_to_matrix_sparse_permutations():
+    nb_qubits = 12
+    circuit = QCircuit(
+        [X(0), CNOT(0, 5), TOF([5, 2], 11), SWAP(3, 9), CZ(1, 11), S(4), T(7)],
+        nb_qubits=nb_qubits,
+    )
+    sparse = circuit.to_sparse_matrix()
+    assert sparse.format == "csr"
+    assert sparse.nnz == 2**nb_qubits
+    assert matrix_eq(sparse.toarray(), circuit.to_matrix(block_size=1000))
+
+
+def test_to_matrix_measure():
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=10)])
+    with pytest.raises(ValueError):
+        circuit.to_matrix()
+    assert matrix_eq(
+        circuit.without_measurements().to_matrix(),
+        QCircuit([H(0), CNOT(0, 1)]).to_matrix(),
+    )
+
+
 @pytest.mark.parametrize(
     "circuit, expected_inverse",
     [
@@ -0,0 +1,105 @@
+from copy import deepcopy
+
+import pytest
+from sympy import symbols
+
+from mpqp import Barrier, Breakpoint, QCircuit
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+
+
+def metadata(circuit: QCircuit):
+    return (
+        circuit.gates,
+        circuit.measurements,
+        circuit.breakpoints,
+        circuit.variables(),
+        circuit.count_gates(),
+        circuit.count_gates(CNOT),
+        circuit.depth(),
+    )
+
+
+def fresh_metadata(circuit: QCircuit):
+    return metadata(QCircuit(list(circuit.instructions), nb_qubits=circuit.nb_qubits))
+
+
+@pytest.fixture(params=[False, True], ids=["list", "compact"])
+def circuit(request: pytest.FixtureRequest) -> QCircuit:
+    theta = symbols("θ")
+    return QCircuit(
+        [H(0), CNOT(0, 1), Rx(theta, 1), Barrier(), Breakpoint(), BasisMeasure()],
+        compact=request.param,  # pyright: ignore[reportAttributeAccessIssue]
+    )
+
+
+def test_metadata_cached(circuit: QCircuit):
+    first = metadata(circuit)
+    assert first == fresh_metadata(circuit)
+    assert len(circuit._cache) != 0  # pyright: ignore[reportPrivateUsage]
+    assert metadata(circuit) == first
+
+
+def test_cached_collections_are_copies(circuit: QCircuit):
+    circuit.gates.clear()
+    circuit.measurements.append(BasisMeasure())
+    circuit.variables().clear()
+    assert len(circuit.gates) == 3
+    assert len(circuit.measurements) == 1
+    assert len(circuit.variables()) == 1
+
+
+def test_cache_invalidated_by_add(circuit: QCircuit):
+    metadata(circuit)
+    circuit.add([Rz(symbols("φ"), 2), CNOT(1, 2), Breakpoint()])
+    assert metadata(circuit) == fresh_metadata(circuit)
+    assert circuit.count_gates(CNOT) == 2
+    assert len(circuit.variables()) == 2
+    circuit.append(QCircuit([CNOT(0, 1), BasisMeasure([0])]))
+    assert metadata(circuit) == fresh_metadata(circuit)
+    assert len(circuit.measurements) == 2
+
+
+def test_cache_invalidated_by_instructions_edition():
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure()])
+    metadata(circuit)
+    circuit.instructions.append(X(1))
+    assert circuit.count_gates(X) == 1
+    circuit.instructions = [H(0), H(1)]
+    assert circuit.measurements == [] and circuit.count_gates() == 2
+    assert metadata(circuit) == fresh_metadata(circuit)
+
+
+def test_cache_invalidated_by_replacement_in_place(circuit: QCircuit):
+    metadata(circuit)
+    circuit.instructions[1] = X(1)
+    assert CNOT(0, 1) not in circuit.gates
+    assert circuit.count_gates(CNOT) == 0 and circuit.count_gates(X) == 1
+    assert metadata(circuit) == fresh_metadata(circuit)
+    circuit.instructions[5] = BasisMeasure([0], c_targets=[0])
+    assert circuit.measurements == [BasisMeasure([0], c_targets=[0])]
+
+
+def test_cache_invalidated_by_registers():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    assert circuit.depth() == 2
+    circuit.nb_qubits = 4
+    circuit.add(BasisMeasure())
+    assert circuit.measurements[0].targets == [0, 1, 2, 3]
+    circuit.nb_cbits = 6
+    assert metadata(circuit) == fresh_metadata(circuit)
+
+
+def test_cache_not_shared(circuit: QCircuit):
+    metadata(circuit)
+    theta = circuit.variables().pop()
+    substituted = circuit.subs({theta: 0.4})  # pyright: ignore[reportArgumentType]
+    assert substituted.variables() == set()
+    assert circuit.variables() == {theta}
+
+    copied = deepcopy(circuit)
+    assert copied._cache == {}  # pyright: ignore[reportPrivateUsage]
+    assert copied == circuit and metadata(copied) == metadata(circuit)
+    copied.add(X(0))
+    assert copied.count_gates() == circuit.count_gates() + 1
+    assert circuit.to_dict() == QCircuit(list(circuit.instructions)).to_dict()
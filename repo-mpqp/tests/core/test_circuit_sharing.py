@@ -0,0 +1,167 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from sympy import symbols
+
+from mpqp import Barrier, QCircuit
+from mpqp.core.instruction_store import CompactInstructions
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.noise import Depolarizing
+from mpqp.tools.circuit import random_circuit
+
+gate_classes = [H, X, Z, S, T, Rx, Ry, Rz, P, CNOT, CZ, CP, SWAP, TOF]
+
+
+def blocks(compact: bool) -> tuple[QCircuit, QCircuit]:
+    first = random_circuit(gate_classes, 3, 20, 1)
+    first.add([Barrier(), BasisMeasure([0, 1])])
+    second = random_circuit(gate_classes[:-1], 2, 20, 2)
+    second.add(BasisMeasure())
+    if compact:
+        return first.to_compact(), second.to_compact()
+    return first, second
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_composition_unchanged(compact: bool):
+    first, second = blocks(compact)
+    before = deepcopy((first, second))
+
+    total = first + second
+    assert list(total.instructions)[: len(first)] == list(first.instructions)
+    assert len(total) == len(first) + len(second)
+    tensor = first @ second
+    assert tensor.nb_qubits == 5
+    assert [gate.connections() for gate in tensor.gates[len(first.gates) :]] == [
+        {qubit + 3 for qubit in gate.connections()} for gate in second.gates
+    ]
+    shifted = QCircuit(6, compact=compact)
+    shifted.append(second, 4)
+    assert shifted.gates[0].connections() == {
+        qubit + 4 for qubit in second.gates[0].connections()
+    }
+    # the measure of ``second`` spans all the qubits
+    assert shifted.measurements[0].targets == list(range(6))
+
+    assert (first, second) == before
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_compact_append_matches_list(compact: bool):
+    first, second = blocks(False)
+    expected = deepcopy(first)
+    expected.append(second, 1)
+    other = first.to_compact() if compact else first
+    result = other + QCircuit([])
+    result.append(second.to_compact(), 1)
+    assert list(result.instructions) == list(expected.instructions)
+    assert result.nb_cbits == expected.nb_cbits
+    assert result.depth() == expected.depth()
+
+
+def test_instructions_shared():
+    first, second = blocks(False)
+    total = first + second
+    assert total.instructions[0] is first.instructions[0]
+    assert total.instructions[len(first)] is second.instructions[0]
+    assert first.without_measurements().instructions[0] is first.instructions[0]
+    assert first.without_noises().instructions[0] is first.instructions[0]
+
+    total.instructions.append(X(0))
+    assert len(first) + len(second) + 1 == len(total)
+    assert first.instructions[-1] != X(0)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_measures_not_shared(compact: bool):
+    first, second = blocks(compact)
+    total = first + second
+    for circuit in (total, first @ second, first.without_noises()):
+        circuit.measurements[0].shots = 100
+        assert first.measurements[0].shots == 1024
+    total.measurements[-1].shots = 100
+    assert second.measurements[0].shots == 1024
+
+    gate = deepcopy(total.instructions[0])
+    gate.label = "modified"
+    total.instructions[0] = gate
+    assert total.instructions[0].label == "modified"
+    assert first.instructions[0].label != "modified"
+
+
+def test_components_given_editable():
+    measure = BasisMeasure(shots=10)
+    circuit = QCircuit([H(0), measure])
+    measure.shots = 100
+    assert circuit.measurements[0].shots == 10
+    circuit.measurements[0].shots = 20
+    assert circuit.measurements[0].shots == 20
+    assert measure.shots == 100
+    # the measures allocating classical bits are copied by the constructor
+    assert measure.c_targets is None
+    circuit.add(measure)
+    assert measure.c_targets == [1]
+
+
+def test_noises_not_shared():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    circuit.add(Depolarizing(0.1, [0]))
+    copied = circuit + QCircuit([X(1)])
+    copied.noises[0].targets = [1]
+    assert circuit.noises[0].targets == [0]
+
+
+def test_dynamic_components_copied():
+    circuit = QCircuit([H(0), CNOT(0, 1), Barrier(), BasisMeasure()])
+    tensor = circuit @ QCircuit([X(0)])
+    assert tensor.nb_qubits == 3
+    assert tensor.measurements[0].targets == [0, 1, 2]
+    barriers = tensor.instructions[2], circuit.instructions[2]
+    assert isinstance(barriers[0], Barrier) and isinstance(barriers[1], Barrier)
+    assert barriers[0].size == 3
+    assert circuit.measurements[0].targets == [0, 1]
+    assert barriers[1].size == 2
+
+    noisy = QCircuit([H(0), CNOT(0, 1)])
+    noisy.add(Depolarizing(0.1))
+    grown = noisy + QCircuit([H(2)])
+    assert grown.noises[0].targets == [0, 1, 2]
+    assert noisy.noises[0].targets == [0, 1]
+
+
+def test_self_append():
+    circuit = QCircuit([H(0), Rz(0.3, 1), BasisMeasure([0])], compact=True)
+    circuit += circuit
+    assert list(circuit.instructions) == [
+        H(0),
+        Rz(0.3, 1),
+        BasisMeasure([0], c_targets=[0]),
+        H(0),
+        Rz(0.3, 1),
+        BasisMeasure([0], c_targets=[1]),
+    ]
+
+
+def test_subs_shares_constant_instructions():
+    theta = symbols("θ")
+    circuit = QCircuit([H(0), Rx(theta, 0), Rz(0.5, 1), BasisMeasure()])
+    numeric = circuit.subs({theta: np.pi}, True)  # pyright: ignore[reportArgumentType]
+    assert numeric.instructions[0] is circuit.instructions[0]
+    assert numeric.instructions[2] is circuit.instructions[2]
+    assert numeric.instructions[1] == Rx(np.pi, 0)
+    assert circuit.instructions[1] == Rx(theta, 0)
+
+
+def test_compact_assembly():
+    block = QCircuit(
+        [CNOT(i % 8, (i + 1) % 8) for i in range(1000)], nb_qubits=8, compact=True
+    )
+    circuit = QCircuit(8, compact=True)
+    for _ in range(100):
+        circuit = circuit + block
+    assert len(circuit) == 100_000
+    assert circuit.count_gates(CNOT) == 100_000
+    assert isinstance(circuit.instructions, CompactInstructions)
+    assert circuit.instructions.qubits.reshape(-1, 2)[-1].tolist() == [7, 0]
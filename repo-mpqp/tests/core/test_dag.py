@@ -0,0 +1,155 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+
+from mpqp import Barrier, Breakpoint, Instruction, Language, QCircuit
+from mpqp.core.dag import CircuitDAG, commute
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import matrix_eq
+
+gate_classes = [H, X, Y, Z, S, T, Id, Rx, Ry, Rz, P, CNOT, CZ, CP, SWAP, TOF]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_depth_matches_qiskit(seed: int):
+    circuit = random_circuit(gate_classes, 5, 40, seed)
+    qiskit_circuit = circuit.to_other_language(Language.QISKIT)
+    assert isinstance(qiskit_circuit, QuantumCircuit)
+    assert circuit.depth() == qiskit_circuit.depth()
+    assert len(circuit.dag.layers()) == circuit.depth()
+
+
+@pytest.mark.parametrize(
+    "instructions, result",
+    [
+        ([], 0),
+        ([H(0), H(0), H(1), H(1)], 2),
+        ([H(0), Barrier(), H(1)], 2),
+        ([H(0), H(0), H(1), Barrier(), X(1)], 3),
+        ([H(0), Barrier()], 2),
+        ([H(0), CNOT(0, 1), BasisMeasure(), Breakpoint()], 2),
+    ],
+)
+def test_depth_barriers(instructions: list[Instruction], result: int):
+    assert QCircuit(instructions).depth() == result
+
+
+def test_dag_updated_by_add():
+    circuit = QCircuit(3)
+    dag = circuit.dag
+    for instruction in random_circuit(gate_classes, 3, 30, 1).instructions:
+        circuit.add(instruction)
+        assert circuit.dag is dag
+    circuit.append(QCircuit([Barrier(), H(0), CNOT(0, 1)]), 1)
+    assert circuit.dag is dag
+    rebuilt = CircuitDAG(circuit.instructions, circuit.nb_qubits)
+    assert dag.depth == rebuilt.depth
+    assert dag.layers() == rebuilt.layers()
+    assert [node.index for node in dag.wire(2)] == [
+        node.index for node in rebuilt.wire(2)
+    ]
+
+
+def test_dag_invalidation():
+    circuit = QCircuit([H(0), Barrier(), CNOT(0, 1)])
+    assert circuit.depth() == 2 and circuit.dag.nb_qubits == 2
+    circuit.add(X(2))
+    # the barrier now spans the new qubit
+    assert isinstance(circuit.dag.wire(2)[0].instruction, Barrier)
+    assert circuit.depth() == 2
+
+    circuit.instructions = circuit.instructions[:1]
+    assert circuit.depth() == 1
+    circuit.instructions.append(H(0))
+    assert circuit.depth() == 2
+
+    copied = deepcopy(circuit)
+    assert copied._dag is None  # pyright: ignore[reportPrivateUsage]
+    assert copied == circuit and copied.depth() == 2
+
+
+def test_dag_invalidated_by_replacement_in_place():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    assert circuit.depth() == 2
+    circuit.instructions[1] = X(1)
+    assert circuit.depth() == 1
+    assert circuit.dag.layers() == [[H(0), X(1)]]
+
+
+def test_dag_kept_by_gate_edition():
+    circuit = QCircuit([H(0), CNOT(1, 2), X(1)])
+    assert circuit.depth() == 2
+    gate = deepcopy(circuit.instructions[1])
+    assert isinstance(gate, ControlledGate)
+    gate.controls, gate.targets = [0], [2]
+    circuit.instructions[1] = gate
+    assert circuit.depth() == 2
+    assert circuit.dag.layers() == [[H(0), X(1)], [CNOT(0, 2)]]
+
+
+def test_front_layers():
+    circuit = random_circuit(gate_classes, 4, 50, 2)
+    circuit.add(BasisMeasure())
+    dag = circuit.dag
+    seen: set[int] = set()
+    for front in dag.front_layers():
+        for node in front:
+            assert all(pred.index in seen for pred in node.predecessors)
+        seen.update(node.index for node in front)
+    assert seen == set(range(len(circuit)))
+    assert dag.front_layer() == next(dag.front_layers())
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_schedule_is_equivalent(seed: int):
+    circuit = random_circuit(gate_classes, 4, 40, seed)
+    circuit.instructions.insert(20, Barrier())
+    dag = circuit.dag
+    assert dag.schedule(False) == dag.layers()
+    schedule = dag.schedule()
+    assert len(schedule) <= dag.depth
+    rescheduled = QCircuit(
+        [instruction for layer in schedule for instruction in layer],
+        nb_qubits=circuit.nb_qubits,
+    )
+    assert len(rescheduled) == len(circuit)
+    assert matrix_eq(rescheduled.to_matrix(), circuit.to_matrix())
+    for layer in schedule:
+        qubits = [
+            qubit
+            for gate in layer
+            if isinstance(gate, Gate)
+            for qubit in gate.connections()
+        ]
+        assert len(qubits) == len(set(qubits))
+
+
+def test_schedule_reduces_depth():
+    circuit = QCircuit([CNOT(i, i + 1) for i in range(4)] + [Rz(0.2, 0)] * 4)
+    circuit.add([CZ(0, 4), Rz(0.1, 4), CNOT(1, 2), CNOT(3, 2)])
+    assert circuit.depth() > len(circuit.dag.schedule())
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [
+        (Rz(0.1, 0), CZ(0, 1), True),
+        (X(1), CNOT(0, 1), True),
+        (CNOT(1, 0), CNOT(0, 1), False),
+        (TOF([0, 1], 2), CNOT(2, 0), False),
+        (TOF([0, 1], 2), Rz(0.3, 1), True),
+        (Id(0), H(0), True),
+        (H(0), H(0), False),
+        (Ry(0.2, 0), Y(0), True),
+    ],
+)
+def test_commute(first: Gate, second: Gate, expected: bool):
+    assert commute(first, second) == expected
+    if expected:
+        product = QCircuit([first, second], nb_qubits=3).to_matrix()
+        reversed_product = QCircuit([second, first], nb_qubits=3).to_matrix()
+        assert np.allclose(product, reversed_product)
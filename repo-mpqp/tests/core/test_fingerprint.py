@@ -0,0 +1,214 @@
+import pickle
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from sympy import symbols
+
+from mpqp import Barrier, QCircuit
+from mpqp.core.instruction.instruction import Instruction
+from mpqp.execution import IBMDevice
+from mpqp.execution.job import Job, JobType
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure, ExpectationMeasure
+from mpqp.measures import I as pauli_I
+from mpqp.measures import Observable
+from mpqp.measures import X as pauli_X
+from mpqp.measures import Z as pauli_Z
+from mpqp.noise import AmplitudeDamping, Depolarizing
+from mpqp.tools.circuit import random_circuit
+
+gate_classes = [H, X, Z, S, T, Rx, Ry, Rz, P, CNOT, CZ, CP, SWAP, TOF]
+
+
+def fresh(circuit: QCircuit) -> str:
+    copied = QCircuit(list(circuit.instructions), nb_qubits=circuit.nb_qubits)
+    copied.noises = circuit.noises
+    return copied.fingerprint()
+
+
+def test_list_and_compact_equal():
+    circuit = random_circuit(gate_classes, 4, 50, 3)
+    circuit.add([Barrier(), BasisMeasure(shots=10)])
+    assert circuit.fingerprint() == circuit.to_compact().fingerprint()
+    assert circuit.fingerprint() == deepcopy(circuit).fingerprint()
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        [H(0), CNOT(1, 0), Rz(0.5, 1)],
+        [H(0), CNOT(0, 1), Rz(0.5, 0)],
+        [H(0), CNOT(0, 1), Rz(0.6, 1)],
+        [H(0), CNOT(0, 1), Rx(0.5, 1)],
+        [H(0), CNOT(0, 1), Rz(symbols("θ"), 1)],
+        [H(0), CNOT(0, 1), Rz(0.5, 1), BasisMeasure(shots=100)],
+        [H(0), CNOT(0, 1), Rz(0.5, 1), BasisMeasure([0], shots=1000)],
+        [
+            H(0),
+            CNOT(0, 1),
+            Rz(0.5, 1),
+            ExpectationMeasure(Observable(pauli_Z @ pauli_Z)),
+        ],
+    ],
+)
+def test_sensitivity(other: list[Instruction]):
+    circuit = QCircuit([H(0), CNOT(0, 1), Rz(0.5, 1), BasisMeasure(shots=1000)])
+    assert circuit.fingerprint() != QCircuit(other).fingerprint()
+
+
+def test_registers_and_noise():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    fingerprint = circuit.fingerprint()
+    assert QCircuit([H(0), CNOT(0, 1)], nb_qubits=3).fingerprint() != fingerprint
+    circuit.add(Depolarizing(0.1))
+    assert circuit.fingerprint() != fingerprint
+    other = QCircuit([H(0), CNOT(0, 1)])
+    other.add(AmplitudeDamping(0.1))
+    assert other.fingerprint() != circuit.fingerprint()
+
+
+def test_numerical_tolerance():
+    assert (
+        QCircuit([Rx(0.1 + 0.2, 0), U(0.0, -0.0, np.pi, 0)]).fingerprint()
+        == QCircuit([Rx(0.3, 0), U(0.0, 0.0, np.pi, 0)]).fingerprint()
+    )
+    assert QCircuit([Rx(0.3001, 0)]).fingerprint(2) == QCircuit(
+        [Rx(0.3, 0)]
+    ).fingerprint(2)
+    assert (
+        QCircuit([Rx(0.3001, 0)]).fingerprint() != QCircuit([Rx(0.3, 0)]).fingerprint()
+    )
+
+
+def test_labels_ignored():
+    gate = Rx(0.3, 0)
+    gate.label = "label"
+    assert QCircuit([gate]).fingerprint() == QCircuit([Rx(0.3, 0)]).fingerprint()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_incremental(compact: bool):
+    circuit = QCircuit([H(0), CNOT(0, 1)], compact=compact)
+    fingerprints = {circuit.fingerprint()}
+    circuit.add([Rz(0.3, 2), Barrier(), CNOT(2, 0)])
+    assert circuit.fingerprint() == fresh(circuit)
+    fingerprints.add(circuit.fingerprint())
+    circuit.append(random_circuit(gate_classes, 3, 20, 4).to_compact(), 1)
+    assert circuit.fingerprint() == fresh(circuit)
+    fingerprints.add(circuit.fingerprint())
+    total = circuit + QCircuit([H(0), BasisMeasure()])
+    assert total.fingerprint() == fresh(total)
+    assert circuit.fingerprint() == fresh(circuit)
+    fingerprints.add(total.fingerprint())
+    assert len(fingerprints) == 4
+
+
+def test_direct_edition():
+    circuit = QCircuit([H(0), CNOT(0, 1), X(1)])
+    circuit.fingerprint()
+    circuit.instructions.append(Y(0))
+    assert circuit.fingerprint() == fresh(circuit)
+    circuit.instructions.pop(0)
+    circuit.instructions.pop(0)
+    assert circuit.fingerprint() == fresh(circuit)
+    circuit.add(Z(1))
+    assert circuit.fingerprint() == fresh(circuit)
+    circuit.instructions = [H(0), H(1)]
+    assert circuit.fingerprint() == fresh(circuit)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_replacement_in_place(compact: bool):
+    circuit = QCircuit([H(0), CNOT(0, 1)], compact=compact)
+    fingerprint = circuit.fingerprint()
+    circuit.instructions[0] = X(0)
+    assert circuit.fingerprint() != fingerprint
+    assert circuit.fingerprint() == QCircuit([X(0), CNOT(0, 1)]).fingerprint()
+
+
+def test_gate_edition():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    fingerprint = circuit.fingerprint()
+    gate = deepcopy(circuit.instructions[1])
+    assert isinstance(gate, ControlledGate)
+    gate.controls, gate.targets = [1], [0]
+    circuit.instructions[1] = gate
+    assert circuit.fingerprint() != fingerprint
+    assert circuit.fingerprint() == QCircuit([H(0), CNOT(1, 0)]).fingerprint()
+
+
+def test_measure_edition_in_place():
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=10)])
+    fingerprint = circuit.fingerprint()
+    circuit.measurements[0].shots = 100
+    assert circuit.fingerprint() != fingerprint
+    expected = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=100)])
+    assert circuit.fingerprint() == expected.fingerprint()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_insertion_in_the_middle(compact: bool):
+    first = QCircuit([H(0), CNOT(0, 1)], compact=compact)
+    second = QCircuit([H(0), CNOT(0, 1)], compact=compact)
+    first.fingerprint()
+    second.fingerprint()
+    first.instructions.insert(0, X(1))
+    second.instructions.insert(1, X(1))
+    assert first.fingerprint() != second.fingerprint()
+    assert first.fingerprint() == fresh(first)
+    assert second.fingerprint() == fresh(second)
+
+
+def test_copies():
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure()])
+    fingerprint = circuit.fingerprint()
+    copied = deepcopy(circuit)
+    assert copied.fingerprint() == fingerprint
+    assert pickle.loads(pickle.dumps(circuit)).fingerprint() == fingerprint
+    assert copied == circuit
+    copied.add(X(0))
+    assert circuit.fingerprint() == fingerprint
+
+
+def test_observable():
+    assert (
+        Observable(np.diag([1, -1, -1, 1])).fingerprint()
+        == Observable([1, -1, -1, 1]).fingerprint()
+        == Observable(pauli_Z @ pauli_Z).fingerprint()
+    )
+    assert (
+        Observable(pauli_X @ pauli_I + pauli_Z @ pauli_Z).fingerprint()
+        == Observable(pauli_Z @ pauli_Z + pauli_X @ pauli_I).fingerprint()
+    )
+    assert (
+        Observable(pauli_X @ pauli_I).fingerprint()
+        != Observable(pauli_I @ pauli_X).fingerprint()
+    )
+    assert (
+        Observable(pauli_X @ pauli_I).fingerprint()
+        != Observable(2 * pauli_X @ pauli_I).fingerprint()
+    )
+
+
+def test_job():
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=100)])
+    job = Job(JobType.SAMPLE, circuit, IBMDevice.AER_SIMULATOR, circuit.measurements[0])
+    copied = deepcopy(circuit)
+    assert (
+        job.fingerprint
+        == Job(
+            JobType.SAMPLE, copied, IBMDevice.AER_SIMULATOR, copied.measurements[0]
+        ).fingerprint
+    )
+    other = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=200)])
+    assert (
+        job.fingerprint
+        != Job(
+            JobType.SAMPLE, other, IBMDevice.AER_SIMULATOR, other.measurements[0]
+        ).fingerprint
+    )
+    assert (
+        job.fingerprint
+        != Job(JobType.STATE_VECTOR, circuit, IBMDevice.AER_SIMULATOR).fingerprint
+    )
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+from sympy import symbols
+
+from mpqp import Barrier, Breakpoint, Language, QCircuit
+from mpqp.core.instruction_store import CompactInstructions, iter_templates
+from mpqp.execution import IBMDevice, MPQPDevice, run
+from mpqp.execution.result import Result
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import matrix_eq
+
+gate_classes = [H, X, Y, Z, S, T, S_dagger, Id, Rx, Ry, Rz, U, P, Rk]
+gate_classes += [CNOT, CZ, SWAP, CP, CRk, TOF]
+
+
+def circuit_pair(seed: int) -> tuple[QCircuit, QCircuit]:
+    circuit = random_circuit(gate_classes, 4, 40, seed)
+    instructions = list(circuit.instructions)
+    instructions.insert(seed % len(instructions), Barrier())
+    instructions += [Breakpoint(), CustomGate(np.eye(2), [1]), BasisMeasure([0, 2])]
+    return (
+        QCircuit(instructions, nb_qubits=4),
+        QCircuit(instructions, nb_qubits=4, compact=True),
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compact_circuit_api(seed: int):
+    circuit, compact = circuit_pair(seed)
+    assert isinstance(compact.instructions, CompactInstructions)
+    assert compact == circuit
+    assert list(compact.instructions) == circuit.instructions
+    assert compact.depth() == circuit.depth()
+    assert compact.count_gates() == circuit.count_gates()
+    assert compact.count_gates(CNOT) == circuit.count_gates(CNOT)
+    assert compact.gates == circuit.gates
+    assert compact.measurements == circuit.measurements
+    assert compact.breakpoints == circuit.breakpoints
+    assert compact.without_measurements() == circuit.without_measurements()
+    assert compact.without_breakpoints() == circuit.without_breakpoints()
+    assert compact.inverse() == circuit.inverse()
+    assert circuit.to_compact() == compact
+    assert repr(compact) == repr(circuit)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_compact_circuit_translation(seed: int):
+    circuit, compact = circuit_pair(seed)
+    for language in [Language.QASM2, Language.QASM3]:
+        assert compact.to_other_language(language) == circuit.to_other_language(
+            language
+        )
+    assert str(compact.to_other_language(Language.QISKIT)) == str(
+        circuit.to_other_language(Language.QISKIT)
+    )
+    assert str(compact.to_other_language(Language.CIRQ)) == str(
+        circuit.to_other_language(Language.CIRQ)
+    )
+
+
+def test_compact_circuit_symbolic():
+    theta, k = symbols("θ k")
+    instructions = [H(0), Rx(theta, 1), CRk(k, 0, 1), Ry(theta + 1, 0)]
+    compact = QCircuit(instructions, compact=True)
+    assert compact.variables() == {theta, k}
+    # the type checker does not know that floats are numbers.Complex
+    partial = compact.subs({theta: 0.5})  # pyright: ignore[reportArgumentType]
+    assert partial.variables() == {k}
+    assert isinstance(compact.instructions, CompactInstructions)
+    assert np.isnan(compact.instructions.parameters).sum() == 3
+
+    values = {theta: 0.5, k: 2}
+    numeric = compact.subs(values, True)  # pyright: ignore[reportArgumentType]
+    assert isinstance(numeric.instructions, CompactInstructions)
+    assert not np.isnan(numeric.instructions.parameters).any()
+    expected = QCircuit(instructions).subs(
+        values, True  # pyright: ignore[reportArgumentType]
+    )
+    assert matrix_eq(numeric.to_matrix(), expected.to_matrix())
+
+
+def test_compact_instructions_edition():
+    instructions = CompactInstructions([H(0), Rx(0.3, 1), BasisMeasure()])
+    instructions.insert(1, CNOT(1, 0))
+    instructions[2] = Ry(0.4, 2)
+    del instructions[0]
+    instructions.append(Barrier())
+    assert list(instructions) == [CNOT(1, 0), Ry(0.4, 2), BasisMeasure(), Barrier()]
+    assert instructions.opcodes.tolist() == [0, 11, -1, -1]
+
+    filtered = instructions.without(BasisMeasure)
+    assert list(filtered) == [CNOT(1, 0), Ry(0.4, 2), Barrier()]
+    assert filtered.qubit_offsets.tolist() == [0, 2, 3, 3]
+    assert filtered.parameter_offsets.tolist() == [0, 0, 1, 1]
+    assert len(instructions) == 4
+
+
+def test_iter_templates_shared():
+    instructions = CompactInstructions([Rz(0.1, i % 3) for i in range(30)])
+    templates = list(iter_templates(instructions))
+    assert len({id(template) for template, _ in templates}) == 1
+    assert [qubits for _, qubits in templates] == [[i % 3] for i in range(30)]
+
+
+def test_compact_circuit_memory():
+    gates = [Rz(0.1 * (i % 5), i % 8) for i in range(2000)]
+    compact = CompactInstructions(gates)
+    assert compact.count_instances(Rz) == 2000
+    assert compact.qubits.nbytes + compact.parameters.nbytes <= 2000 * 12
+
+
+@pytest.mark.parametrize(
+    "device", [MPQPDevice.STATEVECTOR_SIMULATOR, IBMDevice.AER_SIMULATOR]
+)
+def test_run_compact_circuit(device: MPQPDevice | IBMDevice):
+    circuit = random_circuit(gate_classes, 4, 100, 2)
+    circuit.add(BasisMeasure(shots=0))
+    result, compact_result = run(circuit, device), run(circuit.to_compact(), device)
+    assert isinstance(result, Result) and isinstance(compact_result, Result)
+    assert matrix_eq(result.amplitudes, compact_result.amplitudes)
@@ -0,0 +1,136 @@
+from numbers import Complex
+
+import numpy as np
+import pytest
+from sympy import Expr, symbols
+
+from mpqp import ParametricCircuit, QCircuit
+from mpqp.core.instruction_store import CompactInstructions
+from mpqp.execution import IBMDevice, MPQPDevice, run, run_sweep
+from mpqp.execution.result import Result
+from mpqp.execution.runner import generate_job
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
+from mpqp.tools.maths import matrix_eq
+
+theta, phi, k = symbols("θ φ k")
+
+
+def symbolic_circuit() -> QCircuit:
+    # a gate with a label is kept as is by the compact form
+    labeled = Ry(theta, 2)
+    labeled.label = "labeled"
+    return QCircuit(
+        [
+            H(0),
+            Rx(theta, 0),
+            CNOT(0, 1),
+            Rz(2 * phi - theta, 1),
+            U(theta, np.pi / 2, phi, 2),
+            CRk(k, 1, 2),
+            labeled,
+            P(np.pi / 4, 0),
+            BasisMeasure(shots=0),
+        ]
+    )
+
+
+@pytest.mark.parametrize("point", [[0.1, 2, -0.4], [np.pi, 3, 0.0]])
+def test_bind_matches_subs(point: list[float]):
+    circuit = symbolic_circuit()
+    template = ParametricCircuit(circuit, [theta, k, phi])
+    # the type checker does not know that floats are numbers.Complex
+    values: dict[Expr | str, Complex] = {
+        var: value  # pyright: ignore[reportAssignmentType]
+        for var, value in zip([theta, k, phi], point)
+    }
+    bound = template.bind(point)
+    assert isinstance(bound.instructions, CompactInstructions)
+    assert bound.variables() == set()
+    expected = circuit.to_compact().subs(values, True)
+    assert bound == expected
+    assert matrix_eq(
+        bound.without_measurements().to_matrix(),
+        circuit.without_measurements().subs(values, True).to_matrix(),
+    )
+    assert template.bind(values) == bound
+    by_name: dict[Expr | str, Complex] = {
+        str(var): value for var, value in values.items()
+    }
+    assert template.bind(by_name) == bound
+
+
+def test_bound_circuits_independent():
+    circuit = symbolic_circuit()
+    template = ParametricCircuit(circuit)
+    first = template.bind([0.1, 2, 0.3])
+    second = template.bind([0.2, 2, 0.3])
+    first.add(X(1))
+    assert len(second) == len(circuit)
+    assert second.count_gates(X) == 0
+    assert circuit.variables() == {theta, phi, k}
+    assert template.bind([0.2, 2, 0.3]) == second
+
+
+def test_bind_errors():
+    template = ParametricCircuit(symbolic_circuit())
+    with pytest.raises(ValueError):
+        template.bind({theta: 0.1, k: 2})  # pyright: ignore[reportArgumentType]
+    with pytest.raises(ValueError):
+        template.bind([0.1, 2])
+    with pytest.raises(ValueError):
+        ParametricCircuit(symbolic_circuit(), [theta, phi])
+
+
+def test_bind_complex_values():
+    template = ParametricCircuit(symbolic_circuit(), [theta, k, phi])
+    expected = template.bind([0.1, 2, 0.3])
+    values: dict[Expr | str, Complex] = {
+        theta: 0.1 + 0j,  # pyright: ignore[reportAssignmentType]
+        k: 2,
+        phi: 0.3,
+    }
+    assert template.bind(values) == expected
+    assert template.bind(np.array([0.1, 2, 0.3], dtype=complex)) == expected
+    with pytest.raises(ValueError, match="complex value"):
+        template.bind(
+            {theta: 0.1 + 0.2j, k: 2, phi: 0.3}  # pyright: ignore[reportArgumentType]
+        )
+    with pytest.raises(ValueError, match="complex values"):
+        template.bind(np.array([0.1, 2, 0.3j]))
+
+
+def test_numeric_circuit():
+    circuit = QCircuit([H(0), Rx(np.pi / 3, 1), CNOT(0, 1)])
+    template = ParametricCircuit(circuit)
+    assert template.parameters == []
+    assert template.bind([]) == circuit.subs({}, True)
+
+
+@pytest.mark.parametrize(
+    "device", [MPQPDevice.STATEVECTOR_SIMULATOR, IBMDevice.AER_SIMULATOR]
+)
+def test_run_parametric_circuit(device: MPQPDevice | IBMDevice):
+    circuit = symbolic_circuit()
+    template = ParametricCircuit(circuit)
+    values: dict[Expr | str, Complex] = {
+        theta: 0.3,  # pyright: ignore[reportAssignmentType]
+        phi: 1.2,
+        k: 2,
+    }
+    result = run(template, device, values)
+    expected = run(circuit, device, values)
+    assert isinstance(result, Result) and isinstance(expected, Result)
+    assert matrix_eq(result.amplitudes, expected.amplitudes)
+
+    job = generate_job(template, device, values)
+    assert job.circuit == generate_job(circuit.to_compact(), device, values).circuit
+
+
+def test_sweep_point_by_point():
+    circuit = QCircuit(
+        [Rx(theta, 0), Ry(2 * theta, 1), ExpectationMeasure(Observable(np.eye(4)))]
+    )
+    sweep = run_sweep(circuit, IBMDevice.AER_SIMULATOR, np.linspace(0, 1, 3))
+    assert isinstance(sweep.expectation_values, np.ndarray)
+    assert np.allclose(sweep.expectation_values, 1)
@@ -0,0 +1,189 @@
+import warnings
+from pathlib import Path
+from typing import Any
+
+import pytest
+from braket.circuits import Circuit as BraketCircuit
+from braket.circuits.result_types import StateVector
+from qiskit import QuantumCircuit
+
+from mpqp import QCircuit
+from mpqp.core.languages import Language
+from mpqp.core.translation_cache import TranslationCache, translation_cache
+from mpqp.execution import (
+    ATOSDevice,
+    AvailableDevice,
+    AWSDevice,
+    GOOGLEDevice,
+    IBMDevice,
+)
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+
+
+def bell() -> QCircuit:
+    return QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=100)])
+
+
+def same(first: Any, second: Any) -> bool:
+    # the representation of the myQLM circuits contains addresses
+    return str(getattr(first, "ops", first)) == str(getattr(second, "ops", second))
+
+
+@pytest.fixture
+def cache():
+    translation_cache.clear()
+    translation_cache.maxsize = 128
+    yield translation_cache
+    translation_cache.maxsize = 0
+    translation_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "language",
+    [Language.QISKIT, Language.BRAKET, Language.CIRQ, Language.MY_QLM, Language.QASM2],
+)
+def test_hit(cache: TranslationCache, language: Language):
+    first = bell().to_other_language(language)
+    second = bell().to_other_language(language)
+    assert cache.info().hits == 1 and cache.info().misses == 1
+    assert same(first, second)
+    if language != Language.QASM2:
+        assert first is not second
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        IBMDevice.AER_SIMULATOR,
+        AWSDevice.BRAKET_LOCAL_SIMULATOR,
+        GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+        ATOSDevice.MYQLM_PYLINALG,
+    ],
+)
+def test_device_hit(cache: TranslationCache, device: AvailableDevice):
+    first = bell().to_other_device(device)
+    assert same(bell().to_other_device(device), first)
+    assert cache.info().hits == 1
+
+
+def test_keys(cache: TranslationCache):
+    circuit = bell()
+    circuit.to_other_language(Language.QISKIT)
+    circuit.to_other_language(Language.QISKIT, skip_pre_measure=True)
+    circuit.to_other_language(Language.CIRQ)
+    QCircuit([H(0), CNOT(1, 0), BasisMeasure(shots=100)]).to_other_language()
+    labeled = bell()
+    labeled.label = "bell"
+    translated = labeled.to_other_language()
+    assert isinstance(translated, QuantumCircuit) and translated.name == "bell"
+    assert cache.info().misses == 5 and cache.info().hits == 0
+    circuit.add(X(0))
+    circuit.to_other_language(Language.QISKIT)
+    assert cache.info().misses == 6
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_edition_in_place(cache: TranslationCache, compact: bool):
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure()], compact=compact)
+
+    def qasm2() -> str:
+        code = circuit.to_other_language(Language.QASM2)
+        assert isinstance(code, str)
+        return code
+
+    assert "cx q[0],q[1];" in qasm2()
+    circuit.instructions[1] = X(1)
+    code = qasm2()
+    assert "cx" not in code and "x q[1];" in code
+    circuit.instructions.insert(1, CZ(0, 1))
+    assert "cz q[0],q[1];" in qasm2()
+    assert cache.info().hits == 0 and cache.info().misses == 3
+
+
+def test_disabled_by_default():
+    translation_cache.clear()
+    assert not TranslationCache().enabled and not translation_cache.enabled
+    bell().to_other_language(Language.QISKIT)
+    bell().to_other_language(Language.QISKIT)
+    assert translation_cache.info().size == 0 and translation_cache.info().hits == 0
+
+
+def test_copies(cache: TranslationCache):
+    translated = bell().to_other_language(Language.QISKIT)
+    assert isinstance(translated, QuantumCircuit)
+    translated.x(0)
+    translated = bell().to_other_language(Language.QISKIT)
+    assert isinstance(translated, QuantumCircuit)
+    assert "x" not in translated.count_ops()
+    braket_circuit = bell().to_other_device(AWSDevice.BRAKET_LOCAL_SIMULATOR)
+    assert isinstance(braket_circuit, BraketCircuit)
+    braket_circuit.add_result_type(StateVector())
+    braket_circuit = bell().to_other_device(AWSDevice.BRAKET_LOCAL_SIMULATOR)
+    assert isinstance(braket_circuit, BraketCircuit)
+    assert len(braket_circuit.result_types) == 0
+
+
+def test_lru():
+    cache = TranslationCache(maxsize=2)
+    circuits = [QCircuit([Rx(0.1 * i, 0)]) for i in range(3)]
+
+    def translate(circuit: QCircuit):
+        return cache.translate(
+            circuit,
+            Language.QASM2,
+            (),
+            lambda: circuit.to_other_language(Language.QASM2),
+        )
+
+    for circuit in circuits:
+        translate(circuit)
+    translate(circuits[2])
+    translate(circuits[0])
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 4, 2)
+    cache.clear()
+    assert cache.info().size == 0 and cache.info().misses == 0
+
+
+def test_disabled():
+    cache = TranslationCache(maxsize=0)
+    circuit = bell()
+    for _ in range(2):
+        cache.translate(circuit, Language.QISKIT, (), circuit.to_other_language)
+    assert cache.info().misses == 0 and cache.info().size == 0
+
+
+def test_warnings_replayed(cache: TranslationCache):
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    circuit.add(BasisMeasure())
+
+    def translate():
+        warnings.warn("translation warning")
+        return "translated"
+
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="translation warning"):
+            assert (
+                cache.translate(circuit, Language.QASM2, ("test",), translate)
+                == "translated"
+            )
+    assert cache.info().hits == 1
+
+
+def test_disk(tmp_path: Path):
+    cache = TranslationCache(directory=str(tmp_path))
+    circuit = bell()
+
+    def translate():
+        return circuit.to_other_device(IBMDevice.AER_SIMULATOR)
+
+    first = cache.translate(circuit, IBMDevice.AER_SIMULATOR, (), translate)
+    assert len(list(tmp_path.glob("*.qpy"))) == 1
+
+    other = TranslationCache(directory=str(tmp_path))
+    loaded = other.translate(bell(), IBMDevice.AER_SIMULATOR, (), translate)
+    assert other.info().disk_hits == 1 and other.info().misses == 0
+    assert loaded == first
+    other.clear(disk=True)
+    assert len(list(tmp_path.glob("*.qpy"))) == 0
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
+from mpqp.execution import MPQPDevice, run
+from mpqp.execution.result import Result
+from mpqp.execution.simulators.density_matrix import (
+    apply_channel,
+    expectation_from_density_matrix,
+    simulate_density_matrix,
+)
+from mpqp.execution.simulators.statevector import simulate_state_vector
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.noise import AmplitudeDamping, BitFlip, Depolarizing, PhaseDamping
+from mpqp.noise.noise_model import NoiseModel
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.errors import DeviceJobIncompatibleError
+from mpqp.tools.maths import matrix_eq, rand_hermitian_matrix
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_noiseless_density_matrix_matches_state_vector(seed: int):
+    circuit = random_circuit(nb_qubits=4, nb_gates=15, seed=seed)
+    state = simulate_state_vector(circuit)
+    assert matrix_eq(simulate_density_matrix(circuit), np.outer(state, state.conj()))
+
+
+@pytest.mark.parametrize(
+    "noise",
+    [
+        Depolarizing(0.3, [1]),
+        Depolarizing(0.3, [0, 2], dimension=2),
+        BitFlip(0.2, [2]),
+        AmplitudeDamping(0.4, targets=[0]),
+        AmplitudeDamping(0.2, 0.3, [1]),
+        PhaseDamping(0.6, [2]),
+    ],
+)
+def test_apply_channel_matches_dense_products(noise: NoiseModel):
+    rho = simulate_density_matrix(random_circuit(nb_qubits=3, nb_gates=10, seed=1))
+    expected = np.sum(
+        [
+            k @ rho @ k.conj().T
+            for k in noise.to_adjusted_kraus_operators(set(noise.targets), 3)
+        ],
+        axis=0,
+    )
+    kraus = [np.asarray(k, dtype=complex) for k in noise.to_kraus_operators()]
+    result = apply_channel(rho.reshape((2,) * 6), kraus, noise.targets)
+    assert matrix_eq(result.reshape(8, 8), expected)
+
+
+@pytest.mark.parametrize(
+    "noise",
+    [
+        Depolarizing(0.3),
+        Depolarizing(0.1, [0, 1], dimension=2),
+        BitFlip(0.2),
+        AmplitudeDamping(0.36),
+        AmplitudeDamping(0.2, 0.3),
+        PhaseDamping(0.6),
+    ],
+)
+def test_kraus_operators_completeness(noise: NoiseModel):
+    kraus = [np.asarray(k, dtype=complex) for k in noise.to_kraus_operators()]
+    identity = np.eye(kraus[0].shape[0])
+    assert matrix_eq(np.sum([k.conj().T @ k for k in kraus], axis=0), identity)
+
+
+def test_noisy_density_matrix_is_valid():
+    circuit = random_circuit(nb_qubits=4, nb_gates=20, seed=3)
+    circuit.add([Depolarizing(0.1), AmplitudeDamping(0.2, 0.3), PhaseDamping(0.1)])
+    rho = simulate_density_matrix(circuit)
+    assert np.isclose(np.trace(rho), 1)
+    assert matrix_eq(rho, rho.conj().T)
+    assert np.all(np.linalg.eigvalsh(rho) > -1e-10)
+
+
+def test_density_matrix_device():
+    circuit = QCircuit(
+        [H(0), CNOT(0, 1), BitFlip(0.1, [1]), BasisMeasure([0, 1], shots=10000)]
+    )
+    result = run(circuit, MPQPDevice.DENSITY_MATRIX_SIMULATOR)
+    assert isinstance(result, Result)
+    assert np.allclose(result.probabilities, [0.45, 0.05, 0.05, 0.45], atol=0.03)
+
+
+def test_density_matrix_device_observable():
+    observable = rand_hermitian_matrix(4)
+    circuit = QCircuit([H(0), CNOT(0, 1), Depolarizing(0.2, [0])])
+    rho = simulate_density_matrix(circuit)
+    circuit.add(ExpectationMeasure(Observable(observable)))
+    result = run(circuit, MPQPDevice.DENSITY_MATRIX_SIMULATOR)
+    assert isinstance(result, Result)
+    expected, _ = expectation_from_density_matrix(rho, observable)
+    assert isinstance(result.expectation_values, float)
+    assert np.isclose(result.expectation_values, expected)
+
+
+def test_density_matrix_device_refuses_state_vector():
+    with pytest.raises(DeviceJobIncompatibleError):
+        run(QCircuit([H(0)]), MPQPDevice.DENSITY_MATRIX_SIMULATOR)
+
+
+def test_statevector_device_refuses_noise():
+    circuit = QCircuit([H(0), BitFlip(0.1), BasisMeasure([0], shots=10)])
+    with pytest.raises(DeviceJobIncompatibleError):
+        run(circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
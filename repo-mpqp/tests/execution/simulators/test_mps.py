@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
+from mpqp.execution import MPQPDevice, run
+from mpqp.execution.job import Job, JobType
+from mpqp.execution.providers.mpqp_simulators import run_mpqp
+from mpqp.execution.result import Result
+from mpqp.execution.simulators.mps import MPSConfig, mps_config, simulate_mps
+from mpqp.execution.simulators.statevector import simulate_state_vector
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure, I, X, Y, Z
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import matrix_eq
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_mps_matches_state_vector(seed: int):
+    circuit = random_circuit(nb_qubits=5, nb_gates=30, seed=seed)
+    assert matrix_eq(
+        simulate_mps(circuit).to_state_vector(), simulate_state_vector(circuit)
+    )
+
+
+@pytest.mark.parametrize(
+    "gates",
+    [
+        [H(4), CNOT(4, 0), TOF([4, 0], 2)],
+        [H(1), TOF([3, 1], 0), CRk(3, 1, 4), SWAP(0, 3)],
+        [CustomGate(UnitaryMatrix(np.kron(np.eye(2), [[0, 1], [1, 0]])), [1, 2])],
+    ],
+)
+def test_mps_non_adjacent_gates(gates: list[Gate]):
+    circuit = QCircuit(gates, nb_qubits=5)
+    assert matrix_eq(
+        simulate_mps(circuit).to_state_vector(), simulate_state_vector(circuit)
+    )
+
+
+def test_mps_expectation():
+    circuit = random_circuit(nb_qubits=4, nb_gates=30, seed=2)
+    observable = 0.3 * X @ Y @ I @ Z + 2 * Z @ Z @ Z @ I - I @ I @ X @ X
+    state = simulate_state_vector(circuit)
+    expected = np.vdot(state, observable.to_matrix() @ state).real
+    value, error = simulate_mps(circuit).expectation(observable)
+    assert np.isclose(value, expected)
+    assert error == 0
+
+
+def test_mps_truncation():
+    circuit = random_circuit([H, Ry, CNOT, CZ], nb_qubits=6, nb_gates=40, seed=1)
+    mps = simulate_mps(circuit, MPSConfig(max_bond_dimension=2))
+    assert max(mps.bond_dimensions) <= 2
+    assert mps.truncation_error > 0
+    assert np.isclose(np.linalg.norm(mps.to_state_vector()), 1)
+
+
+def test_mps_sample_statistics():
+    circuit = QCircuit([H(0), Ry(1.1, 3), CNOT(0, 2), CNOT(3, 1)])
+    probabilities = np.abs(simulate_state_vector(circuit)) ** 2
+    marginal = probabilities.reshape(2, 2, 2, 2).sum(axis=(0, 2)).reshape(-1)
+    shots = 20000
+    counts = simulate_mps(circuit).sample([1, 3], shots)
+    frequencies = np.array([counts.get(i, 0) for i in range(4)]) / shots
+    assert np.allclose(frequencies, marginal, atol=0.02)
+
+
+def test_mps_device_many_qubits():
+    nb_qubits = 80
+    circuit = QCircuit(
+        [Ry(0.1 * i, i) for i in range(nb_qubits)]
+        + [CNOT(i, i + 1) for i in range(nb_qubits - 1)]
+        + [BasisMeasure(list(range(nb_qubits)), shots=500)]
+    )
+    result = run(circuit, MPQPDevice.MPS_SIMULATOR)
+    assert isinstance(result, Result)
+    assert sum(sample.count or 0 for sample in result.samples) == 500
+    assert result.error == 0
+
+    observable = Observable(Z @ Z @ Z + 0.5 * X @ I @ Y)
+    circuit = circuit.without_measurements()
+    circuit.add(ExpectationMeasure(observable, [10, 11, 12]))
+    result = run(circuit, MPQPDevice.MPS_SIMULATOR)
+    assert isinstance(result, Result)
+    assert isinstance(result.expectation_values, float)
+
+
+def test_mps_device_reports_truncation():
+    max_bond_dimension = mps_config.max_bond_dimension
+    mps_config.max_bond_dimension = 1
+    try:
+        circuit = random_circuit([H, Ry, CNOT, CZ], nb_qubits=5, nb_gates=30, seed=0)
+        circuit.add(BasisMeasure(shots=100))
+        result = run(circuit, MPQPDevice.MPS_SIMULATOR)
+        assert isinstance(result, Result)
+        assert isinstance(result.error, float) and result.error > 0
+    finally:
+        mps_config.max_bond_dimension = max_bond_dimension
+
+
+def test_mps_device_leaves_the_global_phase_of_the_circuit():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    circuit.gphase = 0.3
+    result = run_mpqp(Job(JobType.STATE_VECTOR, circuit, MPQPDevice.MPS_SIMULATOR))
+    assert circuit.gphase == 0.3
+    assert matrix_eq(result.amplitudes, np.array([1, 0, 0, 1]) / np.sqrt(2))
+
+
+def test_mps_device_seeds_the_expectation_shots():
+    observable = Observable(X @ X + 0.5 * Z @ I)
+    measure = ExpectationMeasure(observable, shots=100)
+    circuit = QCircuit([H(0), CNOT(0, 1), measure])
+    values = []
+    for seed in [7, 7, 8]:
+        job = Job(JobType.OBSERVABLE, circuit, MPQPDevice.MPS_SIMULATOR, measure)
+        job.seed = seed
+        values.append(run_mpqp(job).expectation_values)
+    assert values[0] == values[1] != values[2]
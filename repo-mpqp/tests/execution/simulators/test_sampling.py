@@ -0,0 +1,88 @@
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from mpqp import QCircuit
+from mpqp.execution import MPQPDevice, StateVector, run
+from mpqp.execution.result import Result
+from mpqp.execution.simulators.sampling import Sampler, sampling_config
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+
+
+@pytest.fixture
+def seeded_sampling():
+    sampling_config.seed = 7
+    yield
+    sampling_config.seed = None
+
+
+def test_sampler_statistics():
+    probabilities = np.random.default_rng(0).dirichlet(np.ones(16))
+    probabilities[[3, 9]] = 0
+    sampler = Sampler(probabilities / probabilities.sum(), seed=1)
+    shots = 200000
+
+    counts = sampler.counts(shots)
+    assert isinstance(counts, np.ndarray)
+    assert counts.sum() == shots and counts[3] == counts[9] == 0
+    assert np.allclose(counts / shots, probabilities / probabilities.sum(), atol=0.01)
+
+    outcomes = sampler.shots(shots)
+    assert len(outcomes) == shots and not np.isin(outcomes, [3, 9]).any()
+    frequencies = np.bincount(outcomes, minlength=16) / shots
+    assert np.allclose(frequencies, probabilities / probabilities.sum(), atol=0.01)
+
+
+def test_sampler_sparse_counts():
+    probabilities = np.zeros(2**20)
+    probabilities[[0, 2**20 - 1]] = [0.25, 0.75]
+    counts = Sampler(probabilities, seed=0).counts(10**7, sparse=True)
+    assert isinstance(counts, dict)
+    assert set(counts) == {0, 2**20 - 1} and sum(counts.values()) == 10**7
+    assert abs(counts[0] / 10**7 - 0.25) < 0.001
+
+
+def test_sampler_stream():
+    sampler = Sampler(np.array([0.2, 0.3, 0.5]), seed=2)
+    chunks = list(sampler.stream(10**6 + 5, 10**5))
+    assert [len(chunk) for chunk in chunks] == [10**5] * 10 + [5]
+    frequencies = np.bincount(np.concatenate(chunks)) / (10**6 + 5)
+    assert np.allclose(frequencies, [0.2, 0.3, 0.5], atol=0.005)
+    with pytest.raises(ValueError):
+        next(sampler.stream(10, 0))
+
+
+def test_sampler_reproducible():
+    probabilities = np.full(8, 1 / 8)
+    first, second = Sampler(probabilities, seed=5), Sampler(probabilities, seed=5)
+    assert np.array_equal(first.shots(100), second.shots(100))
+    first_counts, second_counts = first.counts(100), second.counts(100)
+    assert isinstance(first_counts, np.ndarray)
+    assert isinstance(second_counts, np.ndarray)
+    assert np.array_equal(first_counts, second_counts)
+    state = StateVector(np.sqrt(probabilities))
+    assert state.sample(1000, 3, True) == state.sample(1000, 3, True)
+
+
+@pytest.mark.parametrize("probabilities", [np.zeros(4), np.ones((2, 2)) / 4])
+def test_sampler_invalid(probabilities: npt.NDArray[np.float64]):
+    with pytest.raises(ValueError):
+        Sampler(probabilities)
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        MPQPDevice.STATEVECTOR_SIMULATOR,
+        MPQPDevice.DENSITY_MATRIX_SIMULATOR,
+        MPQPDevice.MPS_SIMULATOR,
+        MPQPDevice.STABILIZER_SIMULATOR,
+    ],
+)
+def test_local_devices_use_sampling_seed(seeded_sampling: None, device: MPQPDevice):
+    circuit = QCircuit([H(0), CNOT(0, 1), H(2), BasisMeasure(shots=1000)])
+    first, second = run(circuit, device), run(circuit, device)
+    assert isinstance(first, Result) and isinstance(second, Result)
+    assert first.counts == second.counts
+    assert {sample.index for sample in first.samples} <= {0, 1, 6, 7}
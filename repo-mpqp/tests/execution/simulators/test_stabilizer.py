@@ -0,0 +1,145 @@
+from functools import reduce
+from itertools import product
+
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
+from mpqp.core.instruction.measurement.pauli_string import I as Pauli_I
+from mpqp.core.instruction.measurement.pauli_string import X as Pauli_X
+from mpqp.core.instruction.measurement.pauli_string import Y as Pauli_Y
+from mpqp.core.instruction.measurement.pauli_string import Z as Pauli_Z
+from mpqp.execution import MPQPDevice, run
+from mpqp.execution.job import Job, JobType
+from mpqp.execution.providers.mpqp_simulators import run_mpqp
+from mpqp.execution.result import Result
+from mpqp.execution.simulators.stabilizer import (
+    CLIFFORD_GATES,
+    StabilizerTableau,
+    is_clifford,
+    simulate_stabilizer,
+)
+from mpqp.execution.simulators.statevector import (
+    marginal_probabilities,
+    simulate_state_vector,
+)
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.noise import Depolarizing
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.errors import DeviceJobIncompatibleError
+
+atoms = {"I": Pauli_I, "X": Pauli_X, "Y": Pauli_Y, "Z": Pauli_Z}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stabilizer_expectations_match_state_vector(seed: int):
+    circuit = random_circuit(list(CLIFFORD_GATES), nb_qubits=3, nb_gates=30, seed=seed)
+    tableau = simulate_stabilizer(circuit)
+    state = simulate_state_vector(circuit)
+    for labels in product("IXYZ", repeat=3):
+        observable = reduce(lambda a, b: a @ b, [atoms[label] for label in labels])
+        expected = np.vdot(state, observable.to_matrix() @ state).real
+        assert np.isclose(tableau.expectation(observable)[0], expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stabilizer_sample_statistics(seed: int):
+    circuit = random_circuit(list(CLIFFORD_GATES), nb_qubits=4, nb_gates=30, seed=seed)
+    probabilities = np.square(np.abs(simulate_state_vector(circuit)))
+    expected = marginal_probabilities(probabilities, [3, 0, 2])
+    shots = 20000
+    counts = simulate_stabilizer(circuit).sample([3, 0, 2], shots)
+    assert sum(counts.values()) == shots
+    assert all(expected[outcome] > 0 for outcome in counts)
+    frequencies = np.array([counts.get(i, 0) for i in range(8)]) / shots
+    assert np.allclose(frequencies, expected, atol=0.02)
+
+
+def test_stabilizer_sample_many_generators():
+    nb_qubits = 70
+    tableau = StabilizerTableau(nb_qubits)
+    for qubit in range(0, nb_qubits, 2):
+        tableau.apply_gate(H(qubit))
+        tableau.apply_gate(CNOT(qubit, qubit + 1))
+    tableau.apply_gate(X(nb_qubits - 1))
+    counts = tableau.sample(list(range(nb_qubits)), 1000)
+    for outcome in counts:
+        bits = [outcome >> (nb_qubits - 1 - qubit) & 1 for qubit in range(nb_qubits)]
+        assert all(bits[q] == bits[q + 1] for q in range(0, nb_qubits - 2, 2))
+        assert bits[-2] != bits[-1]
+    assert len(counts) > 990
+
+
+def test_stabilizer_measure_collapses():
+    tableau = simulate_stabilizer(QCircuit([H(0), CNOT(0, 1), CNOT(1, 2)]))
+    assert tableau.measure(1, outcome_if_random=True)
+    assert tableau.measure(0) and tableau.measure(2)
+    assert tableau.pauli_expectation(["Z", "I", "I"]) == -1
+
+
+@pytest.mark.parametrize(
+    "circuit, expected",
+    [
+        (QCircuit([H(0), CNOT(0, 1), S_dagger(1), SWAP(0, 1)]), True),
+        (QCircuit([H(0), CZ(0, 1), BasisMeasure(shots=10)]), True),
+        (QCircuit([H(0), Rx(0.3, 1)]), False),
+        (QCircuit([H(0), TOF([0, 1], 2)]), False),
+        (QCircuit([H(0), Depolarizing(0.1)]), False),
+    ],
+)
+def test_is_clifford(circuit: QCircuit, expected: bool):
+    assert is_clifford(circuit) == expected
+
+
+def test_stabilizer_rejects_non_clifford():
+    with pytest.raises(ValueError):
+        simulate_stabilizer(QCircuit([H(0), T(0)]))
+    circuit = QCircuit([H(0), T(0), BasisMeasure(shots=10)])
+    with pytest.raises(DeviceJobIncompatibleError):
+        run(circuit, MPQPDevice.STABILIZER_SIMULATOR)
+
+
+def test_stabilizer_device_many_qubits():
+    nb_qubits = 300
+    circuit = QCircuit(
+        [H(0)]
+        + [CNOT(i, i + 1) for i in range(nb_qubits - 1)]
+        + [BasisMeasure(list(range(nb_qubits)), shots=10000)]
+    )
+    result = run(circuit, MPQPDevice.STABILIZER_SIMULATOR)
+    assert isinstance(result, Result)
+    assert {sample.index for sample in result.samples} == {0, 2**nb_qubits - 1}
+    assert sum(sample.count or 0 for sample in result.samples) == 10000
+
+    observable = Observable(Pauli_Z @ Pauli_Z + 0.5 * Pauli_X @ Pauli_X)
+    circuit = circuit.without_measurements()
+    circuit.add(ExpectationMeasure(observable, [100, 200]))
+    result = run(circuit, MPQPDevice.STABILIZER_SIMULATOR)
+    assert isinstance(result, Result)
+    assert result.expectation_values == 1
+
+
+def test_statevector_device_delegates_clifford_circuits():
+    nb_qubits = 120
+    circuit = QCircuit(
+        [H(0)]
+        + [CNOT(i, i + 1) for i in range(nb_qubits - 1)]
+        + [S(nb_qubits - 1), BasisMeasure(shots=1000)]
+    )
+    result = run(circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    assert isinstance(result, Result)
+    assert {sample.index for sample in result.samples} <= {0, 2**nb_qubits - 1}
+
+
+def test_stabilizer_device_seeds_the_expectation_shots():
+    observable = Observable(Pauli_X @ Pauli_X + 0.5 * Pauli_Z @ Pauli_I)
+    measure = ExpectationMeasure(observable, shots=100)
+    circuit = QCircuit([H(0), CNOT(0, 1), measure])
+    values = []
+    for seed in [7, 7, 8]:
+        job = Job(JobType.OBSERVABLE, circuit, MPQPDevice.STABILIZER_SIMULATOR, measure)
+        job.seed = seed
+        values.append(run_mpqp(job).expectation_values)
+    assert values[0] == values[1] != values[2]
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
+from mpqp.execution import MPQPDevice, run
+from mpqp.execution.job import Job, JobType
+from mpqp.execution.providers.mpqp_simulators import run_mpqp
+from mpqp.execution.result import Result
+from mpqp.execution.simulators.sampling import sampling_config
+from mpqp.execution.simulators.statevector import (
+    apply_matrix,
+    gate_matrix,
+    gate_qubits,
+    marginal_probabilities,
+    simulate_state_vector,
+    sparse_operator,
+    unitary_column_blocks,
+)
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import matrix_eq, rand_hermitian_matrix
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_state_vector_matches_circuit_matrix(seed: int):
+    circuit = random_circuit(nb_qubits=4, nb_gates=15, seed=seed)
+    expected = circuit.to_matrix()[:, 0]
+    assert matrix_eq(simulate_state_vector(circuit), expected)
+
+
+@pytest.mark.parametrize(
+    "gates",
+    [
+        [H(3), CNOT(3, 0), TOF([3, 0], 1)],
+        [X(0), CZ(2, 0), CRk(3, 2, 1), SWAP(0, 2)],
+        [CustomGate(UnitaryMatrix(np.kron(np.eye(2), [[0, 1], [1, 0]])), [1, 2])],
+    ],
+)
+def test_gates_on_unordered_qubits(gates: list[Gate]):
+    circuit = QCircuit(gates, nb_qubits=4)
+    expected = circuit.to_matrix()[:, 0]
+    assert matrix_eq(simulate_state_vector(circuit), expected)
+
+
+def test_state_vector_leaves_the_global_phase_of_the_circuit():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    circuit.gphase = 0.3
+    job = Job(JobType.STATE_VECTOR, circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    result = run_mpqp(job)
+    assert circuit.gphase == 0.3
+    assert matrix_eq(result.amplitudes, np.array([1, 0, 0, 1]) / np.sqrt(2))
+
+
+def test_marginal_probabilities_order():
+    probabilities = np.arange(8, dtype=float) / 28
+    # qubit 2 then qubit 0: index = 2 * q2 + q0
+    expected = np.array([0 + 2, 4 + 6, 1 + 3, 5 + 7]) / 28
+    assert np.allclose(marginal_probabilities(probabilities, [2, 0]), expected)
+
+
+def test_sample_partial_measure():
+    circuit = QCircuit([X(0), H(2), BasisMeasure([0, 1], shots=500)])
+    result = run(circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    assert isinstance(result, Result)
+    assert result.counts == [0, 0, 500, 0]
+
+
+def test_observable_ideal_and_shots():
+    circuit = QCircuit([H(0), CNOT(0, 1), Ry(0.4, 1)])
+    observable = rand_hermitian_matrix(4)
+    state = simulate_state_vector(circuit)
+    expected = np.vdot(state, observable @ state).real
+
+    circuit.add(ExpectationMeasure(Observable(observable)))
+    ideal = run(circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    assert isinstance(ideal, Result)
+    assert ideal.expectation_values == pytest.approx(expected)
+
+    circuit.measurements[0].shots = 20000
+    sampled = run(circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    assert isinstance(sampled, Result)
+    assert isinstance(sampled.error, float)
+    assert isinstance(sampled.expectation_values, float)
+    assert abs(sampled.expectation_values - expected) < 5 * sampled.error + 1e-8
+
+
+@pytest.mark.parametrize(
+    "device", [MPQPDevice.STATEVECTOR_SIMULATOR, MPQPDevice.DENSITY_MATRIX_SIMULATOR]
+)
+def test_observables_sampled_independently(device: MPQPDevice):
+    observable = rand_hermitian_matrix(4)
+    circuit = QCircuit([H(0), CNOT(0, 1), Ry(0.4, 1)])
+    circuit.add(
+        ExpectationMeasure(
+            [Observable(observable, "a"), Observable(observable, "b")], shots=1000
+        )
+    )
+    seed = sampling_config.seed
+    sampling_config.seed = 0
+    try:
+        result = run(circuit, device)
+        again = run(circuit, device)
+    finally:
+        sampling_config.seed = seed
+    assert isinstance(result, Result) and isinstance(again, Result)
+    assert isinstance(result.expectation_values, dict)
+    assert result.expectation_values["a"] != result.expectation_values["b"]
+    assert result.expectation_values == again.expectation_values
+
+
+@pytest.mark.parametrize(
+    "gate", [H(2), CNOT(3, 1), TOF([0, 3], 2), CRk(4, 2, 0), SWAP(0, 3), Rx(0.3, 1)]
+)
+def test_sparse_operator(gate: Gate):
+    operator = sparse_operator(gate_matrix(gate), gate_qubits(gate), 4)
+    identity = np.eye(16, dtype=np.complex128).reshape((2,) * 4 + (16,))
+    expected = apply_matrix(identity, gate_matrix(gate), gate_qubits(gate))
+    assert matrix_eq(operator.toarray(), expected.reshape(16, 16))
+
+
+def test_unitary_column_blocks():
+    circuit = random_circuit(nb_qubits=4, nb_gates=20, seed=7)
+    blocks = list(unitary_column_blocks(circuit, 5))
+    assert [start for start, _ in blocks] == [0, 5, 10, 15]
+    assert [block.shape for _, block in blocks][-1] == (16, 1)
+    assert matrix_eq(np.hstack([block for _, block in blocks]), circuit.to_matrix())
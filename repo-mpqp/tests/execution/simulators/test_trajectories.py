@@ -0,0 +1,194 @@
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.core.instruction.measurement import ExpectationMeasure, Observable
+from mpqp.execution import MPQPDevice, run
+from mpqp.execution.result import Result
+from mpqp.execution.simulators import trajectories
+from mpqp.execution.simulators.density_matrix import (
+    expectation_from_density_matrix,
+    simulate_density_matrix,
+)
+from mpqp.execution.simulators.noise import noisy_operations
+from mpqp.execution.simulators.sampling import sampling_config
+from mpqp.execution.simulators.statevector import marginal_probabilities
+from mpqp.execution.simulators.trajectories import (
+    TrajectoryConfig,
+    prepare_channels,
+    sample_trajectories,
+    sample_trajectory,
+    trajectory_config,
+    trajectory_expectations,
+)
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.noise import AmplitudeDamping, BitFlip, Depolarizing, PhaseDamping
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import rand_hermitian_matrix
+
+
+@pytest.fixture
+def noisy_circuit():
+    circuit = random_circuit(nb_qubits=3, nb_gates=12, seed=4)
+    circuit.add(
+        [
+            Depolarizing(0.1),
+            AmplitudeDamping(0.3, 0.4, [0, 1]),
+            PhaseDamping(0.2, [2]),
+            BitFlip(0.1, gates=[CNOT]),
+        ]
+    )
+    return circuit
+
+
+def test_trajectories_average_to_density_matrix(noisy_circuit: QCircuit):
+    channels = prepare_channels(noisy_operations(noisy_circuit))
+    rng = np.random.default_rng(7)
+    nb_trajectories = 2000
+    average = sum(
+        np.abs(sample_trajectory(channels, 3, rng)) ** 2 for _ in range(nb_trajectories)
+    )
+    expected = simulate_density_matrix(noisy_circuit).diagonal().real
+    assert np.allclose(average / nb_trajectories, expected, atol=0.03)
+
+
+def test_sample_trajectories_statistics(noisy_circuit: QCircuit):
+    shots = 20000
+    counts, error = sample_trajectories(
+        noisy_circuit, [2, 0], shots, TrajectoryConfig(500, max_workers=1, seed=3)
+    )
+    assert sum(counts.values()) == shots
+    frequencies = np.zeros(4)
+    for index, count in counts.items():
+        frequencies[index] = count / shots
+    expected = marginal_probabilities(
+        simulate_density_matrix(noisy_circuit).diagonal().real, [2, 0]
+    )
+    assert 0 < error < 0.05
+    assert np.allclose(frequencies, expected, atol=5 * error)
+
+
+def test_trajectories_do_not_depend_on_workers(noisy_circuit: QCircuit):
+    sequential = sample_trajectories(
+        noisy_circuit, [0, 1, 2], 300, TrajectoryConfig(30, max_workers=1, seed=5)
+    )
+    parallel = sample_trajectories(
+        noisy_circuit,
+        [0, 1, 2],
+        300,
+        TrajectoryConfig(30, max_workers=3, seed=5, parallel_threshold=0),
+    )
+    assert sequential == parallel
+    again = sample_trajectories(
+        noisy_circuit,
+        [0, 1, 2],
+        300,
+        TrajectoryConfig(30, max_workers=3, seed=5, parallel_threshold=0),
+    )
+    assert again == parallel
+
+
+def test_small_simulations_run_in_process(noisy_circuit: QCircuit):
+    trajectories._shutdown_pools()  # pyright: ignore[reportPrivateUsage]
+    sample_trajectories(noisy_circuit, [0], 100, TrajectoryConfig(30, seed=5))
+    sample_trajectories(
+        noisy_circuit, [0], 100, TrajectoryConfig(30, max_workers=3, seed=5)
+    )
+    assert trajectories._pool is None  # pyright: ignore[reportPrivateUsage]
+
+
+def test_replaced_pool_is_shut_down():
+    process_pool = trajectories._process_pool  # pyright: ignore[reportPrivateUsage]
+    trajectories._shutdown_pools()  # pyright: ignore[reportPrivateUsage]
+    with process_pool(2) as small:
+        with process_pool(1) as reused:
+            assert reused is small
+        with process_pool(3) as large:
+            assert large is not small
+        # still used by the outer simulation
+        assert not small._shutdown_thread
+    assert small._shutdown_thread
+    with process_pool(3) as reused:
+        assert reused is large
+
+
+def test_noiseless_circuit_uses_one_trajectory():
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    counts, error = sample_trajectories(
+        circuit, [0, 1], 1000, TrajectoryConfig(max_workers=1)
+    )
+    assert set(counts) <= {0, 3}
+    # the error only comes from the sampling of the single trajectory
+    assert error == pytest.approx(np.sqrt(0.25 / 1000), rel=0.1)
+
+
+def test_noiseless_expectation_sampling_error():
+    circuit = QCircuit([X(0), H(1)])
+    zz = np.diag([1, -1, -1, 1]).astype(complex)
+    [(value, error)] = trajectory_expectations(
+        circuit, [zz], 2000, TrajectoryConfig(max_workers=1)
+    )
+    assert error == pytest.approx(1 / np.sqrt(2000), rel=0.1)
+    assert abs(value) < 5 * error
+    [(value, error)] = trajectory_expectations(
+        circuit, [zz], config=TrajectoryConfig(max_workers=1)
+    )
+    assert value == pytest.approx(0) and error == 0
+
+
+def test_trajectory_expectations(noisy_circuit: QCircuit):
+    observable = rand_hermitian_matrix(8)
+    [(value, error)] = trajectory_expectations(
+        noisy_circuit, [observable], config=TrajectoryConfig(1000, 2, seed=9)
+    )
+    expected, _ = expectation_from_density_matrix(
+        simulate_density_matrix(noisy_circuit), observable
+    )
+    assert error > 0
+    assert abs(value - expected) < 5 * error
+
+
+def test_expectation_shots_seeded_by_trajectories(noisy_circuit: QCircuit):
+    observable = rand_hermitian_matrix(8)
+    sequential = trajectory_expectations(
+        noisy_circuit, [observable], 1000, TrajectoryConfig(20, 1, seed=5)
+    )
+    parallel = trajectory_expectations(
+        noisy_circuit,
+        [observable],
+        1000,
+        TrajectoryConfig(20, 2, seed=5, parallel_threshold=0),
+    )
+    assert sequential == parallel
+
+    seed = sampling_config.seed
+    sampling_config.seed = 0
+    try:
+        # a single trajectory: the estimates only differ by their shots
+        circuit = QCircuit([H(0), H(1)])
+        zz = np.diag([1, -1, -1, 1]).astype(complex)
+        first, second = (
+            trajectory_expectations(circuit, [zz], 100, TrajectoryConfig(1, 1, s))
+            for s in (1, 2)
+        )
+        assert first != second
+    finally:
+        sampling_config.seed = seed
+
+
+def test_trajectory_device(noisy_circuit: QCircuit):
+    nb_trajectories = trajectory_config.nb_trajectories
+    trajectory_config.nb_trajectories = 10
+    try:
+        noisy_circuit.add(BasisMeasure([0, 1, 2], shots=100))
+        result = run(noisy_circuit, MPQPDevice.TRAJECTORY_SIMULATOR)
+        assert isinstance(result, Result)
+        assert sum(result.counts) == 100
+        assert isinstance(result.error, float)
+
+        noisy_circuit = noisy_circuit.without_measurements()
+        noisy_circuit.add(ExpectationMeasure(Observable(rand_hermitian_matrix(8))))
+        assert isinstance(run(noisy_circuit, MPQPDevice.TRAJECTORY_SIMULATOR), Result)
+    finally:
+        trajectory_config.nb_trajectories = nb_trajectories
@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+from sympy import symbols
+
+from mpqp import Barrier, Breakpoint, QCircuit
+from mpqp.execution import IBMDevice, MPQPDevice, run
+from mpqp.execution.fusion import FusionReport, fuse_gates
+from mpqp.execution.result import Result
+from mpqp.execution.simulators.density_matrix import simulate_density_matrix
+from mpqp.execution.simulators.statevector import simulate_state_vector
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure
+from mpqp.noise import AmplitudeDamping, BitFlip, Depolarizing
+from mpqp.tools.circuit import random_circuit
+from mpqp.tools.maths import matrix_eq
+
+gate_classes = [H, X, T, S, Rx, Ry, Rz, U, Rk, CNOT, CZ, SWAP, CRk, TOF]
+
+
+@pytest.mark.parametrize("max_qubits", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(4))
+def test_fusion_is_equivalent(max_qubits: int, seed: int):
+    circuit = random_circuit(gate_classes, 5, 60, seed)
+    fused = fuse_gates(circuit, max_qubits)
+    assert len(fused.gates) < len(circuit.gates)
+    for gate in fused.gates:
+        if isinstance(gate, CustomGate):
+            assert gate.nb_qubits <= max_qubits
+    assert matrix_eq(simulate_state_vector(fused), simulate_state_vector(circuit))
+
+
+def test_fusion_respects_boundaries():
+    circuit = QCircuit(
+        [
+            H(0),
+            Rx(0.3, 0),
+            Barrier(),
+            Ry(0.2, 0),
+            CNOT(0, 1),
+            Breakpoint(),
+            Rz(0.1, 1),
+            S(1),
+            BasisMeasure(shots=100),
+        ]
+    )
+    fused = fuse_gates(circuit)
+    assert [type(instruction) for instruction in fused.instructions] == [
+        CustomGate,
+        Barrier,
+        CustomGate,
+        Breakpoint,
+        CustomGate,
+        BasisMeasure,
+    ]
+    assert [gate.targets for gate in fused.gates] == [[0], [0, 1], [1]]
+
+
+def test_fusion_skips_symbolic_and_large_gates():
+    theta = symbols("θ")
+    circuit = QCircuit(
+        [H(0), Rx(theta, 0), T(0), S(1), TOF([0, 1], 2), X(2), Y(2), CNOT(0, 2)]
+    )
+    fused = fuse_gates(circuit, 2)
+    assert [type(gate) for gate in fused.gates] == [
+        H,
+        Rx,
+        T,
+        S,
+        TOF,
+        CustomGate,
+        CNOT,
+    ]
+    values = {theta: 0.4}
+    assert matrix_eq(
+        simulate_state_vector(
+            fused.subs(values, True)  # pyright: ignore[reportArgumentType]
+        ),
+        simulate_state_vector(
+            circuit.subs(values, True)  # pyright: ignore[reportArgumentType]
+        ),
+    )
+
+
+def test_fusion_respects_noise():
+    circuit = QCircuit(
+        [H(0), X(0), H(1), CNOT(1, 2), Y(2), Z(2), H(3), S(3)],
+        nb_qubits=4,
+    )
+    circuit.add(Depolarizing(0.1, [1]))
+    circuit.add(BitFlip(0.2, [3], gates=[S]))
+    fused = fuse_gates(circuit, 2)
+    assert [type(gate) for gate in fused.gates] == [
+        H,
+        CNOT,
+        H,
+        S,
+        CustomGate,
+        CustomGate,
+    ]
+    assert [gate.targets for gate in fused.gates[-2:]] == [[0], [2]]
+    assert fused.noises == circuit.noises
+
+    circuit.add(AmplitudeDamping(0.3, targets=[2], gates=[Y]))
+    assert np.allclose(
+        simulate_density_matrix(fuse_gates(circuit, 2)),
+        simulate_density_matrix(circuit),
+    )
+
+
+@pytest.mark.parametrize(
+    "device", [MPQPDevice.STATEVECTOR_SIMULATOR, IBMDevice.AER_SIMULATOR]
+)
+def test_run_with_fusion(device: MPQPDevice | IBMDevice):
+    theta = symbols("θ")
+    circuit = random_circuit(gate_classes, 4, 100, 3)
+    circuit.add(Ry(theta, 2))
+    values = {theta: 1.2}
+    result = run(circuit, device, values)  # pyright: ignore[reportArgumentType]
+    fused_result = run(
+        circuit, device, values, gate_fusion=2  # pyright: ignore[reportArgumentType]
+    )
+    assert isinstance(result, Result) and isinstance(fused_result, Result)
+    assert result.job.fusion is None
+    report = fused_result.job.fusion
+    assert isinstance(report, FusionReport)
+    assert report.gates_before == 101
+    assert report.gates_after == len(fused_result.job.circuit.gates)
+    assert report.reduction > 1.5
+    assert matrix_eq(result.amplitudes, fused_result.amplitudes)
+
+
+def test_fusion_invalid_size():
+    with pytest.raises(ValueError):
+        fuse_gates(QCircuit([H(0)]), 0)
+
+
+def test_fusion_does_not_share_the_caches():
+    circuit = random_circuit(gate_classes, 4, 30, 0)
+    circuit.add(Depolarizing(0.1, [0]))
+    depth, fingerprint = circuit.depth(), circuit.fingerprint()
+    fused = fuse_gates(circuit, 2)
+    expected = QCircuit(list(fused.instructions), nb_qubits=4)
+    assert fused.depth() == expected.depth() != depth
+    assert fused.fingerprint() != fingerprint
+    assert fused.noises == circuit.noises and fused.noises[0] is not circuit.noises[0]
+    assert circuit.depth() == depth and circuit.fingerprint() == fingerprint
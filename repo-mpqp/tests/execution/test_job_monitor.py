@@ -0,0 +1,215 @@
+from concurrent.futures import Future
+
+import pytest
+
+from mpqp import QCircuit
+from mpqp.execution import AWSDevice, IBMDevice, Job, JobStatus, JobType
+from mpqp.execution.job_monitor import JobMonitor
+
+
+class Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class Provider:
+    """Stand-in of a provider, the jobs being done after a number of polls."""
+
+    def __init__(self, nb_polls: dict[str, int], final: JobStatus = JobStatus.DONE):
+        self.nb_polls = nb_polls
+        self.final = final
+        self.queries: list[list[str]] = []
+
+    def __call__(self, job_ids: list[str]) -> dict[str, JobStatus]:
+        self.queries.append(list(job_ids))
+        statuses = {}
+        for job_id in job_ids:
+            self.nb_polls[job_id] -= 1
+            statuses[job_id] = (
+                self.final if self.nb_polls[job_id] < 0 else JobStatus.RUNNING
+            )
+        return statuses
+
+
+def monitor(clock: Clock, **providers: Provider) -> JobMonitor:
+    fetchers = {
+        {"ibm": IBMDevice, "aws": AWSDevice}[name]: provider
+        for name, provider in providers.items()
+    }
+    return JobMonitor(
+        fetchers,  # pyright: ignore[reportArgumentType]
+        poll_interval=1,
+        max_poll_interval=8,
+        jitter=0,
+        status_ttl=5,
+        clock=clock,
+        threaded=False,
+    )
+
+
+def test_statuses_are_queried_per_provider():
+    clock = Clock()
+    ibm = Provider({"a": 0, "b": 1, "c": 0})
+    aws = Provider({"d": 0})
+    job_monitor = monitor(clock, ibm=ibm, aws=aws)
+    futures = [job_monitor.watch(job_id, IBMDevice.IBM_BRISBANE) for job_id in "abc"]
+    futures.append(job_monitor.watch("d", AWSDevice.BRAKET_SV1_SIMULATOR))
+    assert job_monitor.poll() == 1
+    assert ibm.queries == [["a", "b", "c"]] and aws.queries == [["d"]]
+    assert [future.done() for future in futures] == [True, False, True, True]
+    clock.time = 1
+    assert job_monitor.poll() is None
+    assert ibm.queries[1:] == [["b"]]
+    assert all(future.result() == JobStatus.DONE for future in futures)
+
+
+def test_polls_back_off_exponentially():
+    clock = Clock()
+    ibm = Provider({"a": 10})
+    job_monitor = monitor(clock, ibm=ibm)
+    job_monitor.watch("a", IBMDevice.IBM_BRISBANE)
+    times = []
+    while len(times) < 6:
+        delay = job_monitor.poll()
+        assert delay is not None
+        times.append(clock.time)
+        clock.time += delay
+    assert times == [0, 1, 3, 7, 15, 23]
+
+
+def test_jitter_spreads_the_polls():
+    clock = Clock()
+    ibm = Provider({str(i): 10 for i in range(20)})
+    job_monitor = JobMonitor({IBMDevice: ibm}, jitter=0.5, clock=clock, threaded=False)
+    for job_id in ibm.nb_polls:
+        job_monitor.watch(job_id, IBMDevice.IBM_BRISBANE)
+    job_monitor.poll()
+    dues = {watch.due for watch in job_monitor._watches.values()}  # pyright: ignore
+    assert len(dues) > 1
+    assert all(0.5 <= due <= 1.5 for due in dues)
+
+
+def test_statuses_are_cached():
+    clock = Clock()
+    ibm = Provider({"a": 10, "b": 0})
+    job_monitor = monitor(clock, ibm=ibm)
+    assert job_monitor.status("a", IBMDevice.IBM_BRISBANE) == JobStatus.RUNNING
+    clock.time = 4
+    assert job_monitor.status("a", IBMDevice.IBM_BRISBANE) == JobStatus.RUNNING
+    assert len(ibm.queries) == 1
+    clock.time = 5
+    job_monitor.status("a", IBMDevice.IBM_BRISBANE)
+    assert len(ibm.queries) == 2
+    # final statuses do not expire
+    assert job_monitor.status("b", IBMDevice.IBM_BRISBANE) == JobStatus.DONE
+    clock.time = 100
+    assert job_monitor.status("b", IBMDevice.IBM_BRISBANE) == JobStatus.DONE
+    assert job_monitor.watch("b", IBMDevice.IBM_BRISBANE).result() == JobStatus.DONE
+    assert len(ibm.queries) == 3
+    assert job_monitor.info().cache_hits == 3
+
+
+def test_job_status_uses_the_monitor(monkeypatch: pytest.MonkeyPatch):
+    from mpqp.execution import job_monitor as module
+
+    clock = Clock()
+    ibm = Provider({"a": 10})
+    monkeypatch.setattr(module, "job_monitor", monitor(clock, ibm=ibm))
+    job = Job(JobType.STATE_VECTOR, QCircuit(2), IBMDevice.IBM_BRISBANE)
+    job.id = "a"
+    assert job.status == JobStatus.RUNNING
+    assert job.status == JobStatus.RUNNING
+    assert len(ibm.queries) == 1
+
+
+@pytest.mark.parametrize("final", [JobStatus.ERROR, JobStatus.CANCELLED])
+def test_callbacks_are_called_with_the_final_status(final: JobStatus):
+    clock = Clock()
+    ibm = Provider({"a": 1}, final)
+    job_monitor = monitor(clock, ibm=ibm)
+    calls = []
+    future = job_monitor.watch(
+        "a", IBMDevice.IBM_BRISBANE, lambda *args: calls.append(args)
+    )
+    assert job_monitor.watch("a", IBMDevice.IBM_BRISBANE) is future
+    while job_monitor.poll() is not None:
+        clock.time += 1
+    assert calls == [("a", final)]
+    assert future.result() == final
+
+
+def test_errors_of_the_provider_are_set_on_the_futures():
+    def fetch(job_ids: list[str]) -> dict[str, JobStatus]:
+        raise ConnectionError("unreachable")
+
+    clock = Clock()
+    job_monitor = JobMonitor(
+        {IBMDevice: fetch}, jitter=0, clock=clock, threaded=False, max_errors=3
+    )
+    futures: list[Future[JobStatus]] = [
+        job_monitor.watch(job_id, IBMDevice.IBM_BRISBANE) for job_id in "ab"
+    ]
+    times = []
+    while (delay := job_monitor.poll()) is not None:
+        assert not any(future.done() for future in futures)
+        times.append(clock.time)
+        clock.time += delay
+    assert times == [0, 1]
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result()
+
+
+def test_transient_errors_of_the_provider_are_retried():
+    ibm = Provider({"a": 1, "b": 2})
+    errors = iter([True, False, True, False, False])
+
+    def fetch(job_ids: list[str]) -> dict[str, JobStatus]:
+        if next(errors):
+            raise ConnectionError("unreachable")
+        return ibm(job_ids)
+
+    clock = Clock()
+    job_monitor = JobMonitor(
+        {IBMDevice: fetch}, jitter=0, clock=clock, threaded=False, max_errors=2
+    )
+    futures = [job_monitor.watch(job_id, IBMDevice.IBM_BRISBANE) for job_id in "ab"]
+    while (delay := job_monitor.poll()) is not None:
+        clock.time += delay
+    assert all(future.result() == JobStatus.DONE for future in futures)
+
+
+def test_concurrent_polls():
+    ibm = Provider({"a": 0, "b": 5})
+    nested: list[bool] = []
+
+    def fetch(job_ids: list[str]) -> dict[str, JobStatus]:
+        # another poll of the same jobs happens while the first one waits
+        if not nested:
+            nested.append(True)
+            job_monitor.poll()
+        return ibm(job_ids)
+
+    job_monitor = JobMonitor({IBMDevice: fetch}, jitter=0, threaded=False)
+    futures = [job_monitor.watch(job_id, IBMDevice.IBM_BRISBANE) for job_id in "ab"]
+    assert job_monitor.poll() is not None
+    assert futures[0].result() == JobStatus.DONE and not futures[1].done()
+
+
+def test_background_polling():
+    ibm = Provider({str(i): i % 3 for i in range(50)})
+    job_monitor = JobMonitor({IBMDevice: ibm}, poll_interval=0.001)
+    futures = [
+        job_monitor.watch(job_id, IBMDevice.IBM_BRISBANE) for job_id in ibm.nb_polls
+    ]
+    assert all(future.result(timeout=10) == JobStatus.DONE for future in futures)
+    assert job_monitor.info().watched == 0
+
+
+def test_unsupported_device():
+    job_monitor = JobMonitor({IBMDevice: Provider({})}, threaded=False)
+    with pytest.raises(NotImplementedError):
+        job_monitor.watch("a", AWSDevice.BRAKET_SV1_SIMULATOR)
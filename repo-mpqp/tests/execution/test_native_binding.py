@@ -0,0 +1,160 @@
+from numbers import Complex
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit as QiskitCircuit
+from sympy import Expr, symbols
+
+from mpqp import Language, ParametricCircuit, QCircuit
+from mpqp.core.translation_cache import translation_cache
+from mpqp.execution import (
+    ATOSDevice,
+    AvailableDevice,
+    AWSDevice,
+    GOOGLEDevice,
+    IBMDevice,
+    run,
+)
+from mpqp.execution.providers.atos import symbolic_circuit_to_myqlm
+from mpqp.execution.result import BatchResult, Result
+from mpqp.execution.runner import generate_job
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
+from mpqp.tools.maths import matrix_eq
+
+theta, phi, k = symbols("θ φ k")
+
+local_devices = [
+    IBMDevice.AER_SIMULATOR,
+    AWSDevice.BRAKET_LOCAL_SIMULATOR,
+    GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+    ATOSDevice.MYQLM_PYLINALG,
+]
+
+
+def symbolic_circuit() -> QCircuit:
+    return QCircuit(
+        [
+            H(0),
+            H(1),
+            H(2),
+            CRk(k, 0, 1),
+            U(theta, phi, 2 * theta, 1),
+            P(theta, 0),
+            Rk_dagger(k, 1),
+            CP(phi, 1, 0),
+            Rx(theta, 0),
+            CRk_dagger(k, 1, 0),
+            Ry(theta * phi, 2),
+            S_dagger(2),
+            TOF([0, 1], 2),
+            CustomGate(
+                np.array([[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 1j], [0, 0, 1j, 0]]),
+                [1, 2],
+            ),
+            SWAP(0, 2),
+            CZ(1, 2),
+        ]
+    )
+
+
+# the type checker does not know that floats are numbers.Complex
+values: dict[Expr | str, Complex] = {
+    theta: 0.3,  # pyright: ignore[reportAssignmentType]
+    phi: 1.1,
+    k: 3,
+}
+
+
+@pytest.mark.parametrize("device", local_devices)
+def test_state_vector_matches_substitution(device: AvailableDevice):
+    circuit = symbolic_circuit()
+    result = run(circuit, device, values)
+    assert isinstance(result, Result)
+    assert result.job.symbolic_circuit is not None
+    assert result.job.values == {"θ": 0.3, "φ": 1.1, "k": 3.0}
+    expected = run(circuit.subs(values, True), device)
+    assert isinstance(expected, Result)
+    assert expected.job.symbolic_circuit is None
+    assert matrix_eq(result.amplitudes, expected.amplitudes)
+
+
+@pytest.mark.parametrize("device", local_devices)
+def test_observable_matches_substitution(device: AvailableDevice):
+    circuit = symbolic_circuit()
+    circuit.add(ExpectationMeasure(Observable(np.diag(np.arange(8.0))), shots=0))
+    result = run(circuit, device, values)
+    expected = run(circuit.subs(values, True), device)
+    assert isinstance(result, Result) and isinstance(expected, Result)
+    assert result.job.symbolic_circuit is not None
+    assert result.expectation_values == pytest.approx(expected.expectation_values)
+
+
+@pytest.mark.parametrize("device", local_devices)
+def test_translation_cached_across_values(device: AvailableDevice):
+    circuit = QCircuit([H(0), Ry(2 * theta, 0), CNOT(0, 1), BasisMeasure(shots=0)])
+    translation_cache.clear()
+    translation_cache.maxsize = 128
+    try:
+        first = run(
+            circuit, device, {theta: 0.2}  # pyright: ignore[reportArgumentType]
+        )
+        misses = translation_cache.info().misses
+        second = run(
+            circuit, device, {theta: 0.7}  # pyright: ignore[reportArgumentType]
+        )
+        assert translation_cache.info().misses == misses
+        assert translation_cache.info().hits >= 1
+    finally:
+        translation_cache.maxsize = 0
+        translation_cache.clear()
+    assert isinstance(first, Result) and isinstance(second, Result)
+    assert second.amplitudes[0] == pytest.approx(np.cos(np.pi / 4 + 0.7))
+    assert first.amplitudes[0] == pytest.approx(np.cos(np.pi / 4 + 0.2))
+
+
+def test_parametric_circuit_bound_natively():
+    template = ParametricCircuit(symbolic_circuit())
+    result = run(template, IBMDevice.AER_SIMULATOR, values)
+    assert isinstance(result, Result)
+    assert result.job.symbolic_circuit is not None
+    expected = run(symbolic_circuit().subs(values, True), IBMDevice.AER_SIMULATOR)
+    assert isinstance(expected, Result)
+    assert matrix_eq(result.amplitudes, expected.amplitudes)
+
+
+def test_batch_parametric_circuits_bound_natively():
+    template = ParametricCircuit(symbolic_circuit())
+    batch = run([template, template], IBMDevice.AER_SIMULATOR, values)
+    assert isinstance(batch, BatchResult)
+    assert [result.job.circuit.label for result in batch] == ["circuit 1"] * 2
+    assert all(result.job.symbolic_circuit is not None for result in batch)
+
+
+def test_remote_devices_not_bound_natively():
+    job = generate_job(symbolic_circuit(), IBMDevice.IBM_BRISBANE, values)
+    assert job.symbolic_circuit is None
+    assert job.circuit.variables() == set()
+
+
+def test_partial_values_not_bound_natively():
+    job = generate_job(
+        symbolic_circuit(),
+        IBMDevice.AER_SIMULATOR,
+        {theta: 0.3},  # pyright: ignore[reportArgumentType]
+        False,
+    )
+    assert job.symbolic_circuit is None
+
+
+def test_qiskit_parameters_are_the_variables():
+    qiskit_circuit = symbolic_circuit().to_other_language(Language.QISKIT)
+    assert isinstance(qiskit_circuit, QiskitCircuit)
+    assert {param.name for param in qiskit_circuit.parameters} == {"θ", "φ", "k"}
+
+
+def test_symbolic_myqlm_translation():
+    myqlm_circuit = symbolic_circuit_to_myqlm(symbolic_circuit())
+    assert sorted(myqlm_circuit.get_variables()) == ["k", "θ", "φ"]
+    bound = myqlm_circuit.bind_variables({"θ": 0.3, "φ": 1.1, "k": 3})
+    assert bound.get_variables() == []
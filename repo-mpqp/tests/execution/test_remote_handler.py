@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+
+from mpqp import QCircuit
+from mpqp.execution import IBMDevice, JobStatus, Result, remote_handler, run
+from mpqp.execution.job_monitor import JobMonitor
+from mpqp.execution.remote_handler import get_remote_result_async
+from mpqp.gates import H
+from mpqp.tools.errors import RemoteExecutionError
+
+
+@pytest.fixture
+def remote_jobs(monkeypatch: pytest.MonkeyPatch):
+    """Fakes remote jobs, ``"<n>:<status>:<name>"`` being done after ``n``
+    polls of its status, or ending with ``status`` if given."""
+    result = run(QCircuit([H(0)]), IBMDevice.AER_SIMULATOR)
+    assert isinstance(result, Result)
+    polls: dict[str, int] = {}
+    threads: set[int] = set()
+    lock = threading.Lock()
+
+    def fetch(job_ids: list[str]) -> dict[str, JobStatus]:
+        statuses = {}
+        with lock:
+            threads.add(threading.get_ident())
+            for job_id in job_ids:
+                polls[job_id] = polls.get(job_id, 0) + 1
+                nb_polls, status, _ = job_id.split(":")
+                if polls[job_id] <= int(nb_polls):
+                    statuses[job_id] = JobStatus.QUEUED
+                else:
+                    statuses[job_id] = JobStatus[status] if status else JobStatus.DONE
+        return statuses
+
+    def get_remote_result(job_id: str, device: IBMDevice) -> Result:
+        assert polls[job_id] > int(job_id.split(":")[0])
+        return result
+
+    monkeypatch.setattr(remote_handler, "get_remote_result", get_remote_result)
+    monitor = JobMonitor({IBMDevice: fetch}, poll_interval=0.001, jitter=0)
+    return result, monitor, polls, threads
+
+
+def test_remote_result_async_polls_until_done(
+    remote_jobs: tuple[Result, JobMonitor, dict[str, int], set[int]],
+):
+    expected, monitor, polls, _ = remote_jobs
+    result = asyncio.run(
+        get_remote_result_async("3::", IBMDevice.IBM_BRISBANE, monitor)
+    )
+    assert result is expected
+    assert polls == {"3::": 4}
+
+
+def test_remote_results_async_share_the_monitor(
+    remote_jobs: tuple[Result, JobMonitor, dict[str, int], set[int]],
+):
+    expected, monitor, polls, threads = remote_jobs
+    job_ids = [f"{i % 5}::{i}" for i in range(1000)]
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                get_remote_result_async(job_id, IBMDevice.IBM_BRISBANE, monitor)
+                for job_id in job_ids
+            )
+        )
+
+    results = asyncio.run(main())
+    assert all(result is expected for result in results)
+    assert all(polls[job_id] == int(job_id[0]) + 1 for job_id in job_ids)
+    # the statuses of the jobs are queried together, by the polling thread
+    assert monitor.info().queries < 100
+    assert len(threads) == 1
+
+
+@pytest.mark.parametrize("status", ["CANCELLED", "ERROR"])
+def test_remote_result_async_of_a_failed_job(
+    remote_jobs: tuple[Result, JobMonitor, dict[str, int], set[int]], status: str
+):
+    _, monitor, _, _ = remote_jobs
+    with pytest.raises(RemoteExecutionError):
+        asyncio.run(
+            get_remote_result_async(f"1:{status}:", IBMDevice.IBM_BRISBANE, monitor)
+        )
+
+
+def test_remote_result_async_of_a_local_device():
+    with pytest.raises(ValueError):
+        asyncio.run(get_remote_result_async("job", IBMDevice.AER_SIMULATOR))
@@ -0,0 +1,222 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mpqp import QCircuit
+from mpqp.execution import (
+    ATOSDevice,
+    AvailableDevice,
+    BatchResult,
+    IBMDevice,
+    MPQPDevice,
+    Result,
+    run,
+    run_native_batch,
+    runner,
+)
+from mpqp.execution.result_cache import ResultCache
+from mpqp.execution.runner import generate_job
+from mpqp.execution.simulators.sampling import sampling_config
+from mpqp.execution.simulators.trajectories import trajectory_config
+from mpqp.gates import CNOT, H, Rx
+from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
+from mpqp.noise import Depolarizing
+from mpqp.tools.maths import matrix_eq
+
+
+class Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def compute(circuit: QCircuit, device: AvailableDevice = IBMDevice.AER_SIMULATOR):
+    calls = []
+
+    def run_circuit() -> Result:
+        calls.append(circuit)
+        result = run(circuit, device)
+        assert isinstance(result, Result)
+        return result
+
+    return run_circuit, calls
+
+
+def test_results_are_copied_and_given_the_job():
+    cache = ResultCache(maxsize=4)
+    circuit = QCircuit([H(0), CNOT(0, 1)], label="first")
+    run_circuit, calls = compute(circuit)
+    expected = cache.run(generate_job(circuit, IBMDevice.AER_SIMULATOR), run_circuit)
+    expected.state_vector.vector[:] = 0
+
+    other = QCircuit([H(0), CNOT(0, 1)], label="second")
+    job = generate_job(other, IBMDevice.AER_SIMULATOR)
+    result = cache.run(job, compute(other)[0])
+    assert len(calls) == 1
+    assert result.job is job and result.job.circuit.label == "second"
+    assert matrix_eq(result.amplitudes, np.array([1, 0, 0, 1]) / np.sqrt(2))
+    assert cache.info().hits == 1 and cache.info().misses == 1
+
+
+@pytest.mark.parametrize(
+    "circuit, device",
+    [
+        (QCircuit([H(0), BasisMeasure(shots=100)]), IBMDevice.AER_SIMULATOR),
+        (
+            QCircuit(
+                [H(0), ExpectationMeasure(Observable(np.diag([1, -1])), shots=100)]
+            ),
+            ATOSDevice.MYQLM_PYLINALG,
+        ),
+        (QCircuit([H(0), BasisMeasure(shots=100)]), MPQPDevice.STATEVECTOR_SIMULATOR),
+        (
+            QCircuit([H(0), Depolarizing(0.1, [0]), BasisMeasure(shots=100)]),
+            MPQPDevice.TRAJECTORY_SIMULATOR,
+        ),
+    ],
+)
+def test_random_jobs_are_not_cached(circuit: QCircuit, device: AvailableDevice):
+    cache = ResultCache(maxsize=4)
+    job = generate_job(circuit, device)
+    assert cache.key(job) is None
+    run_circuit, calls = compute(circuit, device)
+    cache.run(job, run_circuit)
+    cache.run(job, run_circuit)
+    assert len(calls) == 2
+    assert cache.info().skipped == 2 and cache.info().size == 0
+
+
+def test_seeded_samples_are_cached(monkeypatch: pytest.MonkeyPatch):
+    cache = ResultCache(maxsize=4)
+    circuit = QCircuit([H(0), Rx(0.3, 1), BasisMeasure(shots=1000)])
+    job = generate_job(circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    monkeypatch.setattr(sampling_config, "seed", 7)
+    key = cache.key(job)
+    assert key is not None
+    run_circuit, calls = compute(circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    expected = cache.run(job, run_circuit)
+    assert cache.run(job, run_circuit).counts == expected.counts == run_circuit().counts
+    assert len(calls) == 2
+    monkeypatch.setattr(sampling_config, "seed", 8)
+    assert cache.key(job) not in (None, key)
+
+
+def test_sampled_trajectory_expectations_are_not_cached(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    cache = ResultCache(maxsize=4)
+    observable = Observable(np.diag([1, -1]))
+    circuit = QCircuit([H(0), Depolarizing(0.1, [0])])
+    monkeypatch.setattr(trajectory_config, "seed", 5)
+    monkeypatch.setattr(sampling_config, "seed", None)
+    circuit.add(ExpectationMeasure(observable, shots=100))
+    job = generate_job(circuit, MPQPDevice.TRAJECTORY_SIMULATOR)
+    assert cache.key(job) is None
+
+    exact = QCircuit([H(0), Depolarizing(0.1, [0]), ExpectationMeasure(observable)])
+    job = generate_job(exact, MPQPDevice.TRAJECTORY_SIMULATOR)
+    key = cache.key(job)
+    assert key is not None
+    job.seed = 6
+    assert cache.key(job) not in (None, key)
+
+
+def test_exact_jobs_depend_on_the_values():
+    cache = ResultCache(maxsize=4)
+    circuit = QCircuit([Rx(0.3, 0)])
+    assert cache.key(generate_job(circuit, IBMDevice.AER_SIMULATOR)) != cache.key(
+        generate_job(QCircuit([Rx(0.4, 0)]), IBMDevice.AER_SIMULATOR)
+    )
+    assert cache.key(generate_job(circuit, IBMDevice.AER_SIMULATOR)) != cache.key(
+        generate_job(circuit, ATOSDevice.MYQLM_PYLINALG)
+    )
+
+
+def test_least_recently_used_results_are_evicted():
+    cache = ResultCache(maxsize=2)
+    circuits = [QCircuit([Rx(angle, 0)]) for angle in (0.1, 0.2, 0.3)]
+    jobs = [generate_job(circuit, IBMDevice.AER_SIMULATOR) for circuit in circuits]
+    for job, circuit in zip(jobs, circuits):
+        cache.run(job, compute(circuit)[0])
+    assert cache.get(jobs[0]) is None
+    assert cache.get(jobs[1]) is not None and cache.get(jobs[2]) is not None
+    assert cache.info().size == 2
+
+
+def test_results_expire():
+    clock = Clock()
+    cache = ResultCache(maxsize=2, ttl=10, clock=clock)
+    circuit = QCircuit([H(0)])
+    job = generate_job(circuit, IBMDevice.AER_SIMULATOR)
+    cache.run(job, compute(circuit)[0])
+    clock.time = 9
+    assert cache.get(job) is not None
+    clock.time = 10
+    assert cache.get(job) is None
+    assert cache.info().size == 0
+
+
+def test_results_are_saved_in_the_database(tmp_path: Path):
+    clock = Clock()
+    database = str(tmp_path / "results.db")
+    circuit = QCircuit([H(0), CNOT(0, 1)])
+    job = generate_job(circuit, IBMDevice.AER_SIMULATOR)
+    expected = ResultCache(database=database, clock=clock).run(job, compute(circuit)[0])
+
+    cache = ResultCache(maxsize=2, database=database, ttl=10, clock=clock)
+    result = cache.get(job)
+    assert result is not None and result.job is job
+    assert matrix_eq(result.amplitudes, expected.amplitudes)
+    assert cache.get(job) is not None
+    assert cache.info().disk_hits == 1 and cache.info().hits == 1
+
+    cache.clear()
+    clock.time = 10
+    assert cache.get(job) is None
+    assert ResultCache(database=database).get(job) is None
+
+
+def test_database_size_is_bounded(tmp_path: Path):
+    clock = Clock()
+    cache = ResultCache(
+        database=str(tmp_path / "results.db"), disk_maxsize=2, clock=clock
+    )
+    circuits = [QCircuit([Rx(angle, 0)]) for angle in (0.1, 0.2, 0.3)]
+    jobs = [generate_job(circuit, IBMDevice.AER_SIMULATOR) for circuit in circuits]
+    for job, circuit in zip(jobs, circuits):
+        clock.time += 1
+        cache.run(job, compute(circuit)[0])
+    assert cache.get(jobs[0]) is None
+    assert cache.get(jobs[1]) is not None and cache.get(jobs[2]) is not None
+    cache.clear(disk=True)
+    assert cache.get(jobs[2]) is None
+
+
+def test_run_uses_the_cache(monkeypatch: pytest.MonkeyPatch):
+    cache = ResultCache(maxsize=8)
+    monkeypatch.setattr(runner, "result_cache", cache)
+    circuits = [QCircuit([H(0), CNOT(0, 1)]), QCircuit([Rx(0.5, 0), H(1)])]
+    first = run_native_batch(circuits, IBMDevice.AER_SIMULATOR)
+    assert cache.info().misses == 2 and cache.info().size == 2
+    second = run(circuits, IBMDevice.AER_SIMULATOR)
+    assert isinstance(second, BatchResult)
+    assert cache.info().hits == 2
+    for expected, result in zip(first.results, second.results):
+        assert matrix_eq(result.amplitudes, expected.amplitudes)
+
+
+def test_samples_seeded_by_the_job_are_cached():
+    cache = ResultCache(maxsize=4)
+    circuit = QCircuit([H(0), BasisMeasure(shots=100)])
+    job = generate_job(circuit, IBMDevice.AER_SIMULATOR)
+    job.seed = 3
+    key = cache.key(job)
+    assert key is not None
+    job.seed = 4
+    assert cache.key(job) not in (None, key)
+    job = generate_job(circuit, ATOSDevice.MYQLM_PYLINALG)
+    job.seed = 3
+    assert cache.key(job) is None
@@ -1,10 +1,34 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
+
 import numpy as np
 import pytest
+from sympy import symbols
 
-from mpqp import QCircuit
-from mpqp.gates import H, Rx
-from mpqp.measures import ExpectationMeasure, Observable
-from mpqp.execution import adjust_measure
+from mpqp import ParametricCircuit, QCircuit
+from mpqp.gates import CNOT, H, Rx, X
+from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
+from mpqp.execution import (
+    ATOSDevice,
+    AvailableDevice,
+    AWSDevice,
+    GOOGLEDevice,
+    IBMDevice,
+    Job,
+    JobType,
+    MPQPDevice,
+    adjust_measure,
+    run,
+    run_async,
+    run_native_batch,
+    run_sharded,
+    submit_async,
+)
+from mpqp.execution.result import BatchResult, Result
+from mpqp.noise import Depolarizing
+from mpqp.tools.errors import DeviceJobIncompatibleError, RemoteExecutionError
 from mpqp.tools.maths import matrix_eq
 
 
@@ -41,3 +65,283 @@ def test_adjust_measure(
         adjust_measure(measure, circuit).observables[0].matrix,
         adjusted_observable_matrix,
     )
+
+
+def batch_circuits() -> list[QCircuit]:
+    return [
+        QCircuit([H(0), CNOT(0, 1)], label="bell"),
+        QCircuit([Rx(1.76, 0), H(1)], label="rotation"),
+        QCircuit([H(0), Depolarizing(0.1, [0])], label="noisy"),
+        QCircuit([H(0), Rx(0.3, 1), CNOT(1, 0)], label="mixed"),
+    ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_concurrently_keeps_order(executor: Literal["thread", "process"]):
+    circuits = [circuit for circuit in batch_circuits() if circuit.label != "noisy"]
+    sequential = run(circuits, IBMDevice.AER_SIMULATOR)
+    concurrent = run(circuits, IBMDevice.AER_SIMULATOR, executor=executor)
+    assert isinstance(sequential, BatchResult) and isinstance(concurrent, BatchResult)
+    assert concurrent.errors == {}
+    assert len(concurrent.durations) == len(sequential.durations) == 3
+    assert all(duration > 0 for duration in concurrent.durations)
+    for expected, result in zip(sequential.results, concurrent.results):
+        assert result.job.circuit.label == expected.job.circuit.label
+        assert matrix_eq(result.amplitudes, expected.amplitudes)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_templates_concurrently(executor: Literal["thread", "process"]):
+    theta = symbols("θ")
+    template = ParametricCircuit(QCircuit([Rx(theta, 0), CNOT(0, 1)], label="rx"))
+    values = {theta: 0.4}
+    concurrent = run(
+        [template] * 2,
+        IBMDevice.AER_SIMULATOR,
+        values,  # pyright: ignore[reportArgumentType]
+        executor=executor,
+    )
+    expected = run(template.bind([0.4]), IBMDevice.AER_SIMULATOR)
+    assert isinstance(concurrent, BatchResult) and isinstance(expected, Result)
+    assert concurrent.errors == {}
+    for result in concurrent:
+        assert result.job.circuit.label == "rx"
+        assert matrix_eq(result.amplitudes, expected.amplitudes)
+
+
+def test_run_concurrently_isolates_errors():
+    result = run(batch_circuits(), GOOGLEDevice.CIRQ_LOCAL_SIMULATOR, executor="thread")
+    assert isinstance(result, BatchResult)
+    assert list(result.errors) == [2]
+    assert isinstance(result.errors[2], DeviceJobIncompatibleError)
+    assert len(result.durations) == 4
+    assert [r.job.circuit.label for r in result.results] == [
+        "bell",
+        "rotation",
+        "mixed",
+    ]
+    assert "Item 2: DeviceJobIncompatibleError" in str(result)
+    assert result[1].job.circuit.label == "rotation"
+    assert result[3].job.circuit.label == result[-1].job.circuit.label == "mixed"
+    with pytest.raises(DeviceJobIncompatibleError):
+        result[2]
+    with pytest.raises(IndexError):
+        result[4]
+
+
+def test_run_concurrently_limits_the_items_in_flight():
+    in_flight = []
+    lock = threading.Lock()
+
+    class CountingExecutor(ThreadPoolExecutor):
+        running = 0
+
+        def submit(self, fn: Any, /, *args: Any, **kwargs: Any):
+            with lock:
+                CountingExecutor.running += 1
+                in_flight.append(CountingExecutor.running)
+            future = super().submit(fn, *args, **kwargs)
+
+            def done(_: Any):
+                with lock:
+                    CountingExecutor.running -= 1
+
+            future.add_done_callback(done)
+            return future
+
+    with CountingExecutor(4) as executor:
+        result = run(
+            batch_circuits()[:2] * 3,
+            IBMDevice.AER_SIMULATOR,
+            executor=executor,
+            max_workers=2,
+        )
+    assert isinstance(result, BatchResult) and len(result.results) == 6
+    assert max(in_flight) <= 2
+
+
+def test_run_async_matches_run():
+    circuit = batch_circuits()[0]
+    result = asyncio.run(run_async(circuit, IBMDevice.AER_SIMULATOR))
+    expected = run(circuit, IBMDevice.AER_SIMULATOR)
+    assert isinstance(result, Result) and isinstance(expected, Result)
+    assert matrix_eq(result.amplitudes, expected.amplitudes)
+
+
+def test_run_async_batch_isolates_errors():
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            return await run_async(
+                batch_circuits(),
+                GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+                executor=executor,
+            )
+
+    result = asyncio.run(main())
+    assert isinstance(result, BatchResult)
+    assert list(result.errors) == [2]
+    assert isinstance(result.errors[2], DeviceJobIncompatibleError)
+    assert len(result.durations) == 4
+    assert [r.job.circuit.label for r in result.results] == [
+        "bell",
+        "rotation",
+        "mixed",
+    ]
+
+
+def test_run_async_raises_the_error_of_a_single_circuit():
+    with pytest.raises(DeviceJobIncompatibleError):
+        asyncio.run(run_async(batch_circuits()[2], GOOGLEDevice.CIRQ_LOCAL_SIMULATOR))
+
+
+def test_submit_async_rejects_local_devices():
+    with pytest.raises(RemoteExecutionError):
+        asyncio.run(submit_async(batch_circuits()[0], IBMDevice.AER_SIMULATOR))
+
+
+def native_batch_circuits() -> list[QCircuit]:
+    observable = Observable(
+        np.diag([1.0, -2.0, 3.0, 0.5]) + np.eye(4, k=1) * 0.3 + np.eye(4, k=-1) * 0.3
+    )
+    return [
+        QCircuit([H(0), CNOT(0, 1)], label="state"),
+        QCircuit([X(0), Rx(0.4, 1), BasisMeasure(shots=1000)], label="sample"),
+        QCircuit([X(1), BasisMeasure(shots=500)], label="fewer shots"),
+        QCircuit(
+            [H(0), Rx(0.7, 1), ExpectationMeasure(observable)], label="observable"
+        ),
+        QCircuit([Rx(1.1, 0), CNOT(0, 1)], label="other state"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        IBMDevice.AER_SIMULATOR,
+        AWSDevice.BRAKET_LOCAL_SIMULATOR,
+        ATOSDevice.MYQLM_PYLINALG,
+        GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+    ],
+)
+def test_run_native_batch_matches_run(device: AvailableDevice):
+    batch = run_native_batch(native_batch_circuits(), device)
+    assert batch.errors == {}
+    expected = [run(circuit, device) for circuit in native_batch_circuits()]
+    assert len(batch.results) == len(expected)
+    for result, expected_result in zip(batch.results, expected):
+        assert isinstance(expected_result, Result)
+        assert result.job.circuit.label == expected_result.job.circuit.label
+        assert result.job.job_type == expected_result.job.job_type
+        assert result.shots == expected_result.shots
+        if result.job.job_type == JobType.STATE_VECTOR:
+            assert matrix_eq(result.amplitudes, expected_result.amplitudes)
+        elif result.job.job_type == JobType.SAMPLE:
+            assert sum(result.counts) == result.shots
+            assert np.allclose(
+                result.probabilities, expected_result.probabilities, atol=0.1
+            )
+        else:
+            assert isinstance(result.expectation_values, float)
+            assert isinstance(expected_result.expectation_values, float)
+            assert np.isclose(
+                result.expectation_values, expected_result.expectation_values
+            )
+
+
+def test_run_native_batch_isolates_the_circuits_not_prepared():
+    batch = run_native_batch(batch_circuits(), GOOGLEDevice.CIRQ_LOCAL_SIMULATOR)
+    assert list(batch.errors) == [2]
+    assert isinstance(batch.errors[2], DeviceJobIncompatibleError)
+    assert [r.job.circuit.label for r in batch.results] == ["bell", "rotation", "mixed"]
+    assert batch[3].job.circuit.label == "mixed"
+
+
+def test_run_native_batch_isolates_the_failing_executions(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from mpqp.execution.providers import ibm
+
+    run_aer_group = ibm._run_aer_group  # pyright: ignore[reportPrivateUsage]
+
+    def failing_sample_group(jobs: list[Job], job_type: JobType, shots: int):
+        if job_type == JobType.SAMPLE:
+            raise RuntimeError("sampling failed")
+        return run_aer_group(jobs, job_type, shots)
+
+    monkeypatch.setattr(ibm, "_run_aer_group", failing_sample_group)
+    batch = run_native_batch(native_batch_circuits(), IBMDevice.AER_SIMULATOR)
+    assert list(batch.errors) == [1, 2]
+    assert all(isinstance(error, RuntimeError) for error in batch.errors.values())
+    assert [r.job.circuit.label for r in batch.results] == [
+        "state",
+        "observable",
+        "other state",
+    ]
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        IBMDevice.AER_SIMULATOR,
+        GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+        MPQPDevice.STATEVECTOR_SIMULATOR,
+        MPQPDevice.MPS_SIMULATOR,
+    ],
+)
+def test_run_sharded_is_reproducible(device: AvailableDevice):
+    circuit = QCircuit([H(0), Rx(0.8, 1), CNOT(1, 2), BasisMeasure(shots=3001)])
+    result = run_sharded(circuit, device, shards=3, seed=5)
+    assert result.shots == 3001 and sum(result.counts) == 3001
+    assert result.counts == run_sharded(circuit, device, shards=3, seed=5).counts
+    assert result.counts != run_sharded(circuit, device, shards=3, seed=6).counts
+    counts = np.array(result.counts)
+    probabilities = counts / counts.sum()
+    assert result.error == pytest.approx(
+        max(np.sqrt(probabilities * (1 - probabilities) / 3001))
+    )
+
+
+def test_run_sharded_respects_the_shots_per_job():
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn: Any, /, *args: Any, **kwargs: Any):
+            submitted.append(args[0].measurements[0].shots)
+            return super().submit(fn, *args, **kwargs)
+
+    circuit = QCircuit([H(0), CNOT(0, 1), BasisMeasure(shots=1000)])
+    with RecordingExecutor(2) as executor:
+        result = run_sharded(
+            circuit, IBMDevice.AER_SIMULATOR, shards=2, max_shots=300, executor=executor
+        )
+    assert sorted(submitted) == [250, 250, 250, 250]
+    assert result.shots == 1000
+    assert result.job.measure is not None and result.job.measure.shots == 1000
+
+
+def test_run_sharded_stops_at_the_target_error():
+    circuit = QCircuit([H(0), BasisMeasure(shots=200_000)])
+    result = run_sharded(
+        circuit,
+        MPQPDevice.STATEVECTOR_SIMULATOR,
+        shards=200,
+        target_error=0.005,
+        max_workers=2,
+    )
+    assert isinstance(result.error, float) and result.error <= 0.005
+    assert 10_000 <= result.shots < 200_000
+    assert result.job.measure is not None
+    assert result.job.measure.shots == result.shots == sum(result.counts)
+
+
+def test_run_sharded_in_processes():
+    circuit = QCircuit([X(0), BasisMeasure(shots=1000)])
+    result = run_sharded(
+        circuit, MPQPDevice.STATEVECTOR_SIMULATOR, shards=3, executor="process"
+    )
+    assert result.counts == [0, 1000]
+
+
+def test_run_sharded_needs_shots():
+    with pytest.raises(ValueError):
+        run_sharded(QCircuit([H(0)]), IBMDevice.AER_SIMULATOR)
@@ -0,0 +1,185 @@
+import numpy as np
+import pytest
+from sympy import symbols
+
+from mpqp import QCircuit
+from mpqp.execution import (
+    ATOSDevice,
+    AvailableDevice,
+    GOOGLEDevice,
+    IBMDevice,
+    MPQPDevice,
+    run,
+    run_sweep,
+)
+from mpqp.execution.job import Job, JobType
+from mpqp.execution.providers.mpqp_simulators import sweep_mpqp
+from mpqp.execution.result import Result, SweepResult
+from mpqp.execution.runner import generate_job
+from mpqp.execution.simulators.statevector import (
+    simulate_state_vector,
+    simulate_state_vector_batch,
+)
+from mpqp.gates import *
+from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
+from mpqp.tools.maths import matrix_eq
+
+theta, phi = symbols("θ φ")
+
+
+def symbolic_circuit():
+    return QCircuit(
+        [
+            H(0),
+            Rx(theta, 0),
+            CNOT(0, 1),
+            Ry(phi, 1),
+            Rz(np.pi / 3, 2),
+            CRk(2, 1, 2),
+            U(theta, phi, 0.2, 2),
+        ]
+    )
+
+
+def test_simulate_state_vector_batch():
+    circuit = symbolic_circuit()
+    circuit.add(Ry(2 * phi - theta, 0))
+    values = np.random.default_rng(0).uniform(0, 2 * np.pi, (6, 2))
+    states = simulate_state_vector_batch(circuit, [theta, phi], values)
+    for state, (t, p) in zip(states, values):
+        expected = simulate_state_vector(circuit.subs({theta: t, phi: p}, True))
+        assert matrix_eq(state, expected)
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        MPQPDevice.STATEVECTOR_SIMULATOR,
+        GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+        ATOSDevice.MYQLM_PYLINALG,
+    ],
+)
+def test_sweep_state_vector(device: AvailableDevice):
+    circuit = symbolic_circuit()
+    values = np.array([[0.3, 1.2], [2.0, -0.4], [np.pi, 0]])
+    sweep = run_sweep(circuit, device, values, [theta, phi])
+    assert isinstance(sweep, SweepResult)
+    assert sweep.amplitudes.shape == (3, 8)
+    for amplitudes, (t, p) in zip(sweep.amplitudes, values):
+        expected = simulate_state_vector(circuit.subs({theta: t, phi: p}, True))
+        assert matrix_eq(amplitudes, expected, 1e-5, 1e-5)
+
+
+def test_sweep_mpqp_leaves_the_global_phase_of_the_circuit():
+    circuit = QCircuit([Rx(theta, 0)])
+    circuit.gphase = 0.3
+    job = Job(JobType.STATE_VECTOR, circuit, MPQPDevice.STATEVECTOR_SIMULATOR)
+    sweep = sweep_mpqp(job, [theta], np.array([[0.0], [np.pi]]))
+    assert circuit.gphase == 0.3
+    assert matrix_eq(sweep.amplitudes, np.array([[1, 0], [0, -1j]]))
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        MPQPDevice.STATEVECTOR_SIMULATOR,
+        IBMDevice.AER_SIMULATOR,
+        GOOGLEDevice.CIRQ_LOCAL_SIMULATOR,
+        MPQPDevice.MPS_SIMULATOR,
+    ],
+)
+def test_sweep_samples(device: AvailableDevice):
+    circuit = QCircuit(
+        [Rx(theta, 0), CNOT(0, 1), Ry(phi, 2), BasisMeasure([2, 0], shots=500)]
+    )
+    values = np.array([[0, 0], [np.pi, 0], [np.pi, np.pi], [0, np.pi]])
+    sweep = run_sweep(circuit, device, values, ["θ", "φ"])
+    assert sweep.counts.shape == (4, 4)
+    assert sweep.counts.tolist() == [
+        [500, 0, 0, 0],
+        [0, 500, 0, 0],
+        [0, 0, 0, 500],
+        [0, 0, 500, 0],
+    ]
+    assert np.allclose(sweep.probabilities.sum(axis=1), 1)
+    result = sweep[3]
+    assert isinstance(result, Result)
+    assert result.counts == [0, 0, 500, 0]
+
+
+def test_sweep_expectation_values():
+    observables = [
+        Observable(np.diag([1, -1, 1, -1]), label="z1"),
+        Observable(np.array([[0, 1], [1, 0]]), label="x0"),
+    ]
+    circuit = QCircuit(
+        [Ry(theta, 0), CNOT(0, 1), Rx(phi, 1), ExpectationMeasure(observables[0])]
+    )
+    values = np.random.default_rng(1).uniform(0, np.pi, (20, 2))
+    sweep = run_sweep(circuit, MPQPDevice.STATEVECTOR_SIMULATOR, values)
+    expected: list[float] = []
+    for i in range(len(sweep)):
+        result = run(
+            circuit,
+            MPQPDevice.STATEVECTOR_SIMULATOR,
+            sweep.point(i),  # pyright: ignore[reportArgumentType]
+        )
+        assert isinstance(result, Result)
+        assert isinstance(result.expectation_values, float)
+        expected.append(result.expectation_values)
+    assert isinstance(sweep.expectation_values, np.ndarray)
+    assert np.allclose(sweep.expectation_values, expected)
+
+    circuit = circuit.without_measurements()
+    circuit.add(ExpectationMeasure(observables[1], [0], shots=1000))
+    sweep = run_sweep(circuit, MPQPDevice.STATEVECTOR_SIMULATOR, values)
+    assert sweep.errors is not None and np.all(sweep.errors > 0)
+    assert isinstance(sweep[0].expectation_values, float)
+
+
+def test_sweep_several_observables():
+    circuit = QCircuit(
+        [
+            Ry(theta, 0),
+            ExpectationMeasure(
+                [
+                    Observable(np.diag([1, -1]), label="z"),
+                    Observable(np.array([[0, 1], [1, 0]]), label="x"),
+                ]
+            ),
+        ]
+    )
+    angles = np.linspace(0, np.pi, 7)
+    for device in [MPQPDevice.STATEVECTOR_SIMULATOR, IBMDevice.AER_SIMULATOR]:
+        sweep = run_sweep(circuit, device, angles)
+        values = sweep.expectation_values
+        assert isinstance(values, dict)
+        assert np.allclose(values["z"], np.cos(angles))
+        assert np.allclose(values["x"], np.sin(angles))
+        result = sweep[2]
+        assert isinstance(result.expectation_values, dict)
+
+
+def test_sweep_invalid_values():
+    circuit = QCircuit([Rx(theta, 0), Ry(phi, 0)])
+    with pytest.raises(ValueError):
+        run_sweep(circuit, MPQPDevice.STATEVECTOR_SIMULATOR, np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        run_sweep(circuit, MPQPDevice.STATEVECTOR_SIMULATOR, np.zeros(3))
+    with pytest.raises(ValueError):
+        run_sweep(circuit, MPQPDevice.STATEVECTOR_SIMULATOR, np.zeros((3, 1)), [theta])
+
+
+def test_sweep_mpqp_seeded_samples():
+    circuit = QCircuit([Rx(theta, 0), H(1), BasisMeasure([0, 1], shots=200)])
+    values = np.array([[0.3], [1.2], [2.5]])
+
+    def counts(seed: int):
+        job = generate_job(
+            circuit, MPQPDevice.STATEVECTOR_SIMULATOR, remove_symbolic=False
+        )
+        job.seed = seed
+        return sweep_mpqp(job, [theta], values).counts
+
+    assert np.array_equal(counts(4), counts(4))
+    assert not np.array_equal(counts(4), counts(5))
@@ -23,6 +23,7 @@ from mpqp.execution import (
     AZUREDevice,
     GOOGLEDevice,
     IBMDevice,
+    MPQPDevice,
     run,
 )
 from mpqp.execution.result import BatchResult, Result
@@ -54,6 +55,8 @@ state_vector_devices = [
     ATOSDevice.MYQLM_CLINALG,
     ATOSDevice.MYQLM_PYLINALG,
     AWSDevice.BRAKET_LOCAL_SIMULATOR,
+    MPQPDevice.STATEVECTOR_SIMULATOR,
+    MPQPDevice.MPS_SIMULATOR,
 ]
 
 sampling_devices = [
@@ -62,6 +65,8 @@ sampling_devices = [
     ATOSDevice.MYQLM_CLINALG,
     ATOSDevice.MYQLM_PYLINALG,
     AWSDevice.BRAKET_LOCAL_SIMULATOR,
+    MPQPDevice.STATEVECTOR_SIMULATOR,
+    MPQPDevice.MPS_SIMULATOR,
 ]
 
 
@@ -360,7 +365,8 @@ def circuits_type():
     + list(ATOSDevice)
     + list(AWSDevice)
     + list(GOOGLEDevice)
-    + list(AZUREDevice),
+    + list(AZUREDevice)
+    + list(MPQPDevice),
 )
 def test_validity_run_job_type(device: AvailableDevice, circuits_type: list[QCircuit]):
     circuit_state_vector = circuits_type[0]
@@ -388,7 +394,10 @@ def test_validity_run_job_type(device: AvailableDevice, circuits_type: list[QCir
             ):
                 assert run(circuit_state_vector, device) is not None
         else:
-            if isinstance(device, IBMDevice) and not device.supports_state_vector():
+            if (
+                isinstance(device, (IBMDevice, MPQPDevice))
+                and not device.supports_state_vector()
+            ):
                 with pytest.raises(DeviceJobIncompatibleError):
                     run(circuit_state_vector, device)
             else:
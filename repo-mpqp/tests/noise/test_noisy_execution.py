@@ -20,6 +20,7 @@ from mpqp.execution import (
     AWSDevice,
     GOOGLEDevice,
     IBMDevice,
+    MPQPDevice,
     run,
 )
 from mpqp.gates import *
@@ -34,7 +35,11 @@ noisy_devices: list[Any] = [
 ]
 # TODO: in the end this should be automatic as drafted above, but for now only
 # one device is stable
-noisy_devices = [AWSDevice.BRAKET_LOCAL_SIMULATOR, IBMDevice.AER_SIMULATOR]
+noisy_devices = [
+    AWSDevice.BRAKET_LOCAL_SIMULATOR,
+    IBMDevice.AER_SIMULATOR,
+    MPQPDevice.DENSITY_MATRIX_SIMULATOR,
+]
 
 
 def filter_braket_warning(
@@ -84,6 +89,8 @@ def devices():
         IBMDevice.AER_SIMULATOR_STATEVECTOR,
         IBMDevice.AER_SIMULATOR_MATRIX_PRODUCT_STATE,
         IBMDevice.AER_SIMULATOR_DENSITY_MATRIX,
+        MPQPDevice.DENSITY_MATRIX_SIMULATOR,
+        MPQPDevice.TRAJECTORY_SIMULATOR,
     ]
     if "--long" in sys.argv:
         devices.append(ATOSDevice.QLM_NOISYQPROC)
@@ -1,10 +1,19 @@
+from pathlib import Path
+
 import pytest
 
 from mpqp.all import *
 from mpqp.tools.circuit import random_circuit
-from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm2
-from mpqp.qasm.open_qasm_2_and_3 import remove_user_gates
+from mpqp.core.instruction.gates.native_gates import NativeGate
+from mpqp.qasm.mpqp_to_qasm import (
+    mpqp_to_qasm2,
+    mpqp_to_qasm3,
+    write_qasm2,
+    write_qasm3,
+)
+from mpqp.qasm.open_qasm_2_and_3 import open_qasm_2_to_3, remove_user_gates
 from mpqp.tools.display import format_element_str
+from mpqp.tools.errors import OpenQASMTranslationWarning
 
 
 @pytest.mark.parametrize(
@@ -529,3 +538,88 @@ def test_random_mpqp_to_qasm():
         assert isinstance(mpqp_qasm, str)
         mpqp_qasm = normalize_string(mpqp_qasm)
         assert qiskit_qasm == mpqp_qasm
+
+
+def test_qasm3_matches_conversion_from_qasm2():
+    circuits = [
+        QCircuit(
+            [
+                H(0),
+                CustomGate(
+                    UnitaryMatrix(
+                        np.array(
+                            [[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 1j], [0, 0, 1j, 0]]
+                        )
+                    ),
+                    [0, 1],
+                ),
+                U(0.1, 0.2, 0.3, 1),
+                CRk(2, 0, 1),
+                Barrier(),
+                BasisMeasure([0, 1], shots=10),
+            ]
+        ),
+        QCircuit([Id(0), TOF([0, 1], 2), SWAP(1, 2), BasisMeasure([2, 0], [0, 1])]),
+        QCircuit([BasisMeasure([0, 1], shots=10)]),
+        QCircuit(3),
+    ] + [random_circuit(nb_qubits=4, nb_gates=30) for _ in range(10)]
+    for circuit in circuits:
+        qasm2_code, gphase2 = mpqp_to_qasm2(circuit)
+        qasm3_code, gphase3 = mpqp_to_qasm3(circuit, translation_warning=False)
+        assert qasm3_code == open_qasm_2_to_3(qasm2_code, translation_warning=False)
+        assert gphase3 == gphase2
+
+
+def test_qasm_written_to_file(tmp_path: Path):
+    circuit = random_circuit(nb_qubits=5, nb_gates=50)
+    circuit.add(BasisMeasure())
+    for write, convert in [
+        (write_qasm2, mpqp_to_qasm2),
+        (lambda c, f: write_qasm3(c, f, False), lambda c: mpqp_to_qasm3(c, False)),
+    ]:
+        path = tmp_path / "circuit.qasm"
+        with open(path, "w") as file:
+            gphase = write(circuit, file)
+        expected, expected_gphase = convert(circuit)
+        assert path.read_text() == expected
+        assert gphase == expected_gphase
+
+
+def test_compact_circuit_same_qasm():
+    circuit = random_circuit(nb_qubits=4, nb_gates=40)
+    circuit.add(BasisMeasure())
+    assert mpqp_to_qasm2(circuit.to_compact()) == mpqp_to_qasm2(circuit)
+    assert mpqp_to_qasm3(circuit.to_compact(), False) == mpqp_to_qasm3(circuit, False)
+
+
+def test_qasm3_u_gate_warning():
+    with pytest.warns(OpenQASMTranslationWarning):
+        mpqp_to_qasm3(QCircuit([U(0.1, 0.2, 0.3, 0)]))
+
+
+@pytest.mark.parametrize(
+    "gate",
+    [
+        Id(0),
+        X(1),
+        CNOT(2, 0),
+        TOF([0, 2], 1),
+        SWAP(1, 2),
+        Rx(0.3, 0),
+        P(np.pi / 2, 1),
+        CP(-0.2, 2, 1),
+        U(0.1, np.pi, -0.3, 0),
+        Rk(3, 1),
+        Rk_dagger(2, 0),
+        CRk(4, 0, 2),
+        CRk_dagger(1, 2, 0),
+        Rk(2.5, 0),  # pyright: ignore[reportArgumentType]
+        Ry(symbols("θ") * 2, 0),
+        CRk(symbols("k"), 0, 1),
+    ],
+)
+def test_native_gate_written_without_instantiation(gate: NativeGate):
+    circuit = QCircuit([gate], nb_qubits=3)
+    expected = gate.to_other_language(Language.QASM2)
+    assert mpqp_to_qasm2(circuit)[0].splitlines()[-1] == expected
+    assert mpqp_to_qasm2(circuit.to_compact())[0].splitlines()[-1] == expected
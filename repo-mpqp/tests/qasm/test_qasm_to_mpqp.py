@@ -1,11 +1,19 @@
+from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
 import pytest
-from typing import TYPE_CHECKING
 
 from mpqp.core.instruction.barrier import Language
-from mpqp.qasm.qasm_to_mpqp import qasm2_parse
+from mpqp.core.instruction_store import CompactInstructions
+from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm3
+from mpqp.qasm.qasm_to_mpqp import qasm2_parse, qasm_parse_file, qasm_parse_stream
 from mpqp.core.instruction import *
 from mpqp.tools.circuit import random_circuit
-from mpqp import Language
+from mpqp.tools.maths import matrix_eq
+from mpqp import Language, QCircuit
 
 
 @pytest.mark.parametrize(
@@ -201,3 +209,135 @@ def test_random_qasm_code():
         if TYPE_CHECKING:
             assert isinstance(qasm_code, str)
         assert qcircuit.is_equivalent(qasm2_parse(qasm_code))
+
+
+def _chunks(code: str, size: int) -> list[str]:
+    return [code[i : i + size] for i in range(0, len(code), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_stream_chunks_of_any_size(size: int):
+    code = """OPENQASM 3.0; // header
+    include "qelib1.inc";
+    /* a comment with ; and { */
+    qreg q[2]; creg c[2];
+    gate g(a) x, y { rx(a/2) x; cx x, y; }
+    g(pi) q[0], q[1]; // comment ; h q[0];
+    rz(2^2*pi/4) q[1];
+    measure q -> c;"""
+    circuit = qasm_parse_stream(_chunks(code, size))
+    assert circuit == QCircuit(
+        [Rx(np.pi / 2, 0), CNOT(0, 1), Rz(np.pi, 1), BasisMeasure()],
+        nb_qubits=2,
+        nb_cbits=2,
+    )
+
+
+@pytest.mark.parametrize("size", [1, 1000])
+def test_stream_block_comments_rejected_in_openqasm2(size: int):
+    code = "OPENQASM 2.0;\nqreg q[1];\n/* comment */\nh q[0];"
+    with pytest.raises(SyntaxError, match="Block comments"):
+        qasm_parse_stream(_chunks(code, size))
+    circuit = qasm_parse_stream(_chunks(code.replace("2.0", "3.0"), size))
+    assert list(circuit.instructions) == [H(0)]
+
+
+def test_stream_matches_qasm2_parse():
+    for _ in range(5):
+        qcircuit = random_circuit(nb_qubits=4, nb_gates=30)
+        code = qcircuit.to_other_language(Language.QASM2)
+        if TYPE_CHECKING:
+            assert isinstance(code, str)
+        streamed = qasm_parse_stream(StringIO(code))
+        assert isinstance(streamed.instructions, CompactInstructions)
+        assert streamed == qasm2_parse(code)
+
+
+def test_stream_openqasm3_round_trip():
+    qcircuit = QCircuit(
+        [H(0), U(0.1, 0.2, 0.3, 1), CP(0.4, 0, 2), TOF([0, 1], 2), BasisMeasure()]
+    )
+    code, _ = mpqp_to_qasm3(qcircuit)
+    parsed = qasm_parse_stream(StringIO(code), compact=False)
+    assert isinstance(parsed.instructions, list)
+    assert parsed.without_measurements().is_equivalent(qcircuit.without_measurements())
+    assert parsed.measurements == [BasisMeasure([i], [i]) for i in range(3)]
+
+
+def _equal_up_to_phase(matrix: npt.NDArray[Any], other: npt.NDArray[Any]) -> bool:
+    index = np.unravel_index(np.argmax(np.abs(other)), other.shape)
+    return matrix_eq(matrix * other[index] / matrix[index], other)
+
+
+@pytest.mark.parametrize(
+    "gate",
+    [
+        "tdg q[0]",
+        "sx q[1]",
+        "cy q[0], q[1]",
+        "ch q[2], q[0]",
+        "crz(0.3) q[1], q[0]",
+        "cswap q[2], q[0], q[1]",
+        "u2(0.4, 0.5) q[0]",
+        "u1(0.6) q[1]",
+    ],
+)
+def test_stream_standard_gates(gate: str):
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Operator
+
+    code = f'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[3];\n{gate};'
+    expected = Operator(QuantumCircuit.from_qasm_str(code).reverse_bits()).data
+    assert isinstance(expected, np.ndarray)
+    assert _equal_up_to_phase(qasm_parse_stream(code).to_matrix(), expected)
+
+
+def test_stream_registers_and_broadcast():
+    circuit = qasm_parse_stream(
+        """OPENQASM 3.0;
+        qubit[2] a;
+        qubit b;
+        bit[3] c;
+        h a;
+        cx a, b[0];
+        c[2] = measure b;
+        c[0] = measure a[1];"""
+    )
+    assert circuit.nb_qubits == 3 and circuit.nb_cbits == 3
+    assert list(circuit.instructions) == [
+        H(0),
+        H(1),
+        CNOT(0, 2),
+        CNOT(1, 2),
+        BasisMeasure([2], [2]),
+        BasisMeasure([1], [0]),
+    ]
+
+
+def test_parse_file_with_includes(tmp_path: Path):
+    (tmp_path / "definitions.inc").write_text("gate bell a, b { h a; cx a, b; }\n")
+    (tmp_path / "main.qasm").write_text(
+        'OPENQASM 2.0;\ninclude "definitions.inc";\nqreg q[2];\nbell q[0], q[1];\n'
+    )
+    circuit = qasm_parse_file(str(tmp_path / "main.qasm"))
+    assert circuit == QCircuit([H(0), CNOT(0, 1)], nb_qubits=2)
+
+
+@pytest.mark.parametrize(
+    "qasm_code",
+    [
+        "OPENQASM 2.0;\nqreg q[1];\nh q[0]",
+        "OPENQASM 2.0;\nqreg q[1];\nh q[1];",
+        "OPENQASM 2.0;\nqreg q[2];\ncx q[0], q[0];",
+        "OPENQASM 2.0;\nqreg q[1];\nfoo q[0];",
+        "OPENQASM 2.0;\nqreg q[1];\nrx(import) q[0];",
+        "OPENQASM 2.0;\nqreg q[1];\nrx(0.1, 0.2) q[0];",
+        "OPENQASM 2.0;\ngate g a { g a; }",
+        "OPENQASM 2.0;\ngate g a { h a;",
+        "OPENQASM 3.0;\nqubit[2] q;\nctrl @ x q[0], q[1];",
+        "qreg q[1];\nOPENQASM 2.0;",
+    ],
+)
+def test_stream_invalid_code(qasm_code: str):
+    with pytest.raises(SyntaxError):
+        qasm_parse_stream(qasm_code)
@@ -1,10 +1,12 @@
 # pyright: reportUnusedImport=false
+import asyncio
 import importlib
 import os
 import sys
 import warnings
 from doctest import SKIP, DocTest, DocTestFinder, DocTestRunner
 from functools import partial
+from io import StringIO
 from pathlib import Path
 from types import TracebackType
 from typing import Any, Optional, Type
@@ -13,8 +15,17 @@ import pytest
 from anytree import Node
 from dotenv import dotenv_values, set_key, unset_key
 from mpqp.all import *
+from mpqp.core.dag import CircuitDAG, DAGNode, commute
+from mpqp.core.fingerprint import array_token
 from mpqp.core.instruction.measurement import pauli_string
 from mpqp.core.instruction.measurement.pauli_string import PauliString
+from mpqp.core.instruction_store import (
+    OPCODES,
+    CompactInstructions,
+    InstructionList,
+    iter_templates,
+)
+from mpqp.core.translation_cache import TranslationCache, translation_cache
 from mpqp.execution import BatchResult
 from mpqp.execution.connection.env_manager import (
     MPQP_ENV,
@@ -24,8 +35,56 @@ from mpqp.execution.connection.env_manager import (
     load_env_variables,
     save_env_variable,
 )
+from mpqp.execution.fusion import FusionReport, fusion_report
+from mpqp.execution.job_monitor import JobMonitor, job_monitor
+from mpqp.execution.providers.atos import symbolic_circuit_to_myqlm
 from mpqp.execution.providers.aws import estimate_cost_single_job
+from mpqp.execution.result_cache import ResultCache, result_cache
 from mpqp.execution.runner import generate_job
+from mpqp.execution.simulators.density_matrix import (
+    apply_channel,
+    expectation_from_density_matrix,
+    simulate_density_matrix,
+)
+from mpqp.execution.simulators.mps import MPS, MPSConfig, mps_config, simulate_mps
+from mpqp.execution.simulators.noise import noise_sites, noisy_operations
+from mpqp.execution.simulators.sampling import (
+    Sampler,
+    SamplingConfig,
+    random_generator,
+    sampling_config,
+)
+from mpqp.execution.simulators.stabilizer import (
+    StabilizerTableau,
+    is_clifford,
+    simulate_stabilizer,
+)
+from mpqp.execution.simulators.statevector import (
+    apply_matrices,
+    apply_matrix,
+    circuit_unitary,
+    expectation_from_state,
+    expectations_from_states,
+    gate_matrices,
+    gate_matrix,
+    gate_qubits,
+    is_symbolic,
+    marginal_probabilities,
+    sampled_pauli_expectation,
+    simulate_state_vector,
+    simulate_state_vector_batch,
+    sparse_circuit_unitary,
+    sparse_operator,
+    unitary_column_blocks,
+)
+from mpqp.execution.simulators.trajectories import (
+    TrajectoryConfig,
+    prepare_channels,
+    sample_trajectories,
+    sample_trajectory,
+    trajectory_config,
+    trajectory_expectations,
+)
 from mpqp.local_storage.delete import (
     clear_local_storage,
     remove_all_with_job_id,
@@ -75,7 +134,14 @@ from mpqp.qasm import (
     qasm2_to_Qiskit_Circuit,
     qasm3_to_braket_Program,
 )
-from mpqp.qasm.mpqp_to_qasm import mpqp_to_qasm2
+from mpqp.qasm.mpqp_to_qasm import (
+    mpqp_to_qasm2,
+    mpqp_to_qasm3,
+    parameter_to_qasm_str,
+    qasm3_input_declarations,
+    write_qasm2,
+    write_qasm3,
+)
 from mpqp.qasm.open_qasm_2_and_3 import (
     convert_instruction_3_to_2,
     open_qasm_2_to_3,
@@ -86,7 +152,7 @@ from mpqp.qasm.open_qasm_2_and_3 import (
     remove_user_gates,
 )
 from mpqp.qasm.qasm_to_braket import qasm3_to_braket_Circuit
-from mpqp.qasm.qasm_to_mpqp import qasm2_parse
+from mpqp.qasm.qasm_to_mpqp import qasm2_parse, qasm_parse_file, qasm_parse_stream
 from mpqp.tools.circuit import (
     random_circuit,
     random_gate,
@@ -120,6 +186,7 @@ from mpqp.tools.maths import (
     rand_unitary_2x2_matrix,
 )
 from mpqp.tools.pauli_grouping import full_commutation_pauli_grouping_greedy
+from mpqp.tools.theoretical_simulation import theoretical_probs
 from numpy.random import default_rng
 
 sys.path.insert(0, os.path.abspath("."))
@@ -1,8 +1,12 @@
+from typing import Any
+
 import numpy as np
+import pytest
 
 from mpqp import QCircuit
 from mpqp.core.instruction.measurement import BasisMeasure
 from mpqp.gates import *
+from mpqp.noise import AmplitudeDamping, BitFlip, Depolarizing
 from mpqp.tools.theoretical_simulation import theoretical_probs
 
 
@@ -17,3 +21,17 @@ def test_simulation():
     )
 
     assert np.allclose(np.array([0.5, 0, 0, 0.5]), theoretical_probs(circuit))
+
+
+@pytest.mark.parametrize(
+    "instructions, expected",
+    [
+        # the noise only acts on the qubits of the gates in its targets
+        ([H(0), CNOT(0, 1), BitFlip(0.1, [1])], [0.45, 0.05, 0.05, 0.45]),
+        ([H(0), X(1), CNOT(0, 1), Depolarizing(0.2, [0])], [0.05, 0.45, 0.45, 0.05]),
+        ([X(0), X(1), BitFlip(0.1, [0, 1], gates=[X])], [0.01, 0.09, 0.09, 0.81]),
+        ([X(0), AmplitudeDamping(0.3, targets=[0])], [0.3, 0.7]),
+    ],
+)
+def test_noisy_simulation(instructions: list[Any], expected: list[float]):
+    assert np.allclose(theoretical_probs(QCircuit(instructions)), expected)